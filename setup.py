@@ -48,8 +48,17 @@ setup(
     package_dir={'': 'src'},
     packages=find_packages(where='src'),
     python_requires='>=3.7',
-    install_requires=['requests ~= 2.25.1'],
+    install_requires=[
+        'httpx ~= 0.21',
+        'requests ~= 2.25.1',
+    ],
     extras_require={
+        'orjson': [
+            'orjson ~= 3.6',
+        ],
+        'http2': [
+            'httpx[http2] ~= 0.21',
+        ],
         'dev': [
             'autopep8 ~= 1.5.5',
             'flake8 ~= 3.8.4',
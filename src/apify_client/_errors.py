@@ -1,7 +1,10 @@
-from typing import Optional
+from typing import Optional, Union
 
+import httpx
 import requests
 
+_ResponseType = Union[requests.models.Response, httpx.Response]
+
 
 class ApifyClientError(Exception):
     """Base class for errors specific to the Apify API Client."""
@@ -18,7 +21,7 @@ class ApifyApiError(ApifyClientError):
     errors, which are thrown immediately, because a correction by the user is needed.
     """
 
-    def __init__(self, response: requests.models.Response, attempt: int) -> None:
+    def __init__(self, response: _ResponseType, attempt: int) -> None:
         """Create the ApifyApiError instance.
 
         Args:
@@ -58,7 +61,7 @@ class InvalidResponseBodyError(ApifyClientError):
     request. We do that by identifying this error in the _HTTPClient.
     """
 
-    def __init__(self, response: requests.models.Response) -> None:
+    def __init__(self, response: _ResponseType) -> None:
         """Create the InvalidResponseBodyError instance.
 
         Args:
@@ -69,3 +72,40 @@ class InvalidResponseBodyError(ApifyClientError):
         self.name = 'InvalidResponseBodyError'
         self.code = 'invalid-response-body'
         self.response = response
+
+
+class DeadlineExceededError(ApifyClientError):
+    """Error thrown when an API call can't be finished before the deadline set with `ApifyClient.deadline()`.
+
+    Instead of waiting for the next retry of a failed request, when the retry would start after the deadline,
+    this error is thrown right away, with the error of the last attempt as its cause.
+    """
+
+    def __init__(self, message: str = 'The deadline for the API call was exceeded') -> None:
+        """Create the DeadlineExceededError instance.
+
+        Args:
+            message: Description of the error
+        """
+        super().__init__(message)
+
+        self.name = 'DeadlineExceededError'
+
+
+class CircuitOpenError(ApifyClientError):
+    """Error thrown when an API call fails right away, because the circuit breaker of the client is open.
+
+    The breaker opens when too many requests to the API fail, so that the callers don't wait for the retries
+    of requests which would most likely fail too, and the API gets time to recover.
+    """
+
+    def __init__(self, retry_after_secs: float) -> None:
+        """Create the CircuitOpenError instance.
+
+        Args:
+            retry_after_secs: In how many seconds the breaker lets the next requests through
+        """
+        super().__init__(f'Too many requests to the API failed recently, the API calls fail right away for {retry_after_secs:.1f} more seconds')
+
+        self.name = 'CircuitOpenError'
+        self.retry_after_secs = retry_after_secs
@@ -1,37 +1,523 @@
-import gzip
-import json as jsonlib
+import asyncio
+import contextvars
+import copy
+import hashlib
+import io
 import os
 import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait
 from http import HTTPStatus
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple, TypeVar, cast
 
+import httpx
 import requests
-from requests.exceptions import ConnectionError, Timeout
+from requests.exceptions import ConnectionError, ReadTimeout, Timeout
 
-from ._errors import ApifyApiError, InvalidResponseBodyError
+from ._errors import ApifyApiError, DeadlineExceededError, InvalidResponseBodyError
 from ._types import JSONSerializable
-from ._utils import _is_content_type_json, _is_content_type_text, _is_content_type_xml, _retry_with_exp_backoff
+from ._utils import (
+    PARSE_DATES_EAGER,
+    PARSE_DATES_MODES,
+    _FileBody,
+    _get_endpoint_class,
+    _get_remaining_secs_to_deadline,
+    _get_url_template,
+    _GzippedBody,
+    _is_content_type_json,
+    _is_content_type_text,
+    _is_content_type_xml,
+    _StreamingBody,
+    _timeouts_override,
+)
 from ._version import __version__
+from .cache import ResponseCache, _get_conditional_headers
+from .circuit_breaker import CircuitBreaker, CircuitState
+from .compression import CompressionPolicy
+from .concurrency import ConcurrencyGovernor
+from .hedging import HedgingPolicy
+from .hooks import RequestEvent, RequestHooks
+from .json_codec import JSONCodec, default_json_codec
+from .rate_limit import RateLimiter, _parse_retry_after_secs
+from .retry import RetryPolicy
+from .statistics import INVALID_RESPONSE_BODY, NETWORK_ERROR, Statistics
+from .transport import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    AsyncTransport,
+    HTTPXAsyncTransport,
+    HTTPXTransport,
+    RequestsTransport,
+    Transport,
+)
 
-DEFAULT_BACKOFF_EXPONENTIAL_FACTOR = 2
-DEFAULT_BACKOFF_RANDOM_FACTOR = 1
+DEFAULT_CONNECT_TIMEOUT_SECS = 30
+# Long enough for the API calls which wait for something on the server, e.g. for an actor run to finish
+DEFAULT_READ_TIMEOUT_SECS = 360
 
+ResponseType = TypeVar('ResponseType', requests.models.Response, httpx.Response)
+# The outcome of a request shared by concurrent identical calls, the response or the error it failed with,
+# or neither when it failed for a reason specific to the call which sent it, like its deadline or cancellation
+_CoalescedOutcome = Tuple[Optional[ResponseType], Optional[BaseException]]
+
+
+class _BaseHTTPClient:
+    def __init__(
+        self,
+        *,
+        token: Optional[str] = None,
+        max_retries: int = 8,
+        min_delay_between_retries_millis: int = 500,
+        json_codec: Optional[JSONCodec] = None,
+        compression_policy: Optional[CompressionPolicy] = None,
+        connect_timeout_secs: float = DEFAULT_CONNECT_TIMEOUT_SECS,
+        read_timeout_secs: float = DEFAULT_READ_TIMEOUT_SECS,
+        rate_limiter: Optional[RateLimiter] = None,
+        base_url: Optional[str] = None,
+        concurrency_governor: Optional[ConcurrencyGovernor] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        coalesce_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        statistics: Optional[Statistics] = None,
+        request_hooks: Optional[RequestHooks] = None,
+        parse_dates: str = PARSE_DATES_EAGER,
+    ) -> None:
+        if parse_dates not in PARSE_DATES_MODES:
+            raise ValueError(f'The parse_dates option has to be one of {", ".join(PARSE_DATES_MODES)}, got {parse_dates}')
 
-class _HTTPClient:
-    def __init__(self, *, token: Optional[str] = None, max_retries: int = 8, min_delay_between_retries_millis: int = 500) -> None:
         self.max_retries = max_retries
         self.min_delay_between_retries_millis = min_delay_between_retries_millis
-        self.requests_session = requests.Session()
+        self.json_codec = json_codec or default_json_codec()
+        self.compression_policy = compression_policy or CompressionPolicy()
+        self.connect_timeout_secs = connect_timeout_secs
+        self.read_timeout_secs = read_timeout_secs
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.base_url = base_url
+        self.concurrency_governor = concurrency_governor or ConcurrencyGovernor()
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=max_retries,
+            min_delay_between_retries_millis=min_delay_between_retries_millis,
+        )
+        self.circuit_breaker = circuit_breaker
+        self.hedging_policy = hedging_policy
+        self.coalesce_requests = coalesce_requests
+        self.response_cache = response_cache
+        self.stats = statistics or Statistics()
+        self.request_hooks = request_hooks
+        self.parse_dates = parse_dates
 
-        self.requests_session.headers.update({'Accept': 'application/json, */*'})
+        headers = {'Accept': 'application/json, */*'}
 
         is_at_home = ('APIFY_IS_AT_HOME' in os.environ)
         python_version = '.'.join([str(x) for x in sys.version_info[:3]])
 
         user_agent = f'ApifyClient/{__version__} ({sys.platform}; Python/{python_version}); isAtHome/{is_at_home}'
-        self.requests_session.headers.update({'User-Agent': user_agent})
+        headers['User-Agent'] = user_agent
         if token is not None:
-            self.requests_session.headers.update({'Authorization': f'Bearer {token}'})
+            headers['Authorization'] = f'Bearer {token}'
+
+        self.headers = headers
+        # A response cache can be shared by clients with different tokens, which must not get each other's responses,
+        # so its keys contain the token, hashed, so that it isn't kept in the keys in plain text
+        self._token_hash = hashlib.sha256((token or '').encode('utf-8')).hexdigest()
+
+    def _maybe_parse_response(self, response: Any) -> Any:
+        if response.status_code in (HTTPStatus.NO_CONTENT, HTTPStatus.NOT_MODIFIED):
+            return None
+
+        content_type = ''
+        if 'content-type' in response.headers:
+            content_type = response.headers['content-type'].split(';')[0].strip()
+
+        try:
+            if _is_content_type_json(content_type):
+                return self.json_codec.loads(response.content)
+            elif _is_content_type_xml(content_type) or _is_content_type_text(content_type):
+                return response.text
+            else:
+                return response.content
+        except ValueError as err:
+            raise InvalidResponseBodyError(response) from err
+
+    @staticmethod
+    def _parse_params(params: Optional[Dict]) -> Optional[Dict]:
+        if params is None:
+            return None
+
+        parsed_params = {}
+        for key, value in params.items():
+            # None values mean the parameter was not provided, `requests` would skip them, but `httpx` would send them empty
+            if value is None:
+                continue
+            # Our API needs to have boolean parameters passed as 0 or 1, therefore we have to replace them
+            if isinstance(value, bool):
+                parsed_params[key] = int(value)
+            else:
+                parsed_params[key] = value
+
+        return parsed_params
+
+    def _get_timeouts(self, connect_timeout_secs: Optional[float], read_timeout_secs: Optional[float]) -> Tuple[float, float]:
+        # The timeouts passed to the call take precedence over the ones set with `ApifyClient.timeouts()`,
+        # which take precedence over the defaults of the client
+        override_connect_timeout_secs, override_read_timeout_secs = _timeouts_override.get()
+        if connect_timeout_secs is None:
+            connect_timeout_secs = override_connect_timeout_secs if override_connect_timeout_secs is not None else self.connect_timeout_secs
+        if read_timeout_secs is None:
+            read_timeout_secs = override_read_timeout_secs if override_read_timeout_secs is not None else self.read_timeout_secs
+
+        remaining_secs = _get_remaining_secs_to_deadline()
+        if remaining_secs is not None:
+            if remaining_secs <= 0:
+                raise DeadlineExceededError()
+            connect_timeout_secs = min(connect_timeout_secs, remaining_secs)
+            read_timeout_secs = min(read_timeout_secs, remaining_secs)
+
+        return (connect_timeout_secs, read_timeout_secs)
+
+    def _get_coalesced_wait_secs(self, connect_timeout_secs: Optional[float], read_timeout_secs: Optional[float]) -> Tuple[float, bool]:
+        # A call waiting for an identical request in flight waits at most as long as its own request could take, and not past its deadline,
+        # returns how long to wait, and whether it's the deadline that limits it
+        timeout_secs = sum(self._get_timeouts(connect_timeout_secs, read_timeout_secs))
+        remaining_secs = _get_remaining_secs_to_deadline()
+        if remaining_secs is not None and remaining_secs <= timeout_secs:
+            return (remaining_secs, True)
+        return (timeout_secs, False)
+
+    def _get_rate_limit_wait_secs(self, endpoint_class: str) -> float:
+        wait_secs = self.rate_limiter.reserve(endpoint_class)
+        if wait_secs > 0:
+            remaining_secs = _get_remaining_secs_to_deadline()
+            if remaining_secs is not None and wait_secs >= remaining_secs:
+                raise DeadlineExceededError('The API call would have to wait for the rate limit until after the deadline')
+        return wait_secs
+
+    def _create_request_event(
+        self,
+        method: str,
+        url: str,
+        endpoint_class: str,
+        attempt: int,
+        retry_reason: Optional[str],
+    ) -> Optional[RequestEvent]:
+        # Without any hooks, the events are not even created, so the hooks cost nothing unless they are used
+        request_hooks = self.request_hooks
+        if request_hooks is None:
+            return None
+        request_event = RequestEvent(
+            method=method.upper(),
+            url=url,
+            url_template=_get_url_template(url, self.base_url),
+            endpoint_class=endpoint_class,
+            attempt=attempt,
+            retry_reason=retry_reason,
+        )
+        if retry_reason is not None and request_hooks.on_retry is not None:
+            request_hooks.on_retry(request_event)
+        return request_event
+
+    def _before_request(self, request_event: Optional[RequestEvent] = None) -> None:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request()
+        if request_event is not None:
+            request_event.started_at = time.time()
+            before_request = cast(RequestHooks, self.request_hooks).before_request
+            if before_request is not None:
+                before_request(request_event)
+
+    def _is_hedgeable(self, method: str, stream: Optional[bool]) -> bool:
+        # Only the requests which can be repeated safely, and whose latency includes reading the whole response
+        return self.hedging_policy is not None and method.upper() == 'GET' and not stream
+
+    def _get_hedge_delay_secs(self, endpoint_class: str) -> Optional[float]:
+        # The probe requests of a circuit breaker are not hedged, the API may not have recovered yet
+        if self.hedging_policy is None or (self.circuit_breaker is not None and self.circuit_breaker.state != CircuitState.CLOSED):
+            return None
+        return self.hedging_policy.get_hedge_delay_secs(f'GET {endpoint_class}')
+
+    def _on_response(
+        self,
+        method: str,
+        endpoint_class: str,
+        response: Any,
+        latency_secs: float,
+        is_hedgeable: bool = False,
+        request_body_sizes: Tuple[int, int] = (0, 0),
+        response_body_sizes: Tuple[int, int] = (0, 0),
+        request_event: Optional[RequestEvent] = None,
+    ) -> None:
+        request_bytes, request_uncompressed_bytes = request_body_sizes
+        response_bytes, response_decompressed_bytes = response_body_sizes
+        if request_event is not None:
+            request_event.latency_secs = latency_secs
+            request_event.status_code = response.status_code
+            request_event.request_bytes, request_event.request_uncompressed_bytes = request_body_sizes
+            request_event.response_bytes, request_event.response_decompressed_bytes = response_body_sizes
+
+        self.stats.record_request(
+            endpoint_class,
+            status_code=response.status_code,
+            latency_secs=latency_secs,
+            request_bytes=request_bytes,
+            request_uncompressed_bytes=request_uncompressed_bytes,
+            response_bytes=response_bytes,
+            response_decompressed_bytes=response_decompressed_bytes,
+        )
+
+        if is_hedgeable and self.hedging_policy is not None and response.status_code < 300:
+            self.hedging_policy.record_latency(f'GET {endpoint_class}', latency_secs)
+
+        if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            self.rate_limiter.on_rate_limited(endpoint_class, _parse_retry_after_secs(response.headers))
+
+        if response.status_code == HTTPStatus.TOO_MANY_REQUESTS or response.status_code >= 500:
+            self.concurrency_governor.on_overloaded()
+        else:
+            self.concurrency_governor.on_success(f'{method} {endpoint_class}', latency_secs)
+
+        # Rate limit errors show the API is up, they are handled by the rate limiter
+        if self.circuit_breaker is not None:
+            if response.status_code >= 500:
+                self.circuit_breaker.on_failure()
+            else:
+                self.circuit_breaker.on_success()
+
+        # The hooks are called last, so that they see the state of the client after the response
+        if request_event is not None:
+            after_response = cast(RequestHooks, self.request_hooks).after_response
+            if after_response is not None:
+                after_response(request_event)
+
+    def _on_request_error(
+        self,
+        endpoint_class: str,
+        error: Exception,
+        latency_secs: float,
+        request_event: Optional[RequestEvent] = None,
+    ) -> None:
+        self.stats.record_request(endpoint_class, status_code=None, latency_secs=latency_secs)
+        if isinstance(error, (Timeout, httpx.TimeoutException)):
+            self.concurrency_governor.on_overloaded()
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.on_failure()
+
+        if request_event is not None:
+            request_event.latency_secs = latency_secs
+            request_event.error = error
+            on_error = cast(RequestHooks, self.request_hooks).on_error
+            if on_error is not None:
+                on_error(request_event)
+
+    def _get_coalescing_key(
+        self,
+        method: str,
+        url: str,
+        headers: Dict,
+        params: Optional[Dict],
+        stream: Optional[bool],
+        parse_response: Optional[bool],
+    ) -> Optional[str]:
+        # Only the GET requests can be shared, they don't change anything and their responses are read whole
+        if not self.coalesce_requests or method.upper() != 'GET' or stream:
+            return None
+        return self._get_request_key(url, headers, params, parse_response)
+
+    def _get_cache_key(
+        self,
+        method: str,
+        url: str,
+        headers: Dict,
+        params: Optional[Dict],
+        stream: Optional[bool],
+        parse_response: Optional[bool],
+        cacheable: bool,
+    ) -> Optional[str]:
+        if self.response_cache is None or not cacheable or method.upper() != 'GET' or stream:
+            return None
+        return f'{self._token_hash}:{self._get_request_key(url, headers, params, parse_response)}'
+
+    @staticmethod
+    def _get_request_key(url: str, headers: Dict, params: Optional[Dict], parse_response: Optional[bool]) -> str:
+        # Doesn't contain the token of the client, the cache keys add it
+        return repr((url, sorted((params or {}).items()), sorted(headers.items()), parse_response))
+
+    def _get_cached_responses(self, cache_key: str) -> Tuple[Optional[Any], Optional[Any]]:
+        # Returns the cached response, if it can be used right away,
+        # or the expired one, if the API can be asked whether it's still current
+        response_cache = cast(ResponseCache, self.response_cache)
+        cached_response = response_cache.get(cache_key)
+        if cached_response is not None:
+            return (cached_response, None)
+        expired_response = response_cache.get(cache_key, include_expired=True)
+        if expired_response is not None and _get_conditional_headers(expired_response):
+            return (None, expired_response)
+        return (None, None)
+
+    def _cache_response(
+        self,
+        cache_key: str,
+        url: str,
+        endpoint_class: str,
+        response: ResponseType,
+        expired_response: Optional[Any],
+        parse_response: Optional[bool],
+    ) -> ResponseType:
+        response_cache = cast(ResponseCache, self.response_cache)
+        if response.status_code == HTTPStatus.NOT_MODIFIED and expired_response is not None:
+            response_cache.put(cache_key, url=url, endpoint_class=endpoint_class, response=expired_response)
+            return cast(ResponseType, self._copy_response(expired_response, parse_response))
+        if response.status_code == HTTPStatus.OK:
+            response_cache.put(cache_key, url=url, endpoint_class=endpoint_class, response=response)
+        return response
+
+    def _invalidate_cache(self, method: str, url: str) -> None:
+        # Any request which can change a resource drops its cached responses, even when it fails, it might have changed it anyway
+        if self.response_cache is not None and method.upper() not in ('GET', 'HEAD'):
+            self.response_cache.invalidate(url)
+
+    def _copy_response(self, response: ResponseType, parse_response: Optional[bool]) -> ResponseType:
+        # Each of the calls sharing a response gets its own shallow copy of the response, with its own copy of the parsed body,
+        # so that they can't change it for the others, the raw content of the response is shared, as it can't be changed
+        response_copy = copy.copy(response)
+        setattr(response_copy, '_maybe_parsed_body', self._maybe_parse_response(response) if parse_response else response.content)
+        return response_copy
+
+    @staticmethod
+    def _get_coalesced_outcome(response: Optional[ResponseType], error: Optional[BaseException]) -> '_CoalescedOutcome[ResponseType]':
+        # The calls waiting for the request don't share its deadline, they send their own requests when it runs out
+        if isinstance(error, (DeadlineExceededError, asyncio.CancelledError)):
+            return (None, None)
+        return (response, error)
+
+    def _prepare_request_call(
+        self,
+        headers: Optional[Dict] = None,
+        json: Optional[JSONSerializable] = None,
+        data: Optional[Any] = None,
+    ) -> Tuple[Dict, Any, Optional[int]]:
+        if not headers:
+            headers = {}
+
+        if json and not data:
+            data = self.json_codec.dumps(json)
+            headers['Content-Type'] = 'application/json'
+
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+
+        content_type = next((value for key, value in headers.items() if key.lower() == 'content-type'), None)
+        compression_policy = self.compression_policy
+        uncompressed_size_bytes = None
+
+        if isinstance(data, (bytes, bytearray)):
+            uncompressed_size_bytes = len(data)
+            if compression_policy.should_compress(content_type=content_type, size_bytes=len(data)):
+                data = compression_policy.compress(data)
+                headers['Content-Encoding'] = 'gzip'
+        elif isinstance(data, (io.IOBase, _StreamingBody)):
+            body = _FileBody(data) if isinstance(data, io.IOBase) else data
+            if compression_policy.should_compress(content_type=content_type, size_bytes=body.size_bytes):
+                data = _GzippedBody(body, compression_policy)
+                headers['Content-Encoding'] = 'gzip'
+
+        return (headers, data, uncompressed_size_bytes)
+
+    @staticmethod
+    def _get_request_body_sizes(data: Any, uncompressed_size_bytes: Optional[int]) -> Tuple[int, int]:
+        # The sizes of the body as sent and before the compression, streamed bodies are measured only when compressed or of a known size
+        if isinstance(data, (bytes, bytearray)):
+            return (len(data), uncompressed_size_bytes if uncompressed_size_bytes is not None else len(data))
+        if isinstance(data, _GzippedBody):
+            return (data.compressed_size_bytes, data.uncompressed_size_bytes)
+        if isinstance(data, _StreamingBody) and data.size_bytes is not None:
+            return (data.size_bytes, data.size_bytes)
+        return (0, 0)
+
+
+class _HTTPClient(_BaseHTTPClient):
+    def __init__(
+        self,
+        *,
+        token: Optional[str] = None,
+        max_retries: int = 8,
+        min_delay_between_retries_millis: int = 500,
+        json_codec: Optional[JSONCodec] = None,
+        compression_policy: Optional[CompressionPolicy] = None,
+        connect_timeout_secs: float = DEFAULT_CONNECT_TIMEOUT_SECS,
+        read_timeout_secs: float = DEFAULT_READ_TIMEOUT_SECS,
+        rate_limiter: Optional[RateLimiter] = None,
+        base_url: Optional[str] = None,
+        concurrency_governor: Optional[ConcurrencyGovernor] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        coalesce_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        statistics: Optional[Statistics] = None,
+        request_hooks: Optional[RequestHooks] = None,
+        parse_dates: str = PARSE_DATES_EAGER,
+        transport: Optional[Transport] = None,
+        http2: bool = False,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+    ) -> None:
+        super().__init__(
+            token=token,
+            max_retries=max_retries,
+            min_delay_between_retries_millis=min_delay_between_retries_millis,
+            json_codec=json_codec,
+            compression_policy=compression_policy,
+            connect_timeout_secs=connect_timeout_secs,
+            read_timeout_secs=read_timeout_secs,
+            rate_limiter=rate_limiter,
+            base_url=base_url,
+            concurrency_governor=concurrency_governor,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            hedging_policy=hedging_policy,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            statistics=statistics,
+            request_hooks=request_hooks,
+            parse_dates=parse_dates,
+        )
+
+        if transport is not None and http2:
+            raise ValueError('The http2 option applies only to the default transport, pass HTTPXTransport(http2=True) as the transport instead')
+        self.transport: Transport
+        if transport is not None:
+            self.transport = transport
+        elif http2:
+            # The concurrent requests share the HTTP/2 connections, so the connection pool options don't apply
+            self.transport = HTTPXTransport(http2=True)
+        else:
+            self.transport = RequestsTransport(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+
+        # The hedges of slow requests are sent from worker threads, so that the caller can take whichever response arrives first
+        self._hedging_executor = ThreadPoolExecutor(max_workers=pool_maxsize) if hedging_policy is not None else None
+
+        # The identical GET requests in flight, which the concurrent calls wait for instead of sending their own
+        self._coalesced_requests: Dict[str, 'Future[_CoalescedOutcome[requests.models.Response]]'] = {}
+        self._coalesced_requests_lock = threading.Lock()
+
+    @property
+    def requests_session(self) -> requests.Session:
+        # The session of the default transport, the other transports, including the HTTP/2 one, don't have any
+        if not isinstance(self.transport, RequestsTransport):
+            raise TypeError(f'The requests session is available only with RequestsTransport, this client uses {type(self.transport).__name__}')
+        return self.transport.session
+
+    def close(self) -> None:
+        if self._hedging_executor is not None:
+            # The hedged requests in flight can't be interrupted, the worker threads exit once they finish them
+            self._hedging_executor.shutdown(wait=False)
+        self.transport.close()
 
     def call(
         self,
@@ -44,34 +530,78 @@ class _HTTPClient:
         json: Optional[JSONSerializable] = None,
         stream: Optional[bool] = None,
         parse_response: Optional[bool] = True,
+        connect_timeout_secs: Optional[float] = None,
+        read_timeout_secs: Optional[float] = None,
+        cacheable: bool = False,
     ) -> requests.models.Response:
         request_params = self._parse_params(params)
-        requests_session = self.requests_session
+        transport = self.transport
 
-        if not headers:
-            headers = {}
-
-        if json and not data:
-            data = jsonlib.dumps(json, ensure_ascii=False).encode('utf-8')
-            headers['Content-Type'] = 'application/json'
+        headers, data, uncompressed_size_bytes = self._prepare_request_call(headers, json, data)
+        is_data_replayable = not isinstance(data, _StreamingBody) or data.is_replayable
+        endpoint_class = _get_endpoint_class(url, self.base_url)
+        is_hedgeable = self._is_hedgeable(method, stream)
+        self.stats.record_call(endpoint_class)
 
-        if isinstance(data, (str, bytes, bytearray)):
-            if isinstance(data, str):
-                data = data.encode('utf-8')
-            data = gzip.compress(data)
-            headers['Content-Encoding'] = 'gzip'
+        cache_key = self._get_cache_key(method, url, headers, request_params, stream, parse_response, cacheable)
+        expired_response = None
+        if cache_key is not None:
+            cached_response, expired_response = self._get_cached_responses(cache_key)
+            if cached_response is not None:
+                self.stats.record_cache_hit(endpoint_class)
+                return self._copy_response(cast(requests.models.Response, cached_response), parse_response)
+            if expired_response is not None:
+                headers = {**headers, **_get_conditional_headers(expired_response)}
+        is_revalidation = expired_response is not None
+        # Why the previous attempt failed, for the statistics of the retries
+        retry_reason = NETWORK_ERROR
 
         def _make_request(bail: Callable, attempt: int) -> requests.models.Response:  # type: ignore[return]
+            nonlocal retry_reason
+            if attempt > 1:
+                self.stats.record_retry(endpoint_class, reason=retry_reason)
+            request_event = self._create_request_event(method, url, endpoint_class, attempt, retry_reason if attempt > 1 else None)
+
             try:
-                response = requests_session.request(
+                rate_limit_wait_secs = self._get_rate_limit_wait_secs(endpoint_class)
+                if rate_limit_wait_secs > 0:
+                    time.sleep(rate_limit_wait_secs)
+
+                # Computed for each attempt, so that the retries don't run over the deadline
+                timeouts = self._get_timeouts(connect_timeout_secs, read_timeout_secs)
+                self._before_request(request_event)
+
+                def send_request() -> requests.models.Response:
+                    return transport.send(
+                        method,
+                        url,
+                        headers={**self.headers, **headers},
+                        params=request_params,
+                        data=data,
+                        stream=stream or False,
+                        timeout=timeouts,
+                    )
+
+                hedge_delay_secs = self._get_hedge_delay_secs(endpoint_class) if is_hedgeable else None
+                started_at = time.monotonic()
+                try:
+                    response = send_request() if hedge_delay_secs is None else self._send_hedged(send_request, hedge_delay_secs)
+                # Any error of the transport ends the request, not only the ones which are retried
+                except Exception as e:
+                    self._on_request_error(endpoint_class, e, time.monotonic() - started_at, request_event)
+                    raise
+                self._on_response(
                     method,
-                    url,
-                    headers=headers,
-                    params=request_params,
-                    data=data,
-                    stream=stream,
+                    endpoint_class,
+                    response,
+                    time.monotonic() - started_at,
+                    is_hedgeable,
+                    self._get_request_body_sizes(data, uncompressed_size_bytes),
+                    self._get_response_body_sizes(response, stream),
+                    request_event,
                 )
-                if response.status_code < 300:
+
+                if response.status_code < 300 or (is_revalidation and response.status_code == HTTPStatus.NOT_MODIFIED):
                     if parse_response:
                         _maybe_parsed_body = self._maybe_parse_response(response)
                     elif stream:
@@ -83,54 +613,419 @@ class _HTTPClient:
                     return response
 
             except (ConnectionError, Timeout, InvalidResponseBodyError) as e:
+                retry_reason = INVALID_RESPONSE_BODY if isinstance(e, InvalidResponseBodyError) else NETWORK_ERROR
+                if not is_data_replayable:
+                    bail(e)
                 raise e
             except Exception as e:
                 bail(e)
 
+            # Whether the error is retried is up to the retry policy, unless the body of the request can't be sent again
+            retry_reason = str(response.status_code)
             api_error = ApifyApiError(response, attempt)
-            if response.status_code == HTTPStatus.TOO_MANY_REQUESTS or response.status_code >= 500:
+            if is_data_replayable:
                 raise api_error
             else:
                 bail(api_error)
 
-        return _retry_with_exp_backoff(
-            _make_request,
-            max_retries=self.max_retries,
-            backoff_base_millis=self.min_delay_between_retries_millis,
-            backoff_factor=DEFAULT_BACKOFF_EXPONENTIAL_FACTOR,
-            random_factor=DEFAULT_BACKOFF_RANDOM_FACTOR,
-        )
+        def send() -> requests.models.Response:
+            return self.retry_policy.call(_make_request, method=method)
+
+        try:
+            coalescing_key = self._get_coalescing_key(method, url, headers, request_params, stream, parse_response)
+            if coalescing_key is None:
+                response = send()
+            else:
+                wait_secs = self._get_coalesced_wait_secs(connect_timeout_secs, read_timeout_secs)
+                response = self._send_coalesced(coalescing_key, endpoint_class, send, parse_response, wait_secs)
+        finally:
+            self._invalidate_cache(method, url)
+
+        if cache_key is not None:
+            return self._cache_response(cache_key, url, endpoint_class, response, expired_response, parse_response)
+        return response
+
+    def _send_coalesced(
+        self,
+        coalescing_key: str,
+        endpoint_class: str,
+        send: Callable[[], requests.models.Response],
+        parse_response: Optional[bool],
+        wait_secs: Tuple[float, bool],
+    ) -> requests.models.Response:
+        with self._coalesced_requests_lock:
+            coalesced_request = self._coalesced_requests.get(coalescing_key)
+            is_shared_by_this_call = coalesced_request is None
+            if coalesced_request is None:
+                coalesced_request = self._coalesced_requests[coalescing_key] = Future()
+
+        if is_shared_by_this_call:
+            return self._send_shared(coalescing_key, coalesced_request, send)
+
+        timeout_secs, is_limited_by_deadline = wait_secs
+        try:
+            response, error = coalesced_request.result(timeout=timeout_secs)
+        except FutureTimeoutError:
+            if is_limited_by_deadline:
+                raise DeadlineExceededError()
+            raise ReadTimeout('The identical request in flight, which this call waited for, took longer than the timeouts of the call')
+        if response is None and error is None:
+            return send()
+
+        self.stats.record_coalesced_call(endpoint_class)
+        if error is not None:
+            raise error
+        return self._copy_response(cast(requests.models.Response, response), parse_response)
 
     @staticmethod
-    def _maybe_parse_response(response: requests.models.Response) -> Any:
-        if response.status_code == HTTPStatus.NO_CONTENT:
-            return None
+    def _get_response_body_sizes(response: requests.models.Response, stream: Optional[bool]) -> Tuple[int, int]:
+        # The body of a streamed response is read only later, by the caller
+        if stream:
+            return (0, 0)
+        decompressed_size_bytes = len(response.content or b'')
+        # urllib3 counts the bytes read from the connection, before the decompression
+        tell = getattr(response.raw, 'tell', None)
+        return (tell() if tell is not None else decompressed_size_bytes, decompressed_size_bytes)
 
-        content_type = ''
-        if 'content-type' in response.headers:
-            content_type = response.headers['content-type'].split(';')[0].strip()
+    def _send_shared(
+        self,
+        coalescing_key: str,
+        coalesced_request: Future,
+        send: Callable[[], requests.models.Response],
+    ) -> requests.models.Response:
+        response: Optional[requests.models.Response] = None
+        error: Optional[BaseException] = None
+        try:
+            response = send()
+            return response
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            with self._coalesced_requests_lock:
+                del self._coalesced_requests[coalescing_key]
+            coalesced_request.set_result(self._get_coalesced_outcome(response, error))
+
+    def _send_hedged(self, send_request: Callable[[], requests.models.Response], hedge_delay_secs: float) -> requests.models.Response:
+        executor = cast(ThreadPoolExecutor, self._hedging_executor)
+        hedging_policy = cast(HedgingPolicy, self.hedging_policy)
+
+        # The primary request starts right away in a thread of its own, so that it never waits in the queue of the shared
+        # worker threads, which would limit the concurrent requests of the client and count the wait in its latency.
+        # It can't be sent from the caller's thread, which then couldn't take the response of the hedge when it arrives first.
+        # The threads send the requests in the context of the caller, so that they respect its deadline
+        context = contextvars.copy_context()
+        primary_request: 'Future[requests.models.Response]' = Future()
+        # Marked as running, so that it can't be cancelled like a queued hedge
+        primary_request.set_running_or_notify_cancel()
+
+        def send_primary_request() -> None:
+            try:
+                primary_request.set_result(context.run(send_request))
+            except Exception as e:
+                primary_request.set_exception(e)
+
+        threading.Thread(target=send_primary_request, daemon=True).start()
+        done, _ = wait([primary_request], timeout=hedge_delay_secs)
+        if done or not hedging_policy.take_hedge():
+            return primary_request.result()
+
+        pending: Set[Future] = {primary_request, executor.submit(contextvars.copy_context().run, send_request)}
+        first_error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for request in done:
+                if request.exception() is None:
+                    # A request which is already being sent can't be interrupted, its response is dropped when it arrives
+                    for pending_request in pending:
+                        pending_request.cancel()
+                    return request.result()
+                first_error = first_error or request.exception()
+
+        raise cast(BaseException, first_error)
+
+
+class _HTTPClientAsync(_BaseHTTPClient):
+    def __init__(
+        self,
+        *,
+        token: Optional[str] = None,
+        max_retries: int = 8,
+        min_delay_between_retries_millis: int = 500,
+        json_codec: Optional[JSONCodec] = None,
+        compression_policy: Optional[CompressionPolicy] = None,
+        connect_timeout_secs: float = DEFAULT_CONNECT_TIMEOUT_SECS,
+        read_timeout_secs: float = DEFAULT_READ_TIMEOUT_SECS,
+        rate_limiter: Optional[RateLimiter] = None,
+        base_url: Optional[str] = None,
+        concurrency_governor: Optional[ConcurrencyGovernor] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        coalesce_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        statistics: Optional[Statistics] = None,
+        request_hooks: Optional[RequestHooks] = None,
+        parse_dates: str = PARSE_DATES_EAGER,
+        transport: Optional[AsyncTransport] = None,
+        http2: bool = False,
+    ) -> None:
+        super().__init__(
+            token=token,
+            max_retries=max_retries,
+            min_delay_between_retries_millis=min_delay_between_retries_millis,
+            json_codec=json_codec,
+            compression_policy=compression_policy,
+            connect_timeout_secs=connect_timeout_secs,
+            read_timeout_secs=read_timeout_secs,
+            rate_limiter=rate_limiter,
+            base_url=base_url,
+            concurrency_governor=concurrency_governor,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            hedging_policy=hedging_policy,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            statistics=statistics,
+            request_hooks=request_hooks,
+            parse_dates=parse_dates,
+        )
+
+        if transport is not None and http2:
+            raise ValueError('The http2 option applies only to the default transport, pass HTTPXAsyncTransport(http2=True) as the transport instead')
+        self.transport = transport or HTTPXAsyncTransport(http2=http2)
+
+        # The identical GET requests in flight, which the concurrent calls wait for instead of sending their own
+        self._coalesced_requests: Dict[str, 'asyncio.Future[_CoalescedOutcome[httpx.Response]]'] = {}
+
+    @property
+    def httpx_async_client(self) -> httpx.AsyncClient:
+        # The client of the default transport
+        return self._get_httpx_async_transport().client
+
+    @httpx_async_client.setter
+    def httpx_async_client(self, httpx_async_client: httpx.AsyncClient) -> None:
+        self._get_httpx_async_transport().client = httpx_async_client
+
+    def _get_httpx_async_transport(self) -> HTTPXAsyncTransport:
+        if not isinstance(self.transport, HTTPXAsyncTransport):
+            raise TypeError(f'The httpx client is available only with HTTPXAsyncTransport, this client uses {type(self.transport).__name__}')
+        return self.transport
+
+    async def call(
+        self,
+        *,
+        method: str,
+        url: str,
+        headers: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        data: Optional[Any] = None,
+        json: Optional[JSONSerializable] = None,
+        stream: Optional[bool] = None,
+        parse_response: Optional[bool] = True,
+        connect_timeout_secs: Optional[float] = None,
+        read_timeout_secs: Optional[float] = None,
+        cacheable: bool = False,
+    ) -> httpx.Response:
+        request_params = self._parse_params(params)
+        transport = self.transport
+
+        headers, data, uncompressed_size_bytes = self._prepare_request_call(headers, json, data)
+        is_data_replayable = not isinstance(data, _StreamingBody) or data.is_replayable
+        endpoint_class = _get_endpoint_class(url, self.base_url)
+        is_hedgeable = self._is_hedgeable(method, stream)
+        self.stats.record_call(endpoint_class)
+
+        cache_key = self._get_cache_key(method, url, headers, request_params, stream, parse_response, cacheable)
+        expired_response = None
+        if cache_key is not None:
+            cached_response, expired_response = self._get_cached_responses(cache_key)
+            if cached_response is not None:
+                self.stats.record_cache_hit(endpoint_class)
+                return self._copy_response(cast(httpx.Response, cached_response), parse_response)
+            if expired_response is not None:
+                headers = {**headers, **_get_conditional_headers(expired_response)}
+        is_revalidation = expired_response is not None
+        # Why the previous attempt failed, for the statistics of the retries
+        retry_reason = NETWORK_ERROR
+
+        # `httpx.AsyncClient` can't send synchronous file-like objects, so we read them in advance
+        if isinstance(data, io.IOBase):
+            data = data.read()
+
+        async def _make_request(bail: Callable, attempt: int) -> httpx.Response:  # type: ignore[return]
+            nonlocal retry_reason
+            if attempt > 1:
+                self.stats.record_retry(endpoint_class, reason=retry_reason)
+            request_event = self._create_request_event(method, url, endpoint_class, attempt, retry_reason if attempt > 1 else None)
+
+            try:
+                rate_limit_wait_secs = self._get_rate_limit_wait_secs(endpoint_class)
+                if rate_limit_wait_secs > 0:
+                    await asyncio.sleep(rate_limit_wait_secs)
+
+                # Computed for each attempt, so that the retries don't run over the deadline
+                timeouts = self._get_timeouts(connect_timeout_secs, read_timeout_secs)
+                self._before_request(request_event)
+
+                def send_request() -> Awaitable[httpx.Response]:
+                    return transport.send(
+                        method,
+                        url,
+                        headers={**self.headers, **headers},
+                        params=request_params,
+                        content=data.aiter() if isinstance(data, _StreamingBody) else data,
+                        stream=stream or False,
+                        timeout=timeouts,
+                    )
+
+                hedge_delay_secs = self._get_hedge_delay_secs(endpoint_class) if is_hedgeable else None
+                started_at = time.monotonic()
+                try:
+                    if hedge_delay_secs is None:
+                        response = await send_request()
+                    else:
+                        response = await self._send_hedged(send_request, hedge_delay_secs)
+                # Any error of the transport ends the request, not only the ones which are retried
+                except Exception as e:
+                    self._on_request_error(endpoint_class, e, time.monotonic() - started_at, request_event)
+                    raise
+                self._on_response(
+                    method,
+                    endpoint_class,
+                    response,
+                    time.monotonic() - started_at,
+                    is_hedgeable,
+                    self._get_request_body_sizes(data, uncompressed_size_bytes),
+                    self._get_response_body_sizes(response, stream),
+                    request_event,
+                )
+
+                if response.status_code < 300 or (is_revalidation and response.status_code == HTTPStatus.NOT_MODIFIED):
+                    if parse_response:
+                        if stream:
+                            await response.aread()
+                        _maybe_parsed_body = self._maybe_parse_response(response)
+                    elif stream:
+                        _maybe_parsed_body = response
+                    else:
+                        _maybe_parsed_body = response.content
+                    setattr(response, '_maybe_parsed_body', _maybe_parsed_body)
+                    return response
+
+                # The error needs the body of the response, which is not loaded yet when streaming
+                if stream:
+                    await response.aread()
+
+            except (httpx.TransportError, InvalidResponseBodyError) as e:
+                retry_reason = INVALID_RESPONSE_BODY if isinstance(e, InvalidResponseBodyError) else NETWORK_ERROR
+                if not is_data_replayable:
+                    bail(e)
+                raise e
+            except Exception as e:
+                bail(e)
+
+            # Whether the error is retried is up to the retry policy, unless the body of the request can't be sent again
+            retry_reason = str(response.status_code)
+            api_error = ApifyApiError(response, attempt)
+            if is_data_replayable:
+                raise api_error
+            else:
+                bail(api_error)
+
+        async def send() -> httpx.Response:
+            return await self.retry_policy.call_async(_make_request, method=method)
 
         try:
-            if _is_content_type_json(content_type):
-                return response.json()
-            elif _is_content_type_xml(content_type) or _is_content_type_text(content_type):
-                return response.text
+            coalescing_key = self._get_coalescing_key(method, url, headers, request_params, stream, parse_response)
+            if coalescing_key is None:
+                response = await send()
             else:
-                return response.content
-        except ValueError as err:
-            raise InvalidResponseBodyError(response) from err
+                wait_secs = self._get_coalesced_wait_secs(connect_timeout_secs, read_timeout_secs)
+                response = await self._send_coalesced(coalescing_key, endpoint_class, send, parse_response, wait_secs)
+        finally:
+            self._invalidate_cache(method, url)
+
+        if cache_key is not None:
+            return self._cache_response(cache_key, url, endpoint_class, response, expired_response, parse_response)
+        return response
+
+    async def _send_coalesced(
+        self,
+        coalescing_key: str,
+        endpoint_class: str,
+        send: Callable[[], Awaitable[httpx.Response]],
+        parse_response: Optional[bool],
+        wait_secs: Tuple[float, bool],
+    ) -> httpx.Response:
+        coalesced_request = self._coalesced_requests.get(coalescing_key)
+        if coalesced_request is None:
+            return await self._send_shared(coalescing_key, send)
+
+        timeout_secs, is_limited_by_deadline = wait_secs
+        try:
+            # The shield keeps the shared request going when this call is cancelled or runs out of time
+            response, error = await asyncio.wait_for(asyncio.shield(coalesced_request), timeout=timeout_secs)
+        except asyncio.TimeoutError:
+            if is_limited_by_deadline:
+                raise DeadlineExceededError()
+            raise httpx.ReadTimeout('The identical request in flight, which this call waited for, took longer than the timeouts of the call')
+        if response is None and error is None:
+            return await send()
+
+        self.stats.record_coalesced_call(endpoint_class)
+        if error is not None:
+            raise error
+        return self._copy_response(cast(httpx.Response, response), parse_response)
 
     @staticmethod
-    def _parse_params(params: Optional[Dict]) -> Optional[Dict]:
-        if params is None:
-            return None
+    def _get_response_body_sizes(response: httpx.Response, stream: Optional[bool]) -> Tuple[int, int]:
+        # The body of a streamed response is read only later, by the caller
+        if stream:
+            return (0, 0)
+        return (response.num_bytes_downloaded, len(response.content))
 
-        parsed_params = {}
-        for key, value in params.items():
-            # Our API needs to have boolean parameters passed as 0 or 1, therefore we have to replace them
-            if isinstance(value, bool):
-                parsed_params[key] = int(value)
-            else:
-                parsed_params[key] = value
+    async def _send_shared(self, coalescing_key: str, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        coalesced_request = asyncio.get_running_loop().create_future()
+        self._coalesced_requests[coalescing_key] = coalesced_request
+        response: Optional[httpx.Response] = None
+        error: Optional[BaseException] = None
+        try:
+            response = await send()
+            return response
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            del self._coalesced_requests[coalescing_key]
+            coalesced_request.set_result(self._get_coalesced_outcome(response, error))
 
-        return parsed_params
+    async def _send_hedged(self, send_request: Callable[[], Awaitable[httpx.Response]], hedge_delay_secs: float) -> httpx.Response:
+        hedging_policy = cast(HedgingPolicy, self.hedging_policy)
+
+        primary_request = asyncio.ensure_future(send_request())
+        requests_tasks = {primary_request}
+        try:
+            done, _ = await asyncio.wait(requests_tasks, timeout=hedge_delay_secs)
+            if done or not hedging_policy.take_hedge():
+                return await primary_request
+
+            requests_tasks.add(asyncio.ensure_future(send_request()))
+            pending = set(requests_tasks)
+            first_error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for request in done:
+                    if request.exception() is None:
+                        return request.result()
+                    first_error = first_error or request.exception()
+
+            raise cast(BaseException, first_error)
+        finally:
+            # The slower request is cancelled, and so are both of them when the call itself is cancelled
+            for request in requests_tasks:
+                if not request.done():
+                    request.cancel()
+
+    async def close(self) -> None:
+        await self.transport.close()
@@ -1,21 +1,49 @@
 import base64
+import codecs
+import contextvars
 import io
 import json
-import random
 import re
 import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from http import HTTPStatus
-from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, cast
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple, cast
+from urllib.parse import urlparse
 
 from ._errors import ApifyApiError
+from .compression import CompressionPolicy
+from .json_codec import JSONCodec, default_json_codec
 
 PARSE_DATE_FIELDS_MAX_DEPTH = 3
 PARSE_DATE_FIELDS_KEY_SUFFIX = 'At'
+# The format in which the API sends the dates, e.g. `2016-11-14T11:10:52.425Z`
+API_DATE_FORMAT = '%Y-%m-%dT%H:%M:%S.%fZ'
+_API_DATE_REGEX = re.compile(r'\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{3}Z', flags=re.ASCII)
+
+# When the date fields of the responses are converted to datetimes, right away, when they are first accessed, or never
+PARSE_DATES_EAGER = 'eager'
+PARSE_DATES_LAZY = 'lazy'
+PARSE_DATES_OFF = 'off'
+PARSE_DATES_MODES = (PARSE_DATES_EAGER, PARSE_DATES_LAZY, PARSE_DATES_OFF)
 
 NOT_FOUND_TYPE = 'record-not-found'
 NOT_FOUND_ON_S3 = '<Code>NoSuchKey</Code>'
 
+JSON_WHITESPACE = ' \t\n\r'
+# Size of the chunks in which lazily parsed JSON responses are read
+JSON_STREAM_CHUNK_SIZE_BYTES = 64 * 1024
+# How many already parsed characters can stay in the buffer of the incremental JSON reader before they are dropped
+JSON_READER_MAX_CONSUMED_CHARS = 1024 * 1024
+# Size of the chunks in which streamed request bodies are generated
+REQUEST_BODY_STREAM_CHUNK_SIZE_BYTES = 64 * 1024
+
+# Collections of sub-resources whose paths are followed by the IDs of the sub-resources, e.g. `records/{key}`
+URL_TEMPLATE_ID_COLLECTIONS = {'builds', 'env-vars', 'records', 'requests', 'runs', 'versions'}
+# Segments of the paths in these collections which are not IDs, e.g. `runs/last` or `requests/batch`
+URL_TEMPLATE_STATIC_SEGMENTS = {'batch', 'default', 'last', 'unlock'}
+
 
 def _to_safe_id(id: str) -> str:
     # Identificators of resources in the API are either in the format `resource_id` or `username/resource_id`.
@@ -24,7 +52,11 @@ def _to_safe_id(id: str) -> str:
     return id.replace('/', '~')
 
 
-def _parse_date_fields(data: Dict) -> Dict:
+def _parse_date_fields(data: Dict, mode: str = PARSE_DATES_EAGER) -> Dict:
+    if mode == PARSE_DATES_LAZY:
+        return cast(Dict, _wrap_lazily(data, PARSE_DATE_FIELDS_MAX_DEPTH))
+    if mode == PARSE_DATES_OFF:
+        return data
     return cast(Dict, _parse_date_fields_internal(data))
 
 
@@ -36,22 +68,156 @@ def _parse_date_fields_internal(data: object, max_depth: int = PARSE_DATE_FIELDS
         return [_parse_date_fields_internal(item, max_depth - 1) for item in data]
 
     if isinstance(data, dict):
-        def parse(key: str, value: object) -> object:
-            parsed_value = value
-            if key.endswith(PARSE_DATE_FIELDS_KEY_SUFFIX) and isinstance(value, str):
-                try:
-                    parsed_value = datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%fZ').replace(tzinfo=timezone.utc)
-                except ValueError:
-                    pass
-            else:
-                parsed_value = _parse_date_fields_internal(value, max_depth - 1)
-            return parsed_value
+        # Only the strings and the nested containers need any work, so the other values are copied over without a function call
+        parsed = {}
+        for key, value in data.items():
+            if isinstance(value, str):
+                if key.endswith(PARSE_DATE_FIELDS_KEY_SUFFIX):
+                    value = _parse_date(value)
+            elif max_depth > 0 and isinstance(value, (dict, list)):
+                value = _parse_date_fields_internal(value, max_depth - 1)
+            parsed[key] = value
+        return parsed
+
+    return data
 
-        return {key: parse(key, value) for (key, value) in data.items()}
 
+def _parse_date_fields_of_list_items(items: Iterable, mode: str = PARSE_DATES_EAGER) -> Iterator:
+    # Items of a list response are two levels deeper than the response data, so they are parsed with the depth limit reduced by two
+    if mode == PARSE_DATES_OFF:
+        yield from items
+        return
+    for item in items:
+        if mode == PARSE_DATES_LAZY:
+            yield _wrap_lazily(item, PARSE_DATE_FIELDS_MAX_DEPTH - 2)
+        else:
+            yield _parse_date_fields_internal(item, PARSE_DATE_FIELDS_MAX_DEPTH - 2)
+
+
+def _parse_date(value: str) -> object:
+    # The dates from the API always have the same format, which `datetime.fromisoformat` parses many times faster than `strptime`,
+    # though before Python 3.11, it doesn't understand the `Z` suffix, so it's replaced with the UTC offset
+    if _API_DATE_REGEX.fullmatch(value):
+        try:
+            return datetime.fromisoformat(value[:-1] + '+00:00')
+        except ValueError:
+            pass
+    # The other values are parsed the same way as before, in case the API sent a date with a different precision
+    try:
+        return datetime.strptime(value, API_DATE_FORMAT).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return value
+
+
+def _wrap_lazily(data: object, max_depth: int) -> object:
+    if max_depth < 0:
+        return data
+    if isinstance(data, list):
+        return [_wrap_lazily(item, max_depth - 1) for item in data]
+    if isinstance(data, dict):
+        return _LazyDateFieldsDict(data, max_depth)
     return data
 
 
+class _LazyDateFieldsDict(dict):
+    # A dict whose date fields are converted to datetimes only when they are accessed, which saves parsing the dates
+    # which are never read, e.g. in large pages of list results. The nested dicts and lists are wrapped when accessed too.
+    # The methods which read all the values at once, like `items()` or the comparison, convert all of them first.
+
+    def __init__(self, data: Dict, max_depth: int) -> None:
+        super().__init__(data)
+        self._max_depth = max_depth
+        self._pending_keys = set(data)
+
+    def _convert(self, key: Any) -> None:
+        if key in self._pending_keys:
+            self._pending_keys.discard(key)
+            value = dict.__getitem__(self, key)
+            if isinstance(key, str) and key.endswith(PARSE_DATE_FIELDS_KEY_SUFFIX) and isinstance(value, str):
+                value = _parse_date(value)
+            else:
+                value = _wrap_lazily(value, self._max_depth - 1)
+            dict.__setitem__(self, key, value)
+
+    def _convert_all(self) -> None:
+        for key in list(self._pending_keys):
+            self._convert(key)
+
+    def __getitem__(self, key: Any) -> Any:
+        self._convert(key)
+        return dict.__getitem__(self, key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        self._convert(key)
+        return dict.get(self, key, default)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._pending_keys.discard(key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        self._pending_keys.discard(key)
+        dict.__delitem__(self, key)
+
+    def __iter__(self) -> Iterator:
+        # Overriding the iteration makes `dict(...)` and `{**...}` read the values through `__getitem__`, and so convert them
+        return dict.__iter__(self)
+
+    def __eq__(self, other: object) -> bool:
+        self._convert_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __repr__(self) -> str:
+        self._convert_all()
+        return dict.__repr__(self)
+
+    def __reduce__(self) -> Any:
+        self._convert_all()
+        return (dict, (dict(self.items()),))
+
+    def items(self) -> Any:
+        self._convert_all()
+        return dict.items(self)
+
+    def values(self) -> Any:
+        self._convert_all()
+        return dict.values(self)
+
+    def copy(self) -> Dict:
+        self._convert_all()
+        return dict(dict.items(self))
+
+    def pop(self, key: Any, *args: Any) -> Any:
+        self._convert(key)
+        return dict.pop(self, key, *args)
+
+    def popitem(self) -> Any:
+        self._convert_all()
+        return dict.popitem(self)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        self._convert(key)
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        other = dict(*args, **kwargs)
+        self._pending_keys.difference_update(other)
+        dict.update(self, other)
+
+    def clear(self) -> None:
+        self._pending_keys.clear()
+        dict.clear(self)
+
+
+def _get_parsed_body(response: Any) -> Any:
+    # The _HTTPClient parses the response body right after receiving it, to be able to retry on invalid bodies,
+    # so we reuse the parsed body instead of decoding the JSON again with `response.json()`
+    return response._maybe_parsed_body
+
+
 def _pluck_data(parsed_response: Any) -> Dict:
     if isinstance(parsed_response, dict) and 'data' in parsed_response:
         return cast(Dict, parsed_response['data'])
@@ -85,43 +251,49 @@ def _is_file_or_bytes(value: Any) -> bool:
     return isinstance(value, (bytes, bytearray, io.IOBase))
 
 
-T = TypeVar('T')
-BailType = Callable[[Exception], None]
-
+# The deadline of the API calls in the current context, as a value of `time.monotonic()`.
+# Context variables are inherited by asyncio tasks, and copied to other threads explicitly when needed.
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar('apify_client_deadline', default=None)
+# The connect and read timeouts overriding the default ones of the client in the current context
+_timeouts_override: contextvars.ContextVar[Tuple[Optional[float], Optional[float]]] = contextvars.ContextVar(
+    'apify_client_timeouts_override',
+    default=(None, None),
+)
 
-def _retry_with_exp_backoff(
-    func: Callable[[BailType, int], T],
-    *,
-    max_retries: int = 8,
-    backoff_base_millis: int = 500,
-    backoff_factor: float = 2,
-    random_factor: float = 1,
-) -> T:
 
-    random_factor = min(max(0, random_factor), 1)
-    backoff_factor = min(max(1, backoff_factor), 10)
-    swallow = True
+@contextmanager
+def _deadline_scope(secs: float) -> Iterator[None]:
+    deadline = time.monotonic() + secs
+    outer_deadline = _deadline.get()
+    # A nested deadline can't extend the outer one
+    if outer_deadline is not None:
+        deadline = min(deadline, outer_deadline)
 
-    def bail(exception: Exception) -> None:
-        nonlocal swallow
-        swallow = False
-        raise exception
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
 
-    for attempt in range(1, max_retries + 1):
-        try:
-            return func(bail, attempt)
-        except Exception as e:
-            if not swallow:
-                raise e
 
-        random_sleep_factor = random.uniform(1, 1 + random_factor)
-        backoff_base_secs = backoff_base_millis / 1000
-        backoff_exp_factor = backoff_factor ** (attempt - 1)
+@contextmanager
+def _timeouts_scope(connect_timeout_secs: Optional[float], read_timeout_secs: Optional[float]) -> Iterator[None]:
+    outer_connect_timeout_secs, outer_read_timeout_secs = _timeouts_override.get()
+    token = _timeouts_override.set((
+        connect_timeout_secs if connect_timeout_secs is not None else outer_connect_timeout_secs,
+        read_timeout_secs if read_timeout_secs is not None else outer_read_timeout_secs,
+    ))
+    try:
+        yield
+    finally:
+        _timeouts_override.reset(token)
 
-        sleep_time_secs = random_sleep_factor * backoff_base_secs * backoff_exp_factor
-        time.sleep(sleep_time_secs)
 
-    return func(bail, max_retries + 1)
+def _get_remaining_secs_to_deadline() -> Optional[float]:
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
 
 
 def _catch_not_found_or_throw(exc: ApifyApiError) -> None:
@@ -148,6 +320,31 @@ def _encode_webhook_list_to_base64(webhooks: List[Dict]) -> bytes:
     return base64.b64encode(json.dumps(data).encode("utf-8"))
 
 
+def _get_endpoint_class(url: str, base_url: Optional[str]) -> str:
+    """Return the class of an API endpoint, which is the type of the resource it accesses.
+
+    >>> _get_endpoint_class('https://api.apify.com/v2/datasets/someId/items', 'https://api.apify.com/v2')
+    'datasets'
+    """
+    path = url[len(base_url):] if base_url and url.startswith(base_url) else urlparse(url).path
+    return path.strip('/').split('/')[0]
+
+
+def _get_url_template(url: str, base_url: Optional[str]) -> str:
+    """Return the path of an API endpoint, with the IDs of the resources replaced by placeholders.
+
+    >>> _get_url_template('https://api.apify.com/v2/acts/john~my-actor/versions/0.1', 'https://api.apify.com/v2')
+    'acts/{id}/versions/{id}'
+    """
+    path = url[len(base_url):] if base_url and url.startswith(base_url) else urlparse(url).path
+    segments = path.strip('/').split('/')
+    for index in range(1, len(segments)):
+        # Each top-level resource is followed by its ID, and so are the collections of the sub-resources which have IDs
+        if index == 1 or (segments[index - 1] in URL_TEMPLATE_ID_COLLECTIONS and segments[index] not in URL_TEMPLATE_STATIC_SEGMENTS):
+            segments[index] = '{id}'
+    return '/'.join(segments)
+
+
 def _filter_out_none_values(dictionary: Dict) -> Dict:
     """Return copy of the dictionary, omitting all keys for which values are None.
 
@@ -188,7 +385,11 @@ def _snake_case_to_camel_case(str_snake_case: str) -> str:
     ])
 
 
-def _encode_key_value_store_record_value(value: Any, content_type: Optional[str] = None) -> Tuple[Any, str]:
+def _encode_key_value_store_record_value(
+    value: Any,
+    content_type: Optional[str] = None,
+    json_codec: Optional[JSONCodec] = None,
+) -> Tuple[Any, str]:
     if not content_type:
         if _is_file_or_bytes(value):
             content_type = 'application/octet-stream'
@@ -198,29 +399,256 @@ def _encode_key_value_store_record_value(value: Any, content_type: Optional[str]
             content_type = 'application/json; charset=utf-8'
 
     if 'application/json' in content_type and not _is_file_or_bytes(value) and not isinstance(value, str):
-        value = json.dumps(value, ensure_ascii=False, indent=2).encode("utf-8")
+        value = (json_codec or default_json_codec()).dumps(value)
 
     return (value, content_type)
 
 
+class _StreamingBody(ABC):
+    """A request body which is generated in chunks while it is being sent."""
+
+    # Bodies read from iterators, generators or unseekable files can be sent only once, so their requests can't be retried
+    is_replayable = True
+    # The size of the body, if it is known in advance
+    size_bytes: Optional[int] = None
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[bytes]:
+        """Generate the chunks of the body, from the start, each time the body is sent."""
+
+    async def aiter(self) -> AsyncIterator[bytes]:
+        # `httpx.AsyncClient` accepts only asynchronous iterables as streamed request bodies
+        for chunk in self:
+            yield chunk
+
+
+class _JSONArrayBody(_StreamingBody):
+    """A request body which encodes items into a JSON array incrementally, while it is being sent."""
+
+    def __init__(self, items: Iterable, json_codec: JSONCodec, chunk_size: int = REQUEST_BODY_STREAM_CHUNK_SIZE_BYTES) -> None:
+        self._items = items
+        self._json_codec = json_codec
+        self._chunk_size = chunk_size
+        self.is_replayable = iter(items) is not items
+
+    def __iter__(self) -> Iterator[bytes]:
+        buffer = bytearray(b'[')
+        for index, item in enumerate(self._items):
+            if index > 0:
+                buffer += b','
+            buffer += self._json_codec.dumps(item)
+            if len(buffer) >= self._chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+
+        buffer += b']'
+        yield bytes(buffer)
+
+
+class _FileBody(_StreamingBody):
+    """A request body which reads a file-like object in chunks, while it is being sent."""
+
+    def __init__(self, file: Any, chunk_size: int = REQUEST_BODY_STREAM_CHUNK_SIZE_BYTES) -> None:
+        self._file = file
+        self._chunk_size = chunk_size
+        self.is_replayable = file.seekable()
+        if self.is_replayable:
+            self._start_position = file.tell()
+            self.size_bytes = file.seek(0, io.SEEK_END) - self._start_position
+            file.seek(self._start_position)
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self.is_replayable:
+            self._file.seek(self._start_position)
+        while True:
+            chunk = self._file.read(self._chunk_size)
+            if not chunk:
+                break
+            yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+
+
+class _GzippedBody(_StreamingBody):
+    """A request body which compresses another streamed body with gzip, while it is being sent."""
+
+    def __init__(self, body: _StreamingBody, compression_policy: CompressionPolicy) -> None:
+        self._body = body
+        self._compression_policy = compression_policy
+        self.is_replayable = body.is_replayable
+        # The sizes of the body before and after the compression, known once the body was sent whole
+        self.uncompressed_size_bytes = 0
+        self.compressed_size_bytes = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        self.uncompressed_size_bytes = 0
+        self.compressed_size_bytes = 0
+        for chunk in self._compression_policy.compress_stream(self._measure_uncompressed_chunks()):
+            self.compressed_size_bytes += len(chunk)
+            yield chunk
+
+    def _measure_uncompressed_chunks(self) -> Iterator[bytes]:
+        for chunk in self._body:
+            self.uncompressed_size_bytes += len(chunk)
+            yield chunk
+
+
+class _IncrementalJSONReader:
+    """Reads JSON values from a stream of byte chunks, without having to load the whole stream in memory."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._position = 0
+        self._exhausted = False
+
+    def _read_more(self, min_chars: int = 1) -> None:
+        # Drop the already parsed part of the buffer, so that it doesn't grow indefinitely
+        if self._position > JSON_READER_MAX_CONSUMED_CHARS:
+            self._buffer = self._buffer[self._position:]
+            self._position = 0
+
+        new_parts = []
+        new_chars = 0
+        while new_chars < min_chars:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                new_parts.append(self._text_decoder.decode(b'', final=True))
+                self._exhausted = True
+                break
+            new_part = self._text_decoder.decode(chunk)
+            new_parts.append(new_part)
+            new_chars += len(new_part)
+
+        self._buffer += ''.join(new_parts)
+
+    def _peek_char(self) -> str:
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in JSON_WHITESPACE:
+                self._position += 1
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if self._exhausted:
+                return ''
+            self._read_more()
+
+    def _expect_char(self, expected_chars: str) -> str:
+        char = self._peek_char()
+        if not char or char not in expected_chars:
+            raise ValueError(f'Expected one of "{expected_chars}", got "{char}" instead')
+        self._position += 1
+        return char
+
+    def read_value(self) -> Any:
+        """Read the next complete JSON value from the stream."""
+        self._peek_char()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._position)
+                # A value ending right at the end of the buffer might be a truncated number, so we make sure it's really complete
+                if end < len(self._buffer) or self._exhausted:
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                if self._exhausted:
+                    raise
+
+            # Read at least as much data as there is pending in the buffer, so that a large value isn't re-parsed too many times
+            self._read_more(max(len(self._buffer) - self._position, 1))
+
+    def read_object_until_key(self, key: str) -> Tuple[Dict, bool]:
+        """Read the members of the next JSON object up to the given key.
+
+        When the key is found, the reader stays positioned at its value.
+
+        Returns:
+            tuple: The members of the object preceding the key, and whether the key was found
+        """
+        members: Dict = {}
+        self._expect_char('{')
+        if self._peek_char() == '}':
+            self._position += 1
+            return (members, False)
+
+        while True:
+            member_key = self.read_value()
+            self._expect_char(':')
+            if member_key == key:
+                return (members, True)
+            members[member_key] = self.read_value()
+            if self._expect_char(',}') == '}':
+                return (members, False)
+
+    def iterate_array(self) -> Iterator:
+        """Iterate over the elements of the next JSON array, parsing each of them only once it has fully arrived."""
+        self._expect_char('[')
+        if self._peek_char() == ']':
+            self._position += 1
+            return
+
+        while True:
+            yield self.read_value()
+            if self._expect_char(',]') == ']':
+                return
+
+
 class ListPage:
-    """A single page of items returned from a list() method."""
+    """A single page of items returned from a list() method.
+
+    The page can also be created lazily from an iterator of items, which are parsed while the response is still arriving.
+    Such a page can be iterated over only once, and accessing its `items` reads all the remaining items in memory.
+    """
 
-    #: list: List of returned objects on this page
-    items: List
-    #: int: Count of the returned objects on this page
-    count: int
     #: int: The limit on the number of returned objects offset specified in the API call
     offset: int
     #: int: The offset of the first object specified in the API call
     limit: int
-    #: int: Total number of objects matching the API call criteria
-    total: int
 
     def __init__(self, data: Dict) -> None:
         """Initialize a ListPage instance from the API response data."""
-        self.items = data['items'] if 'items' in data else []
+        items = data['items'] if 'items' in data else []
+        self._items: Optional[List] = items if isinstance(items, list) else None
+        self._lazy_items: Optional[Iterator] = None if isinstance(items, list) else iter(items)
+        self._lazy_items_iterated = False
+
         self.offset = data['offset'] if 'offset' in data else 0
         self.limit = data['limit'] if 'limit' in data else 0
-        self.count = data['count'] if 'count' in data else len(self.items)
-        self.total = data['total'] if 'total' in data else self.offset + self.count
+        # Without them in the data, they are computed from the items, only when accessed, so that a lazy page stays lazy
+        self._count: Optional[int] = data['count'] if 'count' in data else None
+        self._total: Optional[int] = data['total'] if 'total' in data else None
+
+    @property
+    def count(self) -> int:
+        """int: Count of the returned objects on this page.
+
+        When the API didn't send it, for a lazily parsed page, accessing it reads all the remaining items in memory.
+        """
+        if self._count is None:
+            self._count = len(self.items)
+        return self._count
+
+    @property
+    def total(self) -> int:
+        """int: Total number of objects matching the API call criteria."""
+        if self._total is None:
+            self._total = self.offset + self.count
+        return self._total
+
+    @property
+    def items(self) -> List:
+        """list: List of returned objects on this page."""
+        if self._items is None:
+            if self._lazy_items_iterated:
+                raise ValueError('The items of this lazily parsed page were already iterated over')
+            self._items = list(cast(Iterator, self._lazy_items))
+            self._lazy_items = None
+        return self._items
+
+    def __iter__(self) -> Iterator:
+        """Iterate over the returned objects on this page, without loading all of them in memory if the page is lazily parsed."""
+        if self._items is not None:
+            return iter(self._items)
+        if self._lazy_items_iterated:
+            raise ValueError('The items of this lazily parsed page were already iterated over')
+        self._lazy_items_iterated = True
+        return cast(Iterator, self._lazy_items)
@@ -0,0 +1,49 @@
+"""Suite of all the benchmarks of the client, which writes their results to a JSON file.
+
+The results contain the versions of the client and of Python they were measured with, so that the files from several runs,
+e.g. before and after upgrading the client, can be compared to catch performance regressions.
+Run it with `python -m apify_client.benchmarks --output results.json`.
+"""
+
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict
+
+from .._version import __version__
+from . import connection_pooling, hot_paths, response_parsing
+
+BENCHMARKS: Dict[str, Callable[[], Any]] = {
+    'hot_paths': hot_paths.run_benchmark,
+    'response_parsing': response_parsing.run_benchmark,
+    'connection_pooling': connection_pooling.run_benchmark,
+}
+
+
+def main() -> None:
+    """Run the benchmarks from the command line and write their results to a JSON file."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--output', default='benchmark-results.json', help='The path of the JSON file to write the results to')
+    parser.add_argument('--benchmarks', nargs='+', choices=list(BENCHMARKS), default=list(BENCHMARKS), help='The benchmarks to run')
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {
+        'client_version': __version__,
+        'python_version': platform.python_version(),
+        'platform': sys.platform,
+        'started_at': datetime.now(timezone.utc).isoformat(),
+        'benchmarks': {},
+    }
+    for name in args.benchmarks:
+        print(f'Running the {name} benchmark...', file=sys.stderr)
+        results['benchmarks'][name] = BENCHMARKS[name]()
+
+    with open(args.output, 'w', encoding='utf-8') as output_file:
+        json.dump(results, output_file, indent=2)
+    print(f'The results were written to {args.output}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
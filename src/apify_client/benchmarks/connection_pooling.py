@@ -0,0 +1,137 @@
+"""Benchmark of sharing one client among many threads, with connection pools of different sizes.
+
+Runs a local keep-alive API server, calls it from many threads through one shared `ApifyClient`
+and counts how many connections the client had to open. Against the real API, every new connection
+costs a TCP and a TLS handshake, which the keep-alive connections in a big enough pool avoid.
+Run it with `python -m apify_client.benchmarks.connection_pooling`.
+"""
+
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Sequence
+
+from ..client import ApifyClient
+
+RESPONSE_BODY = json.dumps({'data': {'id': 'some-dataset-id', 'itemCount': 0}}).encode('utf-8')
+
+
+class _CountingServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latency_secs: float) -> None:
+        super().__init__(('127.0.0.1', 0), _KeepAliveRequestHandler)
+        self.latency_secs = latency_secs
+        self.opened_connections_count = 0
+        self._lock = threading.Lock()
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        with self._lock:
+            self.opened_connections_count += 1
+        super().process_request(request, client_address)
+
+
+class _KeepAliveRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:  # noqa: N802 (the name is required by BaseHTTPRequestHandler)
+        # Simulates the latency of the network and of the API, so the requests of the threads overlap like in reality
+        time.sleep(self.server.latency_secs)  # type: ignore
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(RESPONSE_BODY)))
+        self.end_headers()
+        self.wfile.write(RESPONSE_BODY)
+
+    def log_message(self, *_args: Any) -> None:
+        pass
+
+
+def run_benchmark(
+    *,
+    threads: int = 32,
+    requests_per_thread: int = 50,
+    pool_maxsizes: Sequence[int] = (10, 32),
+    latency_millis: int = 20,
+    work_millis: int = 20,
+) -> List[Dict]:
+    """Measure how many connections one client shared by many threads opens, for each of the pool sizes.
+
+    Args:
+        threads (int, optional): How many threads share the client
+        requests_per_thread (int, optional): How many requests each thread makes
+        pool_maxsizes (list of int, optional): The sizes of the connection pool to compare
+        latency_millis (int, optional): The simulated latency of each request
+        work_millis (int, optional): How long each thread works on average between the requests,
+            while its connection waits in the pool
+
+    Returns:
+        list of dict: The results for each of the pool sizes
+    """
+    # urllib3 warns about every connection it has to discard because the pool is full
+    logging.getLogger('urllib3.connectionpool').setLevel(logging.ERROR)
+
+    results = []
+    for pool_maxsize in pool_maxsizes:
+        server = _CountingServer(latency_millis / 1000)
+        server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+        server_thread.start()
+
+        try:
+            client = ApifyClient(base_url=f'http://127.0.0.1:{server.server_port}', pool_maxsize=pool_maxsize)
+
+            def make_requests() -> None:
+                for _ in range(requests_per_thread):
+                    client.dataset('some-dataset-id').get()
+                    time.sleep(random.uniform(0, 2 * work_millis / 1000))
+
+            started_at = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                for future in [executor.submit(make_requests) for _ in range(threads)]:
+                    future.result()
+            elapsed_secs = time.perf_counter() - started_at
+            client.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        requests_count = threads * requests_per_thread
+        results.append({
+            'threads': threads,
+            'pool_maxsize': pool_maxsize,
+            'requests': requests_count,
+            'opened_connections': server.opened_connections_count,
+            'handshakes_saved_ratio': round(1 - server.opened_connections_count / requests_count, 3),
+            'requests_per_sec': round(requests_count / elapsed_secs, 1),
+        })
+
+    return results
+
+
+def main() -> None:
+    """Run the benchmark from the command line and print its results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--threads', type=int, default=32, help='How many threads share the client')
+    parser.add_argument('--requests-per-thread', type=int, default=50, help='How many requests each thread makes')
+    parser.add_argument('--pool-maxsizes', type=int, nargs='+', default=[10, 32], help='The sizes of the connection pool to compare')
+    parser.add_argument('--latency-millis', type=int, default=20, help='The simulated latency of each request')
+    parser.add_argument('--work-millis', type=int, default=20, help='How long each thread works on average between the requests')
+    args = parser.parse_args()
+
+    results = run_benchmark(
+        threads=args.threads,
+        requests_per_thread=args.requests_per_thread,
+        pool_maxsizes=args.pool_maxsizes,
+        latency_millis=args.latency_millis,
+        work_millis=args.work_millis,
+    )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
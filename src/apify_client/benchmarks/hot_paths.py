@@ -0,0 +1,186 @@
+"""Benchmark of the most used methods of the client, against a local stand-in of the API.
+
+Each scenario repeats one operation, like iterating over the items of a dataset or adding a request to a queue,
+against a `FakeApifyServer` and measures its throughput, the number of requests it makes, the percentiles of its latency,
+the CPU time the calling thread spent on it and the peak memory allocated while it ran. The CPU time of the calling thread leaves out the fake server,
+which runs in other threads, so it shows the overhead of the client itself. The peak memory is measured with `tracemalloc`
+in a separate run, as tracing the allocations slows everything down, and it includes the allocations of the fake server.
+With the in-memory transport, the requests skip the network and the fake server handles them in the calling thread,
+so the times contain only the work of the client and of the fake server.
+Run it with `python -m apify_client.benchmarks.hot_paths`.
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from ..client import ApifyClient
+from ..testing import FakeApifyServer
+from ..transport import HTTPXTransport, InMemoryTransport, RequestsTransport, Transport
+
+READ_CHUNK_SIZE_BYTES = 64 * 1024
+
+TRANSPORTS: Dict[str, Callable[[FakeApifyServer], Transport]] = {
+    'requests': lambda _server: RequestsTransport(),
+    'httpx': lambda _server: HTTPXTransport(),
+    'in-memory': lambda server: InMemoryTransport(server.handle_request),
+}
+
+
+class _Scenario:
+    def __init__(self, name: str, operation: Callable[[int], Any], units: str, units_per_operation: int) -> None:
+        self.name = name
+        # Called with the number of the iteration, so that each call can work with different data
+        self.operation = operation
+        self.units = units
+        self.units_per_operation = units_per_operation
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(percentile / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _measure(server: FakeApifyServer, scenario: _Scenario, iterations: int) -> Dict:
+    latencies_secs = []
+    requests_count_before = len(server.requests)
+    started_at = time.perf_counter()
+    cpu_started_at = time.thread_time()
+    for iteration in range(iterations):
+        operation_started_at = time.perf_counter()
+        scenario.operation(iteration)
+        latencies_secs.append(time.perf_counter() - operation_started_at)
+    cpu_secs = time.thread_time() - cpu_started_at
+    elapsed_secs = time.perf_counter() - started_at
+    # Shows the operations which stopped reaching the server, or started making more requests than before
+    requests_count = len(server.requests) - requests_count_before
+
+    # The memory is measured on an extra call, with different data than the measured ones
+    tracemalloc.start()
+    try:
+        scenario.operation(iterations)
+        _, peak_memory_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies_secs.sort()
+    return {
+        'name': scenario.name,
+        'iterations': iterations,
+        'units': scenario.units,
+        'units_per_operation': scenario.units_per_operation,
+        'requests_per_operation': round(requests_count / iterations, 1),
+        'operations_per_sec': round(iterations / elapsed_secs, 1),
+        'units_per_sec': round(iterations * scenario.units_per_operation / elapsed_secs, 1),
+        'latency_millis': {
+            'mean': round(sum(latencies_secs) / iterations * 1000, 3),
+            'p50': round(_percentile(latencies_secs, 50) * 1000, 3),
+            'p95': round(_percentile(latencies_secs, 95) * 1000, 3),
+            'p99': round(_percentile(latencies_secs, 99) * 1000, 3),
+        },
+        'cpu_millis_per_operation': round(cpu_secs / iterations * 1000, 3),
+        'peak_memory_bytes': peak_memory_bytes,
+    }
+
+
+def _create_scenarios(server: FakeApifyServer, client: ApifyClient, items_count: int, run_duration_millis: int) -> List[_Scenario]:
+    items = [
+        {'id': index, 'url': f'https://example.com/products/{index}', 'title': f'Product {index}', 'price': index / 100, 'tags': ['a', 'b']}
+        for index in range(items_count)
+    ]
+    dataset_client = client.dataset(server.add_dataset(items)['id'])
+    push_dataset_client = client.dataset(server.add_dataset()['id'])
+    store_client = client.key_value_store(server.add_key_value_store({'record': {'value': 'x' * 1000}})['id'])
+    queue_client = client.request_queue(server.add_request_queue([{'url': f'https://example.com/{index}'} for index in range(1000)])['id'])
+    actor_client = client.actor(server.add_actor('benchmark-actor', run_duration_secs=run_duration_millis / 1000)['id'])
+    items_size_bytes = len(dataset_client.download_items())
+
+    def stream_items(_iteration: int) -> None:
+        items_stream = dataset_client.stream_items()
+        try:
+            while items_stream.read(READ_CHUNK_SIZE_BYTES):
+                pass
+        finally:
+            items_stream.close()
+
+    def wait_for_finish(_iteration: int) -> None:
+        client.run(actor_client.start()['id']).wait_for_finish()
+
+    return [
+        _Scenario('iterate_items', lambda _iteration: sum(1 for _ in dataset_client.iterate_items()), 'items', items_count),
+        _Scenario('download_items', lambda _iteration: dataset_client.download_items(), 'bytes', items_size_bytes),
+        _Scenario('stream_items', stream_items, 'bytes', items_size_bytes),
+        _Scenario('push_items', lambda _iteration: push_dataset_client.push_items(items[:1000]), 'items', min(items_count, 1000)),
+        _Scenario('get_record', lambda _iteration: store_client.get_record('record'), 'records', 1),
+        _Scenario('set_record', lambda iteration: store_client.set_record(f'record-{iteration}', {'value': 'x' * 1000}), 'records', 1),
+        _Scenario('add_request', lambda iteration: queue_client.add_request({'url': f'https://example.com/new/{iteration}'}), 'requests', 1),
+        _Scenario('list_head', lambda _iteration: queue_client.list_head(limit=100), 'requests', 100),
+        _Scenario('wait_for_finish', wait_for_finish, 'runs', 1),
+    ]
+
+
+def run_benchmark(
+    *,
+    items_count: int = 10_000,
+    iterations: int = 20,
+    latency_millis: float = 1,
+    bandwidth_bytes_per_sec: Optional[float] = None,
+    run_duration_millis: int = 100,
+    transport: str = 'requests',
+    scenarios: Optional[Sequence[str]] = None,
+) -> List[Dict]:
+    """Measure the throughput, latency, CPU time and peak memory of the most used methods of the client.
+
+    Args:
+        items_count (int, optional): How many items the benchmarked dataset contains
+        iterations (int, optional): How many times to repeat each operation
+        latency_millis (float, optional): The simulated latency of each request
+        bandwidth_bytes_per_sec (float, optional): The simulated bandwidth of the network, by default it's not limited
+        run_duration_millis (int, optional): How long the actor runs take, for the `wait_for_finish` scenario
+        transport (str, optional): The transport of the client, `requests`, `httpx` or `in-memory`,
+            which skips the network and ignores the simulated latency and bandwidth
+        scenarios (list of str, optional): The names of the scenarios to run, e.g. `iterate_items`, by default all of them
+
+    Returns:
+        list of dict: The results of each of the scenarios
+    """
+    with FakeApifyServer(latency_millis=latency_millis, bandwidth_bytes_per_sec=bandwidth_bytes_per_sec, seed=0) as server:
+        client = ApifyClient(base_url=server.url, transport=TRANSPORTS[transport](server))
+        try:
+            return [
+                _measure(server, scenario, iterations)
+                for scenario in _create_scenarios(server, client, items_count, run_duration_millis)
+                if scenarios is None or scenario.name in scenarios
+            ]
+        finally:
+            client.close()
+
+
+def main() -> None:
+    """Run the benchmark from the command line and print its results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=10_000, help='How many items the benchmarked dataset contains')
+    parser.add_argument('--iterations', type=int, default=20, help='How many times to repeat each operation')
+    parser.add_argument('--latency-millis', type=float, default=1, help='The simulated latency of each request')
+    parser.add_argument('--bandwidth-bytes-per-sec', type=float, default=None, help='The simulated bandwidth of the network')
+    parser.add_argument('--run-duration-millis', type=int, default=100, help='How long the actor runs take')
+    parser.add_argument('--transport', choices=list(TRANSPORTS), default='requests', help='The transport of the client')
+    parser.add_argument('--scenarios', nargs='+', default=None, help='The names of the scenarios to run, by default all of them')
+    args = parser.parse_args()
+
+    results = run_benchmark(
+        items_count=args.items,
+        iterations=args.iterations,
+        latency_millis=args.latency_millis,
+        bandwidth_bytes_per_sec=args.bandwidth_bytes_per_sec,
+        run_duration_millis=args.run_duration_millis,
+        transport=args.transport,
+        scenarios=args.scenarios,
+    )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
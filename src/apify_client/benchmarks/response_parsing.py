@@ -0,0 +1,102 @@
+"""Benchmark of the CPU time spent on decoding large list responses.
+
+Compares reusing the body parsed by the HTTP client with decoding the JSON body a second time,
+as the resource clients used to do, and measures the conversion of the date fields of the list in each of the `parse_dates` modes,
+without accessing the converted fields afterwards. Run it with `python -m apify_client.benchmarks.response_parsing`.
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict
+
+import requests
+
+from .._http_client import _HTTPClient
+from .._utils import PARSE_DATES_MODES, ListPage, _get_parsed_body, _parse_date_fields, _pluck_data
+
+
+def _make_list_response(items_count: int) -> requests.models.Response:
+    items = [
+        {
+            'id': f'run{i:014d}',
+            'actId': 'HDSasDasz78YcAPEB',
+            'status': 'SUCCEEDED',
+            'startedAt': '2021-06-10T07:16:29.174Z',
+            'finishedAt': '2021-06-10T07:17:01.422Z',
+            'buildNumber': '0.1.42',
+            'meta': {'origin': 'API', 'userAgent': 'ApifyClient/0.0.1'},
+            'stats': {'inputBodyLen': 240, 'restartCount': 0, 'durationMillis': 32248, 'computeUnits': 0.0358},
+            'defaultDatasetId': f'dataset{i:010d}',
+            'defaultKeyValueStoreId': f'store{i:012d}',
+        }
+        for i in range(items_count)
+    ]
+    body = {'data': {'total': items_count, 'offset': 0, 'limit': items_count, 'count': items_count, 'desc': False, 'items': items}}
+
+    response = requests.models.Response()
+    response.status_code = 200
+    response.headers['content-type'] = 'application/json; charset=utf-8'
+    response._content = json.dumps(body).encode('utf-8')
+    return response
+
+
+def _measure_cpu_time_per_call(func: Callable[[], Any], iterations: int) -> float:
+    started_at = time.process_time()
+    for _ in range(iterations):
+        func()
+    return (time.process_time() - started_at) / iterations
+
+
+def run_benchmark(*, items_count: int = 1000, iterations: int = 50) -> Dict:
+    """Measure the CPU time spent on decoding one list response, with and without decoding the body twice, and on parsing its dates.
+
+    Args:
+        items_count (int, optional): How many items should the list response contain
+        iterations (int, optional): How many times to repeat the measured call
+
+    Returns:
+        dict: The measured CPU times per call, in milliseconds
+    """
+    response = _make_list_response(items_count)
+    http_client = _HTTPClient()
+
+    def parse_twice() -> Any:
+        setattr(response, '_maybe_parsed_body', http_client._maybe_parse_response(response))
+        return response.json()
+
+    def parse_once() -> Any:
+        setattr(response, '_maybe_parsed_body', http_client._maybe_parse_response(response))
+        return _get_parsed_body(response)
+
+    parse_twice_millis = _measure_cpu_time_per_call(parse_twice, iterations) * 1000
+    parse_once_millis = _measure_cpu_time_per_call(parse_once, iterations) * 1000
+
+    data = _pluck_data(parse_once())
+    parse_dates_millis = {
+        mode: round(_measure_cpu_time_per_call(lambda: ListPage(_parse_date_fields(data, mode)), iterations) * 1000, 3)
+        for mode in PARSE_DATES_MODES
+    }
+
+    return {
+        'items_count': items_count,
+        'response_size_bytes': len(response.content),
+        'parse_twice_cpu_millis_per_call': round(parse_twice_millis, 3),
+        'parse_once_cpu_millis_per_call': round(parse_once_millis, 3),
+        'saved_cpu_millis_per_call': round(parse_twice_millis - parse_once_millis, 3),
+        'parse_dates_cpu_millis_per_call': parse_dates_millis,
+    }
+
+
+def main() -> None:
+    """Run the benchmark from the command line and print its results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--items', type=int, default=1000, help='How many items should the list response contain')
+    parser.add_argument('--iterations', type=int, default=50, help='How many times to repeat the measured call')
+    args = parser.parse_args()
+
+    print(json.dumps(run_benchmark(items_count=args.items, iterations=args.iterations), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, Optional
+
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_TTL_SECS = 60
+# The builds change their status while they are running, so they are cached only briefly
+DEFAULT_ENDPOINT_CLASS_TTL_SECS = {'actor-builds': 5}
+
+
+class _CacheEntry:
+    def __init__(self, *, url: str, response: Any, expires_at: float) -> None:
+        self.url = url
+        self.response = response
+        self.expires_at = expires_at
+
+
+class ResponseCache:
+    """Caches the responses to the reads of the metadata of resources, like actors, tasks, builds, datasets or key-value store records.
+
+    The cache is bounded, it keeps the most recently used responses only. A cached response is used without asking the API
+    until its time to live runs out. Afterwards, if the API sent an `ETag` or `Last-Modified` header with it, the client asks
+    the API whether the resource changed since, and uses the cached response again when it didn't, otherwise it's fetched again.
+    When a resource is updated or deleted through the same client, its cached responses are dropped right away,
+    but changes made elsewhere show up only after the time to live runs out.
+    One cache can be shared by several clients, those using different tokens get only the responses cached with their own token.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_secs: float = DEFAULT_TTL_SECS,
+        endpoint_class_ttl_secs: Optional[Mapping[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the ResponseCache.
+
+        Args:
+            max_entries (int, optional): How many responses the cache keeps at most, the least recently used ones are dropped first
+            ttl_secs (float, optional): For how long a cached response is used without asking the API whether it's still current
+            endpoint_class_ttl_secs (dict, optional): The time to live of the responses of some endpoint classes, which are
+                the types of the resources, e.g. `{'acts': 300}`. Defaults to 5 seconds for builds, which change often
+            clock (Callable, optional): The monotonic clock measuring the time in seconds
+        """
+        self.max_entries = max_entries
+        self.ttl_secs = ttl_secs
+        self.endpoint_class_ttl_secs = {**DEFAULT_ENDPOINT_CLASS_TTL_SECS, **(endpoint_class_ttl_secs or {})}
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, _CacheEntry]' = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return how many responses are cached."""
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: str, *, include_expired: bool = False) -> Optional[Any]:
+        """Get a cached response.
+
+        Args:
+            key (str): The key of the request
+            include_expired (bool, optional): Whether to return the response even when its time to live ran out,
+                to ask the API whether it's still current
+
+        Returns:
+            requests.Response or httpx.Response, optional: The cached response, None if it's not cached or it expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (entry.expires_at <= self._clock() and not include_expired):
+                return None
+            self._entries.move_to_end(key)
+            return entry.response
+
+    def put(self, key: str, *, url: str, endpoint_class: str, response: Any) -> None:
+        """Cache a response, or mark a cached response as current again.
+
+        Args:
+            key (str): The key of the request
+            url (str): The URL of the request, by which the response is dropped when the resource changes
+            endpoint_class (str): The type of the resource, which decides the time to live of the response
+            response (requests.Response or httpx.Response): The response, with its body already read
+        """
+        ttl_secs = self.endpoint_class_ttl_secs.get(endpoint_class, self.ttl_secs)
+        with self._lock:
+            self._entries[key] = _CacheEntry(url=_normalize_url(url), response=response, expires_at=self._clock() + ttl_secs)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url: str) -> None:
+        """Drop the cached responses of a resource, of its sub-resources and of the resources containing it.
+
+        Args:
+            url (str): The URL of the resource which changed
+        """
+        url = _normalize_url(url)
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if entry.url == url or entry.url.startswith(f'{url}/') or url.startswith(f'{entry.url}/'):
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all the cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _normalize_url(url: str) -> str:
+    return url.split('?')[0].rstrip('/')
+
+
+def _get_conditional_headers(response: Any) -> Dict[str, str]:
+    # Ask the API to send the resource only when it changed since the cached response, if the response has any validators
+    headers = {}
+    if 'etag' in response.headers:
+        headers['If-None-Match'] = response.headers['etag']
+    if 'last-modified' in response.headers:
+        headers['If-Modified-Since'] = response.headers['last-modified']
+    return headers
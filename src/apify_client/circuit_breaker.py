@@ -0,0 +1,147 @@
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Deque, Tuple
+
+from ._errors import CircuitOpenError
+
+DEFAULT_FAILURE_RATIO_THRESHOLD = 0.5
+DEFAULT_MIN_REQUESTS = 20
+DEFAULT_WINDOW_SECS = 30
+DEFAULT_OPEN_SECS = 15
+DEFAULT_HALF_OPEN_PROBES = 3
+
+
+class CircuitState(Enum):
+    """The states of a circuit breaker."""
+
+    CLOSED = 'CLOSED'  # the requests are sent as usual
+    OPEN = 'OPEN'  # the requests fail right away, without being sent
+    HALF_OPEN = 'HALF_OPEN'  # a few probe requests are sent to find out whether the API has recovered
+
+
+class CircuitBreaker:
+    """Stops the client from sending requests for a while, when too many of them fail, so that they fail fast instead.
+
+    During an incident of the API, retrying every request several times only makes the load worse and keeps the callers
+    waiting for minutes. When the ratio of the requests which failed with a network error or an internal error of the API
+    (HTTP 5xx) reaches the threshold, the breaker opens, and the following requests fail right away with a `CircuitOpenError`.
+    After a while, the breaker lets a few probe requests through, and closes again when all of them succeed.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_ratio_threshold: float = DEFAULT_FAILURE_RATIO_THRESHOLD,
+        min_requests: int = DEFAULT_MIN_REQUESTS,
+        window_secs: float = DEFAULT_WINDOW_SECS,
+        open_secs: float = DEFAULT_OPEN_SECS,
+        half_open_probes: int = DEFAULT_HALF_OPEN_PROBES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the CircuitBreaker.
+
+        Args:
+            failure_ratio_threshold (float, optional): The ratio of failed requests, between 0 and 1, at which the breaker opens
+            min_requests (int, optional): How many requests have to finish in the window before the breaker can open,
+                so that a few failures at low traffic don't open it
+            window_secs (float, optional): The length of the sliding time window in which the failure ratio is measured
+            open_secs (float, optional): How long the breaker stays open before it lets the probe requests through
+            half_open_probes (int, optional): How many probe requests have to succeed to close the breaker again
+            clock (Callable, optional): The monotonic clock measuring the time in seconds
+        """
+        if not 0 < failure_ratio_threshold <= 1:
+            raise ValueError(f'The failure ratio threshold has to be between 0 and 1, got {failure_ratio_threshold}')
+
+        self.failure_ratio_threshold = failure_ratio_threshold
+        self.min_requests = min_requests
+        self.window_secs = window_secs
+        self.open_secs = open_secs
+        self.half_open_probes = half_open_probes
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        # When did the requests in the window finish, and whether they failed
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._failures_count = 0
+        # When did the breaker open, or when did it let the current round of probe requests through
+        self._state_changed_at = 0.0
+        self._probes_started = 0
+        self._probes_succeeded = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state of the breaker."""
+        with self._lock:
+            self._update_state(self._clock())
+            return self._state
+
+    def before_request(self) -> None:
+        """Check whether a request can be sent, right before sending it.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or it's half-open and enough probe requests are already on their way
+        """
+        with self._lock:
+            now = self._clock()
+            self._update_state(now)
+
+            if self._state == CircuitState.OPEN:
+                raise CircuitOpenError(retry_after_secs=self._state_changed_at + self.open_secs - now)
+
+            if self._state == CircuitState.HALF_OPEN:
+                if self._probes_started >= self.half_open_probes:
+                    raise CircuitOpenError(retry_after_secs=self._state_changed_at + self.open_secs - now)
+                self._probes_started += 1
+
+    def on_success(self) -> None:
+        """Record a request which reached the API and didn't fail with an internal error."""
+        with self._lock:
+            now = self._clock()
+            if self._state == CircuitState.HALF_OPEN:
+                self._probes_succeeded += 1
+                if self._probes_succeeded >= self.half_open_probes:
+                    self._state = CircuitState.CLOSED
+                    self._outcomes.clear()
+                    self._failures_count = 0
+            elif self._state == CircuitState.CLOSED:
+                self._add_outcome(now, False)
+
+    def on_failure(self) -> None:
+        """Record a request which failed with a network error or an internal error of the API."""
+        with self._lock:
+            now = self._clock()
+            if self._state == CircuitState.HALF_OPEN:
+                self._open(now)
+            elif self._state == CircuitState.CLOSED:
+                self._add_outcome(now, True)
+                requests_count = len(self._outcomes)
+                if requests_count >= self.min_requests and self._failures_count >= self.failure_ratio_threshold * requests_count:
+                    self._open(now)
+
+    def _update_state(self, now: float) -> None:
+        # Lets a round of probes through after the breaker was open for a while,
+        # and another one when the probes don't finish in that time, e.g. because they were cancelled
+        if self._state != CircuitState.CLOSED and now >= self._state_changed_at + self.open_secs:
+            self._start_probing(now)
+
+    def _start_probing(self, now: float) -> None:
+        self._state = CircuitState.HALF_OPEN
+        self._state_changed_at = now
+        self._probes_started = 0
+        self._probes_succeeded = 0
+
+    def _open(self, now: float) -> None:
+        self._state = CircuitState.OPEN
+        self._state_changed_at = now
+
+    def _add_outcome(self, now: float, failed: bool) -> None:
+        self._outcomes.append((now, failed))
+        if failed:
+            self._failures_count += 1
+        while self._outcomes and self._outcomes[0][0] <= now - self.window_secs:
+            _, outcome_failed = self._outcomes.popleft()
+            if outcome_failed:
+                self._failures_count -= 1
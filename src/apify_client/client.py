@@ -1,36 +1,172 @@
-from typing import Dict, Optional
-
-from ._http_client import _HTTPClient
+from typing import Any, ContextManager, Dict, Optional, Union
+
+from ._http_client import (
+    DEFAULT_CONNECT_TIMEOUT_SECS,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_READ_TIMEOUT_SECS,
+    _HTTPClient,
+    _HTTPClientAsync,
+)
+from ._utils import PARSE_DATES_EAGER, _deadline_scope, _timeouts_scope
+from .cache import ResponseCache
+from .circuit_breaker import CircuitBreaker
 from .clients import (
     ActorClient,
+    ActorClientAsync,
     ActorCollectionClient,
+    ActorCollectionClientAsync,
     BuildClient,
+    BuildClientAsync,
     BuildCollectionClient,
+    BuildCollectionClientAsync,
     DatasetClient,
+    DatasetClientAsync,
     DatasetCollectionClient,
+    DatasetCollectionClientAsync,
     KeyValueStoreClient,
+    KeyValueStoreClientAsync,
     KeyValueStoreCollectionClient,
+    KeyValueStoreCollectionClientAsync,
     LogClient,
+    LogClientAsync,
     RequestQueueClient,
+    RequestQueueClientAsync,
     RequestQueueCollectionClient,
+    RequestQueueCollectionClientAsync,
     RunClient,
+    RunClientAsync,
     RunCollectionClient,
+    RunCollectionClientAsync,
     ScheduleClient,
+    ScheduleClientAsync,
     ScheduleCollectionClient,
+    ScheduleCollectionClientAsync,
     TaskClient,
+    TaskClientAsync,
     TaskCollectionClient,
+    TaskCollectionClientAsync,
     UserClient,
+    UserClientAsync,
     WebhookClient,
+    WebhookClientAsync,
     WebhookCollectionClient,
+    WebhookCollectionClientAsync,
     WebhookDispatchClient,
+    WebhookDispatchClientAsync,
     WebhookDispatchCollectionClient,
+    WebhookDispatchCollectionClientAsync,
 )
+from .compression import CompressionPolicy
+from .concurrency import ConcurrencyGovernor
+from .hedging import HedgingPolicy
+from .hooks import RequestHooks
+from .json_codec import JSONCodec
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .statistics import Statistics
+from .transport import AsyncTransport, Transport
 
 DEFAULT_BASE_API_URL = 'https://api.apify.com/v2'
 
 
-class ApifyClient:
-    """The Apify API client."""
+class _BaseApifyClient:
+    http_client: Union[_HTTPClient, _HTTPClientAsync]
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        *,
+        base_url: str = DEFAULT_BASE_API_URL,
+        max_retries: int = 8,
+        min_delay_between_retries_millis: int = 500,
+        json_codec: Optional[JSONCodec] = None,
+        compression_policy: Optional[CompressionPolicy] = None,
+        connect_timeout_secs: float = DEFAULT_CONNECT_TIMEOUT_SECS,
+        read_timeout_secs: float = DEFAULT_READ_TIMEOUT_SECS,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_governor: Optional[ConcurrencyGovernor] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        coalesce_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        statistics: Optional[Statistics] = None,
+        request_hooks: Optional[RequestHooks] = None,
+        parse_dates: str = PARSE_DATES_EAGER,
+        transport: Optional[Union[Transport, AsyncTransport]] = None,
+        http2: bool = False,
+    ):
+        self.token = token
+        self.base_url = base_url
+        self.max_retries = max_retries
+        self.min_delay_between_retries_millis = min_delay_between_retries_millis
+        self.json_codec = json_codec
+        self.compression_policy = compression_policy
+        self.connect_timeout_secs = connect_timeout_secs
+        self.read_timeout_secs = read_timeout_secs
+        self.rate_limiter = rate_limiter
+        self.concurrency_governor = concurrency_governor
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.hedging_policy = hedging_policy
+        self.coalesce_requests = coalesce_requests
+        self.response_cache = response_cache
+        self.statistics = statistics
+        self.request_hooks = request_hooks
+        self.parse_dates = parse_dates
+        self.transport = transport
+        self.http2 = http2
+
+    @property
+    def stats(self) -> Statistics:
+        """The statistics of the API calls made by the client, which can be exported with `as_dict()` or `to_prometheus()`."""
+        return self.http_client.stats
+
+    def deadline(self, secs: float) -> ContextManager[None]:
+        """Set a deadline for all the API calls made in the returned context.
+
+        The timeouts of the requests and the waiting between retries are cut short so that the calls don't run over the deadline,
+        and when a call can't be finished in time, it fails with a `DeadlineExceededError`. The deadline also applies to the calls
+        of any client in the context, including asyncio tasks started in it, and a nested deadline can't extend the outer one.
+
+            with apify_client.deadline(30):
+                run = apify_client.actor('john-doe/my-cool-actor').call()
+
+        Args:
+            secs (float): In how many seconds from now the API calls have to finish
+        """
+        return _deadline_scope(secs)
+
+    def timeouts(self, *, connect_timeout_secs: Optional[float] = None, read_timeout_secs: Optional[float] = None) -> ContextManager[None]:
+        """Override the timeouts of the requests made in the returned context.
+
+            with apify_client.timeouts(read_timeout_secs=5):
+                dataset = apify_client.dataset('my-dataset').get()
+
+        Args:
+            connect_timeout_secs (float, optional): How long to wait for a connection to the API to be established
+            read_timeout_secs (float, optional): How long to wait for the API to send the next part of the response
+        """
+        return _timeouts_scope(connect_timeout_secs, read_timeout_secs)
+
+    def _options(self) -> Dict:
+        return {
+            'root_client': self,
+            'base_url': self.base_url,
+            'http_client': self.http_client,
+        }
+
+
+class ApifyClient(_BaseApifyClient):
+    """The Apify API client.
+
+    The client is thread-safe, one instance and the resource clients created from it can be shared by many threads.
+    All of them use the same pool of keep-alive connections, which should be at least as big as the number of the threads,
+    otherwise the extra connections are closed after each request and the next requests have to open new ones.
+    """
+
+    http_client: _HTTPClient
 
     def __init__(
         self,
@@ -39,6 +175,25 @@ class ApifyClient:
         base_url: str = DEFAULT_BASE_API_URL,
         max_retries: int = 8,
         min_delay_between_retries_millis: int = 500,
+        json_codec: Optional[JSONCodec] = None,
+        compression_policy: Optional[CompressionPolicy] = None,
+        connect_timeout_secs: float = DEFAULT_CONNECT_TIMEOUT_SECS,
+        read_timeout_secs: float = DEFAULT_READ_TIMEOUT_SECS,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_governor: Optional[ConcurrencyGovernor] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        coalesce_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        statistics: Optional[Statistics] = None,
+        request_hooks: Optional[RequestHooks] = None,
+        parse_dates: str = PARSE_DATES_EAGER,
+        transport: Optional[Transport] = None,
+        http2: bool = False,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
     ):
         """Initialize the Apify API Client.
 
@@ -48,26 +203,108 @@ class ApifyClient:
             max_retries (int, optional): How many times to retry a failed request at most
             min_delay_between_retries_millis (int, optional): How long will the client wait between retrying requests
                 (increases exponentially from this value)
+            json_codec (JSONCodec, optional): The codec used to encode and decode JSON bodies.
+                Defaults to `OrjsonJSONCodec` when the `orjson` package is installed, `StdlibJSONCodec` otherwise
+            compression_policy (CompressionPolicy, optional): Decides which request bodies are compressed and how.
+                By default, bodies over 1 kB are compressed, unless their content type shows they are already compressed
+            connect_timeout_secs (float, optional): How long to wait for a connection to the API to be established
+            read_timeout_secs (float, optional): How long to wait for the API to send the next part of the response
+            rate_limiter (RateLimiter, optional): Paces the requests so that they don't exceed the rate limits of the API.
+                Defaults to 250 requests per second in total, the limit of the API. Share one instance among several clients
+                using the same token, so that they share the budget too
+            concurrency_governor (ConcurrencyGovernor, optional): Adapts how many API calls the parallel helpers of the client,
+                like the dataset batch writer, make at once, to how the API copes with them
+            retry_policy (RetryPolicy, optional): Decides which failed requests are retried and how long to wait between the retries.
+                When set, it replaces the `max_retries` and `min_delay_between_retries_millis` options
+            circuit_breaker (CircuitBreaker, optional): Makes the API calls fail right away with a `CircuitOpenError` for a while,
+                when too many requests fail. Share one instance among the clients of a process, so that they trip together.
+                By default, there is no circuit breaker
+            hedging_policy (HedgingPolicy, optional): Makes the client send a duplicate of a GET request, when its response
+                takes longer than usual, and use the response which arrives first. By default, the requests are not hedged
+            coalesce_requests (bool, optional): Whether the identical GET requests made at the same time, e.g. from several threads,
+                share a single request to the API. Each of the calls gets its own copy of the response, and waits for the shared request
+                at most for its own connect and read timeouts, or until its deadline. Disabled by default
+            response_cache (ResponseCache, optional): Caches the metadata of actors, tasks, builds, datasets and key-value stores,
+                and the key-value store records. By default, nothing is cached
+            statistics (Statistics, optional): Collects the statistics of the API calls, available in the `stats` attribute
+                of the client. Share one instance among several clients to collect their statistics together
+            request_hooks (RequestHooks, optional): Functions called before each request, after its response, before its retries
+                and when it fails, e.g. to trace or profile the API calls
+            parse_dates (str, optional): When the date fields of the returned resources, like `createdAt`, are converted to datetimes.
+                With `eager`, the default, right away, with `lazy`, when they are first accessed, which saves converting the dates
+                which are never read, e.g. in large lists, and with `off`, never, so they stay strings
+            transport (Transport, optional): Sends the HTTP requests, e.g. `HTTPXTransport`, or `InMemoryTransport` in tests.
+                Defaults to `RequestsTransport`, which the pool options below configure, they don't apply to the other transports
+            http2 (bool, optional): Whether to send the requests over HTTP/2, with `HTTPXTransport` instead of the default transport,
+                which multiplexes the concurrent requests, e.g. from many threads, over a few connections.
+                Needs the `h2` package, installed with `pip install apify-client[http2]`
+            pool_connections (int, optional): For how many different hosts to keep a pool of connections
+            pool_maxsize (int, optional): How many keep-alive connections to keep in the pool for each host,
+                should be at least the number of threads sharing the client
+            pool_block (bool, optional): Whether requests should wait for a free connection when all the connections of the pool
+                are in use, instead of opening extra connections, which are closed after the request
         """
-        self.token = token
-        self.base_url = base_url
-        self.max_retries = max_retries
-        self.min_delay_between_retries_millis = min_delay_between_retries_millis
+        super().__init__(
+            token,
+            base_url=base_url,
+            max_retries=max_retries,
+            min_delay_between_retries_millis=min_delay_between_retries_millis,
+            json_codec=json_codec,
+            compression_policy=compression_policy,
+            connect_timeout_secs=connect_timeout_secs,
+            read_timeout_secs=read_timeout_secs,
+            rate_limiter=rate_limiter,
+            concurrency_governor=concurrency_governor,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            hedging_policy=hedging_policy,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            statistics=statistics,
+            request_hooks=request_hooks,
+            parse_dates=parse_dates,
+            transport=transport,
+            http2=http2,
+        )
 
         self.http_client = _HTTPClient(
             token=token,
             max_retries=max_retries,
             min_delay_between_retries_millis=min_delay_between_retries_millis,
+            json_codec=json_codec,
+            compression_policy=compression_policy,
+            connect_timeout_secs=connect_timeout_secs,
+            read_timeout_secs=read_timeout_secs,
+            rate_limiter=rate_limiter,
+            concurrency_governor=concurrency_governor,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            hedging_policy=hedging_policy,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            statistics=statistics,
+            request_hooks=request_hooks,
+            parse_dates=parse_dates,
+            transport=transport,
+            http2=http2,
+            base_url=base_url,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
         )
-        # TODO statistics
         # TODO logger
 
-    def _options(self) -> Dict:
-        return {
-            'root_client': self,
-            'base_url': self.base_url,
-            'http_client': self.http_client,
-        }
+    def close(self) -> None:
+        """Close the underlying connection pool of the client, and stop the threads sending the hedged requests."""
+        self.http_client.close()
+
+    def __enter__(self) -> 'ApifyClient':
+        """Use the client as a context manager, which closes the connection pool on exit."""
+        return self
+
+    def __exit__(self, *_exc_info: Any) -> None:
+        """Close the connection pool of the client."""
+        self.close()
 
     def actor(self, actor_id: str) -> ActorClient:
         """Retrieve the sub-client for manipulating a single actor.
@@ -205,3 +442,275 @@ class ApifyClient:
             user_id (str, optional): ID of user to be queried. If None, queries the user belonging to the token supplied to the client
         """
         return UserClient(resource_id=user_id, **self._options())
+
+
+class ApifyClientAsync(_BaseApifyClient):
+    """The asynchronous version of the Apify API client."""
+
+    http_client: _HTTPClientAsync
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        *,
+        base_url: str = DEFAULT_BASE_API_URL,
+        max_retries: int = 8,
+        min_delay_between_retries_millis: int = 500,
+        json_codec: Optional[JSONCodec] = None,
+        compression_policy: Optional[CompressionPolicy] = None,
+        connect_timeout_secs: float = DEFAULT_CONNECT_TIMEOUT_SECS,
+        read_timeout_secs: float = DEFAULT_READ_TIMEOUT_SECS,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_governor: Optional[ConcurrencyGovernor] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        coalesce_requests: bool = False,
+        response_cache: Optional[ResponseCache] = None,
+        statistics: Optional[Statistics] = None,
+        request_hooks: Optional[RequestHooks] = None,
+        parse_dates: str = PARSE_DATES_EAGER,
+        transport: Optional[AsyncTransport] = None,
+        http2: bool = False,
+    ):
+        """Initialize the asynchronous Apify API Client.
+
+        All the resource clients created from this client share a single connection pool,
+        so one event loop can drive many concurrent API calls.
+
+        Args:
+            token (str, optional): The Apify API token
+            base_url (str, optional): The URL of the Apify API server to which to connect to. Defaults to https://api.apify.com/v2
+            max_retries (int, optional): How many times to retry a failed request at most
+            min_delay_between_retries_millis (int, optional): How long will the client wait between retrying requests
+                (increases exponentially from this value)
+            json_codec (JSONCodec, optional): The codec used to encode and decode JSON bodies.
+                Defaults to `OrjsonJSONCodec` when the `orjson` package is installed, `StdlibJSONCodec` otherwise
+            compression_policy (CompressionPolicy, optional): Decides which request bodies are compressed and how.
+                By default, bodies over 1 kB are compressed, unless their content type shows they are already compressed
+            connect_timeout_secs (float, optional): How long to wait for a connection to the API to be established
+            read_timeout_secs (float, optional): How long to wait for the API to send the next part of the response
+            rate_limiter (RateLimiter, optional): Paces the requests so that they don't exceed the rate limits of the API.
+                Defaults to 250 requests per second in total, the limit of the API. Share one instance among several clients
+                using the same token, so that they share the budget too
+            concurrency_governor (ConcurrencyGovernor, optional): Adapts how many API calls the parallel helpers of the client,
+                like the dataset batch writer, make at once, to how the API copes with them
+            retry_policy (RetryPolicy, optional): Decides which failed requests are retried and how long to wait between the retries.
+                When set, it replaces the `max_retries` and `min_delay_between_retries_millis` options
+            circuit_breaker (CircuitBreaker, optional): Makes the API calls fail right away with a `CircuitOpenError` for a while,
+                when too many requests fail. Share one instance among the clients of a process, so that they trip together.
+                By default, there is no circuit breaker
+            hedging_policy (HedgingPolicy, optional): Makes the client send a duplicate of a GET request, when its response
+                takes longer than usual, and use the response which arrives first. By default, the requests are not hedged
+            coalesce_requests (bool, optional): Whether the identical GET requests made at the same time, e.g. from several tasks,
+                share a single request to the API. Each of the calls gets its own copy of the response, and waits for the shared request
+                at most for its own connect and read timeouts, or until its deadline. Disabled by default
+            response_cache (ResponseCache, optional): Caches the metadata of actors, tasks, builds, datasets and key-value stores,
+                and the key-value store records. By default, nothing is cached
+            statistics (Statistics, optional): Collects the statistics of the API calls, available in the `stats` attribute
+                of the client. Share one instance among several clients to collect their statistics together
+            request_hooks (RequestHooks, optional): Functions called before each request, after its response, before its retries
+                and when it fails, e.g. to trace or profile the API calls
+            parse_dates (str, optional): When the date fields of the returned resources, like `createdAt`, are converted to datetimes.
+                With `eager`, the default, right away, with `lazy`, when they are first accessed, which saves converting the dates
+                which are never read, e.g. in large lists, and with `off`, never, so they stay strings
+            transport (AsyncTransport, optional): Sends the HTTP requests, e.g. `InMemoryAsyncTransport` in tests.
+                Defaults to `HTTPXAsyncTransport`
+            http2 (bool, optional): Whether the default transport sends the requests over HTTP/2, which multiplexes
+                the concurrent requests, e.g. from many tasks, over a few connections.
+                Needs the `h2` package, installed with `pip install apify-client[http2]`
+        """
+        super().__init__(
+            token,
+            base_url=base_url,
+            max_retries=max_retries,
+            min_delay_between_retries_millis=min_delay_between_retries_millis,
+            json_codec=json_codec,
+            compression_policy=compression_policy,
+            connect_timeout_secs=connect_timeout_secs,
+            read_timeout_secs=read_timeout_secs,
+            rate_limiter=rate_limiter,
+            concurrency_governor=concurrency_governor,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            hedging_policy=hedging_policy,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            statistics=statistics,
+            request_hooks=request_hooks,
+            parse_dates=parse_dates,
+            transport=transport,
+            http2=http2,
+        )
+
+        self.http_client = _HTTPClientAsync(
+            token=token,
+            max_retries=max_retries,
+            min_delay_between_retries_millis=min_delay_between_retries_millis,
+            json_codec=json_codec,
+            compression_policy=compression_policy,
+            connect_timeout_secs=connect_timeout_secs,
+            read_timeout_secs=read_timeout_secs,
+            rate_limiter=rate_limiter,
+            concurrency_governor=concurrency_governor,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            hedging_policy=hedging_policy,
+            coalesce_requests=coalesce_requests,
+            response_cache=response_cache,
+            statistics=statistics,
+            request_hooks=request_hooks,
+            parse_dates=parse_dates,
+            transport=transport,
+            http2=http2,
+            base_url=base_url,
+        )
+
+    async def close(self) -> None:
+        """Close the underlying connection pool of the client."""
+        await self.http_client.close()
+
+    async def __aenter__(self) -> 'ApifyClientAsync':
+        """Use the client as an async context manager, which closes the connection pool on exit."""
+        return self
+
+    async def __aexit__(self, *_exc_info: Any) -> None:
+        """Close the connection pool of the client."""
+        await self.close()
+
+    def actor(self, actor_id: str) -> ActorClientAsync:
+        """Retrieve the sub-client for manipulating a single actor.
+
+        Args:
+            actor_id (str): ID of the actor to be manipulated
+        """
+        return ActorClientAsync(resource_id=actor_id, **self._options())
+
+    def actors(self) -> ActorCollectionClientAsync:
+        """Retrieve the sub-client for manipulating actors."""
+        return ActorCollectionClientAsync(**self._options())
+
+    def build(self, build_id: str) -> BuildClientAsync:
+        """Retrieve the sub-client for manipulating a single actor build.
+
+        Args:
+            build_id (str): ID of the actor build to be manipulated
+        """
+        return BuildClientAsync(resource_id=build_id, **self._options())
+
+    def builds(self) -> BuildCollectionClientAsync:
+        """Retrieve the sub-client for querying multiple builds of a user."""
+        return BuildCollectionClientAsync(**self._options())
+
+    def run(self, run_id: str) -> RunClientAsync:
+        """Retrieve the sub-client for manipulating a single actor run.
+
+        Args:
+            run_id (str): ID of the actor run to be manipulated
+        """
+        return RunClientAsync(resource_id=run_id, **self._options())
+
+    def runs(self) -> RunCollectionClientAsync:
+        """Retrieve the sub-client for querying multiple actor runs of a user."""
+        return RunCollectionClientAsync(**self._options())
+
+    def dataset(self, dataset_id: str) -> DatasetClientAsync:
+        """Retrieve the sub-client for manipulating a single dataset.
+
+        Args:
+            dataset_id (str): ID of the dataset to be manipulated
+        """
+        return DatasetClientAsync(resource_id=dataset_id, **self._options())
+
+    def datasets(self) -> DatasetCollectionClientAsync:
+        """Retrieve the sub-client for manipulating datasets."""
+        return DatasetCollectionClientAsync(**self._options())
+
+    def key_value_store(self, key_value_store_id: str) -> KeyValueStoreClientAsync:
+        """Retrieve the sub-client for manipulating a single key-value store.
+
+        Args:
+            key_value_store_id (str): ID of the key-value store to be manipulated
+        """
+        return KeyValueStoreClientAsync(resource_id=key_value_store_id, **self._options())
+
+    def key_value_stores(self) -> KeyValueStoreCollectionClientAsync:
+        """Retrieve the sub-client for manipulating key-value stores."""
+        return KeyValueStoreCollectionClientAsync(**self._options())
+
+    def request_queue(self, request_queue_id: str, *, client_key: Optional[str] = None) -> RequestQueueClientAsync:
+        """Retrieve the sub-client for manipulating a single request queue.
+
+        Args:
+            request_queue_id (str): ID of the request queue to be manipulated
+            client_key (str): A unique identifier of the client accessing the request queue
+        """
+        return RequestQueueClientAsync(resource_id=request_queue_id, client_key=client_key, **self._options())
+
+    def request_queues(self) -> RequestQueueCollectionClientAsync:
+        """Retrieve the sub-client for manipulating request queues."""
+        return RequestQueueCollectionClientAsync(**self._options())
+
+    def webhook(self, webhook_id: str) -> WebhookClientAsync:
+        """Retrieve the sub-client for manipulating a single webhook.
+
+        Args:
+            webhook_id (str): ID of the webhook to be manipulated
+        """
+        return WebhookClientAsync(resource_id=webhook_id, **self._options())
+
+    def webhooks(self) -> WebhookCollectionClientAsync:
+        """Retrieve the sub-client for querying multiple webhooks of a user."""
+        return WebhookCollectionClientAsync(**self._options())
+
+    def webhook_dispatch(self, webhook_dispatch_id: str) -> WebhookDispatchClientAsync:
+        """Retrieve the sub-client for accessing a single webhook dispatch.
+
+        Args:
+            webhook_dispatch_id (str): ID of the webhook dispatch to access
+        """
+        return WebhookDispatchClientAsync(resource_id=webhook_dispatch_id, **self._options())
+
+    def webhook_dispatches(self) -> WebhookDispatchCollectionClientAsync:
+        """Retrieve the sub-client for querying multiple webhook dispatches of a user."""
+        return WebhookDispatchCollectionClientAsync(**self._options())
+
+    def schedule(self, schedule_id: str) -> ScheduleClientAsync:
+        """Retrieve the sub-client for manipulating a single schedule.
+
+        Args:
+            schedule_id (str): ID of the schedule to be manipulated
+        """
+        return ScheduleClientAsync(resource_id=schedule_id, **self._options())
+
+    def schedules(self) -> ScheduleCollectionClientAsync:
+        """Retrieve the sub-client for manipulating schedules."""
+        return ScheduleCollectionClientAsync(**self._options())
+
+    def log(self, build_or_run_id: str) -> LogClientAsync:
+        """Retrieve the sub-client for retrieving logs.
+
+        Args:
+            build_or_run_id (str): ID of the actor build or run for which to access the log
+        """
+        return LogClientAsync(resource_id=build_or_run_id, **self._options())
+
+    def task(self, task_id: str) -> TaskClientAsync:
+        """Retrieve the sub-client for manipulating a single task.
+
+        Args:
+            task_id (str): ID of the task to be manipulated
+        """
+        return TaskClientAsync(resource_id=task_id, **self._options())
+
+    def tasks(self) -> TaskCollectionClientAsync:
+        """Retrieve the sub-client for manipulating tasks."""
+        return TaskCollectionClientAsync(**self._options())
+
+    def user(self, user_id: Optional[str] = None) -> UserClientAsync:
+        """Retrieve the sub-client for querying users.
+
+        Args:
+            user_id (str, optional): ID of user to be queried. If None, queries the user belonging to the token supplied to the client
+        """
+        return UserClientAsync(resource_id=user_id, **self._options())
@@ -1,58 +1,119 @@
-from .base import ActorJobBaseClient, BaseClient, ResourceClient, ResourceCollectionClient
+from .base import (
+    ActorJobBaseClient,
+    ActorJobBaseClientAsync,
+    BaseClient,
+    BaseClientAsync,
+    ResourceClient,
+    ResourceClientAsync,
+    ResourceCollectionClient,
+    ResourceCollectionClientAsync,
+)
 from .resource_clients import (
     ActorClient,
+    ActorClientAsync,
     ActorCollectionClient,
+    ActorCollectionClientAsync,
     ActorVersionClient,
+    ActorVersionClientAsync,
     ActorVersionCollectionClient,
+    ActorVersionCollectionClientAsync,
     BuildClient,
+    BuildClientAsync,
     BuildCollectionClient,
+    BuildCollectionClientAsync,
     DatasetClient,
+    DatasetClientAsync,
     DatasetCollectionClient,
+    DatasetCollectionClientAsync,
     KeyValueStoreClient,
+    KeyValueStoreClientAsync,
     KeyValueStoreCollectionClient,
+    KeyValueStoreCollectionClientAsync,
     LogClient,
+    LogClientAsync,
     RequestQueueClient,
+    RequestQueueClientAsync,
     RequestQueueCollectionClient,
+    RequestQueueCollectionClientAsync,
     RunClient,
+    RunClientAsync,
     RunCollectionClient,
+    RunCollectionClientAsync,
     ScheduleClient,
+    ScheduleClientAsync,
     ScheduleCollectionClient,
+    ScheduleCollectionClientAsync,
     TaskClient,
+    TaskClientAsync,
     TaskCollectionClient,
+    TaskCollectionClientAsync,
     UserClient,
+    UserClientAsync,
     WebhookClient,
+    WebhookClientAsync,
     WebhookCollectionClient,
+    WebhookCollectionClientAsync,
     WebhookDispatchClient,
+    WebhookDispatchClientAsync,
     WebhookDispatchCollectionClient,
+    WebhookDispatchCollectionClientAsync,
 )
 
 __all__ = [
     'ActorJobBaseClient',
+    'ActorJobBaseClientAsync',
     'BaseClient',
+    'BaseClientAsync',
     'ResourceClient',
+    'ResourceClientAsync',
     'ResourceCollectionClient',
+    'ResourceCollectionClientAsync',
     'ActorClient',
+    'ActorClientAsync',
     'ActorCollectionClient',
+    'ActorCollectionClientAsync',
     'ActorVersionClient',
+    'ActorVersionClientAsync',
     'ActorVersionCollectionClient',
+    'ActorVersionCollectionClientAsync',
     'BuildClient',
+    'BuildClientAsync',
     'BuildCollectionClient',
+    'BuildCollectionClientAsync',
     'DatasetClient',
+    'DatasetClientAsync',
     'DatasetCollectionClient',
+    'DatasetCollectionClientAsync',
     'KeyValueStoreClient',
+    'KeyValueStoreClientAsync',
     'KeyValueStoreCollectionClient',
+    'KeyValueStoreCollectionClientAsync',
     'LogClient',
+    'LogClientAsync',
     'RequestQueueClient',
+    'RequestQueueClientAsync',
     'RequestQueueCollectionClient',
+    'RequestQueueCollectionClientAsync',
     'RunClient',
+    'RunClientAsync',
     'RunCollectionClient',
+    'RunCollectionClientAsync',
     'ScheduleClient',
+    'ScheduleClientAsync',
     'ScheduleCollectionClient',
+    'ScheduleCollectionClientAsync',
     'TaskClient',
+    'TaskClientAsync',
     'TaskCollectionClient',
+    'TaskCollectionClientAsync',
     'UserClient',
+    'UserClientAsync',
     'WebhookClient',
+    'WebhookClientAsync',
     'WebhookCollectionClient',
+    'WebhookCollectionClientAsync',
     'WebhookDispatchClient',
+    'WebhookDispatchClientAsync',
     'WebhookDispatchCollectionClient',
+    'WebhookDispatchCollectionClientAsync',
 ]
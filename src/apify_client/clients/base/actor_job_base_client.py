@@ -1,3 +1,4 @@
+import asyncio
 import math
 import time
 from datetime import datetime
@@ -5,14 +6,20 @@ from typing import Dict, Optional
 
 from ..._consts import TERMINAL_ACTOR_JOB_STATUSES, ActorJobStatus
 from ..._errors import ApifyApiError
-from ..._utils import _catch_not_found_or_throw, _parse_date_fields, _pluck_data
-from .resource_client import ResourceClient
+from ..._utils import _catch_not_found_or_throw, _get_parsed_body, _get_remaining_secs_to_deadline, _parse_date_fields, _pluck_data
+from .resource_client import ResourceClient, ResourceClientAsync
 
 DEFAULT_WAIT_FOR_FINISH_SEC = 999999
 
 # After how many seconds we give up trying in case job doesn't exist
 DEFAULT_WAIT_WHEN_JOB_NOT_EXIST_SEC = 3
 
+# How long to wait before polling the job again
+WAIT_BETWEEN_POLLS_SEC = 0.25
+
+# How many seconds before the deadline the API should stop waiting for the job and respond
+DEADLINE_RESPONSE_MARGIN_SEC = 1
+
 
 class ActorJobBaseClient(ResourceClient):
     """Base sub-client class for actor runs and actor builds."""
@@ -28,13 +35,18 @@ class ActorJobBaseClient(ResourceClient):
             if wait_secs is not None:
                 wait_for_finish = wait_secs - seconds_elapsed
 
+            # The API has to respond before the deadline, so it can't wait for the job to finish until then
+            remaining_secs = _get_remaining_secs_to_deadline()
+            if remaining_secs is not None:
+                wait_for_finish = max(0, min(wait_for_finish, math.floor(remaining_secs) - DEADLINE_RESPONSE_MARGIN_SEC))
+
             try:
                 response = self.http_client.call(
                     url=self._url(),
                     method='GET',
                     params=self._params(waitForFinish=wait_for_finish),
                 )
-                job = _parse_date_fields(_pluck_data(response.json()))
+                job = _parse_date_fields(_pluck_data(_get_parsed_body(response)), self.http_client.parse_dates)
 
                 seconds_elapsed = math.floor(((datetime.now() - started_at).total_seconds()))
                 if (
@@ -55,7 +67,7 @@ class ActorJobBaseClient(ResourceClient):
                     return None
 
             # It might take some time for database replicas to get up-to-date so sleep a bit before retrying
-            time.sleep(250)
+            time.sleep(WAIT_BETWEEN_POLLS_SEC)
 
         return job
 
@@ -65,4 +77,63 @@ class ActorJobBaseClient(ResourceClient):
             method='POST',
             params=self._params(),
         )
-        return _parse_date_fields(_pluck_data(response.json()))
+        return _parse_date_fields(_pluck_data(_get_parsed_body(response)), self.http_client.parse_dates)
+
+
+class ActorJobBaseClientAsync(ResourceClientAsync):
+    """Base async sub-client class for actor runs and actor builds."""
+
+    async def _wait_for_finish(self, wait_secs: Optional[int] = None) -> Optional[Dict]:
+        started_at = datetime.now()
+        should_repeat = True
+        job: Optional[Dict] = None
+        seconds_elapsed = 0
+
+        while should_repeat:
+            wait_for_finish = DEFAULT_WAIT_FOR_FINISH_SEC
+            if wait_secs is not None:
+                wait_for_finish = wait_secs - seconds_elapsed
+
+            # The API has to respond before the deadline, so it can't wait for the job to finish until then
+            remaining_secs = _get_remaining_secs_to_deadline()
+            if remaining_secs is not None:
+                wait_for_finish = max(0, min(wait_for_finish, math.floor(remaining_secs) - DEADLINE_RESPONSE_MARGIN_SEC))
+
+            try:
+                response = await self.http_client.call(
+                    url=self._url(),
+                    method='GET',
+                    params=self._params(waitForFinish=wait_for_finish),
+                )
+                job = _parse_date_fields(_pluck_data(_get_parsed_body(response)), self.http_client.parse_dates)
+
+                seconds_elapsed = math.floor(((datetime.now() - started_at).total_seconds()))
+                if (
+                    ActorJobStatus(job['status']) in TERMINAL_ACTOR_JOB_STATUSES or (wait_secs is not None and seconds_elapsed >= wait_secs)
+                ):
+                    should_repeat = False
+
+                if not should_repeat:
+                    # Early return here so that we avoid the sleep below if not needed
+                    return job
+
+            except ApifyApiError as exc:
+                _catch_not_found_or_throw(exc)
+
+                # If there are still not found errors after DEFAULT_WAIT_WHEN_JOB_NOT_EXIST_SEC, we give up and return None
+                # In such case, the requested record probably really doesn't exist.
+                if (seconds_elapsed > DEFAULT_WAIT_WHEN_JOB_NOT_EXIST_SEC):
+                    return None
+
+            # It might take some time for database replicas to get up-to-date so sleep a bit before retrying
+            await asyncio.sleep(WAIT_BETWEEN_POLLS_SEC)
+
+        return job
+
+    async def _abort(self) -> Dict:
+        response = await self.http_client.call(
+            url=self._url('abort'),
+            method='POST',
+            params=self._params(),
+        )
+        return _parse_date_fields(_pluck_data(_get_parsed_body(response)), self.http_client.parse_dates)
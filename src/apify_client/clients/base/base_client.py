@@ -1,44 +1,27 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
-from ..._http_client import _HTTPClient
+from ..._http_client import _HTTPClient, _HTTPClientAsync
 from ..._utils import _to_safe_id
 
 # Conditional import only executed when type checking, otherwise we'd get circular dependency issues
 if TYPE_CHECKING:
-    from ...client import ApifyClient
+    from ...client import ApifyClient, ApifyClientAsync
 
 
-class BaseClient:
-    """Base class for sub-clients."""
-
-    def __init__(
-        self,
-        *,
-        base_url: str,
-        root_client: ApifyClient,
-        http_client: _HTTPClient,
-        resource_id: Optional[str] = None,
-        resource_path: str,
-        params: Optional[Dict] = None,
-    ) -> None:
-        """Initialize the sub-client.
+class _BaseBaseClient:
+    resource_id: Optional[str]
+    url: str
+    params: Dict
+    http_client: Union[_HTTPClient, _HTTPClientAsync]
+    root_client: Union[ApifyClient, ApifyClientAsync]
 
-        Args:
-            base_url (str): Base URL of the API server
-            root_client (ApifyClient): The ApifyClient instance under which this resource client exists
-            http_client (_HTTPClient): The _HTTPClient instance to be used in this client
-            resource_id (str): ID of the manipulated resource, in case of a single-resource client
-            resource_path (str): Path to the resource's endpoint on the API server
-            params (dict): Parameters to include in all requests from this client
-        """
+    def _init(self, *, base_url: str, resource_id: Optional[str], resource_path: str, params: Optional[Dict]) -> None:
         if resource_path.endswith('/'):
             raise ValueError('resource_path must not end with "/"')
 
         self.base_url = base_url
-        self.root_client = root_client
-        self.http_client = http_client
         self.params = params or {}
         self.resource_path = resource_path
         self.resource_id = resource_id
@@ -70,3 +53,65 @@ class BaseClient:
             **options,
             **kwargs,
         }
+
+
+class BaseClient(_BaseBaseClient):
+    """Base class for sub-clients."""
+
+    http_client: _HTTPClient
+    root_client: ApifyClient
+
+    def __init__(
+        self,
+        *,
+        base_url: str,
+        root_client: ApifyClient,
+        http_client: _HTTPClient,
+        resource_id: Optional[str] = None,
+        resource_path: str,
+        params: Optional[Dict] = None,
+    ) -> None:
+        """Initialize the sub-client.
+
+        Args:
+            base_url (str): Base URL of the API server
+            root_client (ApifyClient): The ApifyClient instance under which this resource client exists
+            http_client (_HTTPClient): The _HTTPClient instance to be used in this client
+            resource_id (str): ID of the manipulated resource, in case of a single-resource client
+            resource_path (str): Path to the resource's endpoint on the API server
+            params (dict): Parameters to include in all requests from this client
+        """
+        self._init(base_url=base_url, resource_id=resource_id, resource_path=resource_path, params=params)
+        self.root_client = root_client
+        self.http_client = http_client
+
+
+class BaseClientAsync(_BaseBaseClient):
+    """Base class for async sub-clients."""
+
+    http_client: _HTTPClientAsync
+    root_client: ApifyClientAsync
+
+    def __init__(
+        self,
+        *,
+        base_url: str,
+        root_client: ApifyClientAsync,
+        http_client: _HTTPClientAsync,
+        resource_id: Optional[str] = None,
+        resource_path: str,
+        params: Optional[Dict] = None,
+    ) -> None:
+        """Initialize the async sub-client.
+
+        Args:
+            base_url (str): Base URL of the API server
+            root_client (ApifyClientAsync): The ApifyClientAsync instance under which this resource client exists
+            http_client (_HTTPClientAsync): The _HTTPClientAsync instance to be used in this client
+            resource_id (str): ID of the manipulated resource, in case of a single-resource client
+            resource_path (str): Path to the resource's endpoint on the API server
+            params (dict): Parameters to include in all requests from this client
+        """
+        self._init(base_url=base_url, resource_id=resource_id, resource_path=resource_path, params=params)
+        self.root_client = root_client
+        self.http_client = http_client
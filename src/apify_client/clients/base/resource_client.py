@@ -1,22 +1,23 @@
 from typing import Dict, Optional
 
 from ..._errors import ApifyApiError
-from ..._utils import _catch_not_found_or_throw, _parse_date_fields, _pluck_data
-from .base_client import BaseClient
+from ..._utils import _catch_not_found_or_throw, _get_parsed_body, _parse_date_fields, _pluck_data
+from .base_client import BaseClient, BaseClientAsync
 
 
 class ResourceClient(BaseClient):
     """Base class for sub-clients manipulating a single resource."""
 
-    def _get(self) -> Optional[Dict]:
+    def _get(self, *, cacheable: bool = False) -> Optional[Dict]:
         try:
             response = self.http_client.call(
                 url=self.url,
                 method='GET',
                 params=self._params(),
+                cacheable=cacheable,
             )
 
-            return _parse_date_fields(_pluck_data(response.json()))
+            return _parse_date_fields(_pluck_data(_get_parsed_body(response)), self.http_client.parse_dates)
 
         except ApifyApiError as exc:
             _catch_not_found_or_throw(exc)
@@ -31,7 +32,7 @@ class ResourceClient(BaseClient):
             json=updated_fields,
         )
 
-        return _parse_date_fields(_pluck_data(response.json()))
+        return _parse_date_fields(_pluck_data(_get_parsed_body(response)), self.http_client.parse_dates)
 
     def _delete(self) -> None:
         try:
@@ -43,3 +44,44 @@ class ResourceClient(BaseClient):
 
         except ApifyApiError as exc:
             _catch_not_found_or_throw(exc)
+
+
+class ResourceClientAsync(BaseClientAsync):
+    """Base class for async sub-clients manipulating a single resource."""
+
+    async def _get(self, *, cacheable: bool = False) -> Optional[Dict]:
+        try:
+            response = await self.http_client.call(
+                url=self.url,
+                method='GET',
+                params=self._params(),
+                cacheable=cacheable,
+            )
+
+            return _parse_date_fields(_pluck_data(_get_parsed_body(response)), self.http_client.parse_dates)
+
+        except ApifyApiError as exc:
+            _catch_not_found_or_throw(exc)
+
+        return None
+
+    async def _update(self, updated_fields: Dict) -> Dict:
+        response = await self.http_client.call(
+            url=self._url(),
+            method='PUT',
+            params=self._params(),
+            json=updated_fields,
+        )
+
+        return _parse_date_fields(_pluck_data(_get_parsed_body(response)), self.http_client.parse_dates)
+
+    async def _delete(self) -> None:
+        try:
+            await self.http_client.call(
+                url=self._url(),
+                method='DELETE',
+                params=self._params(),
+            )
+
+        except ApifyApiError as exc:
+            _catch_not_found_or_throw(exc)
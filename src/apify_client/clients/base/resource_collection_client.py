@@ -1,20 +1,63 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Generator, Optional
 
-from ..._utils import ListPage, _parse_date_fields, _pluck_data
-from .base_client import BaseClient
+from ..._utils import (
+    JSON_STREAM_CHUNK_SIZE_BYTES,
+    ListPage,
+    _get_parsed_body,
+    _IncrementalJSONReader,
+    _parse_date_fields,
+    _parse_date_fields_of_list_items,
+    _pluck_data,
+)
+from .base_client import BaseClient, BaseClientAsync
 
 
 class ResourceCollectionClient(BaseClient):
     """Base class for sub-clients manipulating a resource collection."""
 
-    def _list(self, **kwargs: Any) -> ListPage:
+    def _list(self, *, lazy: bool = False, **kwargs: Any) -> ListPage:
+        if lazy:
+            return self._list_lazily(**kwargs)
+
+        response = self.http_client.call(
+            url=self._url(),
+            method='GET',
+            params=self._params(**kwargs),
+        )
+
+        return ListPage(_parse_date_fields(_pluck_data(_get_parsed_body(response)), self.http_client.parse_dates))
+
+    def _list_lazily(self, **kwargs: Any) -> ListPage:
         response = self.http_client.call(
             url=self._url(),
             method='GET',
             params=self._params(**kwargs),
+            stream=True,
+            parse_response=False,
         )
 
-        return ListPage(_parse_date_fields(_pluck_data(response.json())))
+        try:
+            reader = _IncrementalJSONReader(response.iter_content(chunk_size=JSON_STREAM_CHUNK_SIZE_BYTES))
+            _, has_data = reader.read_object_until_key('data')
+            if not has_data:
+                raise ValueError('The "data" property is missing in the response.')
+            # The API sends the pagination info before the items, so we can read it right away and parse the items only when needed
+            data, has_items = reader.read_object_until_key('items')
+        except Exception:
+            response.close()
+            raise
+
+        def iterate_items() -> Generator:
+            try:
+                if has_items:
+                    yield from _parse_date_fields_of_list_items(reader.iterate_array(), self.http_client.parse_dates)
+            finally:
+                response.close()
+
+        return ListPage({
+            **_parse_date_fields(data, self.http_client.parse_dates),
+            'items': iterate_items(),
+        })
 
     def _create(self, resource: Dict) -> Dict:
         response = self.http_client.call(
@@ -24,7 +67,7 @@ class ResourceCollectionClient(BaseClient):
             json=resource,
         )
 
-        return _parse_date_fields(_pluck_data(response.json()))
+        return _parse_date_fields(_pluck_data(_get_parsed_body(response)), self.http_client.parse_dates)
 
     def _get_or_create(self, name: Optional[str] = None) -> Dict:
         response = self.http_client.call(
@@ -33,4 +76,36 @@ class ResourceCollectionClient(BaseClient):
             params=self._params(name=name),
         )
 
-        return _parse_date_fields(_pluck_data(response.json()))
+        return _parse_date_fields(_pluck_data(_get_parsed_body(response)), self.http_client.parse_dates)
+
+
+class ResourceCollectionClientAsync(BaseClientAsync):
+    """Base class for async sub-clients manipulating a resource collection."""
+
+    async def _list(self, **kwargs: Any) -> ListPage:
+        response = await self.http_client.call(
+            url=self._url(),
+            method='GET',
+            params=self._params(**kwargs),
+        )
+
+        return ListPage(_parse_date_fields(_pluck_data(_get_parsed_body(response)), self.http_client.parse_dates))
+
+    async def _create(self, resource: Dict) -> Dict:
+        response = await self.http_client.call(
+            url=self._url(),
+            method='POST',
+            params=self._params(),
+            json=resource,
+        )
+
+        return _parse_date_fields(_pluck_data(_get_parsed_body(response)), self.http_client.parse_dates)
+
+    async def _get_or_create(self, name: Optional[str] = None) -> Dict:
+        response = await self.http_client.call(
+            url=self._url(),
+            method='POST',
+            params=self._params(name=name),
+        )
+
+        return _parse_date_fields(_pluck_data(_get_parsed_body(response)), self.http_client.parse_dates)
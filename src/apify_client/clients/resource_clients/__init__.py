@@ -1,51 +1,75 @@
-from .actor import ActorClient
-from .actor_collection import ActorCollectionClient
-from .actor_version import ActorVersionClient
-from .actor_version_collection import ActorVersionCollectionClient
-from .build import BuildClient
-from .build_collection import BuildCollectionClient
-from .dataset import DatasetClient
-from .dataset_collection import DatasetCollectionClient
-from .key_value_store import KeyValueStoreClient
-from .key_value_store_collection import KeyValueStoreCollectionClient
-from .log import LogClient
-from .request_queue import RequestQueueClient
-from .request_queue_collection import RequestQueueCollectionClient
-from .run import RunClient
-from .run_collection import RunCollectionClient
-from .schedule import ScheduleClient
-from .schedule_collection import ScheduleCollectionClient
-from .task import TaskClient
-from .task_collection import TaskCollectionClient
-from .user import UserClient
-from .webhook import WebhookClient
-from .webhook_collection import WebhookCollectionClient
-from .webhook_dispatch import WebhookDispatchClient
-from .webhook_dispatch_collection import WebhookDispatchCollectionClient
+from .actor import ActorClient, ActorClientAsync
+from .actor_collection import ActorCollectionClient, ActorCollectionClientAsync
+from .actor_version import ActorVersionClient, ActorVersionClientAsync
+from .actor_version_collection import ActorVersionCollectionClient, ActorVersionCollectionClientAsync
+from .build import BuildClient, BuildClientAsync
+from .build_collection import BuildCollectionClient, BuildCollectionClientAsync
+from .dataset import DatasetClient, DatasetClientAsync
+from .dataset_collection import DatasetCollectionClient, DatasetCollectionClientAsync
+from .key_value_store import KeyValueStoreClient, KeyValueStoreClientAsync
+from .key_value_store_collection import KeyValueStoreCollectionClient, KeyValueStoreCollectionClientAsync
+from .log import LogClient, LogClientAsync
+from .request_queue import RequestQueueClient, RequestQueueClientAsync
+from .request_queue_collection import RequestQueueCollectionClient, RequestQueueCollectionClientAsync
+from .run import RunClient, RunClientAsync
+from .run_collection import RunCollectionClient, RunCollectionClientAsync
+from .schedule import ScheduleClient, ScheduleClientAsync
+from .schedule_collection import ScheduleCollectionClient, ScheduleCollectionClientAsync
+from .task import TaskClient, TaskClientAsync
+from .task_collection import TaskCollectionClient, TaskCollectionClientAsync
+from .user import UserClient, UserClientAsync
+from .webhook import WebhookClient, WebhookClientAsync
+from .webhook_collection import WebhookCollectionClient, WebhookCollectionClientAsync
+from .webhook_dispatch import WebhookDispatchClient, WebhookDispatchClientAsync
+from .webhook_dispatch_collection import WebhookDispatchCollectionClient, WebhookDispatchCollectionClientAsync
 
 __all__ = [
     'ActorClient',
+    'ActorClientAsync',
     'ActorCollectionClient',
+    'ActorCollectionClientAsync',
     'ActorVersionClient',
+    'ActorVersionClientAsync',
     'ActorVersionCollectionClient',
+    'ActorVersionCollectionClientAsync',
     'RunClient',
+    'RunClientAsync',
     'RunCollectionClient',
+    'RunCollectionClientAsync',
     'BuildClient',
+    'BuildClientAsync',
     'BuildCollectionClient',
+    'BuildCollectionClientAsync',
     'DatasetClient',
+    'DatasetClientAsync',
     'DatasetCollectionClient',
+    'DatasetCollectionClientAsync',
     'KeyValueStoreClient',
+    'KeyValueStoreClientAsync',
     'KeyValueStoreCollectionClient',
+    'KeyValueStoreCollectionClientAsync',
     'RequestQueueClient',
+    'RequestQueueClientAsync',
     'RequestQueueCollectionClient',
+    'RequestQueueCollectionClientAsync',
     'LogClient',
+    'LogClientAsync',
     'WebhookClient',
+    'WebhookClientAsync',
     'WebhookCollectionClient',
+    'WebhookCollectionClientAsync',
     'WebhookDispatchClient',
+    'WebhookDispatchClientAsync',
     'WebhookDispatchCollectionClient',
+    'WebhookDispatchCollectionClientAsync',
     'TaskClient',
+    'TaskClientAsync',
     'TaskCollectionClient',
+    'TaskCollectionClientAsync',
     'ScheduleClient',
+    'ScheduleClientAsync',
     'ScheduleCollectionClient',
+    'ScheduleCollectionClientAsync',
     'UserClient',
+    'UserClientAsync',
 ]
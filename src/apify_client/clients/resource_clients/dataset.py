@@ -1,9 +1,273 @@
+import asyncio
+import contextvars
+import functools
 import io
-from typing import Any, Dict, Generator, List, Optional, cast
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Deque, Dict, Generator, Iterable, List, Optional, Set, Union, cast
 
-from ..._types import JSONSerializable
-from ..._utils import ListPage
-from ..base import ResourceClient
+import httpx
+
+from ..._utils import JSON_STREAM_CHUNK_SIZE_BYTES, ListPage, _get_parsed_body, _IncrementalJSONReader, _JSONArrayBody
+from ...json_codec import JSONCodec
+from ..base import ResourceClient, ResourceClientAsync
+
+# The API rejects requests with payloads over 9 MB, the limit applies to the uncompressed JSON body
+DEFAULT_BATCH_WRITER_MAX_PAYLOAD_SIZE_BYTES = 9 * 1024 * 1024
+
+
+class _BaseDatasetBatchWriter:
+    def __init__(self, *, json_codec: JSONCodec, max_payload_size_bytes: int) -> None:
+        self._json_codec = json_codec
+        self._max_payload_size_bytes = max_payload_size_bytes
+        self._buffer: List[bytes] = []
+        # Starts with the size of the brackets of the JSON array
+        self._buffer_size = 2
+        self._error: Optional[BaseException] = None
+
+    def _add_to_buffer(self, item: Any) -> Optional[bytes]:
+        # Returns the payload of the batch which has to be pushed before the item fits in the buffer
+        encoded_item = self._json_codec.dumps(item)
+        if len(encoded_item) + 2 > self._max_payload_size_bytes:
+            raise ValueError(
+                f'The item is too large to be pushed to a dataset, it has {len(encoded_item)} bytes, '
+                f'while the limit is {self._max_payload_size_bytes} bytes',
+            )
+
+        payload = None
+        if self._buffer and self._buffer_size + 1 + len(encoded_item) > self._max_payload_size_bytes:
+            payload = self._take_buffer()
+
+        if self._buffer:
+            self._buffer_size += 1
+        self._buffer.append(encoded_item)
+        self._buffer_size += len(encoded_item)
+        return payload
+
+    def _take_buffer(self) -> Optional[bytes]:
+        if not self._buffer:
+            return None
+        payload = b'[' + b','.join(self._buffer) + b']'
+        self._buffer = []
+        self._buffer_size = 2
+        return payload
+
+    def _record_batch_error(self, batch: Union[Future, asyncio.Task]) -> None:
+        # Only the first error is kept, the following ones are most likely caused by the same problem
+        if self._error is None and not batch.cancelled() and batch.exception() is not None:
+            self._error = batch.exception()
+
+    def _raise_error_if_any(self) -> None:
+        if self._error is not None:
+            error = self._error
+            self._error = None
+            raise error
+
+
+class DatasetBatchWriter(_BaseDatasetBatchWriter):
+    """Buffers items and pushes them to a dataset in batches, which stay under the API payload size limit.
+
+    The batches are pushed on a pool of worker threads, so the order of the items across the batches is not preserved.
+    When too many batches are waiting to be pushed, adding more items blocks until some of them finish.
+    If pushing a batch fails, the error is raised from the next call of `add`, `add_items`, `flush` or `close`.
+    """
+
+    def __init__(
+        self,
+        dataset_client: 'DatasetClient',
+        *,
+        max_payload_size_bytes: int = DEFAULT_BATCH_WRITER_MAX_PAYLOAD_SIZE_BYTES,
+        max_workers: Optional[int] = None,
+        max_pending_batches: Optional[int] = None,
+    ) -> None:
+        """Initialize the DatasetBatchWriter.
+
+        Args:
+            dataset_client (DatasetClient): The client of the dataset to which to push the items
+            max_payload_size_bytes (int, optional): The maximum size of one batch of items, serialized to JSON
+            max_workers (int, optional): How many batches can be pushed concurrently at most, within that, the concurrency
+                is adapted to how the API copes by the concurrency governor of the client. Defaults to its maximum concurrency
+            max_pending_batches (int, optional): How many batches can be pushed or waiting to be pushed at once,
+                before adding more items blocks. Defaults to twice the `max_workers`
+        """
+        super().__init__(json_codec=dataset_client.http_client.json_codec, max_payload_size_bytes=max_payload_size_bytes)
+        self._dataset_client = dataset_client
+        self._concurrency_governor = dataset_client.http_client.concurrency_governor
+        max_workers = max_workers or self._concurrency_governor.max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._pending_batches_semaphore = threading.BoundedSemaphore(max_pending_batches or 2 * max_workers)
+        self._pending_batches: Set[Future] = set()
+        self._lock = threading.Lock()
+
+    def add(self, item: Any) -> None:
+        """Add an item to be pushed to the dataset.
+
+        Args:
+            item (Any): The item to push, it has to be serializable to JSON
+        """
+        self._raise_error_if_any()
+        payload = self._add_to_buffer(item)
+        if payload is not None:
+            self._push_batch(payload)
+
+    def add_items(self, items: Iterable[Any]) -> None:
+        """Add multiple items to be pushed to the dataset.
+
+        Args:
+            items (Iterable): The items to push, they have to be serializable to JSON
+        """
+        for item in items:
+            self.add(item)
+
+    def flush(self) -> None:
+        """Push all the buffered items and wait until all the batches are pushed."""
+        payload = self._take_buffer()
+        if payload is not None:
+            self._push_batch(payload)
+
+        with self._lock:
+            pending_batches = list(self._pending_batches)
+        wait(pending_batches)
+        # The done callbacks of the batches can still be running at this point, so the errors are collected here too
+        for batch in pending_batches:
+            self._record_batch_error(batch)
+        self._raise_error_if_any()
+
+    def close(self) -> None:
+        """Push all the buffered items and shut down the worker pool."""
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown()
+
+    def __enter__(self) -> 'DatasetBatchWriter':
+        """Use the writer as a context manager, which pushes all the remaining items on exit."""
+        return self
+
+    def __exit__(self, *_exc_info: Any) -> None:
+        """Push all the remaining items and shut down the worker pool."""
+        self.close()
+
+    def _push_batch(self, payload: bytes) -> None:
+        self._pending_batches_semaphore.acquire()
+
+        try:
+            # The worker threads push the batches in the context of the caller, so that they respect its deadline
+            future = self._executor.submit(contextvars.copy_context().run, self._push_batch_when_slot_free, payload)
+        except BaseException:
+            self._pending_batches_semaphore.release()
+            raise
+
+        with self._lock:
+            self._pending_batches.add(future)
+        future.add_done_callback(self._on_batch_done)
+
+    def _push_batch_when_slot_free(self, payload: bytes) -> None:
+        with self._concurrency_governor.slot():
+            self._dataset_client.push_items(payload)
+
+    def _on_batch_done(self, future: Future) -> None:
+        with self._lock:
+            self._pending_batches.discard(future)
+        self._pending_batches_semaphore.release()
+        self._record_batch_error(future)
+
+
+class DatasetBatchWriterAsync(_BaseDatasetBatchWriter):
+    """Buffers items and pushes them to a dataset in batches, which stay under the API payload size limit.
+
+    The batches are pushed in concurrent tasks, so the order of the items across the batches is not preserved.
+    When too many batches are waiting to be pushed, adding more items waits until some of them finish.
+    If pushing a batch fails, the error is raised from the next call of `add`, `add_items`, `flush` or `close`.
+    """
+
+    def __init__(
+        self,
+        dataset_client: 'DatasetClientAsync',
+        *,
+        max_payload_size_bytes: int = DEFAULT_BATCH_WRITER_MAX_PAYLOAD_SIZE_BYTES,
+        max_workers: Optional[int] = None,
+        max_pending_batches: Optional[int] = None,
+    ) -> None:
+        """Initialize the DatasetBatchWriterAsync.
+
+        Args:
+            dataset_client (DatasetClientAsync): The client of the dataset to which to push the items
+            max_payload_size_bytes (int, optional): The maximum size of one batch of items, serialized to JSON
+            max_workers (int, optional): How many batches can be pushed concurrently at most, within that, the concurrency
+                is adapted to how the API copes by the concurrency governor of the client. Defaults to its maximum concurrency
+            max_pending_batches (int, optional): How many batches can be pushed or waiting to be pushed at once,
+                before adding more items waits. Defaults to twice the `max_workers`
+        """
+        super().__init__(json_codec=dataset_client.http_client.json_codec, max_payload_size_bytes=max_payload_size_bytes)
+        self._dataset_client = dataset_client
+        self._concurrency_governor = dataset_client.http_client.concurrency_governor
+        max_workers = max_workers or self._concurrency_governor.max_concurrency
+        self._workers_semaphore = asyncio.Semaphore(max_workers)
+        self._pending_batches_semaphore = asyncio.Semaphore(max_pending_batches or 2 * max_workers)
+        self._pending_batches: Set[asyncio.Task] = set()
+
+    async def add(self, item: Any) -> None:
+        """Add an item to be pushed to the dataset.
+
+        Args:
+            item (Any): The item to push, it has to be serializable to JSON
+        """
+        self._raise_error_if_any()
+        payload = self._add_to_buffer(item)
+        if payload is not None:
+            await self._push_batch(payload)
+
+    async def add_items(self, items: Iterable[Any]) -> None:
+        """Add multiple items to be pushed to the dataset.
+
+        Args:
+            items (Iterable): The items to push, they have to be serializable to JSON
+        """
+        for item in items:
+            await self.add(item)
+
+    async def flush(self) -> None:
+        """Push all the buffered items and wait until all the batches are pushed."""
+        payload = self._take_buffer()
+        if payload is not None:
+            await self._push_batch(payload)
+
+        pending_batches = list(self._pending_batches)
+        if pending_batches:
+            await asyncio.wait(pending_batches)
+        for batch in pending_batches:
+            self._record_batch_error(batch)
+        self._raise_error_if_any()
+
+    async def close(self) -> None:
+        """Push all the buffered items."""
+        await self.flush()
+
+    async def __aenter__(self) -> 'DatasetBatchWriterAsync':
+        """Use the writer as an async context manager, which pushes all the remaining items on exit."""
+        return self
+
+    async def __aexit__(self, *_exc_info: Any) -> None:
+        """Push all the remaining items."""
+        await self.close()
+
+    async def _push_batch(self, payload: bytes) -> None:
+        await self._pending_batches_semaphore.acquire()
+        task = asyncio.create_task(self._push_batch_when_worker_free(payload))
+        self._pending_batches.add(task)
+        task.add_done_callback(self._on_batch_done)
+
+    async def _push_batch_when_worker_free(self, payload: bytes) -> None:
+        async with self._workers_semaphore, self._concurrency_governor.slot_async():
+            await self._dataset_client.push_items(payload)
+
+    def _on_batch_done(self, task: asyncio.Task) -> None:
+        self._pending_batches.discard(task)
+        self._pending_batches_semaphore.release()
+        self._record_batch_error(task)
 
 
 class DatasetClient(ResourceClient):
@@ -22,7 +286,7 @@ class DatasetClient(ResourceClient):
         Returns:
             dict, optional: The retrieved dataset, or None, if it does not exist
         """
-        return self._get()
+        return self._get(cacheable=True)
 
     def update(self, *, name: Optional[str] = None) -> Dict:
         """Update the dataset with specified fields.
@@ -60,6 +324,7 @@ class DatasetClient(ResourceClient):
         unwind: Optional[str] = None,
         skip_empty: Optional[bool] = None,
         skip_hidden: Optional[bool] = None,
+        lazy: bool = False,
     ) -> ListPage:
         """List the items of the dataset.
 
@@ -86,9 +351,12 @@ class DatasetClient(ResourceClient):
             skip_empty (bool, optional): If True, then empty items are skipped from the output.
                 Note that if used, the results might contain less items than the limit value.
             skip_hidden (bool, optional): If True, then hidden fields are skipped from the output, i.e. fields starting with the # character.
+            lazy (bool, optional): If True, the items are parsed one by one while the response is still arriving,
+                instead of parsing the whole response at once. The returned page can then be iterated over only once,
+                and errors which happen while reading the items are not retried. Accessing the `count` of the page reads all its items.
 
         Returns:
-            dict: The dataset items
+            ListPage: The dataset items
         """
         request_params = self._params(
             offset=offset,
@@ -102,13 +370,16 @@ class DatasetClient(ResourceClient):
             skipHidden=skip_hidden,
         )
 
+        if lazy:
+            return self._list_items_lazily(request_params)
+
         response = self.http_client.call(
             url=self._url('items'),
             method='GET',
             params=request_params,
         )
 
-        data = response.json()
+        data = _get_parsed_body(response)
 
         return ListPage({
             'items': data,
@@ -118,6 +389,31 @@ class DatasetClient(ResourceClient):
             'limit': int(response.headers['x-apify-pagination-limit']),  # API returns 999999999999 when no limit is used
         })
 
+    def _list_items_lazily(self, request_params: Dict) -> ListPage:
+        response = self.http_client.call(
+            url=self._url('items'),
+            method='GET',
+            params=request_params,
+            stream=True,
+            parse_response=False,
+        )
+
+        def iterate_items() -> Generator:
+            try:
+                reader = _IncrementalJSONReader(response.iter_content(chunk_size=JSON_STREAM_CHUNK_SIZE_BYTES))
+                yield from reader.iterate_array()
+            finally:
+                response.close()
+
+        return ListPage({
+            'items': iterate_items(),
+            'total': int(response.headers['x-apify-pagination-total']),
+            'offset': int(response.headers['x-apify-pagination-offset']),
+            # There's no count, because x-apify-pagination-count returns invalid values when hidden/empty items are skipped,
+            # so the page counts the items itself, when the count is first accessed
+            'limit': int(response.headers['x-apify-pagination-limit']),
+        })
+
     def iterate_items(
         self,
         *,
@@ -130,6 +426,7 @@ class DatasetClient(ResourceClient):
         unwind: Optional[str] = None,
         skip_empty: Optional[bool] = None,
         skip_hidden: Optional[bool] = None,
+        prefetch_pages: Optional[int] = None,
     ) -> Generator:
         """Iterate over the items in the dataset.
 
@@ -156,12 +453,21 @@ class DatasetClient(ResourceClient):
             skip_empty (bool, optional): If True, then empty items are skipped from the output.
                 Note that if used, the results might contain less items than the limit value.
             skip_hidden (bool, optional): If True, then hidden fields are skipped from the output, i.e. fields starting with the # character.
+            prefetch_pages (int, optional): If set, the pages following the first one are fetched concurrently on a thread pool,
+                with at most this many pages being fetched or buffered at once. The items are still yielded in order.
+                How many of the pages are fetched at the same time is adapted by the concurrency governor of the client.
+                By default, the pages are fetched one after another. It's ignored together with the clean, skip_empty, skip_hidden
+                or unwind options, with which the pages can have a different number of items than the limit,
+                so the offset of the next page is known only after the previous one arrives.
 
         Yields:
             dict: An item from the dataset
         """
         cache_size = 1000
         first_item = offset
+        # The pages are fetched in fixed windows only when each of them has as many items as requested
+        if clean or skip_empty or skip_hidden or unwind:
+            prefetch_pages = None
 
         # If there is no limit, set last_item to None until we get the total from the first API response
         if limit is None:
@@ -194,6 +500,132 @@ class DatasetClient(ResourceClient):
 
             yield from current_items_page.items
 
+            # Once we know the total from the first page, the remaining pages can be fetched concurrently
+            if prefetch_pages and current_offset < last_item:
+                yield from self._iterate_items_pages_concurrently(
+                    start_offset=current_offset,
+                    end_offset=last_item,
+                    page_size=cache_size,
+                    prefetch_pages=prefetch_pages,
+                    clean=clean,
+                    desc=desc,
+                    fields=fields,
+                    omit=omit,
+                    unwind=unwind,
+                    skip_empty=skip_empty,
+                    skip_hidden=skip_hidden,
+                )
+                return
+
+    def _iterate_items_pages_concurrently(
+        self,
+        *,
+        start_offset: int,
+        end_offset: int,
+        page_size: int,
+        prefetch_pages: int,
+        **list_items_kwargs: Any,
+    ) -> Generator:
+        window_offsets = iter(range(start_offset, end_offset, page_size))
+        executor = ThreadPoolExecutor(max_workers=prefetch_pages)
+        # Pages which are being fetched or were fetched but not yielded yet, in the order of their offsets
+        pending_pages: Deque[Future] = deque()
+
+        def fetch_next_page() -> None:
+            window_offset = next(window_offsets, None)
+            if window_offset is not None:
+                # The worker threads run the calls in the context of the caller, so that they respect its deadline
+                pending_pages.append(executor.submit(contextvars.copy_context().run, functools.partial(
+                    self._list_items_when_slot_free,
+                    offset=window_offset,
+                    limit=min(page_size, end_offset - window_offset),
+                    **list_items_kwargs,
+                )))
+
+        try:
+            for _ in range(prefetch_pages):
+                fetch_next_page()
+
+            while pending_pages:
+                current_items_page = pending_pages.popleft().result()
+                fetch_next_page()
+                yield from current_items_page.items
+        finally:
+            for page_future in pending_pages:
+                page_future.cancel()
+            # The calls which already started are not interrupted, but waited for, so that none of them runs after the iteration ends
+            executor.shutdown(wait=True)
+
+    def _list_items_when_slot_free(self, **kwargs: Any) -> ListPage:
+        with self.http_client.concurrency_governor.slot():
+            return self.list_items(**kwargs)
+
+    def iterate_items_streaming(
+        self,
+        *,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        clean: Optional[bool] = None,
+        desc: Optional[bool] = None,
+        fields: Optional[List[str]] = None,
+        omit: Optional[List[str]] = None,
+        unwind: Optional[str] = None,
+        skip_empty: Optional[bool] = None,
+        skip_hidden: Optional[bool] = None,
+    ) -> Generator:
+        """Iterate over the items in the dataset, streamed in a single API request.
+
+        Unlike `iterate_items()`, which fetches the items in pages, this method fetches all the items in the JSONL format
+        in one request and yields them one by one as their lines arrive, so it uses a constant amount of memory.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/get-items
+
+        Args:
+            offset (int, optional): Number of items that should be skipped at the start. The default value is 0
+            limit (int, optional): Maximum number of items to return. By default there is no limit.
+            desc (bool, optional): By default, results are returned in the same order as they were stored.
+                To reverse the order, set this parameter to True.
+            clean (bool, optional): If True, returns only non-empty items and skips hidden fields (i.e. fields starting with the # character).
+                The clean parameter is just a shortcut for skip_hidden=True and skip_empty=True parameters.
+                Note that since some objects might be skipped from the output, that the result might contain less items than the limit value.
+            fields (list of str, optional): A list of fields which should be picked from the items,
+                only these fields will remain in the resulting record objects.
+                Note that the fields in the outputted items are sorted the same way as they are specified in the fields parameter.
+                You can use this feature to effectively fix the output format.
+            omit (list of str, optional): A list of fields which should be omitted from the items.
+            unwind (str, optional): Name of a field which should be unwound.
+                If the field is an array then every element of the array will become a separate record and merged with parent object.
+                If the unwound field is an object then it is merged with the parent object.
+                If the unwound field is missing or its value is neither an array nor an object and therefore cannot be merged with a parent object,
+                then the item gets preserved as it is. Note that the unwound items ignore the desc parameter.
+            skip_empty (bool, optional): If True, then empty items are skipped from the output.
+                Note that if used, the results might contain less items than the limit value.
+            skip_hidden (bool, optional): If True, then hidden fields are skipped from the output, i.e. fields starting with the # character.
+
+        Yields:
+            dict: An item from the dataset
+        """
+        items_stream = self.stream_items(
+            item_format='jsonl',
+            offset=offset,
+            limit=limit,
+            clean=clean,
+            desc=desc,
+            fields=fields,
+            omit=omit,
+            unwind=unwind,
+            skip_empty=skip_empty,
+            skip_hidden=skip_hidden,
+        )
+
+        try:
+            # Iterating over the raw urllib3 response yields the body line by line as the data arrives
+            for line in items_stream:
+                if line.strip():
+                    yield self.http_client.json_codec.loads(line)
+        finally:
+            items_stream.close()
+
     def download_items(
         self,
         *,
@@ -367,21 +799,29 @@ class DatasetClient(ResourceClient):
         # response.raw is the raw urllib3 response, which subclasses IOBase
         return cast(io.IOBase, response.raw)
 
-    def push_items(self, items: JSONSerializable) -> None:
+    def push_items(self, items: Union[str, bytes, Dict, Iterable[Any]]) -> None:
         """Push items to the dataset.
 
         https://docs.apify.com/api/v2#/reference/datasets/item-collection/put-items
 
         Args:
-            items: The items which to push in the dataset. Either a stringified JSON, a dictionary, or a list of strings or dictionaries.
+            items: The items which to push in the dataset. Either a stringified or UTF-8 encoded JSON, a dictionary,
+                or a list, an iterable or a generator of strings or dictionaries. Lists and tuples are encoded at once, like a dictionary,
+                other iterables and generators are encoded incrementally while the request is being sent, so they don't have to fit in memory.
+                Requests with items from an iterator or a generator can't be retried, because the items are consumed.
         """
-        data = None
+        data: Any = None
         json = None
 
-        if isinstance(items, str):
+        if isinstance(items, (str, bytes)):
             data = items
-        else:
+        elif isinstance(items, (dict, list)):
             json = items
+        elif isinstance(items, tuple):
+            json = list(items)
+        else:
+            # Only the lazy iterables are streamed, the small pushes keep their Content-Length and the minimum size for compression
+            data = _JSONArrayBody(items, self.http_client.json_codec)
 
         self.http_client.call(
             url=self._url('items'),
@@ -391,3 +831,596 @@ class DatasetClient(ResourceClient):
             data=data,
             json=json,
         )
+
+    def batch_writer(
+        self,
+        *,
+        max_payload_size_bytes: int = DEFAULT_BATCH_WRITER_MAX_PAYLOAD_SIZE_BYTES,
+        max_workers: Optional[int] = None,
+        max_pending_batches: Optional[int] = None,
+    ) -> DatasetBatchWriter:
+        """Create a writer, which buffers items and pushes them to the dataset in batches under the API payload size limit.
+
+        Use it as a context manager, which pushes the remaining items when it exits:
+
+            with dataset_client.batch_writer() as writer:
+                for item in items:
+                    writer.add(item)
+
+        Args:
+            max_payload_size_bytes (int, optional): The maximum size of one batch of items, serialized to JSON
+            max_workers (int, optional): How many batches can be pushed concurrently at most, within that, the concurrency
+                is adapted to how the API copes by the concurrency governor of the client. Defaults to its maximum concurrency
+            max_pending_batches (int, optional): How many batches can be pushed or waiting to be pushed at once,
+                before adding more items blocks. Defaults to twice the `max_workers`
+
+        Returns:
+            DatasetBatchWriter: The batch writer
+        """
+        return DatasetBatchWriter(
+            self,
+            max_payload_size_bytes=max_payload_size_bytes,
+            max_workers=max_workers,
+            max_pending_batches=max_pending_batches,
+        )
+
+
+class DatasetClientAsync(ResourceClientAsync):
+    """Async sub-client for manipulating a single dataset."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the DatasetClientAsync."""
+        resource_path = kwargs.pop('resource_path', 'datasets')
+        super().__init__(*args, resource_path=resource_path, **kwargs)
+
+    async def get(self) -> Optional[Dict]:
+        """Retrieve the dataset.
+
+        https://docs.apify.com/api/v2#/reference/datasets/dataset/get-dataset
+
+        Returns:
+            dict, optional: The retrieved dataset, or None, if it does not exist
+        """
+        return await self._get(cacheable=True)
+
+    async def update(self, *, name: Optional[str] = None) -> Dict:
+        """Update the dataset with specified fields.
+
+        https://docs.apify.com/api/v2#/reference/datasets/dataset/update-dataset
+
+        Args:
+            name (str, optional): The new name for the dataset
+
+        Returns:
+            dict: The updated dataset
+        """
+        updated_fields = {}
+        if name is not None:
+            updated_fields['name'] = name
+
+        return await self._update(updated_fields)
+
+    async def delete(self) -> None:
+        """Delete the dataset.
+
+        https://docs.apify.com/api/v2#/reference/datasets/dataset/delete-dataset
+        """
+        return await self._delete()
+
+    async def list_items(
+        self,
+        *,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        clean: Optional[bool] = None,
+        desc: Optional[bool] = None,
+        fields: Optional[List[str]] = None,
+        omit: Optional[List[str]] = None,
+        unwind: Optional[str] = None,
+        skip_empty: Optional[bool] = None,
+        skip_hidden: Optional[bool] = None,
+    ) -> ListPage:
+        """List the items of the dataset.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/get-items
+
+        Args:
+            offset (int, optional): Number of items that should be skipped at the start. The default value is 0
+            limit (int, optional): Maximum number of items to return. By default there is no limit.
+            desc (bool, optional): By default, results are returned in the same order as they were stored.
+                To reverse the order, set this parameter to True.
+            clean (bool, optional): If True, returns only non-empty items and skips hidden fields (i.e. fields starting with the # character).
+                The clean parameter is just a shortcut for skip_hidden=True and skip_empty=True parameters.
+                Note that since some objects might be skipped from the output, that the result might contain less items than the limit value.
+            fields (list of str, optional): A list of fields which should be picked from the items,
+                only these fields will remain in the resulting record objects.
+                Note that the fields in the outputted items are sorted the same way as they are specified in the fields parameter.
+                You can use this feature to effectively fix the output format.
+            omit (list of str, optional): A list of fields which should be omitted from the items.
+            unwind (str, optional): Name of a field which should be unwound.
+                If the field is an array then every element of the array will become a separate record and merged with parent object.
+                If the unwound field is an object then it is merged with the parent object.
+                If the unwound field is missing or its value is neither an array nor an object and therefore cannot be merged with a parent object,
+                then the item gets preserved as it is. Note that the unwound items ignore the desc parameter.
+            skip_empty (bool, optional): If True, then empty items are skipped from the output.
+                Note that if used, the results might contain less items than the limit value.
+            skip_hidden (bool, optional): If True, then hidden fields are skipped from the output, i.e. fields starting with the # character.
+
+        Returns:
+            ListPage: The dataset items
+        """
+        request_params = self._params(
+            offset=offset,
+            limit=limit,
+            desc=desc,
+            clean=clean,
+            fields=fields,
+            omit=omit,
+            unwind=unwind,
+            skipEmpty=skip_empty,
+            skipHidden=skip_hidden,
+        )
+
+        response = await self.http_client.call(
+            url=self._url('items'),
+            method='GET',
+            params=request_params,
+        )
+
+        data = _get_parsed_body(response)
+
+        return ListPage({
+            'items': data,
+            'total': int(response.headers['x-apify-pagination-total']),
+            'offset': int(response.headers['x-apify-pagination-offset']),
+            'count': len(data),  # because x-apify-pagination-count returns invalid values when hidden/empty items are skipped
+            'limit': int(response.headers['x-apify-pagination-limit']),  # API returns 999999999999 when no limit is used
+        })
+
+    async def iterate_items(
+        self,
+        *,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        clean: Optional[bool] = None,
+        desc: Optional[bool] = None,
+        fields: Optional[List[str]] = None,
+        omit: Optional[List[str]] = None,
+        unwind: Optional[str] = None,
+        skip_empty: Optional[bool] = None,
+        skip_hidden: Optional[bool] = None,
+        prefetch_pages: Optional[int] = None,
+    ) -> AsyncGenerator:
+        """Iterate over the items in the dataset.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/get-items
+
+        Args:
+            offset (int, optional): Number of items that should be skipped at the start. The default value is 0
+            limit (int, optional): Maximum number of items to return. By default there is no limit.
+            desc (bool, optional): By default, results are returned in the same order as they were stored.
+                To reverse the order, set this parameter to True.
+            clean (bool, optional): If True, returns only non-empty items and skips hidden fields (i.e. fields starting with the # character).
+                The clean parameter is just a shortcut for skip_hidden=True and skip_empty=True parameters.
+                Note that since some objects might be skipped from the output, that the result might contain less items than the limit value.
+            fields (list of str, optional): A list of fields which should be picked from the items,
+                only these fields will remain in the resulting record objects.
+                Note that the fields in the outputted items are sorted the same way as they are specified in the fields parameter.
+                You can use this feature to effectively fix the output format.
+            omit (list of str, optional): A list of fields which should be omitted from the items.
+            unwind (str, optional): Name of a field which should be unwound.
+                If the field is an array then every element of the array will become a separate record and merged with parent object.
+                If the unwound field is an object then it is merged with the parent object.
+                If the unwound field is missing or its value is neither an array nor an object and therefore cannot be merged with a parent object,
+                then the item gets preserved as it is. Note that the unwound items ignore the desc parameter.
+            skip_empty (bool, optional): If True, then empty items are skipped from the output.
+                Note that if used, the results might contain less items than the limit value.
+            skip_hidden (bool, optional): If True, then hidden fields are skipped from the output, i.e. fields starting with the # character.
+            prefetch_pages (int, optional): If set, the pages following the first one are fetched concurrently in asyncio tasks,
+                with at most this many pages being fetched or buffered at once. The items are still yielded in order.
+                How many of the pages are fetched at the same time is adapted by the concurrency governor of the client.
+                By default, the pages are fetched one after another. It's ignored together with the clean, skip_empty, skip_hidden
+                or unwind options, with which the pages can have a different number of items than the limit,
+                so the offset of the next page is known only after the previous one arrives.
+
+        Yields:
+            dict: An item from the dataset
+        """
+        cache_size = 1000
+        first_item = offset
+        # The pages are fetched in fixed windows only when each of them has as many items as requested
+        if clean or skip_empty or skip_hidden or unwind:
+            prefetch_pages = None
+
+        # If there is no limit, set last_item to None until we get the total from the first API response
+        if limit is None:
+            last_item = None
+        else:
+            last_item = offset + limit
+
+        current_offset = first_item
+        while last_item is None or current_offset < last_item:
+            if last_item is None:
+                current_limit = cache_size
+            else:
+                current_limit = min(cache_size, last_item - current_offset)
+
+            current_items_page = await self.list_items(
+                offset=current_offset,
+                limit=current_limit,
+                clean=clean,
+                desc=desc,
+                fields=fields,
+                omit=omit,
+                unwind=unwind,
+                skip_empty=skip_empty,
+                skip_hidden=skip_hidden,
+            )
+
+            current_offset += current_items_page.count
+            if last_item is None or current_items_page.total < last_item:
+                last_item = current_items_page.total
+
+            for item in current_items_page.items:
+                yield item
+
+            # Once we know the total from the first page, the remaining pages can be fetched concurrently
+            if prefetch_pages and current_offset < last_item:
+                async for item in self._iterate_items_pages_concurrently(
+                    start_offset=current_offset,
+                    end_offset=last_item,
+                    page_size=cache_size,
+                    prefetch_pages=prefetch_pages,
+                    clean=clean,
+                    desc=desc,
+                    fields=fields,
+                    omit=omit,
+                    unwind=unwind,
+                    skip_empty=skip_empty,
+                    skip_hidden=skip_hidden,
+                ):
+                    yield item
+                return
+
+    async def _iterate_items_pages_concurrently(
+        self,
+        *,
+        start_offset: int,
+        end_offset: int,
+        page_size: int,
+        prefetch_pages: int,
+        **list_items_kwargs: Any,
+    ) -> AsyncGenerator:
+        window_offsets = iter(range(start_offset, end_offset, page_size))
+        # Pages which are being fetched or were fetched but not yielded yet, in the order of their offsets
+        pending_pages: Deque[asyncio.Task] = deque()
+
+        def fetch_next_page() -> None:
+            window_offset = next(window_offsets, None)
+            if window_offset is not None:
+                pending_pages.append(asyncio.ensure_future(self._list_items_when_slot_free(
+                    offset=window_offset,
+                    limit=min(page_size, end_offset - window_offset),
+                    **list_items_kwargs,
+                )))
+
+        try:
+            for _ in range(prefetch_pages):
+                fetch_next_page()
+
+            while pending_pages:
+                current_items_page = await pending_pages.popleft()
+                fetch_next_page()
+                for item in current_items_page.items:
+                    yield item
+        finally:
+            for page_task in pending_pages:
+                page_task.cancel()
+            # Wait for the cancelled calls to finish, so that none of them runs after the iteration ends
+            await asyncio.gather(*pending_pages, return_exceptions=True)
+
+    async def _list_items_when_slot_free(self, **kwargs: Any) -> ListPage:
+        async with self.http_client.concurrency_governor.slot_async():
+            return await self.list_items(**kwargs)
+
+    async def iterate_items_streaming(
+        self,
+        *,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        clean: Optional[bool] = None,
+        desc: Optional[bool] = None,
+        fields: Optional[List[str]] = None,
+        omit: Optional[List[str]] = None,
+        unwind: Optional[str] = None,
+        skip_empty: Optional[bool] = None,
+        skip_hidden: Optional[bool] = None,
+    ) -> AsyncGenerator:
+        """Iterate over the items in the dataset, streamed in a single API request.
+
+        Unlike `iterate_items()`, which fetches the items in pages, this method fetches all the items in the JSONL format
+        in one request and yields them one by one as their lines arrive, so it uses a constant amount of memory.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/get-items
+
+        Args:
+            offset (int, optional): Number of items that should be skipped at the start. The default value is 0
+            limit (int, optional): Maximum number of items to return. By default there is no limit.
+            desc (bool, optional): By default, results are returned in the same order as they were stored.
+                To reverse the order, set this parameter to True.
+            clean (bool, optional): If True, returns only non-empty items and skips hidden fields (i.e. fields starting with the # character).
+                The clean parameter is just a shortcut for skip_hidden=True and skip_empty=True parameters.
+                Note that since some objects might be skipped from the output, that the result might contain less items than the limit value.
+            fields (list of str, optional): A list of fields which should be picked from the items,
+                only these fields will remain in the resulting record objects.
+                Note that the fields in the outputted items are sorted the same way as they are specified in the fields parameter.
+                You can use this feature to effectively fix the output format.
+            omit (list of str, optional): A list of fields which should be omitted from the items.
+            unwind (str, optional): Name of a field which should be unwound.
+                If the field is an array then every element of the array will become a separate record and merged with parent object.
+                If the unwound field is an object then it is merged with the parent object.
+                If the unwound field is missing or its value is neither an array nor an object and therefore cannot be merged with a parent object,
+                then the item gets preserved as it is. Note that the unwound items ignore the desc parameter.
+            skip_empty (bool, optional): If True, then empty items are skipped from the output.
+                Note that if used, the results might contain less items than the limit value.
+            skip_hidden (bool, optional): If True, then hidden fields are skipped from the output, i.e. fields starting with the # character.
+
+        Yields:
+            dict: An item from the dataset
+        """
+        async with self.stream_items(
+            item_format='jsonl',
+            offset=offset,
+            limit=limit,
+            clean=clean,
+            desc=desc,
+            fields=fields,
+            omit=omit,
+            unwind=unwind,
+            skip_empty=skip_empty,
+            skip_hidden=skip_hidden,
+        ) as response:
+            async for line in response.aiter_lines():
+                if line.strip():
+                    yield self.http_client.json_codec.loads(line)
+
+    async def download_items(
+        self,
+        *,
+        item_format: str = 'json',
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        desc: Optional[bool] = None,
+        clean: Optional[bool] = None,
+        bom: Optional[bool] = None,
+        delimiter: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        omit: Optional[List[str]] = None,
+        unwind: Optional[str] = None,
+        skip_empty: Optional[bool] = None,
+        skip_header_row: Optional[bool] = None,
+        skip_hidden: Optional[bool] = None,
+        xml_root: Optional[str] = None,
+        xml_row: Optional[str] = None,
+    ) -> bytes:
+        """Download the items in the dataset as raw bytes.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/get-items
+
+        Args:
+            item_format (str): Format of the results, possible values are: json, jsonl, csv, html, xlsx, xml and rss. The default value is json.
+            offset (int, optional): Number of items that should be skipped at the start. The default value is 0
+            limit (int, optional): Maximum number of items to return. By default there is no limit.
+            desc (bool, optional): By default, results are returned in the same order as they were stored.
+                To reverse the order, set this parameter to True.
+            clean (bool, optional): If True, returns only non-empty items and skips hidden fields (i.e. fields starting with the # character).
+                The clean parameter is just a shortcut for skip_hidden=True and skip_empty=True parameters.
+                Note that since some objects might be skipped from the output, that the result might contain less items than the limit value.
+            bom (bool, optional): All text responses are encoded in UTF-8 encoding.
+                By default, csv files are prefixed with the UTF-8 Byte Order Mark (BOM),
+                while json, jsonl, xml, html and rss files are not. If you want to override this default behavior,
+                specify bom=True query parameter to include the BOM or bom=False to skip it.
+            delimiter (str, optional): A delimiter character for CSV files. The default delimiter is a simple comma (,).
+            fields (list of str, optional): A list of fields which should be picked from the items,
+                only these fields will remain in the resulting record objects.
+                Note that the fields in the outputted items are sorted the same way as they are specified in the fields parameter.
+                You can use this feature to effectively fix the output format.
+            omit (list of str, optional): A list of fields which should be omitted from the items.
+            unwind (str, optional): Name of a field which should be unwound.
+                If the field is an array then every element of the array will become a separate record and merged with parent object.
+                If the unwound field is an object then it is merged with the parent object.
+                If the unwound field is missing or its value is neither an array nor an object and therefore cannot be merged with a parent object,
+                then the item gets preserved as it is. Note that the unwound items ignore the desc parameter.
+            skip_empty (bool, optional): If True, then empty items are skipped from the output.
+                Note that if used, the results might contain less items than the limit value.
+            skip_header_row (bool, optional): If True, then header row in the csv format is skipped.
+            skip_hidden (bool, optional): If True, then hidden fields are skipped from the output, i.e. fields starting with the # character.
+            xml_root (str, optional): Overrides default root element name of xml output. By default the root element is items.
+            xml_row (str, optional): Overrides default element name that wraps each page or page function result object in xml output.
+                By default the element name is item.
+
+        Returns:
+            bytes: The dataset items as raw bytes
+        """
+        request_params = self._params(
+            format=item_format,
+            offset=offset,
+            limit=limit,
+            desc=desc,
+            clean=clean,
+            bom=bom,
+            delimiter=delimiter,
+            fields=fields,
+            omit=omit,
+            unwind=unwind,
+            skipEmpty=skip_empty,
+            skipHeaderRow=skip_header_row,
+            skipHidden=skip_hidden,
+            xmlRoot=xml_root,
+            xmlRow=xml_row,
+        )
+
+        response = await self.http_client.call(
+            url=self._url('items'),
+            method='GET',
+            params=request_params,
+            parse_response=False,
+        )
+
+        return response.content
+
+    @asynccontextmanager
+    async def stream_items(
+        self,
+        *,
+        item_format: str = 'json',
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        desc: Optional[bool] = None,
+        clean: Optional[bool] = None,
+        bom: Optional[bool] = None,
+        delimiter: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        omit: Optional[List[str]] = None,
+        unwind: Optional[str] = None,
+        skip_empty: Optional[bool] = None,
+        skip_header_row: Optional[bool] = None,
+        skip_hidden: Optional[bool] = None,
+        xml_root: Optional[str] = None,
+        xml_row: Optional[str] = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """Retrieve the items in the dataset as a stream.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/get-items
+
+        Args:
+            item_format (str): Format of the results, possible values are: json, jsonl, csv, html, xlsx, xml and rss. The default value is json.
+            offset (int, optional): Number of items that should be skipped at the start. The default value is 0
+            limit (int, optional): Maximum number of items to return. By default there is no limit.
+            desc (bool, optional): By default, results are returned in the same order as they were stored.
+                To reverse the order, set this parameter to True.
+            clean (bool, optional): If True, returns only non-empty items and skips hidden fields (i.e. fields starting with the # character).
+                The clean parameter is just a shortcut for skip_hidden=True and skip_empty=True parameters.
+                Note that since some objects might be skipped from the output, that the result might contain less items than the limit value.
+            bom (bool, optional): All text responses are encoded in UTF-8 encoding.
+                By default, csv files are prefixed with the UTF-8 Byte Order Mark (BOM),
+                while json, jsonl, xml, html and rss files are not. If you want to override this default behavior,
+                specify bom=True query parameter to include the BOM or bom=False to skip it.
+            delimiter (str, optional): A delimiter character for CSV files. The default delimiter is a simple comma (,).
+            fields (list of str, optional): A list of fields which should be picked from the items,
+                only these fields will remain in the resulting record objects.
+                Note that the fields in the outputted items are sorted the same way as they are specified in the fields parameter.
+                You can use this feature to effectively fix the output format.
+            omit (list of str, optional): A list of fields which should be omitted from the items.
+            unwind (str, optional): Name of a field which should be unwound.
+                If the field is an array then every element of the array will become a separate record and merged with parent object.
+                If the unwound field is an object then it is merged with the parent object.
+                If the unwound field is missing or its value is neither an array nor an object and therefore cannot be merged with a parent object,
+                then the item gets preserved as it is. Note that the unwound items ignore the desc parameter.
+            skip_empty (bool, optional): If True, then empty items are skipped from the output.
+                Note that if used, the results might contain less items than the limit value.
+            skip_header_row (bool, optional): If True, then header row in the csv format is skipped.
+            skip_hidden (bool, optional): If True, then hidden fields are skipped from the output, i.e. fields starting with the # character.
+            xml_root (str, optional): Overrides default root element name of xml output. By default the root element is items.
+            xml_row (str, optional): Overrides default element name that wraps each page or page function result object in xml output.
+                By default the element name is item.
+
+        Returns:
+            httpx.Response: The raw response with the dataset items streamed in its body.
+                The response is closed when the context manager exits.
+        """
+        request_params = self._params(
+            format=item_format,
+            offset=offset,
+            limit=limit,
+            desc=desc,
+            clean=clean,
+            bom=bom,
+            delimiter=delimiter,
+            fields=fields,
+            omit=omit,
+            unwind=unwind,
+            skipEmpty=skip_empty,
+            skipHeaderRow=skip_header_row,
+            skipHidden=skip_hidden,
+            xmlRoot=xml_root,
+            xmlRow=xml_row,
+        )
+
+        response = await self.http_client.call(
+            url=self._url('items'),
+            method='GET',
+            params=request_params,
+            stream=True,
+            parse_response=False,
+        )
+
+        try:
+            yield response
+        finally:
+            await response.aclose()
+
+    async def push_items(self, items: Union[str, bytes, Dict, Iterable[Any]]) -> None:
+        """Push items to the dataset.
+
+        https://docs.apify.com/api/v2#/reference/datasets/item-collection/put-items
+
+        Args:
+            items: The items which to push in the dataset. Either a stringified or UTF-8 encoded JSON, a dictionary,
+                or a list, an iterable or a generator of strings or dictionaries. Lists and tuples are encoded at once, like a dictionary,
+                other iterables and generators are encoded incrementally while the request is being sent, so they don't have to fit in memory.
+                Requests with items from an iterator or a generator can't be retried, because the items are consumed.
+        """
+        data: Any = None
+        json = None
+
+        if isinstance(items, (str, bytes)):
+            data = items
+        elif isinstance(items, (dict, list)):
+            json = items
+        elif isinstance(items, tuple):
+            json = list(items)
+        else:
+            # Only the lazy iterables are streamed, the small pushes keep their Content-Length and the minimum size for compression
+            data = _JSONArrayBody(items, self.http_client.json_codec)
+
+        await self.http_client.call(
+            url=self._url('items'),
+            method='POST',
+            headers={'content-type': 'application/json; charset=utf-8'},
+            params=self._params(),
+            data=data,
+            json=json,
+        )
+
+    def batch_writer(
+        self,
+        *,
+        max_payload_size_bytes: int = DEFAULT_BATCH_WRITER_MAX_PAYLOAD_SIZE_BYTES,
+        max_workers: Optional[int] = None,
+        max_pending_batches: Optional[int] = None,
+    ) -> DatasetBatchWriterAsync:
+        """Create a writer, which buffers items and pushes them to the dataset in batches under the API payload size limit.
+
+        Use it as a context manager, which pushes the remaining items when it exits:
+
+            async with dataset_client.batch_writer() as writer:
+                for item in items:
+                    await writer.add(item)
+
+        Args:
+            max_payload_size_bytes (int, optional): The maximum size of one batch of items, serialized to JSON
+            max_workers (int, optional): How many batches can be pushed concurrently at most, within that, the concurrency
+                is adapted to how the API copes by the concurrency governor of the client. Defaults to its maximum concurrency
+            max_pending_batches (int, optional): How many batches can be pushed or waiting to be pushed at once,
+                before adding more items waits. Defaults to twice the `max_workers`
+
+        Returns:
+            DatasetBatchWriterAsync: The batch writer
+        """
+        return DatasetBatchWriterAsync(
+            self,
+            max_payload_size_bytes=max_payload_size_bytes,
+            max_workers=max_workers,
+            max_pending_batches=max_pending_batches,
+        )
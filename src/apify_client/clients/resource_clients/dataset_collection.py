@@ -1,7 +1,7 @@
 from typing import Any, Dict, Optional
 
 from ..._utils import ListPage
-from ..base import ResourceCollectionClient
+from ..base import ResourceCollectionClient, ResourceCollectionClientAsync
 
 
 class DatasetCollectionClient(ResourceCollectionClient):
@@ -19,6 +19,7 @@ class DatasetCollectionClient(ResourceCollectionClient):
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         desc: Optional[bool] = None,
+        lazy: bool = False,
     ) -> ListPage:
         """List the available datasets.
 
@@ -29,11 +30,13 @@ class DatasetCollectionClient(ResourceCollectionClient):
             limit (int, optional): How many datasets to retrieve
             offset (int, optional): What dataset to include as first when retrieving the list
             desc (bool, optional): Whether to sort the datasets in descending order based on their modification date
+            lazy (bool, optional): If True, the items are parsed one by one while the response is still arriving,
+                instead of parsing the whole response at once. The returned page can then be iterated over only once.
 
         Returns:
             ListPage: The list of available datasets matching the specified filters.
         """
-        return self._list(unnamed=unnamed, limit=limit, offset=offset, desc=desc)
+        return self._list(unnamed=unnamed, limit=limit, offset=offset, desc=desc, lazy=lazy)
 
     def get_or_create(self, *, name: Optional[str] = None) -> Dict:
         """Retrieve a named dataset, or create a new one when it doesn't exist.
@@ -47,3 +50,48 @@ class DatasetCollectionClient(ResourceCollectionClient):
             dict: The retrieved or newly-created dataset.
         """
         return self._get_or_create(name=name)
+
+
+class DatasetCollectionClientAsync(ResourceCollectionClientAsync):
+    """Async sub-client for manipulating datasets."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the DatasetCollectionClientAsync with the passed arguments."""
+        resource_path = kwargs.pop('resource_path', 'datasets')
+        super().__init__(*args, resource_path=resource_path, **kwargs)
+
+    async def list(
+        self,
+        *,
+        unnamed: Optional[bool] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        desc: Optional[bool] = None,
+    ) -> ListPage:
+        """List the available datasets.
+
+        https://docs.apify.com/api/v2#/reference/datasets/dataset-collection/get-list-of-datasets
+
+        Args:
+            unnamed (bool, optional): Whether to include unnamed datasets in the list
+            limit (int, optional): How many datasets to retrieve
+            offset (int, optional): What dataset to include as first when retrieving the list
+            desc (bool, optional): Whether to sort the datasets in descending order based on their modification date
+
+        Returns:
+            ListPage: The list of available datasets matching the specified filters.
+        """
+        return await self._list(unnamed=unnamed, limit=limit, offset=offset, desc=desc)
+
+    async def get_or_create(self, *, name: Optional[str] = None) -> Dict:
+        """Retrieve a named dataset, or create a new one when it doesn't exist.
+
+        https://docs.apify.com/api/v2#/reference/datasets/dataset-collection/create-dataset
+
+        Args:
+            name (str, optional): The name of the dataset to retrieve or create.
+
+        Returns:
+            dict: The retrieved or newly-created dataset.
+        """
+        return await self._get_or_create(name=name)
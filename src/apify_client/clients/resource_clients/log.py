@@ -1,9 +1,12 @@
 import io
-from typing import Any, Optional, cast
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional, cast
+
+import httpx
 
 from ..._errors import ApifyApiError
 from ..._utils import _catch_not_found_or_throw
-from ..base import ResourceClient
+from ..base import ResourceClient, ResourceClientAsync
 
 
 class LogClient(ResourceClient):
@@ -62,3 +65,63 @@ class LogClient(ResourceClient):
             _catch_not_found_or_throw(exc)
 
         return None
+
+
+class LogClientAsync(ResourceClientAsync):
+    """Async sub-client for manipulating logs."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the LogClientAsync."""
+        resource_path = kwargs.pop('resource_path', 'logs')
+        super().__init__(*args, resource_path=resource_path, **kwargs)
+
+    async def get(self) -> Optional[str]:
+        """Retrieve the log as text.
+
+        https://docs.apify.com/api/v2#/reference/logs/log/get-log
+
+        Returns:
+            str, optional: The retrieved log, or None, if it does not exist.
+        """
+        try:
+            response = await self.http_client.call(
+                url=self.url,
+                method='GET',
+                params=self._params(),
+            )
+
+            return response.text
+
+        except ApifyApiError as exc:
+            _catch_not_found_or_throw(exc)
+
+        return None
+
+    @asynccontextmanager
+    async def stream(self) -> AsyncIterator[Optional[httpx.Response]]:
+        """Retrieve the log as a stream.
+
+        https://docs.apify.com/api/v2#/reference/logs/log/get-log
+
+        Returns:
+            httpx.Response, optional: The raw response with the log streamed in its body, or None, if it does not exist.
+                The response is closed when the context manager exits.
+        """
+        response = None
+        try:
+            response = await self.http_client.call(
+                url=self.url,
+                method='GET',
+                params=self._params(),
+                stream=True,
+                parse_response=False,
+            )
+
+        except ApifyApiError as exc:
+            _catch_not_found_or_throw(exc)
+
+        try:
+            yield response
+        finally:
+            if response is not None:
+                await response.aclose()
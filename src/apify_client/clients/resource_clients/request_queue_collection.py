@@ -1,7 +1,7 @@
 from typing import Any, Dict, Optional
 
 from ..._utils import ListPage
-from ..base import ResourceCollectionClient
+from ..base import ResourceCollectionClient, ResourceCollectionClientAsync
 
 
 class RequestQueueCollectionClient(ResourceCollectionClient):
@@ -19,6 +19,7 @@ class RequestQueueCollectionClient(ResourceCollectionClient):
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         desc: Optional[bool] = None,
+        lazy: bool = False,
     ) -> ListPage:
         """List the available request queues.
 
@@ -29,11 +30,13 @@ class RequestQueueCollectionClient(ResourceCollectionClient):
             limit (int, optional): How many request queues to retrieve
             offset (int, optional): What request queue to include as first when retrieving the list
             desc (bool, optional): Whether to sort therequest queues in descending order based on their modification date
+            lazy (bool, optional): If True, the items are parsed one by one while the response is still arriving,
+                instead of parsing the whole response at once. The returned page can then be iterated over only once.
 
         Returns:
             ListPage: The list of available request queues matching the specified filters.
         """
-        return self._list(unnamed=unnamed, limit=limit, offset=offset, desc=desc)
+        return self._list(unnamed=unnamed, limit=limit, offset=offset, desc=desc, lazy=lazy)
 
     def get_or_create(self, *, name: Optional[str] = None) -> Dict:
         """Retrieve a named request queue, or create a new one when it doesn't exist.
@@ -47,3 +50,48 @@ class RequestQueueCollectionClient(ResourceCollectionClient):
             dict: The retrieved or newly-created request queue.
         """
         return self._get_or_create(name=name)
+
+
+class RequestQueueCollectionClientAsync(ResourceCollectionClientAsync):
+    """Async sub-client for manipulating request queues."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the RequestQueueCollectionClientAsync with the passed arguments."""
+        resource_path = kwargs.pop('resource_path', 'request-queues')
+        super().__init__(*args, resource_path=resource_path, **kwargs)
+
+    async def list(
+        self,
+        *,
+        unnamed: Optional[bool] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        desc: Optional[bool] = None,
+    ) -> ListPage:
+        """List the available request queues.
+
+        https://docs.apify.com/api/v2#/reference/request-queues/queue-collection/get-list-of-request-queues
+
+        Args:
+            unnamed (bool, optional): Whether to include unnamed request queues in the list
+            limit (int, optional): How many request queues to retrieve
+            offset (int, optional): What request queue to include as first when retrieving the list
+            desc (bool, optional): Whether to sort therequest queues in descending order based on their modification date
+
+        Returns:
+            ListPage: The list of available request queues matching the specified filters.
+        """
+        return await self._list(unnamed=unnamed, limit=limit, offset=offset, desc=desc)
+
+    async def get_or_create(self, *, name: Optional[str] = None) -> Dict:
+        """Retrieve a named request queue, or create a new one when it doesn't exist.
+
+        https://docs.apify.com/api/v2#/reference/request-queues/queue-collection/create-request-queue
+
+        Args:
+            name (str, optional): The name of the request queue to retrieve or create.
+
+        Returns:
+            dict: The retrieved or newly-created request queue.
+        """
+        return await self._get_or_create(name=name)
@@ -2,7 +2,7 @@ from typing import Any, Optional
 
 from ..._consts import ActorJobStatus
 from ..._utils import ListPage
-from ..base import ResourceCollectionClient
+from ..base import ResourceCollectionClient, ResourceCollectionClientAsync
 
 
 class RunCollectionClient(ResourceCollectionClient):
@@ -20,6 +20,7 @@ class RunCollectionClient(ResourceCollectionClient):
         offset: Optional[int] = None,
         desc: Optional[bool] = None,
         status: Optional[ActorJobStatus] = None,
+        lazy: bool = False,
     ) -> ListPage:
         """List all actor runs (either of a single actor, or all user's actors, depending on where this client was initialized from).
 
@@ -31,8 +32,43 @@ class RunCollectionClient(ResourceCollectionClient):
             offset (int, optional): What run to include as first when retrieving the list
             desc (bool, optional): Whether to sort the runs in descending order based on their start date
             status (str, optional): Retrieve only runs with the provided status
+            lazy (bool, optional): If True, the items are parsed one by one while the response is still arriving,
+                instead of parsing the whole response at once. The returned page can then be iterated over only once.
 
         Returns:
             ListPage: The retrieved actor runs
         """
-        return self._list(limit=limit, offset=offset, desc=desc, status=status)
+        return self._list(limit=limit, offset=offset, desc=desc, status=status, lazy=lazy)
+
+
+class RunCollectionClientAsync(ResourceCollectionClientAsync):
+    """Async sub-client for listing actor runs."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the RunCollectionClientAsync."""
+        resource_path = kwargs.pop('resource_path', 'actor-runs')
+        super().__init__(*args, resource_path=resource_path, **kwargs)
+
+    async def list(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        desc: Optional[bool] = None,
+        status: Optional[ActorJobStatus] = None,
+    ) -> ListPage:
+        """List all actor runs (either of a single actor, or all user's actors, depending on where this client was initialized from).
+
+        https://docs.apify.com/api/v2#/reference/actors/run-collection/get-list-of-runs
+        https://docs.apify.com/api/v2#/reference/actor-runs/run-collection/get-user-runs-list
+
+        Args:
+            limit (int, optional): How many runs to retrieve
+            offset (int, optional): What run to include as first when retrieving the list
+            desc (bool, optional): Whether to sort the runs in descending order based on their start date
+            status (str, optional): Retrieve only runs with the provided status
+
+        Returns:
+            ListPage: The retrieved actor runs
+        """
+        return await self._list(limit=limit, offset=offset, desc=desc, status=status)
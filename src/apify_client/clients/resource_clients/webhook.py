@@ -1,8 +1,8 @@
 from typing import Any, Dict, List, Optional
 
 from ..._utils import _snake_case_to_camel_case
-from ..base import ResourceClient
-from .webhook_dispatch_collection import WebhookDispatchCollectionClient
+from ..base import ResourceClient, ResourceClientAsync
+from .webhook_dispatch_collection import WebhookDispatchCollectionClient, WebhookDispatchCollectionClientAsync
 
 
 def _prepare_webhook_representation(
@@ -115,3 +115,80 @@ class WebhookClient(ResourceClient):
         return WebhookDispatchCollectionClient(
             **self._sub_resource_init_options(resource_path="dispatches"),
         )
+
+
+class WebhookClientAsync(ResourceClientAsync):
+    """Async sub-client for manipulating a single webhook."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the WebhookClientAsync."""
+        resource_path = kwargs.pop('resource_path', 'webhooks')
+        super().__init__(*args, resource_path=resource_path, **kwargs)
+
+    async def get(self) -> Optional[Dict]:
+        """Retrieve the webhook.
+
+        https://docs.apify.com/api/v2#/reference/webhooks/webhook-object/get-webhook
+
+        Returns:
+            dict, optional: The retrieved webhook, or None if it does not exist
+        """
+        return await self._get()
+
+    async def update(
+        self,
+        *,
+        event_types: Optional[List] = None,
+        request_url: Optional[str] = None,
+        payload_template: Optional[str] = None,
+        actor_id: Optional[str] = None,
+        actor_task_id: Optional[str] = None,
+        actor_run_id: Optional[str] = None,
+        ignore_ssl_errors: Optional[bool] = None,
+        do_not_retry: Optional[bool] = None,
+        is_ad_hoc: Optional[bool] = None,
+    ) -> Dict:
+        """Update the webhook.
+
+        https://docs.apify.com/api/v2#/reference/webhooks/webhook-object/update-webhook
+
+        Args:
+            event_types (list, optional): List of event types that should trigger the webhook.
+                                          Present in the client constants as WebhookEventType. At least one is required.
+            request_url (str, optional): URL that will be invoked once the webhook is triggered.
+            payload_template (str, optional): Specification of the payload that will be sent to request_url
+            actor_id (str, optional): Id of the actor whose runs should trigger the webhook.
+            actor_task_id (str, optional): Id of the actor task whose runs should trigger the webhook.
+            actor_run_id (str, optional): Id of the actor run which should trigger the webhook.
+            ignore_ssl_errors (bool, optional): Whether the webhook should ignore SSL errors returned by request_url
+            do_not_retry (bool, optional): Whether the webhook should retry sending the payload to request_url upon
+                                           failure.
+            is_ad_hoc (bool, optional): Set to True if you want the webhook to be triggered only the first time the
+                                        condition is fulfilled. Only applicable when actor_run_id is filled.
+
+        Returns:
+            dict: The updated webhook
+        """
+        parameters = locals()
+        parameters.pop('self')
+        webhook = _prepare_webhook_representation(**parameters)
+        return await self._update(webhook)
+
+    async def delete(self) -> None:
+        """Delete the webhook.
+
+        https://docs.apify.com/api/v2#/reference/webhooks/webhook-object/delete-webhook
+        """
+        return await self._delete()
+
+    def dispatches(self) -> WebhookDispatchCollectionClientAsync:
+        """Get dispatches of the webhook.
+
+        https://docs.apify.com/api/v2#/reference/webhooks/dispatches-collection/get-collection
+
+        Returns:
+            WebhookDispatchCollectionClientAsync: A client allowing access to dispatches of this webhook using its list method
+        """
+        return WebhookDispatchCollectionClientAsync(
+            **self._sub_resource_init_options(resource_path="dispatches"),
+        )
@@ -1,6 +1,6 @@
 from typing import Any, Dict, Optional
 
-from ..base import ResourceClient
+from ..base import ResourceClient, ResourceClientAsync
 
 
 class WebhookDispatchClient(ResourceClient):
@@ -20,3 +20,22 @@ class WebhookDispatchClient(ResourceClient):
             dict, optional: The retrieved webhook dispatch, or None if it does not exist
         """
         return self._get()
+
+
+class WebhookDispatchClientAsync(ResourceClientAsync):
+    """Async sub-client for querying information about a webhook dispatch."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the WebhookDispatchClientAsync."""
+        resource_path = kwargs.pop('resource_path', 'webhook-dispatches')
+        super().__init__(*args, resource_path=resource_path, **kwargs)
+
+    async def get(self) -> Optional[Dict]:
+        """Retrieve the webhook dispatch.
+
+        https://docs.apify.com/api/v2#/reference/webhook-dispatches/webhook-dispatch-object/get-webhook-dispatch
+
+        Returns:
+            dict, optional: The retrieved webhook dispatch, or None if it does not exist
+        """
+        return await self._get()
@@ -1,7 +1,7 @@
 from typing import Any, Optional
 
 from ..._utils import ListPage
-from ..base import ResourceCollectionClient
+from ..base import ResourceCollectionClient, ResourceCollectionClientAsync
 
 
 class WebhookDispatchCollectionClient(ResourceCollectionClient):
@@ -18,6 +18,7 @@ class WebhookDispatchCollectionClient(ResourceCollectionClient):
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         desc: Optional[bool] = None,
+        lazy: bool = False,
     ) -> ListPage:
         """List all webhook dispatches of a user.
 
@@ -27,8 +28,40 @@ class WebhookDispatchCollectionClient(ResourceCollectionClient):
             limit (int, optional): How many webhook dispatches to retrieve
             offset (int, optional): What webhook dispatch to include as first when retrieving the list
             desc (bool, optional): Whether to sort the webhook dispatches in descending order based on the date of their creation
+            lazy (bool, optional): If True, the items are parsed one by one while the response is still arriving,
+                instead of parsing the whole response at once. The returned page can then be iterated over only once.
 
         Returns:
             ListPage: The retrieved webhook dispatches of a user
         """
-        return self._list(limit=limit, offset=offset, desc=desc)
+        return self._list(limit=limit, offset=offset, desc=desc, lazy=lazy)
+
+
+class WebhookDispatchCollectionClientAsync(ResourceCollectionClientAsync):
+    """Async sub-client for listing webhook dispatches."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the WebhookDispatchCollectionClientAsync."""
+        resource_path = kwargs.pop('resource_path', 'webhook-dispatches')
+        super().__init__(*args, resource_path=resource_path, **kwargs)
+
+    async def list(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        desc: Optional[bool] = None,
+    ) -> ListPage:
+        """List all webhook dispatches of a user.
+
+        https://docs.apify.com/api/v2#/reference/webhook-dispatches/webhook-dispatches-collection/get-list-of-webhook-dispatches
+
+        Args:
+            limit (int, optional): How many webhook dispatches to retrieve
+            offset (int, optional): What webhook dispatch to include as first when retrieving the list
+            desc (bool, optional): Whether to sort the webhook dispatches in descending order based on the date of their creation
+
+        Returns:
+            ListPage: The retrieved webhook dispatches of a user
+        """
+        return await self._list(limit=limit, offset=offset, desc=desc)
@@ -0,0 +1,152 @@
+import time
+import zlib
+from typing import Callable, Iterable, Iterator, Optional, Sequence, Union
+
+DEFAULT_COMPRESSION_MIN_SIZE_BYTES = 1024
+DEFAULT_COMPRESSION_LEVEL = 6
+# Media types (or their prefixes) of content which is already compressed, so compressing it again would only waste CPU
+DEFAULT_SKIP_CONTENT_TYPES = (
+    'image/',
+    'audio/',
+    'video/',
+    'font/woff',
+    'application/zip',
+    'application/gzip',
+    'application/x-gzip',
+    'application/x-bzip2',
+    'application/x-xz',
+    'application/x-7z-compressed',
+    'application/x-rar-compressed',
+    'application/zstd',
+    'application/pdf',
+)
+
+# gzip container around the deflate stream
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+class CompressionStats:
+    """Statistics of compressing the body of a single request."""
+
+    def __init__(self, *, original_size_bytes: int, compressed_size_bytes: int, compression_time_secs: float) -> None:
+        """Initialize the CompressionStats.
+
+        Args:
+            original_size_bytes (int): Size of the body before compression
+            compressed_size_bytes (int): Size of the body after compression
+            compression_time_secs (float): Time spent compressing the body
+        """
+        self.original_size_bytes = original_size_bytes
+        self.compressed_size_bytes = compressed_size_bytes
+        self.compression_time_secs = compression_time_secs
+
+    @property
+    def saved_bytes(self) -> int:
+        """How many bytes the compression saved, negative when the compressed body is bigger."""
+        return self.original_size_bytes - self.compressed_size_bytes
+
+    def __repr__(self) -> str:
+        """Show the statistics in a readable form."""
+        return (
+            f'CompressionStats(original_size_bytes={self.original_size_bytes}, compressed_size_bytes={self.compressed_size_bytes}, '
+            f'compression_time_secs={self.compression_time_secs:.6f})'
+        )
+
+
+class CompressionPolicy:
+    """Decides which request bodies the client compresses with gzip, and compresses them."""
+
+    def __init__(
+        self,
+        *,
+        min_size_bytes: int = DEFAULT_COMPRESSION_MIN_SIZE_BYTES,
+        level: int = DEFAULT_COMPRESSION_LEVEL,
+        skip_content_types: Sequence[str] = DEFAULT_SKIP_CONTENT_TYPES,
+        on_request_compressed: Optional[Callable[[CompressionStats], None]] = None,
+    ) -> None:
+        """Initialize the CompressionPolicy.
+
+        Args:
+            min_size_bytes (int, optional): Bodies smaller than this are sent uncompressed.
+                Streamed bodies of unknown size are always compressed
+            level (int, optional): The gzip compression level, from 1 (fastest) to 9 (smallest)
+            skip_content_types (list of str, optional): Bodies with content types starting with any of these are sent uncompressed.
+                Defaults to the common types of already compressed content, like images, videos or archives
+            on_request_compressed (Callable, optional): Called with the `CompressionStats` of every compressed request body
+        """
+        if not 1 <= level <= 9:
+            raise ValueError(f'The compression level has to be between 1 and 9, got {level}')
+
+        self.min_size_bytes = min_size_bytes
+        self.level = level
+        self.skip_content_types = tuple(content_type.lower() for content_type in skip_content_types)
+        self.on_request_compressed = on_request_compressed
+
+    def should_compress(self, *, content_type: Optional[str] = None, size_bytes: Optional[int] = None) -> bool:
+        """Decide whether to compress a request body.
+
+        Args:
+            content_type (str, optional): The content type of the body, if known
+            size_bytes (int, optional): The size of the body, if known
+
+        Returns:
+            bool: Whether the body should be compressed
+        """
+        if content_type and content_type.split(';')[0].strip().lower().startswith(self.skip_content_types):
+            return False
+        if size_bytes is not None and size_bytes < self.min_size_bytes:
+            return False
+        return True
+
+    def compress(self, data: Union[bytes, bytearray]) -> bytes:
+        """Compress a request body with gzip.
+
+        Args:
+            data (bytes or bytearray): The body to compress
+
+        Returns:
+            bytes: The compressed body
+        """
+        started_at = time.perf_counter()
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, GZIP_WBITS)
+        compressed_data = compressor.compress(data) + compressor.flush()
+        self._report_stats(len(data), len(compressed_data), time.perf_counter() - started_at)
+        return compressed_data
+
+    def compress_stream(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """Compress a request body with gzip chunk by chunk, while it is being sent.
+
+        Args:
+            chunks (Iterable[bytes]): The chunks of the body to compress
+
+        Returns:
+            Iterator[bytes]: The chunks of the compressed body
+        """
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, GZIP_WBITS)
+        original_size_bytes = 0
+        compressed_size_bytes = 0
+        compression_time_secs = 0.0
+
+        for chunk in chunks:
+            started_at = time.perf_counter()
+            compressed_chunk = compressor.compress(chunk)
+            compression_time_secs += time.perf_counter() - started_at
+            original_size_bytes += len(chunk)
+            if compressed_chunk:
+                compressed_size_bytes += len(compressed_chunk)
+                yield compressed_chunk
+
+        started_at = time.perf_counter()
+        compressed_chunk = compressor.flush()
+        compression_time_secs += time.perf_counter() - started_at
+        compressed_size_bytes += len(compressed_chunk)
+        self._report_stats(original_size_bytes, compressed_size_bytes, compression_time_secs)
+        yield compressed_chunk
+
+    def _report_stats(self, original_size_bytes: int, compressed_size_bytes: int, compression_time_secs: float) -> None:
+        if self.on_request_compressed is not None:
+            self.on_request_compressed(CompressionStats(
+                original_size_bytes=original_size_bytes,
+                compressed_size_bytes=compressed_size_bytes,
+                compression_time_secs=compression_time_secs,
+            ))
@@ -0,0 +1,203 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Callable, Deque, Dict, Iterator
+
+DEFAULT_MIN_CONCURRENCY = 1
+DEFAULT_MAX_CONCURRENCY = 16
+DEFAULT_INITIAL_CONCURRENCY = 4
+DEFAULT_DECREASE_FACTOR = 0.5
+DEFAULT_LATENCY_TOLERANCE = 2.0
+DEFAULT_DECREASE_COOLDOWN_SECS = 1.0
+
+# How quickly the short-term and the long-term averages of the latency follow the new measurements
+_SHORT_TERM_LATENCY_WEIGHT = 0.3
+_LONG_TERM_LATENCY_WEIGHT = 0.05
+# How many latencies have to be measured before they are compared, so that a few slow first requests don't cut the concurrency
+_LATENCY_WARMUP_SAMPLES = 10
+
+
+class _LatencyTracker:
+    def __init__(self) -> None:
+        self.samples_count = 0
+        self.short_term_secs = 0.0
+        self.long_term_secs = 0.0
+
+    def add(self, latency_secs: float) -> None:
+        if self.samples_count == 0:
+            self.short_term_secs = self.long_term_secs = latency_secs
+        else:
+            self.short_term_secs += _SHORT_TERM_LATENCY_WEIGHT * (latency_secs - self.short_term_secs)
+            self.long_term_secs += _LONG_TERM_LATENCY_WEIGHT * (latency_secs - self.long_term_secs)
+        self.samples_count += 1
+
+    def is_healthy(self, tolerance: float) -> bool:
+        return self.samples_count < _LATENCY_WARMUP_SAMPLES or self.short_term_secs <= tolerance * self.long_term_secs
+
+
+class ConcurrencyGovernor:
+    """Limits how many API calls the parallel helpers of a client make at once, and adapts the limit to how the API copes.
+
+    The limit grows additively while the calls succeed and their latency stays close to its long-term average,
+    and is cut multiplicatively when the API responds with 429 or 5xx errors, the requests time out, or the latency rises.
+    This way, the helpers find the fastest concurrency the API can handle without tuning their number of workers.
+
+    The governor is shared by all the parallel helpers of one `ApifyClient` or `ApifyClientAsync`, like the dataset batch writer
+    or the prefetching of dataset pages, and all the requests of the client feed it with their results.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_concurrency: int = DEFAULT_MIN_CONCURRENCY,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        initial_concurrency: int = DEFAULT_INITIAL_CONCURRENCY,
+        increase_step: float = 1,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+        latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+        decrease_cooldown_secs: float = DEFAULT_DECREASE_COOLDOWN_SECS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the ConcurrencyGovernor.
+
+        Args:
+            min_concurrency (int, optional): The lowest the limit can be cut to
+            max_concurrency (int, optional): The highest the limit can grow to
+            initial_concurrency (int, optional): The limit to start with
+            increase_step (float, optional): How much the limit grows after a full limit's worth of successful calls
+            decrease_factor (float, optional): By what the limit is multiplied when the API is overloaded
+            latency_tolerance (float, optional): How many times the recent latency of an endpoint can exceed its long-term average
+                before it counts as a sign of overload
+            decrease_cooldown_secs (float, optional): The shortest time between two cuts of the limit,
+                so that a burst of errors caused by the same overload cuts it only once
+            clock (Callable, optional): The monotonic clock measuring the time in seconds
+        """
+        if not 1 <= min_concurrency <= initial_concurrency <= max_concurrency:
+            raise ValueError('The concurrency limits have to satisfy 1 <= min_concurrency <= initial_concurrency <= max_concurrency')
+        if not 0 < decrease_factor < 1:
+            raise ValueError(f'The decrease factor has to be between 0 and 1, got {decrease_factor}')
+
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.decrease_cooldown_secs = decrease_cooldown_secs
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._limit = float(initial_concurrency)
+        self._in_flight = 0
+        # Callbacks which hand a slot over to the calls waiting for it, in the order in which they came
+        self._waiters: Deque[Callable[[], None]] = deque()
+        self._last_decrease_at = float('-inf')
+        self._latency_trackers: Dict[str, _LatencyTracker] = {}
+
+    @property
+    def concurrency(self) -> int:
+        """The current limit of concurrent calls."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """How many calls are running at the moment."""
+        return self._in_flight
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Wait until a call fits under the limit, and hold its slot for the duration of the context."""
+        self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def slot_async(self) -> AsyncIterator[None]:
+        """Wait until a call fits under the limit, and hold its slot for the duration of the async context."""
+        await self._acquire_async()
+        try:
+            yield
+        finally:
+            self._release()
+
+    def on_success(self, endpoint: str, latency_secs: float) -> None:
+        """Record a successful call, which grows the limit, unless its endpoint has become too slow.
+
+        Args:
+            endpoint (str): The endpoint of the call, the latency is only compared to the earlier calls of the same endpoint
+            latency_secs (float): How long the call took
+        """
+        with self._lock:
+            latency_tracker = self._latency_trackers.setdefault(endpoint, _LatencyTracker())
+            latency_tracker.add(latency_secs)
+            if latency_tracker.is_healthy(self.latency_tolerance):
+                # Spread over the calls, so that the limit grows by one step after a full limit's worth of them
+                self._limit = min(self.max_concurrency, self._limit + self.increase_step / self._limit)
+                self._wake_waiters()
+            else:
+                self._decrease()
+
+    def on_overloaded(self) -> None:
+        """Record a call which failed because the API is overloaded, which cuts the limit."""
+        with self._lock:
+            self._decrease()
+
+    def _decrease(self) -> None:
+        now = self._clock()
+        if now - self._last_decrease_at >= self.decrease_cooldown_secs:
+            self._limit = max(self.min_concurrency, self._limit * self.decrease_factor)
+            self._last_decrease_at = now
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if not self._waiters and self._in_flight < self.concurrency:
+                self._in_flight += 1
+                return
+            slot_granted = threading.Event()
+            self._waiters.append(slot_granted.set)
+        slot_granted.wait()
+
+    async def _acquire_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        slot_granted = loop.create_future()
+
+        def on_slot_granted() -> None:
+            if slot_granted.cancelled():
+                self._release()
+            else:
+                slot_granted.set_result(None)
+
+        def grant_slot() -> None:
+            # The slot can be granted from another thread, when a synchronous helper shares the governor
+            loop.call_soon_threadsafe(on_slot_granted)
+
+        with self._lock:
+            if not self._waiters and self._in_flight < self.concurrency:
+                self._in_flight += 1
+                return
+            self._waiters.append(grant_slot)
+
+        try:
+            await slot_granted
+        except BaseException:
+            with self._lock:
+                if grant_slot in self._waiters:
+                    self._waiters.remove(grant_slot)
+                    raise
+            # The slot was granted, but the call was cancelled before it could use it
+            if slot_granted.done() and not slot_granted.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.concurrency:
+            self._in_flight += 1
+            self._waiters.popleft()()
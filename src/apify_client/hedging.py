@@ -0,0 +1,116 @@
+import math
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional
+
+DEFAULT_PERCENTILE = 95
+DEFAULT_MIN_DELAY_MILLIS = 20
+DEFAULT_MAX_HEDGED_RATIO = 0.05
+DEFAULT_MAX_HEDGES_BURST = 10
+DEFAULT_MIN_SAMPLES = 20
+DEFAULT_SAMPLES_WINDOW = 1000
+
+# How many new latencies are measured before the percentile is computed again, so it's not sorted on every request
+_PERCENTILE_RECOMPUTE_INTERVAL = 20
+
+
+class _LatencySamples:
+    def __init__(self, window: int) -> None:
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.added_since_recompute = 0
+        self.percentile_secs: Optional[float] = None
+
+
+class HedgingPolicy:
+    """Decides when the client sends a duplicate of a slow GET request, to cut the tail latency of the API calls.
+
+    When the response to a GET request doesn't arrive within the given percentile of the recent latencies of its endpoint,
+    the client sends the same request again, uses the response which arrives first and cancels the other request.
+    The extra load is capped, only a small fraction of the requests can be hedged.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = DEFAULT_PERCENTILE,
+        min_delay_millis: int = DEFAULT_MIN_DELAY_MILLIS,
+        max_hedged_ratio: float = DEFAULT_MAX_HEDGED_RATIO,
+        max_hedges_burst: int = DEFAULT_MAX_HEDGES_BURST,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        samples_window: int = DEFAULT_SAMPLES_WINDOW,
+    ) -> None:
+        """Initialize the HedgingPolicy.
+
+        Args:
+            percentile (float, optional): Which percentile of the recent latencies of an endpoint the request can take
+                before it is hedged, between 0 and 100
+            min_delay_millis (int, optional): The shortest time to wait before hedging a request
+            max_hedged_ratio (float, optional): At most what fraction of the requests can be hedged, e.g. 0.05 for 5 %
+            max_hedges_burst (int, optional): How many hedges can be sent in a burst, after a period with few slow requests
+            min_samples (int, optional): How many latencies of an endpoint have to be measured before its requests are hedged
+            samples_window (int, optional): From how many of the most recent latencies of an endpoint the percentile is computed
+        """
+        if not 0 < percentile < 100:
+            raise ValueError(f'The percentile has to be between 0 and 100, got {percentile}')
+
+        self.percentile = percentile
+        self.min_delay_millis = min_delay_millis
+        self.max_hedged_ratio = max_hedged_ratio
+        self.max_hedges_burst = max_hedges_burst
+        self.min_samples = min_samples
+        self.samples_window = samples_window
+
+        self._lock = threading.Lock()
+        self._samples: Dict[str, _LatencySamples] = {}
+        # Every request adds the `max_hedged_ratio` of a hedge to the budget, every hedge takes a whole one
+        self._hedges_budget = 0.0
+
+    def get_hedge_delay_secs(self, endpoint: str) -> Optional[float]:
+        """Register a request to an endpoint, and compute after how long to hedge it.
+
+        Args:
+            endpoint (str): The endpoint of the request, the delay is computed from the latencies of this endpoint only
+
+        Returns:
+            float, optional: After how many seconds without a response to hedge the request,
+                None if there are not enough measured latencies of the endpoint yet
+        """
+        with self._lock:
+            self._hedges_budget = min(self.max_hedges_burst, self._hedges_budget + self.max_hedged_ratio)
+
+            samples = self._samples.get(endpoint)
+            if samples is None or samples.percentile_secs is None:
+                return None
+            return max(self.min_delay_millis / 1000, samples.percentile_secs)
+
+    def take_hedge(self) -> bool:
+        """Take a hedge from the budget, right before sending it.
+
+        Returns:
+            bool: Whether the hedge can be sent, False when too many requests were hedged recently
+        """
+        with self._lock:
+            if self._hedges_budget < 1:
+                return False
+            self._hedges_budget -= 1
+            return True
+
+    def record_latency(self, endpoint: str, latency_secs: float) -> None:
+        """Record how long a request to an endpoint took.
+
+        Args:
+            endpoint (str): The endpoint of the request
+            latency_secs (float): How long the request took
+        """
+        with self._lock:
+            samples = self._samples.setdefault(endpoint, _LatencySamples(self.samples_window))
+            samples.latencies.append(latency_secs)
+            samples.added_since_recompute += 1
+
+            if len(samples.latencies) >= self.min_samples and (
+                samples.percentile_secs is None or samples.added_since_recompute >= _PERCENTILE_RECOMPUTE_INTERVAL
+            ):
+                sorted_latencies = sorted(samples.latencies)
+                index = min(len(sorted_latencies) - 1, math.ceil(self.percentile / 100 * len(sorted_latencies)) - 1)
+                samples.percentile_secs = sorted_latencies[index]
+                samples.added_since_recompute = 0
@@ -0,0 +1,90 @@
+from typing import Any, Callable, Dict, Optional
+
+
+class RequestEvent:
+    """A single HTTP request sent by the client, passed to the request hooks.
+
+    The same event is passed to all the hooks called for the request, so a hook can keep its own data in the `context`,
+    e.g. the tracing span started in `before_request` and ended in `after_response` or `on_error`.
+    """
+
+    def __init__(
+        self,
+        *,
+        method: str,
+        url: str,
+        url_template: str,
+        endpoint_class: str,
+        attempt: int,
+        retry_reason: Optional[str] = None,
+    ) -> None:
+        """Initialize the RequestEvent.
+
+        Args:
+            method (str): The HTTP method of the request
+            url (str): The URL of the request, without the query parameters
+            url_template (str): The path of the request, with the IDs of the resources replaced by placeholders,
+                e.g. `acts/{id}/runs/last`, to group the requests to the same endpoint
+            endpoint_class (str): The type of the resource the request accesses, e.g. `datasets`
+            attempt (int): The number of the attempt to send the request, starting at 1
+            retry_reason (str, optional): Why the previous attempt failed, the status code of its response, `network_error`
+                or `invalid_response_body`, None for the first attempt
+        """
+        self.method = method
+        self.url = url
+        self.url_template = url_template
+        self.endpoint_class = endpoint_class
+        self.attempt = attempt
+        self.retry_reason = retry_reason
+
+        # When the request was sent, as a Unix timestamp, and how long it took to get the response or the error
+        self.started_at: Optional[float] = None
+        self.latency_secs: Optional[float] = None
+        self.status_code: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self.request_bytes = 0
+        self.request_uncompressed_bytes = 0
+        self.response_bytes = 0
+        self.response_decompressed_bytes = 0
+        # Free for the hooks to keep their own data in
+        self.context: Dict[str, Any] = {}
+
+    def __repr__(self) -> str:
+        """Show the event in a readable form."""
+        return (
+            f'RequestEvent(method={self.method!r}, url_template={self.url_template!r}, attempt={self.attempt}, '
+            f'status_code={self.status_code}, latency_secs={self.latency_secs})'
+        )
+
+
+RequestHook = Callable[[RequestEvent], None]
+
+
+class RequestHooks:
+    """Functions called at the points of the lifecycle of the requests of the client, e.g. for tracing, profiling or logging.
+
+    Each request ends with either `after_response`, when the API responded, even with an error status code,
+    or `on_error`, when the request failed without a response. The hooks are called synchronously, in the thread or task
+    which sends the request, so they should be quick. When no hooks are set, the client doesn't even create the events.
+    """
+
+    def __init__(
+        self,
+        *,
+        before_request: Optional[RequestHook] = None,
+        after_response: Optional[RequestHook] = None,
+        on_retry: Optional[RequestHook] = None,
+        on_error: Optional[RequestHook] = None,
+    ) -> None:
+        """Initialize the RequestHooks.
+
+        Args:
+            before_request (Callable, optional): Called right before a request is sent
+            after_response (Callable, optional): Called when the response to a request arrives, with its status code, latency and sizes
+            on_retry (Callable, optional): Called before a failed request is sent again, with the reason of the failure
+            on_error (Callable, optional): Called when a request fails without a response, with the error
+        """
+        self.before_request = before_request
+        self.after_response = after_response
+        self.on_retry = on_retry
+        self.on_error = on_error
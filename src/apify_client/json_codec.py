@@ -0,0 +1,85 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Union
+
+try:
+    import orjson
+    _IS_ORJSON_INSTALLED = True
+except ImportError:  # pragma: no cover
+    _IS_ORJSON_INSTALLED = False
+
+
+class JSONCodec(ABC):
+    """The interface of the codecs which the client uses to encode and decode JSON bodies.
+
+    Subclass it and pass an instance as the `json_codec` argument of `ApifyClient` to plug in a different JSON library.
+    """
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value to compact, UTF-8 encoded JSON.
+
+        Args:
+            value (Any): The value to encode
+
+        Returns:
+            bytes: The encoded value
+        """
+
+    @abstractmethod
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        """Decode a JSON document.
+
+        Args:
+            data (str or bytes): The JSON document, in bytes it has to be UTF-8 encoded
+
+        Returns:
+            Any: The decoded value
+
+        Raises:
+            ValueError: If the document is not valid JSON
+        """
+
+
+class StdlibJSONCodec(JSONCodec):
+    """JSON codec using the `json` module from the standard library."""
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value to compact, UTF-8 encoded JSON."""
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        """Decode a JSON document."""
+        return json.loads(data)
+
+
+class OrjsonJSONCodec(JSONCodec):
+    """JSON codec using the `orjson` library, which is several times faster than the standard library.
+
+    Values which `orjson` can't encode, but the standard library can (e.g. integers bigger than 64 bits),
+    are encoded with the standard library.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the codec, fails if `orjson` is not installed."""
+        if not _IS_ORJSON_INSTALLED:
+            raise ImportError('The orjson package is not installed, install it with "pip install apify-client[orjson]"')
+        self._fallback_codec = StdlibJSONCodec()
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value to compact, UTF-8 encoded JSON."""
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return self._fallback_codec.dumps(value)
+
+    def loads(self, data: Union[str, bytes, bytearray]) -> Any:
+        """Decode a JSON document."""
+        return orjson.loads(data)
+
+
+def default_json_codec() -> JSONCodec:
+    """Return the fastest JSON codec available, `OrjsonJSONCodec` if `orjson` is installed, otherwise `StdlibJSONCodec`."""
+    if _IS_ORJSON_INSTALLED:
+        return OrjsonJSONCodec()
+    return StdlibJSONCodec()
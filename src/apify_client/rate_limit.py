@@ -0,0 +1,146 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Mapping, Optional
+
+# The API allows each user 250 requests per second in total
+DEFAULT_REQUESTS_PER_SECOND = 250
+# How long to hold back requests to an endpoint class which was rate limited without saying for how long
+DEFAULT_RATE_LIMITED_PAUSE_SECS = 1
+
+# Values of the rate limit reset headers bigger than this are Unix timestamps, smaller ones are numbers of seconds
+_UNIX_TIMESTAMP_THRESHOLD = 1_000_000_000
+
+
+class _TokenBucket:
+    def __init__(self, *, requests_per_second: float, burst: float, now: float) -> None:
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.tokens = burst
+        self.updated_at = now
+        self.paused_until = now
+
+    def reserve(self, now: float) -> float:
+        # Takes a token, even if there's none left, and returns how long to wait until the token is refilled,
+        # so the waiting requests are spread evenly, in the order in which they came
+        self.tokens = min(self.burst, self.tokens + max(0, now - self.updated_at) * self.requests_per_second)
+        self.updated_at = max(self.updated_at, now)
+        self.tokens -= 1
+
+        wait_secs = -self.tokens / self.requests_per_second if self.tokens < 0 else 0
+        return max(wait_secs, self.paused_until - now)
+
+    def pause(self, until: float) -> None:
+        self.paused_until = max(self.paused_until, until)
+        # No bursts right after the pause, the API just showed the requests are coming too fast,
+        # so the bucket starts refilling only when the pause ends
+        self.tokens = min(self.tokens, 0)
+        self.updated_at = max(self.updated_at, until)
+
+
+class RateLimiter:
+    """Paces the requests of the client, so that they don't exceed the rate limits of the API.
+
+    The limiter has a global token bucket for all the requests, and optionally separate buckets for classes of endpoints,
+    which are the types of the resources the endpoints access, e.g. `datasets`, `key-value-stores` or `actor-runs`.
+    When the API rate limits a request anyway, the limiter holds back the following requests to the same endpoint class
+    for the time the API asks for in the `Retry-After` or `RateLimit-Reset` headers of the response.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_second: Optional[float] = DEFAULT_REQUESTS_PER_SECOND,
+        burst: Optional[float] = None,
+        endpoint_class_requests_per_second: Optional[Mapping[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the RateLimiter.
+
+        Args:
+            requests_per_second (float, optional): How many requests per second the client can send in total, None for no limit
+            burst (float, optional): How many requests can be sent at once after a period of inactivity.
+                Defaults to the number of requests allowed per second
+            endpoint_class_requests_per_second (dict, optional): How many requests per second the client can send
+                to each of the endpoint classes, e.g. `{'datasets': 30}`
+            clock (Callable, optional): The monotonic clock measuring the time in seconds
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        now = clock()
+
+        self._global_bucket: Optional[_TokenBucket] = None
+        if requests_per_second is not None:
+            self._global_bucket = _TokenBucket(requests_per_second=requests_per_second, burst=burst or max(1, requests_per_second), now=now)
+
+        self._endpoint_class_buckets: Dict[str, _TokenBucket] = {}
+        for endpoint_class, endpoint_class_rate in (endpoint_class_requests_per_second or {}).items():
+            self._endpoint_class_buckets[endpoint_class] = self._create_endpoint_class_bucket(endpoint_class_rate, now)
+
+    def reserve(self, endpoint_class: str) -> float:
+        """Reserve the sending of one request to an endpoint class.
+
+        Args:
+            endpoint_class (str): The endpoint class of the request
+
+        Returns:
+            float: How many seconds to wait before sending the request
+        """
+        with self._lock:
+            now = self._clock()
+            wait_secs = 0.0
+            if self._global_bucket is not None:
+                wait_secs = self._global_bucket.reserve(now)
+            endpoint_class_bucket = self._endpoint_class_buckets.get(endpoint_class)
+            if endpoint_class_bucket is not None:
+                wait_secs = max(wait_secs, endpoint_class_bucket.reserve(now))
+            return wait_secs
+
+    def on_rate_limited(self, endpoint_class: str, retry_after_secs: Optional[float] = None) -> None:
+        """Hold back the requests to an endpoint class, after the API rate limited a request to it.
+
+        Args:
+            endpoint_class (str): The endpoint class of the rate limited request
+            retry_after_secs (float, optional): After how many seconds the API allows the next request, if it said so
+        """
+        with self._lock:
+            now = self._clock()
+            endpoint_class_bucket = self._endpoint_class_buckets.get(endpoint_class)
+            if endpoint_class_bucket is None:
+                # Endpoint classes without their own limit get a bucket with the global rate, so that the pause applies only to them
+                global_rate = self._global_bucket.requests_per_second if self._global_bucket is not None else DEFAULT_REQUESTS_PER_SECOND
+                endpoint_class_bucket = self._create_endpoint_class_bucket(global_rate, now)
+                self._endpoint_class_buckets[endpoint_class] = endpoint_class_bucket
+
+            endpoint_class_bucket.pause(now + (retry_after_secs if retry_after_secs is not None else DEFAULT_RATE_LIMITED_PAUSE_SECS))
+
+    @staticmethod
+    def _create_endpoint_class_bucket(requests_per_second: float, now: float) -> _TokenBucket:
+        return _TokenBucket(requests_per_second=requests_per_second, burst=max(1, requests_per_second), now=now)
+
+
+def _parse_retry_after_secs(headers: Mapping[str, str]) -> Optional[float]:
+    """Read after how many seconds the API allows the next request, from the headers of a rate limited response."""
+    retry_after = headers.get('retry-after')
+    if retry_after:
+        try:
+            return max(0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+
+    for header in ('ratelimit-reset', 'x-ratelimit-reset'):
+        reset = headers.get(header)
+        if reset:
+            try:
+                reset_value = float(reset)
+            except ValueError:
+                continue
+            if reset_value > _UNIX_TIMESTAMP_THRESHOLD:
+                return max(0, reset_value - time.time())
+            return max(0, reset_value)
+
+    return None
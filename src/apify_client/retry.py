@@ -0,0 +1,288 @@
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Awaitable, Callable, Collection, Deque, Mapping, Optional, TypeVar
+
+import httpx
+import requests
+from urllib3.exceptions import NewConnectionError
+
+from ._errors import ApifyApiError, DeadlineExceededError, InvalidResponseBodyError
+from ._utils import _get_remaining_secs_to_deadline
+
+T = TypeVar('T')
+BailType = Callable[[Exception], None]
+
+DEFAULT_MAX_RETRIES = 8
+DEFAULT_MIN_DELAY_BETWEEN_RETRIES_MILLIS = 500
+DEFAULT_BACKOFF_FACTOR = 2
+DEFAULT_RETRY_BUDGET_WINDOW_SECS = 60
+DEFAULT_RETRY_BUDGET_MIN_RETRIES = 10
+# Rate limit errors and internal errors of the API
+DEFAULT_RETRYABLE_STATUS_CODES = frozenset([429, *range(500, 600)])
+# Methods which can be repeated without changing the result, even when the first request has reached the API
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+
+# How much bigger than the previous one the next delay with decorrelated jitter can be at most
+_DECORRELATED_JITTER_MAX_GROWTH = 3
+
+
+class Jitter(Enum):
+    """How the delays between retries are randomized, so that many clients failing at once don't all retry at once."""
+
+    NONE = 'NONE'  # exactly the exponential delay
+    PROPORTIONAL = 'PROPORTIONAL'  # the exponential delay, prolonged by a random fraction of up to 100 %
+    FULL = 'FULL'  # a random delay between zero and the exponential delay
+    DECORRELATED = 'DECORRELATED'  # a random delay between the minimum one and three times the previous one
+
+
+class RetryPolicy:
+    """Decides which failed requests the client retries, and how long it waits before retrying them.
+
+    By default, the client retries the requests which failed on a network error, or which the API rejected
+    with a rate limit error (HTTP 429) or an internal error (HTTP 5xx), up to 8 times, with an exponentially
+    growing delay. Requests with non-idempotent methods, like POST, are not retried after network errors
+    which could have happened after the API received them, so that e.g. an actor is not started twice.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        min_delay_between_retries_millis: int = DEFAULT_MIN_DELAY_BETWEEN_RETRIES_MILLIS,
+        max_delay_between_retries_millis: Optional[int] = None,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        jitter: Jitter = Jitter.PROPORTIONAL,
+        retryable_status_codes: Collection[int] = DEFAULT_RETRYABLE_STATUS_CODES,
+        max_retries_by_method: Optional[Mapping[str, int]] = None,
+        max_retries_by_status_code: Optional[Mapping[int, int]] = None,
+        retry_non_idempotent_requests: bool = False,
+        retry_budget: Optional[int] = None,
+        retry_budget_window_secs: float = DEFAULT_RETRY_BUDGET_WINDOW_SECS,
+        retry_budget_ratio: Optional[float] = None,
+        retry_budget_min_retries: int = DEFAULT_RETRY_BUDGET_MIN_RETRIES,
+        sleep: Callable[[float], None] = time.sleep,
+        async_sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the RetryPolicy.
+
+        Args:
+            max_retries (int, optional): How many times to retry a failed request at most
+            min_delay_between_retries_millis (int, optional): The delay before the first retry, the following ones grow exponentially
+            max_delay_between_retries_millis (int, optional): The longest delay between two retries, by default it's not limited
+            backoff_factor (float, optional): How many times the delay grows after each retry, between 1 and 10
+            jitter (Jitter, optional): How the delays between retries are randomized
+            retryable_status_codes (list of int, optional): The HTTP status codes of the API errors which are retried.
+                Defaults to 429 and all the 5xx codes
+            max_retries_by_method (dict, optional): How many times to retry the requests with the given HTTP methods,
+                e.g. `{'POST': 2}`, overriding the `max_retries`
+            max_retries_by_status_code (dict, optional): How many times to retry the requests which failed with the given
+                HTTP status codes, e.g. `{500: 1}`, overriding both the `max_retries` and the `max_retries_by_method`
+            retry_non_idempotent_requests (bool, optional): Whether to retry requests with non-idempotent methods, like POST,
+                after network errors which could have happened after the API received them
+            retry_budget (int, optional): How many retries all the requests using this policy can make together
+                in each `retry_budget_window_secs`, so that an outage of the API isn't made worse by a storm of retries.
+                When the budget is spent, failed requests are not retried. By default, the retries are not limited
+            retry_budget_window_secs (float, optional): The length of the sliding time window of the retry budget
+            retry_budget_ratio (float, optional): At most what fraction of the calls using this policy in each `retry_budget_window_secs`
+                can be retried, e.g. 0.1 for 10 %, so that the retries add only a little load to the API when most requests fail
+            retry_budget_min_retries (int, optional): How many retries the `retry_budget_ratio` allows in each window at least,
+                so that a few failed calls at low traffic can still be retried
+            sleep (Callable, optional): The function used to wait between retries in the synchronous client
+            async_sleep (Callable, optional): The coroutine function used to wait between retries in the asynchronous client
+            clock (Callable, optional): The monotonic clock measuring the time in seconds, used by the retry budget
+        """
+        if not 1 <= backoff_factor <= 10:
+            raise ValueError(f'The backoff factor has to be between 1 and 10, got {backoff_factor}')
+
+        self.max_retries = max_retries
+        self.min_delay_between_retries_millis = min_delay_between_retries_millis
+        self.max_delay_between_retries_millis = max_delay_between_retries_millis
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.retryable_status_codes = frozenset(retryable_status_codes)
+        self.max_retries_by_method = {method.upper(): method_max_retries for method, method_max_retries in (max_retries_by_method or {}).items()}
+        self.max_retries_by_status_code = dict(max_retries_by_status_code or {})
+        self.retry_non_idempotent_requests = retry_non_idempotent_requests
+        self.retry_budget = retry_budget
+        self.retry_budget_window_secs = retry_budget_window_secs
+        self.retry_budget_ratio = retry_budget_ratio
+        self.retry_budget_min_retries = retry_budget_min_retries
+        self.sleep = sleep
+        self.async_sleep = async_sleep
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        # When were the calls and the retries in the current window of the retry budget made
+        self._called_at: Deque[float] = deque()
+        self._retried_at: Deque[float] = deque()
+
+    def should_retry(self, *, method: str, attempt: int, error: Exception) -> bool:
+        """Decide whether to retry a failed request, and if so, take the retry from the retry budget.
+
+        Args:
+            method (str): The HTTP method of the request
+            attempt (int): Which attempt at the request failed, starting from 1
+            error (Exception): The error of the failed attempt
+
+        Returns:
+            bool: Whether to retry the request
+        """
+        method = method.upper()
+        max_retries = self.max_retries_by_method.get(method, self.max_retries)
+
+        if isinstance(error, ApifyApiError):
+            if error.status_code not in self.retryable_status_codes:
+                return False
+            max_retries = self.max_retries_by_status_code.get(error.status_code, max_retries)
+        elif method not in IDEMPOTENT_METHODS and not self.retry_non_idempotent_requests and _may_have_reached_api(error):
+            return False
+
+        if attempt > max_retries:
+            return False
+
+        return self._take_retry_from_budget()
+
+    def get_delay_secs(self, attempt: int, previous_delay_secs: Optional[float] = None) -> float:
+        """Compute how long to wait before retrying a failed request.
+
+        Args:
+            attempt (int): Which attempt at the request failed, starting from 1
+            previous_delay_secs (float, optional): The delay before the failed attempt, used by the decorrelated jitter
+
+        Returns:
+            float: The delay in seconds
+        """
+        min_delay_secs = self.min_delay_between_retries_millis / 1000
+        max_delay_secs = self.max_delay_between_retries_millis / 1000 if self.max_delay_between_retries_millis is not None else float('inf')
+
+        if self.jitter == Jitter.DECORRELATED:
+            delay_secs = random.uniform(min_delay_secs, _DECORRELATED_JITTER_MAX_GROWTH * (previous_delay_secs or min_delay_secs))
+            return min(max_delay_secs, delay_secs)
+
+        delay_secs = min(max_delay_secs, min_delay_secs * self.backoff_factor ** (attempt - 1))
+        if self.jitter == Jitter.FULL:
+            return random.uniform(0, delay_secs)
+        if self.jitter == Jitter.PROPORTIONAL:
+            return min(max_delay_secs, delay_secs * random.uniform(1, 2))
+        return delay_secs
+
+    def call(self, func: Callable[[BailType, int], T], *, method: str) -> T:
+        """Call a function making a request, and retry it according to the policy when it fails.
+
+        Args:
+            func (Callable): The function making the request, called with a `bail` function, which raises an error
+                without retrying it, and with the number of the attempt, starting from 1
+            method (str): The HTTP method of the request
+
+        Returns:
+            The result of the function
+        """
+        bailed = False
+
+        def bail(error: Exception) -> None:
+            nonlocal bailed
+            bailed = True
+            raise error
+
+        self._record_call()
+        attempt = 1
+        delay_secs: Optional[float] = None
+        while True:
+            try:
+                return func(bail, attempt)
+            except Exception as e:
+                if bailed or not self.should_retry(method=method, attempt=attempt, error=e):
+                    raise
+                delay_secs = self._get_delay_secs_before_deadline(attempt, delay_secs, e)
+
+            self.sleep(delay_secs)
+            attempt += 1
+
+    async def call_async(self, async_func: Callable[[BailType, int], Awaitable[T]], *, method: str) -> T:
+        """Call a coroutine function making a request, and retry it according to the policy when it fails.
+
+        Args:
+            async_func (Callable): The coroutine function making the request, called with a `bail` function, which raises an error
+                without retrying it, and with the number of the attempt, starting from 1
+            method (str): The HTTP method of the request
+
+        Returns:
+            The result of the coroutine function
+        """
+        bailed = False
+
+        def bail(error: Exception) -> None:
+            nonlocal bailed
+            bailed = True
+            raise error
+
+        self._record_call()
+        attempt = 1
+        delay_secs: Optional[float] = None
+        while True:
+            try:
+                return await async_func(bail, attempt)
+            except Exception as e:
+                if bailed or not self.should_retry(method=method, attempt=attempt, error=e):
+                    raise
+                delay_secs = self._get_delay_secs_before_deadline(attempt, delay_secs, e)
+
+            await self.async_sleep(delay_secs)
+            attempt += 1
+
+    def _get_delay_secs_before_deadline(self, attempt: int, previous_delay_secs: Optional[float], last_error: Exception) -> float:
+        delay_secs = self.get_delay_secs(attempt, previous_delay_secs)
+
+        # There's no point in waiting for a retry which would start after the deadline
+        remaining_secs = _get_remaining_secs_to_deadline()
+        if remaining_secs is not None and delay_secs >= remaining_secs:
+            raise DeadlineExceededError(f'The API call failed and the deadline would pass before retrying it ({last_error})') from last_error
+
+        return delay_secs
+
+    def _record_call(self) -> None:
+        if self.retry_budget_ratio is not None:
+            with self._lock:
+                now = self._clock()
+                # Also removed here, so that the calls of a client which never retries don't pile up
+                self._remove_expired_timestamps(now)
+                self._called_at.append(now)
+
+    def _take_retry_from_budget(self) -> bool:
+        if self.retry_budget is None and self.retry_budget_ratio is None:
+            return True
+
+        with self._lock:
+            now = self._clock()
+            self._remove_expired_timestamps(now)
+
+            max_retries_in_window = float('inf')
+            if self.retry_budget is not None:
+                max_retries_in_window = self.retry_budget
+            if self.retry_budget_ratio is not None:
+                max_retries_by_ratio = max(self.retry_budget_min_retries, int(self.retry_budget_ratio * len(self._called_at)))
+                max_retries_in_window = min(max_retries_in_window, max_retries_by_ratio)
+
+            if len(self._retried_at) >= max_retries_in_window:
+                return False
+            self._retried_at.append(now)
+            return True
+
+    def _remove_expired_timestamps(self, now: float) -> None:
+        for timestamps in (self._called_at, self._retried_at):
+            while timestamps and timestamps[0] <= now - self.retry_budget_window_secs:
+                timestamps.popleft()
+
+
+def _may_have_reached_api(error: Exception) -> bool:
+    # Errors of establishing the connection happen before any part of the request is sent
+    if isinstance(error, (requests.exceptions.ConnectTimeout, httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        return False
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        return not isinstance(getattr(error.args[0], 'reason', None), NewConnectionError)
+    return isinstance(error, (requests.exceptions.RequestException, httpx.TransportError, InvalidResponseBodyError))
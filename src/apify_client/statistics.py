@@ -0,0 +1,306 @@
+import bisect
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Upper bounds of the buckets of the latency histograms, from the quick reads to the calls waiting for a run to finish
+DEFAULT_LATENCY_BUCKETS_SECS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+DEFAULT_PERCENTILES = (50, 95, 99)
+DEFAULT_METRICS_PREFIX = 'apify_client'
+
+# The counters exported to Prometheus, with the attributes of the statistics they come from
+_PROMETHEUS_COUNTERS = (
+    ('calls_total', 'calls', 'The API calls made by the client.'),
+    ('cache_hits_total', 'cache_hits', 'The API calls answered from the response cache.'),
+    ('coalesced_calls_total', 'coalesced_calls', 'The API calls which shared a request with an identical concurrent call.'),
+    ('requests_total', 'requests', 'The HTTP requests sent to the API, including the retries.'),
+    ('network_errors_total', 'network_errors', 'The requests which failed without a response.'),
+    ('request_bytes_total', 'request_bytes', 'The bytes of the request bodies as sent.'),
+    ('request_uncompressed_bytes_total', 'request_uncompressed_bytes', 'The bytes of the request bodies before compression.'),
+    ('response_bytes_total', 'response_bytes', 'The bytes of the response bodies as received.'),
+    ('response_decompressed_bytes_total', 'response_decompressed_bytes', 'The bytes of the response bodies after decompression.'),
+)
+
+# The reason of a retry after a request which didn't get any response
+NETWORK_ERROR = 'network_error'
+# The reason of a retry after a response whose body couldn't be parsed
+INVALID_RESPONSE_BODY = 'invalid_response_body'
+
+
+class _LatencyHistogram:
+    def __init__(self, buckets_secs: Sequence[float]) -> None:
+        self.buckets_secs = buckets_secs
+        # The last bucket counts the latencies longer than the last bound
+        self.counts = [0] * (len(buckets_secs) + 1)
+        self.count = 0
+        self.sum_secs = 0.0
+        self.max_secs = 0.0
+
+    def record(self, latency_secs: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets_secs, latency_secs)] += 1
+        self.count += 1
+        self.sum_secs += latency_secs
+        self.max_secs = max(self.max_secs, latency_secs)
+
+    def merge(self, other: '_LatencyHistogram') -> None:
+        self.counts = [count + other_count for count, other_count in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.sum_secs += other.sum_secs
+        self.max_secs = max(self.max_secs, other.max_secs)
+
+    def get_percentile_secs(self, percentile: float) -> Optional[float]:
+        # Estimated by interpolating within the bucket the percentile falls into, like Prometheus does
+        if self.count == 0:
+            return None
+
+        rank = percentile / 100 * self.count
+        cumulative_count = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count > 0 and cumulative_count + bucket_count >= rank:
+                lower_bound = min(self.buckets_secs[index - 1], self.max_secs) if index > 0 else 0
+                upper_bound = min(self.buckets_secs[index], self.max_secs) if index < len(self.buckets_secs) else self.max_secs
+                return lower_bound + (upper_bound - lower_bound) * (rank - cumulative_count) / bucket_count
+            cumulative_count += bucket_count
+        return self.max_secs
+
+
+class _EndpointClassStatistics:
+    def __init__(self, latency_buckets_secs: Sequence[float]) -> None:
+        self.calls = 0
+        self.cache_hits = 0
+        self.coalesced_calls = 0
+        self.requests = 0
+        self.responses_by_status_code: Dict[int, int] = {}
+        self.network_errors = 0
+        self.retries_by_reason: Dict[str, int] = {}
+        self.request_bytes = 0
+        self.request_uncompressed_bytes = 0
+        self.response_bytes = 0
+        self.response_decompressed_bytes = 0
+        self.latency = _LatencyHistogram(latency_buckets_secs)
+
+    def merge(self, other: '_EndpointClassStatistics') -> None:
+        self.calls += other.calls
+        self.cache_hits += other.cache_hits
+        self.coalesced_calls += other.coalesced_calls
+        self.requests += other.requests
+        for status_code, count in other.responses_by_status_code.items():
+            self.responses_by_status_code[status_code] = self.responses_by_status_code.get(status_code, 0) + count
+        self.network_errors += other.network_errors
+        for reason, count in other.retries_by_reason.items():
+            self.retries_by_reason[reason] = self.retries_by_reason.get(reason, 0) + count
+        self.request_bytes += other.request_bytes
+        self.request_uncompressed_bytes += other.request_uncompressed_bytes
+        self.response_bytes += other.response_bytes
+        self.response_decompressed_bytes += other.response_decompressed_bytes
+        self.latency.merge(other.latency)
+
+    def as_dict(self, percentiles: Sequence[float]) -> Dict:
+        return {
+            'calls': self.calls,
+            'cache_hits': self.cache_hits,
+            'coalesced_calls': self.coalesced_calls,
+            'requests': self.requests,
+            'responses_by_status_code': dict(sorted(self.responses_by_status_code.items())),
+            'network_errors': self.network_errors,
+            'retries': sum(self.retries_by_reason.values()),
+            'retries_by_reason': dict(sorted(self.retries_by_reason.items())),
+            'request_bytes': self.request_bytes,
+            'request_uncompressed_bytes': self.request_uncompressed_bytes,
+            'response_bytes': self.response_bytes,
+            'response_decompressed_bytes': self.response_decompressed_bytes,
+            'latency_secs': {
+                'count': self.latency.count,
+                'sum': self.latency.sum_secs,
+                'max': self.latency.max_secs,
+                **{f'p{percentile:g}': self.latency.get_percentile_secs(percentile) for percentile in percentiles},
+            },
+        }
+
+
+class Statistics:
+    """Statistics of the API calls made by a client, by the endpoint classes, which are the types of the resources they access.
+
+    For each endpoint class, the statistics count the API calls, the HTTP requests sent for them, including the retries,
+    the responses by status code, the network errors and the retries by their reason, which is the status code of the failed
+    response or `network_error`. They sum the bytes of the request bodies before and after compression and of the response bodies
+    as received and after decompression, and they keep a histogram of the latencies of the requests.
+    Recording a request costs a few dictionary updates, so the statistics can stay on in production.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency_buckets_secs: Sequence[float] = DEFAULT_LATENCY_BUCKETS_SECS,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    ) -> None:
+        """Initialize the Statistics.
+
+        Args:
+            latency_buckets_secs (list of float, optional): The upper bounds of the buckets of the latency histograms, in seconds
+            percentiles (list of float, optional): Which percentiles of the latencies to estimate in the exported statistics
+        """
+        self.latency_buckets_secs = tuple(sorted(latency_buckets_secs))
+        self.percentiles = tuple(percentiles)
+
+        self._lock = threading.Lock()
+        self._endpoint_classes: Dict[str, _EndpointClassStatistics] = {}
+
+    def record_call(self, endpoint_class: str) -> None:
+        """Record an API call.
+
+        Args:
+            endpoint_class (str): The type of the resource the call accessed
+        """
+        with self._lock:
+            self._get_endpoint_class_statistics(endpoint_class).calls += 1
+
+    def record_cache_hit(self, endpoint_class: str) -> None:
+        """Record an API call answered from the response cache, without sending a request.
+
+        Args:
+            endpoint_class (str): The type of the resource the call accessed
+        """
+        with self._lock:
+            self._get_endpoint_class_statistics(endpoint_class).cache_hits += 1
+
+    def record_coalesced_call(self, endpoint_class: str) -> None:
+        """Record an API call which shared the request sent by an identical concurrent call.
+
+        Args:
+            endpoint_class (str): The type of the resource the call accessed
+        """
+        with self._lock:
+            self._get_endpoint_class_statistics(endpoint_class).coalesced_calls += 1
+
+    def record_request(
+        self,
+        endpoint_class: str,
+        *,
+        status_code: Optional[int],
+        latency_secs: float,
+        request_bytes: int = 0,
+        request_uncompressed_bytes: int = 0,
+        response_bytes: int = 0,
+        response_decompressed_bytes: int = 0,
+    ) -> None:
+        """Record an HTTP request.
+
+        Args:
+            endpoint_class (str): The type of the resource the request accessed
+            status_code (int, optional): The status code of the response, None if the request failed with a network error
+            latency_secs (float): How long it took to get the response, or the error
+            request_bytes (int, optional): The size of the request body as it was sent
+            request_uncompressed_bytes (int, optional): The size of the request body before compression
+            response_bytes (int, optional): The size of the response body as it was received
+            response_decompressed_bytes (int, optional): The size of the response body after decompression
+        """
+        with self._lock:
+            endpoint_class_statistics = self._get_endpoint_class_statistics(endpoint_class)
+            endpoint_class_statistics.requests += 1
+            if status_code is None:
+                endpoint_class_statistics.network_errors += 1
+            else:
+                responses_by_status_code = endpoint_class_statistics.responses_by_status_code
+                responses_by_status_code[status_code] = responses_by_status_code.get(status_code, 0) + 1
+            endpoint_class_statistics.request_bytes += request_bytes
+            endpoint_class_statistics.request_uncompressed_bytes += request_uncompressed_bytes
+            endpoint_class_statistics.response_bytes += response_bytes
+            endpoint_class_statistics.response_decompressed_bytes += response_decompressed_bytes
+            endpoint_class_statistics.latency.record(latency_secs)
+
+    def record_retry(self, endpoint_class: str, *, reason: str) -> None:
+        """Record a retry of a failed request.
+
+        Args:
+            endpoint_class (str): The type of the resource the request accessed
+            reason (str): The status code of the failed response, `network_error` or `invalid_response_body`
+        """
+        with self._lock:
+            retries_by_reason = self._get_endpoint_class_statistics(endpoint_class).retries_by_reason
+            retries_by_reason[reason] = retries_by_reason.get(reason, 0) + 1
+
+    def as_dict(self) -> Dict:
+        """Export the statistics as a dictionary.
+
+        Returns:
+            dict: The statistics of each endpoint class under `endpoint_classes`, and of all the calls together under `total`
+        """
+        with self._lock:
+            total = _EndpointClassStatistics(self.latency_buckets_secs)
+            for endpoint_class_statistics in self._endpoint_classes.values():
+                total.merge(endpoint_class_statistics)
+
+            return {
+                'endpoint_classes': {
+                    endpoint_class: endpoint_class_statistics.as_dict(self.percentiles)
+                    for endpoint_class, endpoint_class_statistics in sorted(self._endpoint_classes.items())
+                },
+                'total': total.as_dict(self.percentiles),
+            }
+
+    def to_prometheus(self, *, prefix: str = DEFAULT_METRICS_PREFIX) -> str:
+        """Export the statistics in the Prometheus text format, to be served to a Prometheus server.
+
+        Args:
+            prefix (str, optional): The prefix of the names of the metrics
+
+        Returns:
+            str: The metrics in the Prometheus text exposition format
+        """
+        lines: List[str] = []
+
+        def add_metric(name: str, metric_type: str, description: str, samples: List[Tuple[str, str, object]]) -> None:
+            lines.append(f'# HELP {prefix}_{name} {description}')
+            lines.append(f'# TYPE {prefix}_{name} {metric_type}')
+            lines.extend(f'{prefix}_{sample_name}{{{labels}}} {value}' for sample_name, labels, value in samples)
+
+        with self._lock:
+            endpoint_classes = sorted(
+                (f'endpoint_class="{_escape_label_value(endpoint_class)}"', endpoint_class_statistics)
+                for endpoint_class, endpoint_class_statistics in self._endpoint_classes.items()
+            )
+
+            for name, attribute, description in _PROMETHEUS_COUNTERS:
+                add_metric(name, 'counter', description, [
+                    (name, labels, getattr(endpoint_class_statistics, attribute)) for labels, endpoint_class_statistics in endpoint_classes
+                ])
+
+            add_metric('responses_total', 'counter', 'The responses received from the API, by status code.', [
+                ('responses_total', f'{labels},status_code="{status_code}"', count)
+                for labels, endpoint_class_statistics in endpoint_classes
+                for status_code, count in sorted(endpoint_class_statistics.responses_by_status_code.items())
+            ])
+            add_metric('retries_total', 'counter', 'The retries of failed requests, by the reason of the failure.', [
+                ('retries_total', f'{labels},reason="{_escape_label_value(reason)}"', count)
+                for labels, endpoint_class_statistics in endpoint_classes
+                for reason, count in sorted(endpoint_class_statistics.retries_by_reason.items())
+            ])
+
+            latency_samples: List[Tuple[str, str, object]] = []
+            for labels, endpoint_class_statistics in endpoint_classes:
+                latency = endpoint_class_statistics.latency
+                cumulative_count = 0
+                for bucket_secs, bucket_count in zip(self.latency_buckets_secs, latency.counts):
+                    cumulative_count += bucket_count
+                    latency_samples.append(('request_duration_seconds_bucket', f'{labels},le="{bucket_secs:g}"', cumulative_count))
+                latency_samples.append(('request_duration_seconds_bucket', f'{labels},le="+Inf"', latency.count))
+                latency_samples.append(('request_duration_seconds_sum', labels, latency.sum_secs))
+                latency_samples.append(('request_duration_seconds_count', labels, latency.count))
+            add_metric('request_duration_seconds', 'histogram', 'The latencies of the requests, in seconds.', latency_samples)
+
+        return '\n'.join(lines) + '\n'
+
+    def reset(self) -> None:
+        """Reset all the statistics to zero."""
+        with self._lock:
+            self._endpoint_classes.clear()
+
+    def _get_endpoint_class_statistics(self, endpoint_class: str) -> _EndpointClassStatistics:
+        endpoint_class_statistics = self._endpoint_classes.get(endpoint_class)
+        if endpoint_class_statistics is None:
+            endpoint_class_statistics = self._endpoint_classes[endpoint_class] = _EndpointClassStatistics(self.latency_buckets_secs)
+        return endpoint_class_statistics
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
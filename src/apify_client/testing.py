@@ -0,0 +1,907 @@
+"""An in-process stand-in for the Apify API, to test and benchmark the client offline.
+
+`FakeApifyServer` serves the endpoints of datasets, key-value stores, request queues, actors, actor runs and logs
+which the client uses, keeping the data in memory. It can simulate the latency and the bandwidth of the network,
+inject errors and rate limit errors, and its actor runs finish after a configurable time, so that the performance
+of the client can be measured reproducibly without an Apify account. Example:
+
+    with FakeApifyServer(latency_millis=20) as server:
+        dataset = server.add_dataset([{'index': i} for i in range(10_000)])
+        client = ApifyClient(base_url=server.url)
+        items = list(client.dataset(dataset['id']).iterate_items())
+"""
+
+import csv
+import gzip
+import io
+import json
+import random
+import re
+import string
+import threading
+import time
+from datetime import datetime, timezone
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Type, TypeVar
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from ._consts import TERMINAL_ACTOR_JOB_STATUSES, ActorJobStatus
+from ._utils import NOT_FOUND_TYPE
+
+# The API sends this limit in the pagination headers when no limit was requested
+NO_LIMIT = 999999999999
+# The longest the API waits for an actor run to finish before responding
+MAX_WAIT_FOR_FINISH_SECS = 60
+# Responses over this size are compressed, when the client accepts it
+RESPONSE_COMPRESSION_THRESHOLD_BYTES = 1024
+# Size of the chunks in which the responses are sent when the bandwidth is limited
+BANDWIDTH_CHUNK_SIZE_BYTES = 16 * 1024
+
+_JSON_CONTENT_TYPE = 'application/json; charset=utf-8'
+
+
+class _Response:
+    def __init__(self, status_code: int, body: bytes = b'', headers: Optional[Dict[str, str]] = None) -> None:
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+
+
+class _ApiError(Exception):
+    def __init__(self, status_code: int, error_type: str, message: str) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.error_type = error_type
+        self.message = message
+
+
+def _not_found(what: str) -> _ApiError:
+    return _ApiError(HTTPStatus.NOT_FOUND, NOT_FOUND_TYPE, f'{what} was not found')
+
+
+def _now_iso() -> str:
+    # The same format as the API uses, with milliseconds
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+
+
+def _is_truthy(value: Optional[str]) -> bool:
+    return value is not None and value.lower() in ('1', 'true')
+
+
+def _json_response(data: Any, status_code: int = HTTPStatus.OK, headers: Optional[Dict[str, str]] = None) -> _Response:
+    return _Response(status_code, json.dumps(data).encode('utf-8'), {'Content-Type': _JSON_CONTENT_TYPE, **(headers or {})})
+
+
+def _list_page(items: List[Dict], query: Mapping[str, str]) -> _Response:
+    offset = int(query.get('offset', 0))
+    limit = int(query['limit']) if 'limit' in query else None
+    if _is_truthy(query.get('desc')):
+        items = items[::-1]
+    page_items = items[offset:offset + limit if limit is not None else None]
+    return _json_response({'data': {
+        'total': len(items),
+        'offset': offset,
+        'limit': limit if limit is not None else NO_LIMIT,
+        'count': len(page_items),
+        'desc': _is_truthy(query.get('desc')),
+        'items': page_items,
+    }})
+
+
+class _Storage:
+    def __init__(self, storage_id: str, name: Optional[str]) -> None:
+        self.id = storage_id
+        self.name = name
+        self.created_at = self.modified_at = self.accessed_at = _now_iso()
+
+    def matches(self, id_or_name: str) -> bool:
+        # The resources can be referred to by their ID, their name or `username~name`
+        return id_or_name == self.id or (self.name is not None and id_or_name.split('~')[-1] == self.name)
+
+    def to_dict(self) -> Dict:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'userId': 'fake-user-id',
+            'createdAt': self.created_at,
+            'modifiedAt': self.modified_at,
+            'accessedAt': self.accessed_at,
+        }
+
+
+class _Dataset(_Storage):
+    def __init__(self, storage_id: str, name: Optional[str]) -> None:
+        super().__init__(storage_id, name)
+        self.items: List[Any] = []
+
+    def to_dict(self) -> Dict:
+        clean_item_count = sum(1 for item in self.items if item)
+        return {**super().to_dict(), 'itemCount': len(self.items), 'cleanItemCount': clean_item_count}
+
+
+class _KeyValueStore(_Storage):
+    def __init__(self, storage_id: str, name: Optional[str]) -> None:
+        super().__init__(storage_id, name)
+        # The values of the records, with their content types
+        self.records: Dict[str, Tuple[bytes, str]] = {}
+
+
+class _RequestQueue(_Storage):
+    def __init__(self, storage_id: str, name: Optional[str]) -> None:
+        super().__init__(storage_id, name)
+        self.requests: Dict[str, Dict] = {}
+        self.request_ids_by_unique_key: Dict[str, str] = {}
+        # The IDs of the requests which are not handled yet, in the order in which they are processed
+        self.pending_request_ids: List[str] = []
+
+    def to_dict(self) -> Dict:
+        handled_request_count = len(self.requests) - len(self.pending_request_ids)
+        return {
+            **super().to_dict(),
+            'totalRequestCount': len(self.requests),
+            'handledRequestCount': handled_request_count,
+            'pendingRequestCount': len(self.pending_request_ids),
+        }
+
+
+StorageType = TypeVar('StorageType', bound=_Storage)
+
+
+class _Actor(_Storage):
+    def __init__(self, storage_id: str, name: Optional[str]) -> None:
+        super().__init__(storage_id, name)
+        self.run_duration_secs = 0.0
+        self.output_items: List[Any] = []
+        self.run_ids: List[str] = []
+
+
+class _Run:
+    def __init__(self, run_id: str, actor_id: str, duration_secs: float, dataset_id: str, key_value_store_id: str, request_queue_id: str) -> None:
+        self.id = run_id
+        self.actor_id = actor_id
+        self.started_at = _now_iso()
+        self.finished_at: Optional[str] = None
+        self.finishes_at = time.monotonic() + duration_secs
+        self.aborted = False
+        self.default_dataset_id = dataset_id
+        self.default_key_value_store_id = key_value_store_id
+        self.default_request_queue_id = request_queue_id
+
+    @property
+    def status(self) -> ActorJobStatus:
+        if self.aborted:
+            return ActorJobStatus.ABORTED
+        if time.monotonic() >= self.finishes_at:
+            if self.finished_at is None:
+                self.finished_at = _now_iso()
+            return ActorJobStatus.SUCCEEDED
+        return ActorJobStatus.RUNNING
+
+    def to_dict(self) -> Dict:
+        status = self.status
+        return {
+            'id': self.id,
+            'actId': self.actor_id,
+            'userId': 'fake-user-id',
+            'status': status.value,
+            'startedAt': self.started_at,
+            'finishedAt': self.finished_at,
+            'buildNumber': '0.0.1',
+            'defaultDatasetId': self.default_dataset_id,
+            'defaultKeyValueStoreId': self.default_key_value_store_id,
+            'defaultRequestQueueId': self.default_request_queue_id,
+        }
+
+
+class FakeApifyServer:
+    """A local stand-in for the Apify API, serving the data it keeps in memory over HTTP.
+
+    The server runs in a background thread of the current process. Use it as a context manager, or call `start()`
+    and `stop()`, and point the client to it with `ApifyClient(base_url=server.url)`. Any token is accepted.
+    The state of the server can be prepared with the `add_*` methods, which return the resources in the same form
+    as the API. The simulated latency is added to every response, and with a limited bandwidth, the bodies of the responses
+    are sent in chunks paced to it. The injected errors are returned before the request is handled, so they don't change
+    the state of the server, like the errors the client retries.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency_millis: float = 0,
+        bandwidth_bytes_per_sec: Optional[float] = None,
+        error_rate: float = 0,
+        rate_limit_error_rate: float = 0,
+        retry_after_secs: Optional[float] = None,
+        run_duration_secs: float = 0,
+        compress_responses: bool = True,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Initialize the FakeApifyServer.
+
+        Args:
+            latency_millis (float, optional): How long the server waits before responding to each request
+            bandwidth_bytes_per_sec (float, optional): How fast the bodies of the responses are sent. By default, it's not limited
+            error_rate (float, optional): Which fraction of the requests fails with an internal server error
+            rate_limit_error_rate (float, optional): Which fraction of the requests fails with a rate limit error
+            retry_after_secs (float, optional): The `Retry-After` header of the rate limit errors, they don't have it by default
+            run_duration_secs (float, optional): How long the actor runs take by default, before they succeed
+            compress_responses (bool, optional): Whether to gzip the bodies of the responses over 1 kB, when the client accepts it
+            seed (int, optional): The seed of the random numbers deciding the IDs of the resources and which requests fail
+        """
+        self.latency_millis = latency_millis
+        self.bandwidth_bytes_per_sec = bandwidth_bytes_per_sec
+        self.error_rate = error_rate
+        self.rate_limit_error_rate = rate_limit_error_rate
+        self.retry_after_secs = retry_after_secs
+        self.run_duration_secs = run_duration_secs
+        self.compress_responses = compress_responses
+
+        self._random = random.Random(seed)
+        self._lock = threading.RLock()
+        self._datasets: Dict[str, _Dataset] = {}
+        self._key_value_stores: Dict[str, _KeyValueStore] = {}
+        self._request_queues: Dict[str, _RequestQueue] = {}
+        self._actors: Dict[str, _Actor] = {}
+        self._runs: Dict[str, _Run] = {}
+        self._logs: Dict[str, str] = {}
+        self._failing_requests: List[int] = []
+        self._http_server: Optional[ThreadingHTTPServer] = None
+
+        # The method and the path of each request the server received, in the order they arrived
+        self.requests: List[Tuple[str, str]] = []
+
+        routes: List[Tuple[str, str, Callable[..., _Response]]] = [
+            ('GET', r'datasets', self._list_datasets),
+            ('POST', r'datasets', self._get_or_create_dataset),
+            ('GET', r'datasets/(?P<dataset_id>[^/]+)', self._get_dataset),
+            ('PUT', r'datasets/(?P<dataset_id>[^/]+)', self._update_dataset),
+            ('DELETE', r'datasets/(?P<dataset_id>[^/]+)', self._delete_dataset),
+            ('GET', r'datasets/(?P<dataset_id>[^/]+)/items', self._get_items),
+            ('POST', r'datasets/(?P<dataset_id>[^/]+)/items', self._push_items),
+            ('GET', r'key-value-stores', self._list_key_value_stores),
+            ('POST', r'key-value-stores', self._get_or_create_key_value_store),
+            ('GET', r'key-value-stores/(?P<store_id>[^/]+)', self._get_key_value_store),
+            ('PUT', r'key-value-stores/(?P<store_id>[^/]+)', self._update_key_value_store),
+            ('DELETE', r'key-value-stores/(?P<store_id>[^/]+)', self._delete_key_value_store),
+            ('GET', r'key-value-stores/(?P<store_id>[^/]+)/keys', self._list_keys),
+            ('GET', r'key-value-stores/(?P<store_id>[^/]+)/records/(?P<key>[^/]+)', self._get_record),
+            ('PUT', r'key-value-stores/(?P<store_id>[^/]+)/records/(?P<key>[^/]+)', self._set_record),
+            ('DELETE', r'key-value-stores/(?P<store_id>[^/]+)/records/(?P<key>[^/]+)', self._delete_record),
+            ('GET', r'request-queues', self._list_request_queues),
+            ('POST', r'request-queues', self._get_or_create_request_queue),
+            ('GET', r'request-queues/(?P<queue_id>[^/]+)', self._get_request_queue),
+            ('PUT', r'request-queues/(?P<queue_id>[^/]+)', self._update_request_queue),
+            ('DELETE', r'request-queues/(?P<queue_id>[^/]+)', self._delete_request_queue),
+            ('GET', r'request-queues/(?P<queue_id>[^/]+)/head', self._list_head),
+            ('POST', r'request-queues/(?P<queue_id>[^/]+)/requests', self._add_request),
+            ('GET', r'request-queues/(?P<queue_id>[^/]+)/requests/(?P<request_id>[^/]+)', self._get_request),
+            ('PUT', r'request-queues/(?P<queue_id>[^/]+)/requests/(?P<request_id>[^/]+)', self._update_request),
+            ('DELETE', r'request-queues/(?P<queue_id>[^/]+)/requests/(?P<request_id>[^/]+)', self._delete_request),
+            ('GET', r'acts', self._list_actors),
+            ('POST', r'acts', self._create_actor),
+            ('GET', r'acts/(?P<actor_id>[^/]+)', self._get_actor),
+            ('GET', r'acts/(?P<actor_id>[^/]+)/runs', self._list_runs),
+            ('POST', r'acts/(?P<actor_id>[^/]+)/runs', self._start_run),
+            ('GET', r'actor-runs', self._list_runs),
+            ('GET', r'actor-runs/(?P<run_id>[^/]+)', self._get_run),
+            ('POST', r'actor-runs/(?P<run_id>[^/]+)/abort', self._abort_run),
+            ('GET', r'logs/(?P<run_id>[^/]+)', self._get_log),
+        ]
+        self._routes = [(method, re.compile(f'^{pattern}$'), handler) for method, pattern, handler in routes]
+
+    @property
+    def url(self) -> str:
+        """The base URL of the API served by the server, to pass to the client as its `base_url`."""
+        if self._http_server is None:
+            raise RuntimeError('The server is not running, call start() first')
+        return f'http://127.0.0.1:{self._http_server.server_port}/v2'
+
+    def start(self) -> 'FakeApifyServer':
+        """Start serving the API on a free local port, in a background thread.
+
+        Returns:
+            FakeApifyServer: The server itself
+        """
+        http_server = _FakeApiHTTPServer(self)
+        threading.Thread(target=http_server.serve_forever, daemon=True).start()
+        self._http_server = http_server
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and close its connections."""
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_server = None
+
+    def __enter__(self) -> 'FakeApifyServer':
+        """Start the server."""
+        return self.start()
+
+    def __exit__(self, *_args: Any) -> None:
+        """Stop the server."""
+        self.stop()
+
+    def fail_next_requests(self, count: int, *, status_code: int = HTTPStatus.INTERNAL_SERVER_ERROR) -> None:
+        """Make the next requests fail with an error status code, before they are handled.
+
+        Args:
+            count (int): How many of the next requests should fail
+            status_code (int, optional): The status code of the errors, e.g. 429 for rate limit errors
+        """
+        with self._lock:
+            self._failing_requests.extend([status_code] * count)
+
+    def add_dataset(self, items: Iterable[Any] = (), *, name: Optional[str] = None) -> Dict:
+        """Create a dataset with the given items.
+
+        Args:
+            items (iterable, optional): The items of the dataset
+            name (str, optional): The name of the dataset
+
+        Returns:
+            dict: The dataset, as the API returns it
+        """
+        with self._lock:
+            dataset = self._create_storage(self._datasets, _Dataset, name)
+            dataset.items.extend(items)
+            return dataset.to_dict()
+
+    def add_key_value_store(self, records: Optional[Mapping[str, Any]] = None, *, name: Optional[str] = None) -> Dict:
+        """Create a key-value store with the given records.
+
+        Args:
+            records (dict, optional): The records of the store, bytes and strings are stored as they are, other values as JSON
+            name (str, optional): The name of the store
+
+        Returns:
+            dict: The key-value store, as the API returns it
+        """
+        with self._lock:
+            store = self._create_storage(self._key_value_stores, _KeyValueStore, name)
+            for key, value in (records or {}).items():
+                if isinstance(value, bytes):
+                    store.records[key] = (value, 'application/octet-stream')
+                elif isinstance(value, str):
+                    store.records[key] = (value.encode('utf-8'), 'text/plain; charset=utf-8')
+                else:
+                    store.records[key] = (json.dumps(value).encode('utf-8'), _JSON_CONTENT_TYPE)
+            return store.to_dict()
+
+    def add_request_queue(self, requests: Iterable[Dict] = (), *, name: Optional[str] = None) -> Dict:
+        """Create a request queue with the given requests.
+
+        Args:
+            requests (iterable of dict, optional): The requests in the queue, each with at least its `url`
+            name (str, optional): The name of the queue
+
+        Returns:
+            dict: The request queue, as the API returns it
+        """
+        with self._lock:
+            queue = self._create_storage(self._request_queues, _RequestQueue, name)
+            for request in requests:
+                self._add_request_to_queue(queue, request, forefront=False)
+            return queue.to_dict()
+
+    def add_actor(self, name: str, *, run_duration_secs: Optional[float] = None, output_items: Iterable[Any] = ()) -> Dict:
+        """Create an actor, whose runs do nothing for a while and succeed.
+
+        Args:
+            name (str): The name of the actor
+            run_duration_secs (float, optional): How long the runs of the actor take, defaults to the `run_duration_secs` of the server
+            output_items (iterable, optional): The items each run of the actor stores in its default dataset
+
+        Returns:
+            dict: The actor, as the API returns it
+        """
+        with self._lock:
+            actor = self._create_storage(self._actors, _Actor, name)
+            actor.run_duration_secs = self.run_duration_secs if run_duration_secs is None else run_duration_secs
+            actor.output_items = list(output_items)
+            return actor.to_dict()
+
+    def set_log(self, run_id: str, log: str) -> None:
+        """Set the log of an actor run.
+
+        Args:
+            run_id (str): The ID of the run
+            log (str): The text of the log
+        """
+        with self._lock:
+            self._logs[run_id] = log
+
+    def handle_request(self, method: str, url: str, headers: Mapping[str, str], body: bytes = b'') -> Tuple[int, Dict[str, str], bytes]:
+        """Handle a request to the API, without the simulated latency, bandwidth and compression.
+
+        Args:
+            method (str): The HTTP method of the request
+            url (str): The URL or the path of the request, with the query parameters
+            headers (dict): The headers of the request
+            body (bytes, optional): The body of the request, gzipped if its `Content-Encoding` says so
+
+        Returns:
+            tuple: The status code, the headers and the body of the response
+        """
+        headers = {key.lower(): value for key, value in headers.items()}
+        split_url = urlsplit(url)
+        path = split_url.path
+        query = {key: values[-1] for key, values in parse_qs(split_url.query).items()}
+        if headers.get('content-encoding') == 'gzip':
+            body = gzip.decompress(body)
+
+        with self._lock:
+            self.requests.append((method.upper(), path))
+            injected_status_code = self._get_injected_error()
+
+        if injected_status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            response = self._error_response(_ApiError(injected_status_code, 'rate-limit-exceeded', 'This error was injected by the fake API server'))
+            if self.retry_after_secs is not None:
+                response.headers['Retry-After'] = str(self.retry_after_secs)
+        elif injected_status_code is not None:
+            response = self._error_response(_ApiError(injected_status_code, 'internal-error', 'This error was injected by the fake API server'))
+        else:
+            try:
+                response = self._route(method.upper(), path, query, headers, body)
+            except _ApiError as err:
+                response = self._error_response(err)
+
+        return (response.status_code, response.headers, response.body)
+
+    def _get_injected_error(self) -> Optional[int]:
+        if self._failing_requests:
+            return self._failing_requests.pop(0)
+        chance = self._random.random()
+        if chance < self.rate_limit_error_rate:
+            return HTTPStatus.TOO_MANY_REQUESTS
+        if chance < self.rate_limit_error_rate + self.error_rate:
+            return HTTPStatus.INTERNAL_SERVER_ERROR
+        return None
+
+    @staticmethod
+    def _error_response(err: _ApiError) -> _Response:
+        return _json_response({'error': {'type': err.error_type, 'message': err.message}}, err.status_code)
+
+    def _route(self, method: str, path: str, query: Dict[str, str], headers: Dict[str, str], body: bytes) -> _Response:
+        segments = [unquote(segment) for segment in path.strip('/').split('/')]
+        if segments[:1] == ['v2']:
+            segments = segments[1:]
+
+        # The actor runs access the default storages and the log of the run through their own paths
+        if segments[:1] == ['acts'] and segments[2:4] == ['runs', 'last']:
+            with self._lock:
+                segments = ['actor-runs', self._get_last_run(segments[1], query.get('status')).id, *segments[4:]]
+        if segments[:1] == ['actor-runs'] and len(segments) >= 3 and segments[2] in ('dataset', 'key-value-store', 'request-queue', 'log'):
+            with self._lock:
+                run = self._get(self._runs, segments[1], 'Actor run')
+            segments = {
+                'dataset': ['datasets', run.default_dataset_id],
+                'key-value-store': ['key-value-stores', run.default_key_value_store_id],
+                'request-queue': ['request-queues', run.default_request_queue_id],
+                'log': ['logs', run.id],
+            }[segments[2]] + segments[3:]
+
+        relative_path = '/'.join(segments)
+        for route_method, pattern, handler in self._routes:
+            match = pattern.match(relative_path)
+            if match is not None and route_method == method:
+                return handler(query=query, headers=headers, body=body, **match.groupdict())
+
+        raise _ApiError(HTTPStatus.NOT_FOUND, 'page-not-found', f'The endpoint {method} {path} is not supported by the fake API server')
+
+    def _new_id(self) -> str:
+        return ''.join(self._random.choice(string.ascii_letters + string.digits) for _ in range(17))
+
+    def _create_storage(self, storages: Dict[str, StorageType], storage_class: Type[StorageType], name: Optional[str]) -> StorageType:
+        storage = storage_class(self._new_id(), name)
+        storages[storage.id] = storage
+        return storage
+
+    @staticmethod
+    def _get(resources: Mapping[str, Any], id_or_name: str, what: str) -> Any:
+        resource = resources.get(id_or_name)
+        if resource is None:
+            resource = next((resource for resource in resources.values() if isinstance(resource, _Storage) and resource.matches(id_or_name)), None)
+        if resource is None:
+            raise _not_found(what)
+        return resource
+
+    def _get_or_create(self, storages: Dict[str, StorageType], storage_class: Type[StorageType], query: Mapping[str, str]) -> _Response:
+        name = query.get('name')
+        with self._lock:
+            storage = next((storage for storage in storages.values() if name is not None and storage.name == name), None)
+            status_code = HTTPStatus.OK
+            if storage is None:
+                storage = self._create_storage(storages, storage_class, name)
+                status_code = HTTPStatus.CREATED
+            return _json_response({'data': storage.to_dict()}, status_code)
+
+    def _update(self, storages: Dict, storage_id: str, what: str, body: bytes) -> _Response:
+        changes = json.loads(body or b'{}')
+        with self._lock:
+            storage = self._get(storages, storage_id, what)
+            if 'name' in changes:
+                storage.name = changes['name']
+            storage.modified_at = _now_iso()
+            return _json_response({'data': storage.to_dict()})
+
+    def _delete(self, storages: Dict, storage_id: str, what: str) -> _Response:
+        with self._lock:
+            del storages[self._get(storages, storage_id, what).id]
+        return _Response(HTTPStatus.NO_CONTENT)
+
+    def _list(self, storages: Mapping[str, Any], query: Mapping[str, str]) -> _Response:
+        with self._lock:
+            items = [storage.to_dict() for storage in storages.values()]
+        return _list_page(items, query)
+
+    # Datasets
+
+    def _list_datasets(self, *, query: Mapping[str, str], **_kwargs: Any) -> _Response:
+        return self._list(self._datasets, query)
+
+    def _get_or_create_dataset(self, *, query: Mapping[str, str], **_kwargs: Any) -> _Response:
+        return self._get_or_create(self._datasets, _Dataset, query)
+
+    def _get_dataset(self, *, dataset_id: str, **_kwargs: Any) -> _Response:
+        with self._lock:
+            return _json_response({'data': self._get(self._datasets, dataset_id, 'Dataset').to_dict()})
+
+    def _update_dataset(self, *, dataset_id: str, body: bytes, **_kwargs: Any) -> _Response:
+        return self._update(self._datasets, dataset_id, 'Dataset', body)
+
+    def _delete_dataset(self, *, dataset_id: str, **_kwargs: Any) -> _Response:
+        return self._delete(self._datasets, dataset_id, 'Dataset')
+
+    def _get_items(self, *, dataset_id: str, query: Mapping[str, str], **_kwargs: Any) -> _Response:
+        with self._lock:
+            items = list(self._get(self._datasets, dataset_id, 'Dataset').items)
+
+        total = len(items)
+        offset = int(query.get('offset', 0))
+        limit = int(query['limit']) if 'limit' in query else None
+        if _is_truthy(query.get('desc')):
+            items = items[::-1]
+        items = items[offset:offset + limit if limit is not None else None]
+        count = len(items)
+
+        if _is_truthy(query.get('clean')) or _is_truthy(query.get('skipEmpty')):
+            items = [item for item in items if item]
+        if _is_truthy(query.get('clean')) or _is_truthy(query.get('skipHidden')):
+            items = [{key: value for key, value in item.items() if not key.startswith('#')} for item in items]
+        if query.get('fields'):
+            fields = query['fields'].split(',')
+            items = [{field: item[field] for field in fields if field in item} for item in items]
+        if query.get('omit'):
+            omitted_fields = set(query['omit'].split(','))
+            items = [{key: value for key, value in item.items() if key not in omitted_fields} for item in items]
+
+        item_format = query.get('format', 'json')
+        if item_format == 'json':
+            body, content_type = json.dumps(items).encode('utf-8'), _JSON_CONTENT_TYPE
+        elif item_format == 'jsonl':
+            body, content_type = ''.join(f'{json.dumps(item)}\n' for item in items).encode('utf-8'), 'application/jsonl; charset=utf-8'
+        elif item_format == 'csv':
+            body, content_type = self._format_csv(items, query), 'text/csv; charset=utf-8'
+        else:
+            raise _ApiError(HTTPStatus.BAD_REQUEST, 'invalid-parameter', f'The format {item_format} is not supported by the fake API server')
+
+        return _Response(HTTPStatus.OK, body, {
+            'Content-Type': content_type,
+            'X-Apify-Pagination-Total': str(total),
+            'X-Apify-Pagination-Offset': str(offset),
+            'X-Apify-Pagination-Limit': str(limit if limit is not None else NO_LIMIT),
+            'X-Apify-Pagination-Count': str(count),
+            'X-Apify-Pagination-Desc': str(_is_truthy(query.get('desc'))).lower(),
+        })
+
+    @staticmethod
+    def _format_csv(items: List[Dict], query: Mapping[str, str]) -> bytes:
+        fields = list(dict.fromkeys(key for item in items for key in item))
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=fields, delimiter=query.get('delimiter', ','), lineterminator='\n')
+        if not _is_truthy(query.get('skipHeaderRow')):
+            writer.writeheader()
+        writer.writerows(items)
+        bom = '\ufeff' if query.get('bom') is None or _is_truthy(query.get('bom')) else ''
+        return f'{bom}{output.getvalue()}'.encode('utf-8')
+
+    def _push_items(self, *, dataset_id: str, body: bytes, **_kwargs: Any) -> _Response:
+        try:
+            items = json.loads(body)
+        except ValueError:
+            raise _ApiError(HTTPStatus.BAD_REQUEST, 'invalid-payload', 'The items are not valid JSON')
+        with self._lock:
+            dataset = self._get(self._datasets, dataset_id, 'Dataset')
+            dataset.items.extend(items if isinstance(items, list) else [items])
+            dataset.modified_at = _now_iso()
+        return _Response(HTTPStatus.CREATED)
+
+    # Key-value stores
+
+    def _list_key_value_stores(self, *, query: Mapping[str, str], **_kwargs: Any) -> _Response:
+        return self._list(self._key_value_stores, query)
+
+    def _get_or_create_key_value_store(self, *, query: Mapping[str, str], **_kwargs: Any) -> _Response:
+        return self._get_or_create(self._key_value_stores, _KeyValueStore, query)
+
+    def _get_key_value_store(self, *, store_id: str, **_kwargs: Any) -> _Response:
+        with self._lock:
+            return _json_response({'data': self._get(self._key_value_stores, store_id, 'Key-value store').to_dict()})
+
+    def _update_key_value_store(self, *, store_id: str, body: bytes, **_kwargs: Any) -> _Response:
+        return self._update(self._key_value_stores, store_id, 'Key-value store', body)
+
+    def _delete_key_value_store(self, *, store_id: str, **_kwargs: Any) -> _Response:
+        return self._delete(self._key_value_stores, store_id, 'Key-value store')
+
+    def _list_keys(self, *, store_id: str, query: Mapping[str, str], **_kwargs: Any) -> _Response:
+        limit = min(int(query.get('limit', 1000)), 1000)
+        exclusive_start_key = query.get('exclusiveStartKey')
+        with self._lock:
+            records = self._get(self._key_value_stores, store_id, 'Key-value store').records
+            keys = sorted(key for key in records if exclusive_start_key is None or key > exclusive_start_key)
+            items = [{'key': key, 'size': len(records[key][0])} for key in keys[:limit]]
+        return _json_response({'data': {
+            'items': items,
+            'count': len(items),
+            'limit': limit,
+            'exclusiveStartKey': exclusive_start_key,
+            'isTruncated': len(keys) > limit,
+            'nextExclusiveStartKey': items[-1]['key'] if len(keys) > limit else None,
+        }})
+
+    def _get_record(self, *, store_id: str, key: str, **_kwargs: Any) -> _Response:
+        with self._lock:
+            record = self._get(self._key_value_stores, store_id, 'Key-value store').records.get(key)
+        if record is None:
+            raise _not_found('Record')
+        value, content_type = record
+        return _Response(HTTPStatus.OK, value, {'Content-Type': content_type})
+
+    def _set_record(self, *, store_id: str, key: str, headers: Mapping[str, str], body: bytes, **_kwargs: Any) -> _Response:
+        with self._lock:
+            store = self._get(self._key_value_stores, store_id, 'Key-value store')
+            store.records[key] = (body, headers.get('content-type', 'application/octet-stream'))
+            store.modified_at = _now_iso()
+        return _Response(HTTPStatus.CREATED)
+
+    def _delete_record(self, *, store_id: str, key: str, **_kwargs: Any) -> _Response:
+        with self._lock:
+            self._get(self._key_value_stores, store_id, 'Key-value store').records.pop(key, None)
+        return _Response(HTTPStatus.NO_CONTENT)
+
+    # Request queues
+
+    def _list_request_queues(self, *, query: Mapping[str, str], **_kwargs: Any) -> _Response:
+        return self._list(self._request_queues, query)
+
+    def _get_or_create_request_queue(self, *, query: Mapping[str, str], **_kwargs: Any) -> _Response:
+        return self._get_or_create(self._request_queues, _RequestQueue, query)
+
+    def _get_request_queue(self, *, queue_id: str, **_kwargs: Any) -> _Response:
+        with self._lock:
+            return _json_response({'data': self._get(self._request_queues, queue_id, 'Request queue').to_dict()})
+
+    def _update_request_queue(self, *, queue_id: str, body: bytes, **_kwargs: Any) -> _Response:
+        return self._update(self._request_queues, queue_id, 'Request queue', body)
+
+    def _delete_request_queue(self, *, queue_id: str, **_kwargs: Any) -> _Response:
+        return self._delete(self._request_queues, queue_id, 'Request queue')
+
+    def _list_head(self, *, queue_id: str, query: Mapping[str, str], **_kwargs: Any) -> _Response:
+        limit = int(query.get('limit', 100))
+        with self._lock:
+            queue = self._get(self._request_queues, queue_id, 'Request queue')
+            items = [
+                {key: queue.requests[request_id].get(key) for key in ('id', 'retryCount', 'uniqueKey', 'url', 'method')}
+                for request_id in queue.pending_request_ids[:limit]
+            ]
+            return _json_response({'data': {
+                'limit': limit,
+                'queueModifiedAt': queue.modified_at,
+                'hadMultipleClients': False,
+                'items': items,
+            }})
+
+    def _add_request_to_queue(self, queue: _RequestQueue, request: Dict, *, forefront: bool) -> Dict:
+        unique_key = request.get('uniqueKey') or request['url']
+        existing_request_id = queue.request_ids_by_unique_key.get(unique_key)
+        if existing_request_id is not None:
+            return {
+                'requestId': existing_request_id,
+                'wasAlreadyPresent': True,
+                'wasAlreadyHandled': queue.requests[existing_request_id].get('handledAt') is not None,
+            }
+
+        request_id = self._new_id()
+        queue.requests[request_id] = {'method': 'GET', 'retryCount': 0, **request, 'id': request_id, 'uniqueKey': unique_key}
+        queue.request_ids_by_unique_key[unique_key] = request_id
+        self._enqueue(queue, request_id, forefront=forefront, is_handled=request.get('handledAt') is not None)
+        queue.modified_at = _now_iso()
+        return {'requestId': request_id, 'wasAlreadyPresent': False, 'wasAlreadyHandled': False}
+
+    @staticmethod
+    def _enqueue(queue: _RequestQueue, request_id: str, *, forefront: bool, is_handled: bool) -> None:
+        if request_id in queue.pending_request_ids:
+            queue.pending_request_ids.remove(request_id)
+        if not is_handled:
+            if forefront:
+                queue.pending_request_ids.insert(0, request_id)
+            else:
+                queue.pending_request_ids.append(request_id)
+
+    def _add_request(self, *, queue_id: str, query: Mapping[str, str], body: bytes, **_kwargs: Any) -> _Response:
+        request = json.loads(body)
+        if not isinstance(request, dict) or 'url' not in request:
+            raise _ApiError(HTTPStatus.BAD_REQUEST, 'invalid-payload', 'The request must have a url')
+        with self._lock:
+            queue = self._get(self._request_queues, queue_id, 'Request queue')
+            result = self._add_request_to_queue(queue, request, forefront=_is_truthy(query.get('forefront')))
+        return _json_response({'data': result}, HTTPStatus.CREATED)
+
+    def _get_request(self, *, queue_id: str, request_id: str, **_kwargs: Any) -> _Response:
+        with self._lock:
+            request = self._get(self._request_queues, queue_id, 'Request queue').requests.get(request_id)
+            if request is None:
+                raise _not_found('Request')
+            return _json_response({'data': request})
+
+    def _update_request(self, *, queue_id: str, request_id: str, query: Mapping[str, str], body: bytes, **_kwargs: Any) -> _Response:
+        request = json.loads(body)
+        with self._lock:
+            queue = self._get(self._request_queues, queue_id, 'Request queue')
+            if request_id not in queue.requests:
+                raise _not_found('Request')
+            queue.requests[request_id] = {**queue.requests[request_id], **request, 'id': request_id}
+            is_handled = queue.requests[request_id].get('handledAt') is not None
+            self._enqueue(queue, request_id, forefront=_is_truthy(query.get('forefront')), is_handled=is_handled)
+            queue.modified_at = _now_iso()
+            return _json_response({'data': {'requestId': request_id, 'wasAlreadyPresent': True, 'wasAlreadyHandled': is_handled}})
+
+    def _delete_request(self, *, queue_id: str, request_id: str, **_kwargs: Any) -> _Response:
+        with self._lock:
+            queue = self._get(self._request_queues, queue_id, 'Request queue')
+            request = queue.requests.pop(request_id, None)
+            if request is not None:
+                del queue.request_ids_by_unique_key[request['uniqueKey']]
+                self._enqueue(queue, request_id, forefront=False, is_handled=True)
+        return _Response(HTTPStatus.NO_CONTENT)
+
+    # Actors and their runs
+
+    def _list_actors(self, *, query: Mapping[str, str], **_kwargs: Any) -> _Response:
+        return self._list(self._actors, query)
+
+    def _create_actor(self, *, body: bytes, **_kwargs: Any) -> _Response:
+        actor = json.loads(body or b'{}')
+        return _json_response({'data': self.add_actor(actor.get('name') or self._new_id())}, HTTPStatus.CREATED)
+
+    def _get_actor(self, *, actor_id: str, **_kwargs: Any) -> _Response:
+        with self._lock:
+            return _json_response({'data': self._get(self._actors, actor_id, 'Actor').to_dict()})
+
+    def _list_runs(self, *, query: Mapping[str, str], actor_id: Optional[str] = None, **_kwargs: Any) -> _Response:
+        with self._lock:
+            run_ids = self._get(self._actors, actor_id, 'Actor').run_ids if actor_id is not None else list(self._runs)
+            runs = [self._runs[run_id].to_dict() for run_id in run_ids]
+        return _list_page([run for run in runs if query.get('status') in (None, run['status'])], query)
+
+    def _get_last_run(self, actor_id: str, status: Optional[str]) -> _Run:
+        actor = self._get(self._actors, actor_id, 'Actor')
+        for run_id in reversed(actor.run_ids):
+            if status is None or self._runs[run_id].status.value == status:
+                return self._runs[run_id]
+        raise _not_found('Actor run')
+
+    def _start_run(self, *, actor_id: str, query: Mapping[str, str], headers: Mapping[str, str], body: bytes, **_kwargs: Any) -> _Response:
+        with self._lock:
+            actor = self._get(self._actors, actor_id, 'Actor')
+            dataset = self._create_storage(self._datasets, _Dataset, None)
+            dataset.items.extend(actor.output_items)
+            key_value_store = self._create_storage(self._key_value_stores, _KeyValueStore, None)
+            if body:
+                key_value_store.records['INPUT'] = (body, headers.get('content-type', _JSON_CONTENT_TYPE))
+            request_queue = self._create_storage(self._request_queues, _RequestQueue, None)
+
+            run = _Run(self._new_id(), actor.id, actor.run_duration_secs, dataset.id, key_value_store.id, request_queue.id)
+            self._runs[run.id] = run
+            actor.run_ids.append(run.id)
+            self._logs[run.id] = f'{run.started_at} INFO  Run started\n'
+
+        self._wait_for_run(run, query)
+        with self._lock:
+            return _json_response({'data': run.to_dict()}, HTTPStatus.CREATED)
+
+    def _get_run(self, *, run_id: str, query: Mapping[str, str], **_kwargs: Any) -> _Response:
+        with self._lock:
+            run = self._get(self._runs, run_id, 'Actor run')
+        self._wait_for_run(run, query)
+        with self._lock:
+            return _json_response({'data': run.to_dict()})
+
+    @staticmethod
+    def _wait_for_run(run: _Run, query: Mapping[str, str]) -> None:
+        # Like the API, the server waits for the run to finish only for a limited time, the client has to ask again
+        wait_secs = min(float(query.get('waitForFinish', 0)), MAX_WAIT_FOR_FINISH_SECS)
+        give_up_at = time.monotonic() + wait_secs
+        while run.status not in TERMINAL_ACTOR_JOB_STATUSES and time.monotonic() < give_up_at:
+            time.sleep(min(0.05, max(0.0, min(run.finishes_at, give_up_at) - time.monotonic())))
+
+    def _abort_run(self, *, run_id: str, **_kwargs: Any) -> _Response:
+        with self._lock:
+            run = self._get(self._runs, run_id, 'Actor run')
+            if run.status not in TERMINAL_ACTOR_JOB_STATUSES:
+                run.aborted = True
+                run.finished_at = _now_iso()
+            return _json_response({'data': run.to_dict()})
+
+    def _get_log(self, *, run_id: str, **_kwargs: Any) -> _Response:
+        with self._lock:
+            log = self._logs.get(run_id)
+        if log is None:
+            raise _not_found('Log')
+        return _Response(HTTPStatus.OK, log.encode('utf-8'), {'Content-Type': 'text/plain; charset=utf-8'})
+
+
+class _FakeApiHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, fake_api: FakeApifyServer) -> None:
+        super().__init__(('127.0.0.1', 0), _FakeApiRequestHandler)
+        self.fake_api = fake_api
+
+
+class _FakeApiRequestHandler(BaseHTTPRequestHandler):
+    # Keep-alive connections, like the real API has
+    protocol_version = 'HTTP/1.1'
+    # The headers and the body are written separately, so without this, small responses would wait for delayed ACKs
+    disable_nagle_algorithm = True
+    server: _FakeApiHTTPServer
+
+    def _handle(self) -> None:
+        fake_api = self.server.fake_api
+        status_code, headers, body = fake_api.handle_request(self.command, self.path, dict(self.headers.items()), self._read_body())
+
+        if fake_api.latency_millis:
+            time.sleep(fake_api.latency_millis / 1000)
+
+        accepts_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+        if fake_api.compress_responses and accepts_gzip and len(body) > RESPONSE_COMPRESSION_THRESHOLD_BYTES:
+            body = gzip.compress(body, compresslevel=1)
+            headers = {**headers, 'Content-Encoding': 'gzip'}
+
+        self.send_response(status_code)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+
+        if fake_api.bandwidth_bytes_per_sec is None:
+            self.wfile.write(body)
+            return
+        for chunk_start in range(0, len(body), BANDWIDTH_CHUNK_SIZE_BYTES):
+            chunk = body[chunk_start:chunk_start + BANDWIDTH_CHUNK_SIZE_BYTES]
+            time.sleep(len(chunk) / fake_api.bandwidth_bytes_per_sec)
+            self.wfile.write(chunk)
+            self.wfile.flush()
+
+    def _read_body(self) -> bytes:
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            body = bytearray()
+            while True:
+                chunk_size = int(self.rfile.readline().split(b';')[0].strip(), 16)
+                if chunk_size == 0:
+                    # The trailers, if any, end with an empty line
+                    while self.rfile.readline().strip():
+                        pass
+                    return bytes(body)
+                body += self.rfile.read(chunk_size)
+                self.rfile.readline()
+        return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle  # noqa: N815 (the names are required by BaseHTTPRequestHandler)
+
+    def log_message(self, *_args: Any) -> None:
+        pass
@@ -0,0 +1,417 @@
+import importlib.util
+import io
+from abc import ABC, abstractmethod
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, ConnectTimeout, ReadTimeout
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+# HTTP/2 in `httpx` needs the optional `h2` package
+_IS_H2_INSTALLED = importlib.util.find_spec('h2') is not None
+
+# Handles a request in memory, it gets the method, the URL with the query parameters, the headers and the body of the request,
+# and returns the status code, the headers and the body of the response, e.g. `FakeApifyServer.handle_request`
+RequestHandler = Callable[[str, str, Mapping[str, str], bytes], Tuple[int, Mapping[str, str], bytes]]
+
+
+class Transport(ABC):
+    """Sends the HTTP requests of `ApifyClient`, subclass it to send them with another HTTP library.
+
+    The client handles everything else, like the retries, the rate limiting or the parsing of the responses.
+    The responses are returned as `requests` responses, whose body is read only later when they are streamed.
+    The network errors have to be raised as `requests.exceptions.ConnectionError`, or `Timeout` when a timeout ran out,
+    for the client to retry them.
+    """
+
+    @abstractmethod
+    def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        params: Optional[Dict],
+        data: Any,
+        stream: bool,
+        timeout: Tuple[float, float],
+    ) -> requests.models.Response:
+        """Send a request and receive its response.
+
+        Args:
+            method (str): The HTTP method of the request
+            url (str): The URL of the request, without the query parameters
+            headers (dict): The headers of the request
+            params (dict, optional): The query parameters of the request
+            data (bytes or iterable of bytes or file-like object, optional): The body of the request
+            stream (bool): Whether to return the response before its body arrives, to be read by the caller
+            timeout (tuple of float): How long to wait for the connection and for the next part of the response, in seconds
+
+        Returns:
+            requests.Response: The response
+        """
+
+    def close(self) -> None:
+        """Close the connections of the transport."""
+        pass
+
+
+class AsyncTransport(ABC):
+    """Sends the HTTP requests of `ApifyClientAsync`, subclass it to send them with another HTTP library.
+
+    The responses are returned as `httpx` responses, and the network errors have to be raised as `httpx.TransportError`,
+    for the client to retry them.
+    """
+
+    @abstractmethod
+    async def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        params: Optional[Dict],
+        content: Any,
+        stream: bool,
+        timeout: Tuple[float, float],
+    ) -> httpx.Response:
+        """Send a request and receive its response.
+
+        Args:
+            method (str): The HTTP method of the request
+            url (str): The URL of the request, without the query parameters
+            headers (dict): The headers of the request
+            params (dict, optional): The query parameters of the request
+            content (bytes or async iterable of bytes, optional): The body of the request
+            stream (bool): Whether to return the response before its body arrives, to be read by the caller
+            timeout (tuple of float): How long to wait for the connection and for the next part of the response, in seconds
+
+        Returns:
+            httpx.Response: The response
+        """
+
+    async def close(self) -> None:
+        """Close the connections of the transport."""
+        pass
+
+
+class RequestsTransport(Transport):
+    """Sends the requests with the `requests` library, over HTTP/1.1, the default transport of `ApifyClient`."""
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+    ) -> None:
+        """Initialize the RequestsTransport.
+
+        Args:
+            pool_connections (int, optional): For how many different hosts to keep a pool of connections
+            pool_maxsize (int, optional): How many keep-alive connections to keep in the pool for each host,
+                should be at least the number of threads sharing the client
+            pool_block (bool, optional): Whether requests should wait for a free connection when all the connections of the pool
+                are in use, instead of opening extra connections, which are closed after the request
+        """
+        # With no room in the pool, a blocking pool would make the requests wait for a free connection forever
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError(f'The pool_connections and pool_maxsize options have to be at least 1, got {pool_connections} and {pool_maxsize}')
+
+        self.session = requests.Session()
+        # The API doesn't use cookies, rejecting them keeps the session free of state shared between threads
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        # The connection pools of urllib3 are thread-safe, so one session can serve many threads,
+        # as long as the pools are big enough to keep a connection alive for each of them
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        params: Optional[Dict],
+        data: Any,
+        stream: bool,
+        timeout: Tuple[float, float],
+    ) -> requests.models.Response:
+        """Send a request with the session of the transport."""
+        return self.session.request(method, url, headers=headers, params=params, data=data, stream=stream, timeout=timeout)
+
+    def close(self) -> None:
+        """Close the connections of the session."""
+        self.session.close()
+
+
+class HTTPXTransport(Transport):
+    """Sends the requests of `ApifyClient` with the `httpx` library.
+
+    With HTTP/2, the concurrent requests, e.g. from many threads sharing the client, are multiplexed over a few connections,
+    instead of each of them needing its own connection, which saves the handshakes and the memory of the extra connections.
+    """
+
+    def __init__(self, *, max_connections: int = 100, max_keepalive_connections: int = 20, http2: bool = False) -> None:
+        """Initialize the HTTPXTransport.
+
+        Args:
+            max_connections (int, optional): How many connections to open at most
+            max_keepalive_connections (int, optional): How many idle connections to keep open for the next requests
+            http2 (bool, optional): Whether to use HTTP/2 when the server supports it, needs the `h2` package.
+                HTTP/2 is negotiated during the TLS handshake, so the requests to plain HTTP URLs keep using HTTP/1.1
+        """
+        if http2:
+            _check_http2_support()
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections)
+        self.client = httpx.Client(follow_redirects=True, timeout=None, limits=limits, http2=http2)
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        params: Optional[Dict],
+        data: Any,
+        stream: bool,
+        timeout: Tuple[float, float],
+    ) -> requests.models.Response:
+        """Send a request with the client of the transport, and convert its response to a `requests` response."""
+        connect_timeout, read_timeout = timeout
+        request = self.client.build_request(
+            method,
+            url,
+            headers=headers,
+            params=params,
+            content=data.read() if isinstance(data, io.IOBase) else data,
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+        )
+        try:
+            response = self.client.send(request, stream=stream)
+        except httpx.ConnectTimeout as err:
+            raise ConnectTimeout(err) from err
+        except httpx.TimeoutException as err:
+            raise ReadTimeout(err) from err
+        except httpx.ConnectError as err:
+            # Wrapped like by `requests`, so that the retry policy knows that the request wasn't sent and can be retried
+            reason = NewConnectionError(None, f'Failed to establish a new connection: {err}')  # type: ignore[arg-type]
+            raise ConnectionError(MaxRetryError(None, url, reason)) from err  # type: ignore[arg-type]
+        except httpx.TransportError as err:
+            raise ConnectionError(err) from err
+
+        return _build_response(
+            method,
+            str(response.url),
+            response.status_code,
+            response.headers,
+            _iter_httpx_response_body(response),
+            close=response.close,
+            num_bytes_downloaded=lambda: response.num_bytes_downloaded,
+            stream=stream,
+        )
+
+    def close(self) -> None:
+        """Close the connections of the client."""
+        self.client.close()
+
+
+class HTTPXAsyncTransport(AsyncTransport):
+    """Sends the requests with the `httpx` library, the default transport of `ApifyClientAsync`."""
+
+    def __init__(self, *, http2: bool = False) -> None:
+        """Initialize the HTTPXAsyncTransport.
+
+        Args:
+            http2 (bool, optional): Whether to use HTTP/2 when the server supports it, to multiplex the concurrent requests
+                over a few connections, needs the `h2` package.
+                HTTP/2 is negotiated during the TLS handshake, so the requests to plain HTTP URLs keep using HTTP/1.1
+        """
+        if http2:
+            _check_http2_support()
+        # A single `httpx.AsyncClient` keeps one connection pool, which is shared by all the resource clients
+        # created from the same `ApifyClientAsync`, so all the concurrent calls reuse the pooled connections
+        self.client = httpx.AsyncClient(follow_redirects=True, timeout=None, http2=http2)
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        params: Optional[Dict],
+        content: Any,
+        stream: bool,
+        timeout: Tuple[float, float],
+    ) -> httpx.Response:
+        """Send a request with the client of the transport."""
+        connect_timeout, read_timeout = timeout
+        request = self.client.build_request(
+            method=method,
+            url=url,
+            headers=headers,
+            params=params,
+            content=content,
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+        )
+        return await self.client.send(request, stream=stream)
+
+    async def close(self) -> None:
+        """Close the connections of the client."""
+        await self.client.aclose()
+
+
+class InMemoryTransport(Transport):
+    """Passes the requests of `ApifyClient` to a function instead of sending them over the network, e.g. to a `FakeApifyServer`.
+
+    It's useful in the tests, and in the benchmarks which measure the overhead of the client without the network.
+    """
+
+    def __init__(self, handler: RequestHandler) -> None:
+        """Initialize the InMemoryTransport.
+
+        Args:
+            handler (Callable): Gets the method, the URL with the query parameters, the headers and the body of each request,
+                and returns the status code, the headers and the body of its response
+        """
+        self.handler = handler
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        params: Optional[Dict],
+        data: Any,
+        stream: bool,
+        timeout: Tuple[float, float],
+    ) -> requests.models.Response:
+        """Pass a request to the handler of the transport."""
+        # Encodes the query parameters the same way as when the request is sent with `requests`
+        full_url = requests.Request(method, url, params=params).prepare().url or url
+        if isinstance(data, io.IOBase):
+            body = data.read()
+        elif data is None or isinstance(data, (bytes, bytearray)):
+            body = bytes(data or b'')
+        else:
+            body = b''.join(data)
+
+        status_code, response_headers, response_body = self.handler(method, full_url, headers, body)
+        return _build_response(method, full_url, status_code, response_headers, iter([response_body]), stream=stream)
+
+
+class InMemoryAsyncTransport(AsyncTransport):
+    """Passes the requests of `ApifyClientAsync` to a function instead of sending them over the network, e.g. to a `FakeApifyServer`."""
+
+    def __init__(self, handler: RequestHandler) -> None:
+        """Initialize the InMemoryAsyncTransport.
+
+        Args:
+            handler (Callable): Gets the method, the URL with the query parameters, the headers and the body of each request,
+                and returns the status code, the headers and the body of its response
+        """
+        self.handler = handler
+
+    async def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str],
+        params: Optional[Dict],
+        content: Any,
+        stream: bool,
+        timeout: Tuple[float, float],
+    ) -> httpx.Response:
+        """Pass a request to the handler of the transport."""
+        if hasattr(content, '__aiter__'):
+            body = b''.join([chunk async for chunk in content])
+        else:
+            body = bytes(content or b'')
+        request = httpx.Request(method, url, headers=headers, params=params, content=body)
+
+        status_code, response_headers, response_body = self.handler(method, str(request.url), headers, body)
+        return httpx.Response(status_code, headers=dict(response_headers), content=response_body, request=request)
+
+
+class _ResponseBody(io.RawIOBase):
+    # The body of a response as a file-like object, in place of the urllib3 response which `requests` responses have in `raw`
+
+    def __init__(self, chunks: Iterator[bytes], close: Optional[Callable[[], None]], num_bytes_downloaded: Optional[Callable[[], int]]) -> None:
+        super().__init__()
+        self._chunks = chunks
+        self._close = close
+        self._num_bytes_downloaded = num_bytes_downloaded
+        self._pending = b''
+        self._position = 0
+        # The chunks are already decompressed, it's here only for the code which sets it on the urllib3 responses
+        self.decode_content = True
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = chunk
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        self._position += size
+        return size
+
+    def tell(self) -> int:
+        # Like urllib3, counts the bytes received, before the decompression, when the transport knows them
+        return self._num_bytes_downloaded() if self._num_bytes_downloaded is not None else self._position
+
+    def close(self) -> None:
+        if not self.closed and self._close is not None:
+            self._close()
+        super().close()
+
+
+def _check_http2_support() -> None:
+    if not _IS_H2_INSTALLED:
+        raise ImportError('The h2 package, needed for HTTP/2, is not installed, install it with "pip install apify-client[http2]"')
+
+
+def _iter_httpx_response_body(response: httpx.Response) -> Iterator[bytes]:
+    yield from response.iter_bytes()
+
+
+def _build_response(
+    method: str,
+    url: str,
+    status_code: int,
+    headers: Mapping[str, str],
+    chunks: Iterable[bytes],
+    *,
+    close: Optional[Callable[[], None]] = None,
+    num_bytes_downloaded: Optional[Callable[[], int]] = None,
+    stream: bool,
+) -> requests.models.Response:
+    response = requests.models.Response()
+    response.status_code = status_code
+    response.url = url
+    response.request = requests.Request(method, url).prepare()
+    # The body is already decompressed by the transport
+    response.headers = CaseInsensitiveDict({key: value for key, value in headers.items() if key.lower() != 'content-encoding'})
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.raw = io.BufferedReader(_ResponseBody(iter(chunks), close, num_bytes_downloaded))
+    if not stream:
+        # Reads the whole body right away, like `requests` does
+        response.content
+    return response
@@ -0,0 +1,107 @@
+import functools
+import json
+import os
+import sys
+import tempfile
+import unittest
+from typing import Dict, List
+from unittest import mock
+
+from apify_client._version import __version__
+from apify_client.benchmarks import __main__ as benchmarks_main
+from apify_client.benchmarks import hot_paths
+
+SCENARIO_NAMES = [
+    'iterate_items',
+    'download_items',
+    'stream_items',
+    'push_items',
+    'get_record',
+    'set_record',
+    'add_request',
+    'list_head',
+    'wait_for_finish',
+]
+
+RESULT_KEYS = {
+    'name',
+    'iterations',
+    'units',
+    'units_per_operation',
+    'requests_per_operation',
+    'operations_per_sec',
+    'units_per_sec',
+    'latency_millis',
+    'cpu_millis_per_operation',
+    'peak_memory_bytes',
+}
+
+
+class HotPathsBenchmarkTest(unittest.TestCase):
+    def assert_results_valid(self, results: List[Dict], iterations: int) -> None:
+        for result in results:
+            with self.subTest(scenario=result['name']):
+                self.assertEqual(set(result), RESULT_KEYS)
+                self.assertEqual(set(result['latency_millis']), {'mean', 'p50', 'p95', 'p99'})
+                self.assertEqual(result['iterations'], iterations)
+                self.assertIsInstance(result['units'], str)
+                self.assertGreater(result['units_per_operation'], 0)
+                self.assertGreater(result['operations_per_sec'], 0)
+                units_per_sec = result['operations_per_sec'] * result['units_per_operation']
+                self.assertAlmostEqual(result['units_per_sec'], units_per_sec, delta=units_per_sec * 0.01)
+                latency_millis = result['latency_millis']
+                self.assertTrue(0 < latency_millis['p50'] <= latency_millis['p95'] <= latency_millis['p99'])
+                self.assertGreater(latency_millis['mean'], 0)
+                self.assertGreaterEqual(result['cpu_millis_per_operation'], 0)
+                self.assertGreater(result['peak_memory_bytes'], 0)
+
+    def test_run_benchmark(self) -> None:
+        results = hot_paths.run_benchmark(items_count=100, iterations=3, latency_millis=0, run_duration_millis=10)
+
+        self.assertEqual([result['name'] for result in results], SCENARIO_NAMES)
+        self.assert_results_valid(results, 3)
+
+        results_by_name = {result['name']: result for result in results}
+        self.assertEqual((results_by_name['iterate_items']['units'], results_by_name['iterate_items']['units_per_operation']), ('items', 100))
+        self.assertEqual(results_by_name['list_head']['units_per_operation'], 100)
+        # each of the operations has reached the fake server, waiting for a run takes starting it and waiting for it
+        for name in SCENARIO_NAMES[:-1]:
+            self.assertEqual(results_by_name[name]['requests_per_operation'], 1, name)
+        self.assertGreaterEqual(results_by_name['wait_for_finish']['requests_per_operation'], 2)
+
+        results = hot_paths.run_benchmark(items_count=10, iterations=1, latency_millis=0, scenarios=['get_record'])
+        self.assertEqual([result['name'] for result in results], ['get_record'])
+
+    def test_transports(self) -> None:
+        # iterating over 2500 items takes three pages of a thousand items
+        for transport in ['httpx', 'in-memory']:
+            with self.subTest(transport=transport):
+                results = hot_paths.run_benchmark(
+                    items_count=2500,
+                    iterations=2,
+                    latency_millis=0,
+                    transport=transport,
+                    scenarios=['iterate_items', 'set_record'],
+                )
+                self.assertEqual([result['name'] for result in results], ['iterate_items', 'set_record'])
+                self.assert_results_valid(results, 2)
+                self.assertEqual([result['requests_per_operation'] for result in results], [3, 1])
+
+    def test_main(self) -> None:
+        benchmarks = {'hot_paths': functools.partial(hot_paths.run_benchmark, items_count=10, iterations=2, latency_millis=0, run_duration_millis=10)}
+
+        with tempfile.TemporaryDirectory() as directory:
+            output_path = os.path.join(directory, 'results.json')
+            argv = ['apify_client.benchmarks', '--output', output_path, '--benchmarks', 'hot_paths']
+            with mock.patch.dict(benchmarks_main.BENCHMARKS, benchmarks), mock.patch.object(sys, 'argv', argv):
+                benchmarks_main.main()
+
+            with open(output_path, encoding='utf-8') as output_file:
+                results = json.load(output_file)
+
+        self.assertEqual(set(results), {'client_version', 'python_version', 'platform', 'started_at', 'benchmarks'})
+        self.assertEqual(results['client_version'], __version__)
+        self.assertEqual(results['platform'], sys.platform)
+        self.assertEqual(list(results['benchmarks']), ['hot_paths'])
+        self.assertEqual([result['name'] for result in results['benchmarks']['hot_paths']], SCENARIO_NAMES)
+        self.assert_results_valid(results['benchmarks']['hot_paths'], 2)
@@ -0,0 +1,170 @@
+import asyncio
+import unittest
+from typing import Any, Dict, List, Optional, Tuple
+
+from apify_client import ApifyClient, ApifyClientAsync
+from apify_client.cache import ResponseCache
+
+import httpx
+import requests
+
+ACTOR_URL = 'https://api.apify.com/v2/acts/some-actor'
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_response(status_code: int = 200, body: bytes = b'{"data": {"id": "some-actor"}}', headers: Optional[Dict] = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers.update({'Content-Type': 'application/json', **(headers or {})})
+    response.request = requests.Request('GET', ACTOR_URL).prepare()
+    return response
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def test_ttl(self) -> None:
+        clock = FakeClock()
+        response_cache = ResponseCache(ttl_secs=60, endpoint_class_ttl_secs={'acts': 300}, clock=clock)
+        actor_response = make_response()
+        dataset_response = make_response()
+        response_cache.put('actor', url=ACTOR_URL, endpoint_class='acts', response=actor_response)
+        response_cache.put('dataset', url='https://api.apify.com/v2/datasets/some-dataset', endpoint_class='datasets', response=dataset_response)
+        response_cache.put('build', url='https://api.apify.com/v2/actor-builds/some-build', endpoint_class='actor-builds', response=make_response())
+
+        clock.now += 30
+        self.assertIs(response_cache.get('actor'), actor_response)
+        self.assertIs(response_cache.get('dataset'), dataset_response)
+        # the builds are cached only briefly by default
+        self.assertIsNone(response_cache.get('build'))
+
+        clock.now += 60
+        self.assertIs(response_cache.get('actor'), actor_response)
+        self.assertIsNone(response_cache.get('dataset'))
+        self.assertIs(response_cache.get('dataset', include_expired=True), dataset_response)
+
+    def test_lru(self) -> None:
+        response_cache = ResponseCache(max_entries=2)
+        for key in ['a', 'b']:
+            response_cache.put(key, url=f'{ACTOR_URL}-{key}', endpoint_class='acts', response=make_response())
+        response_cache.get('a')
+        response_cache.put('c', url=f'{ACTOR_URL}-c', endpoint_class='acts', response=make_response())
+
+        self.assertEqual(len(response_cache), 2)
+        self.assertIsNotNone(response_cache.get('a'))
+        self.assertIsNone(response_cache.get('b'))
+        self.assertIsNotNone(response_cache.get('c'))
+
+    def test_invalidate(self) -> None:
+        response_cache = ResponseCache()
+        urls = [
+            'https://api.apify.com/v2/key-value-stores/some-store',
+            'https://api.apify.com/v2/key-value-stores/some-store/records/a',
+            'https://api.apify.com/v2/key-value-stores/some-store/records/ab',
+            'https://api.apify.com/v2/key-value-stores/some-store-2',
+        ]
+        for url in urls:
+            response_cache.put(url, url=url, endpoint_class='key-value-stores', response=make_response())
+
+        # the record and the store containing it are dropped, the other records and stores are kept
+        response_cache.invalidate('https://api.apify.com/v2/key-value-stores/some-store/records/a')
+        self.assertEqual([url for url in urls if response_cache.get(url) is not None], urls[2:])
+
+        response_cache.invalidate('https://api.apify.com/v2/key-value-stores/some-store/')
+        self.assertEqual([url for url in urls if response_cache.get(url) is not None], urls[3:])
+
+    def test_client(self) -> None:
+        clock = FakeClock()
+        client = ApifyClient(response_cache=ResponseCache(ttl_secs=60, clock=clock))
+        sent_requests: List[Tuple[str, str, Dict]] = []
+        responses: List[requests.Response] = []
+
+        def request(method: str, url: str, *, headers: Dict, **_kwargs: Any) -> requests.Response:
+            sent_requests.append((method, url, headers))
+            return responses.pop(0)
+
+        client.http_client.requests_session.request = request  # type: ignore
+
+        responses.append(make_response(headers={'ETag': '"1"'}))
+        self.assertEqual(client.actor('some-actor').get(), {'id': 'some-actor'})
+        # the cached response is used, and changing it doesn't change the cache
+        actor = client.actor('some-actor').get()
+        self.assertEqual(actor, {'id': 'some-actor'})
+        actor['id'] = 'changed'  # type: ignore
+        self.assertEqual(client.actor('some-actor').get(), {'id': 'some-actor'})
+        self.assertEqual(len(sent_requests), 1)
+
+        # the runs are not cached
+        responses.append(make_response(body=b'{"data": {"id": "some-run"}}'))
+        responses.append(make_response(body=b'{"data": {"id": "some-run"}}'))
+        client.run('some-run').get()
+        client.run('some-run').get()
+        self.assertEqual(len(sent_requests), 3)
+
+        # an expired response is used again when the API says it didn't change
+        clock.now += 61
+        responses.append(make_response(status_code=304, body=b'', headers={'ETag': '"1"'}))
+        self.assertEqual(client.actor('some-actor').get(), {'id': 'some-actor'})
+        self.assertEqual(sent_requests[-1][2]['If-None-Match'], '"1"')
+        self.assertEqual(client.actor('some-actor').get(), {'id': 'some-actor'})
+        self.assertEqual(len(sent_requests), 4)
+
+        # updating the actor drops its cached response
+        responses.append(make_response(body=b'{"data": {"id": "some-actor", "title": "New"}}'))
+        responses.append(make_response(body=b'{"data": {"id": "some-actor", "title": "New"}}'))
+        client.actor('some-actor').update(title='New')
+        self.assertEqual(client.actor('some-actor').get(), {'id': 'some-actor', 'title': 'New'})
+        self.assertEqual(len(sent_requests), 6)
+        self.assertNotIn('If-None-Match', sent_requests[-1][2])
+
+    def test_shared_cache(self) -> None:
+        response_cache = ResponseCache(ttl_secs=60)
+        sent_requests: List[str] = []
+
+        def create_client(token: str) -> ApifyClient:
+            client = ApifyClient(token, response_cache=response_cache)
+
+            def request(method: str, url: str, *, headers: Dict, **_kwargs: Any) -> requests.Response:
+                sent_requests.append(headers['Authorization'])
+                return make_response(body=f'{{"data": {{"id": "some-actor", "owner": "{token}"}}}}'.encode('utf-8'))
+
+            client.http_client.requests_session.request = request  # type: ignore
+            return client
+
+        # the clients with different tokens don't get each other's responses, the clients with the same token share them
+        self.assertEqual(create_client('token-a').actor('some-actor').get(), {'id': 'some-actor', 'owner': 'token-a'})
+        self.assertEqual(create_client('token-b').actor('some-actor').get(), {'id': 'some-actor', 'owner': 'token-b'})
+        self.assertEqual(create_client('token-a').actor('some-actor').get(), {'id': 'some-actor', 'owner': 'token-a'})
+        self.assertEqual(sent_requests, ['Bearer token-a', 'Bearer token-b'])
+
+    def test_async_client(self) -> None:
+        requested_urls: List[str] = []
+
+        async def handle_request(request: httpx.Request) -> httpx.Response:
+            requested_urls.append(f'{request.method} {request.url.path}')
+            if request.method == 'GET':
+                return httpx.Response(200, content=b'{"a": 1}', headers={'Content-Type': 'application/json'})
+            return httpx.Response(201)
+
+        async def main() -> None:
+            client = ApifyClientAsync(response_cache=ResponseCache())
+            client.http_client.httpx_async_client = httpx.AsyncClient(transport=httpx.MockTransport(handle_request))
+            store = client.key_value_store('some-store')
+
+            self.assertEqual((await store.get_record('a') or {})['value'], {'a': 1})
+            self.assertEqual((await store.get_record('a') or {})['value'], {'a': 1})
+            await store.set_record('a', {'a': 2})
+            await store.get_record('a')
+
+        asyncio.run(main())
+        self.assertEqual(requested_urls, [
+            'GET /v2/key-value-stores/some-store/records/a',
+            'PUT /v2/key-value-stores/some-store/records/a',
+            'GET /v2/key-value-stores/some-store/records/a',
+        ])
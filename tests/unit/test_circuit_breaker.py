@@ -0,0 +1,105 @@
+import unittest
+from typing import Any
+
+from apify_client import ApifyClient
+from apify_client._errors import CircuitOpenError
+from apify_client.circuit_breaker import CircuitBreaker, CircuitState
+
+import requests
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def test_opens_on_failure_ratio(self) -> None:
+        clock = FakeClock()
+        circuit_breaker = CircuitBreaker(failure_ratio_threshold=0.5, min_requests=10, window_secs=10, clock=clock)
+
+        # failures at low traffic don't open the breaker
+        for _ in range(4):
+            circuit_breaker.before_request()
+            circuit_breaker.on_failure()
+        self.assertEqual(circuit_breaker.state, CircuitState.CLOSED)
+
+        for _ in range(5):
+            circuit_breaker.before_request()
+            circuit_breaker.on_success()
+        circuit_breaker.before_request()
+        circuit_breaker.on_failure()
+        self.assertEqual(circuit_breaker.state, CircuitState.OPEN)
+
+        with self.assertRaises(CircuitOpenError) as context_manager:
+            circuit_breaker.before_request()
+        self.assertAlmostEqual(context_manager.exception.retry_after_secs, 15)
+
+    def test_old_outcomes_leave_the_window(self) -> None:
+        clock = FakeClock()
+        circuit_breaker = CircuitBreaker(min_requests=4, window_secs=10, clock=clock)
+        for _ in range(3):
+            circuit_breaker.on_failure()
+        clock.now += 11
+        circuit_breaker.on_success()
+        circuit_breaker.on_failure()
+        circuit_breaker.on_success()
+        circuit_breaker.on_success()
+        self.assertEqual(circuit_breaker.state, CircuitState.CLOSED)
+
+    def test_half_open_probes(self) -> None:
+        clock = FakeClock()
+        circuit_breaker = CircuitBreaker(min_requests=1, open_secs=10, half_open_probes=2, clock=clock)
+        circuit_breaker.on_failure()
+        self.assertEqual(circuit_breaker.state, CircuitState.OPEN)
+
+        # only the probes are let through, and a failed probe opens the breaker again
+        clock.now += 10
+        circuit_breaker.before_request()
+        circuit_breaker.before_request()
+        self.assertRaises(CircuitOpenError, circuit_breaker.before_request)
+        circuit_breaker.on_success()
+        circuit_breaker.on_failure()
+        self.assertEqual(circuit_breaker.state, CircuitState.OPEN)
+
+        clock.now += 10
+        circuit_breaker.before_request()
+        circuit_breaker.before_request()
+        circuit_breaker.on_success()
+        self.assertEqual(circuit_breaker.state, CircuitState.HALF_OPEN)
+        circuit_breaker.on_success()
+        self.assertEqual(circuit_breaker.state, CircuitState.CLOSED)
+        circuit_breaker.before_request()
+
+        # probes which never finish don't keep the breaker half-open forever
+        circuit_breaker.on_failure()
+        clock.now += 10
+        circuit_breaker.before_request()
+        circuit_breaker.before_request()
+        self.assertRaises(CircuitOpenError, circuit_breaker.before_request)
+        clock.now += 10
+        circuit_breaker.before_request()
+
+    def test_client_fails_fast(self) -> None:
+        circuit_breaker = CircuitBreaker(min_requests=3)
+        client = ApifyClient(min_delay_between_retries_millis=1, circuit_breaker=circuit_breaker)
+        requests_count = 0
+
+        def request(*_args: Any, **_kwargs: Any) -> requests.Response:
+            nonlocal requests_count
+            requests_count += 1
+            response = requests.Response()
+            response.status_code = 503
+            response._content = b'{"error": {"message": "Service unavailable", "type": "service-unavailable"}}'
+            response.request = requests.Request('GET', 'https://api.apify.com/v2').prepare()
+            return response
+
+        client.http_client.requests_session.request = request  # type: ignore
+
+        self.assertRaises(CircuitOpenError, client.dataset('some-dataset').get)
+        self.assertEqual(requests_count, 3)
+        self.assertRaises(CircuitOpenError, client.dataset('some-dataset').get)
+        self.assertEqual(requests_count, 3)
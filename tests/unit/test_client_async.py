@@ -0,0 +1,109 @@
+import asyncio
+import unittest
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+
+from apify_client import ApifyClientAsync
+from apify_client._errors import ApifyApiError
+from apify_client.testing import FakeApifyServer
+from apify_client.transport import InMemoryAsyncTransport
+
+
+class ApifyClientAsyncTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = FakeApifyServer(seed=1)
+
+    def _run(self, test: Callable[[ApifyClientAsync], Awaitable[Any]]) -> None:
+        async def main() -> None:
+            async with ApifyClientAsync('some-token', transport=InMemoryAsyncTransport(self.server.handle_request)) as client:
+                await test(client)
+
+        asyncio.run(main())
+
+    def test_datasets(self) -> None:
+        dataset = self.server.add_dataset([{'index': i} for i in range(2500)], name='my-dataset')
+
+        async def test(client: ApifyClientAsync) -> None:
+            datasets_page = await client.datasets().list()
+            self.assertEqual([item['name'] for item in datasets_page.items], ['my-dataset'])
+
+            dataset_client = client.dataset(dataset['id'])
+            dataset_info = await dataset_client.get()
+            self.assertEqual((dataset_info or {})['itemCount'], 2500)
+            self.assertIsInstance((dataset_info or {})['createdAt'], datetime)
+
+            updated_dataset = await dataset_client.update(name='renamed-dataset')
+            self.assertEqual(updated_dataset['name'], 'renamed-dataset')
+            self.assertEqual((await client.dataset('someone~renamed-dataset').get() or {})['id'], dataset['id'])
+
+            self.assertEqual(len([item async for item in dataset_client.iterate_items()]), 2500)
+            page = await dataset_client.list_items(offset=10, limit=5, desc=True)
+            self.assertEqual((page.total, page.offset, page.count), (2500, 10, 5))
+            self.assertEqual(page.items[0], {'index': 2489})
+
+            await dataset_client.delete()
+            self.assertIsNone(await dataset_client.get())
+
+        self._run(test)
+
+    def test_key_value_stores(self) -> None:
+        async def test(client: ApifyClientAsync) -> None:
+            store = await client.key_value_stores().get_or_create(name='my-store')
+            store_client = client.key_value_store(store['id'])
+            await store_client.set_record('a', {'value': 1})
+            await store_client.set_record('b', 'some text')
+
+            self.assertEqual((await store_client.get_record('a') or {})['value'], {'value': 1})
+            self.assertEqual((await store_client.get_record('b') or {})['value'], 'some text')
+            self.assertIsNone(await store_client.get_record('c'))
+            self.assertEqual([item['key'] for item in (await store_client.list_keys())['items']], ['a', 'b'])
+
+            await store_client.update(name='renamed-store')
+            self.assertEqual((await store_client.get() or {})['name'], 'renamed-store')
+
+        self._run(test)
+
+    def test_request_queues(self) -> None:
+        async def test(client: ApifyClientAsync) -> None:
+            queue = await client.request_queues().get_or_create(name='my-queue')
+            queue_client = client.request_queue(queue['id'])
+            added = await queue_client.add_request({'url': 'https://example.com', 'uniqueKey': 'a'})
+            self.assertFalse(added['wasAlreadyPresent'])
+            self.assertTrue((await queue_client.add_request({'url': 'https://example.com', 'uniqueKey': 'a'}))['wasAlreadyPresent'])
+
+            head = await queue_client.list_head()
+            self.assertEqual([item['uniqueKey'] for item in head['items']], ['a'])
+
+            request = await queue_client.get_request(added['requestId'])
+            await queue_client.update_request({**(request or {}), 'handledAt': '2021-06-10T07:16:29.174Z'})
+            self.assertEqual((await queue_client.list_head())['items'], [])
+
+        self._run(test)
+
+    def test_actor_runs(self) -> None:
+        actor = self.server.add_actor('my-actor', run_duration_secs=0.2, output_items=[{'result': 1}])
+
+        async def test(client: ApifyClientAsync) -> None:
+            actor_client = client.actor(actor['id'])
+            run = await actor_client.start()
+            self.assertEqual(run['status'], 'RUNNING')
+
+            # waits until the run finishes, polling the API
+            finished_run = await client.run(run['id']).wait_for_finish()
+            self.assertEqual((finished_run or {})['status'], 'SUCCEEDED')
+            self.assertIsInstance((finished_run or {})['finishedAt'], datetime)
+            self.assertEqual((await client.run(run['id']).dataset().list_items()).items, [{'result': 1}])
+
+            # the wait can run out before the run finishes
+            other_run = await actor_client.start()
+            unfinished_run = await client.run(other_run['id']).wait_for_finish(wait_secs=0)
+            self.assertEqual((unfinished_run or {})['status'], 'RUNNING')
+
+            runs_page = await actor_client.runs().list()
+            self.assertEqual([item['id'] for item in runs_page.items], [run['id'], other_run['id']])
+            self.assertEqual(((await actor_client.call()) or {})['status'], 'SUCCEEDED')
+
+            with self.assertRaises(ApifyApiError):
+                await client.run('missing-run').abort()
+
+        self._run(test)
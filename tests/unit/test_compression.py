@@ -0,0 +1,72 @@
+import gzip
+import io
+import unittest
+from typing import List
+
+from apify_client._http_client import _HTTPClient
+from apify_client._utils import _GzippedBody
+from apify_client.compression import CompressionPolicy, CompressionStats
+
+
+class CompressionPolicyTest(unittest.TestCase):
+    def test_should_compress(self) -> None:
+        policy = CompressionPolicy(min_size_bytes=100)
+        self.assertTrue(policy.should_compress(content_type='application/json; charset=utf-8', size_bytes=100))
+        self.assertTrue(policy.should_compress(content_type='text/plain', size_bytes=None))
+        self.assertTrue(policy.should_compress())
+        self.assertFalse(policy.should_compress(content_type='application/json', size_bytes=99))
+        self.assertFalse(policy.should_compress(content_type='image/png', size_bytes=10000))
+        self.assertFalse(policy.should_compress(content_type='Application/ZIP', size_bytes=10000))
+
+        policy = CompressionPolicy(skip_content_types=['text/'])
+        self.assertTrue(policy.should_compress(content_type='image/png', size_bytes=10000))
+        self.assertFalse(policy.should_compress(content_type='text/html', size_bytes=10000))
+
+        with self.assertRaises(ValueError):
+            CompressionPolicy(level=0)
+
+    def test_compress(self) -> None:
+        stats: List[CompressionStats] = []
+        policy = CompressionPolicy(level=1, on_request_compressed=stats.append)
+        data = b'abcdefgh' * 1000
+
+        self.assertEqual(gzip.decompress(policy.compress(data)), data)
+        self.assertEqual(gzip.decompress(b''.join(policy.compress_stream([data[:10], data[10:], b'']))), data)
+
+        self.assertEqual(len(stats), 2)
+        for stat in stats:
+            self.assertEqual(stat.original_size_bytes, 8000)
+            self.assertLess(stat.compressed_size_bytes, 100)
+            self.assertEqual(stat.saved_bytes, stat.original_size_bytes - stat.compressed_size_bytes)
+            self.assertGreaterEqual(stat.compression_time_secs, 0)
+
+    def test_http_client_request_body_compression(self) -> None:
+        http_client = _HTTPClient(compression_policy=CompressionPolicy(min_size_bytes=1000))
+        large_data = b'x' * 1000
+
+        # small bodies are sent as they are
+        headers, data, _ = http_client._prepare_request_call({}, {'small': 'json'})
+        self.assertEqual(data, b'{"small":"json"}')
+        self.assertNotIn('Content-Encoding', headers)
+
+        # large bodies are compressed
+        headers, data, _ = http_client._prepare_request_call({'content-type': 'text/plain'}, None, large_data.decode())
+        self.assertEqual(gzip.decompress(data), large_data)
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+
+        # unless they are already compressed
+        headers, data, _ = http_client._prepare_request_call({'Content-Type': 'image/png'}, None, large_data)
+        self.assertEqual(data, large_data)
+        self.assertNotIn('Content-Encoding', headers)
+
+        # files are compressed while being sent
+        headers, data, _ = http_client._prepare_request_call({'content-type': 'text/csv'}, None, io.BytesIO(large_data))
+        self.assertIsInstance(data, _GzippedBody)
+        self.assertEqual(gzip.decompress(b''.join(data)), large_data)
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+
+        # small files are sent as they are
+        file = io.BytesIO(b'small')
+        headers, data, _ = http_client._prepare_request_call({'content-type': 'text/csv'}, None, file)
+        self.assertIs(data, file)
+        self.assertNotIn('Content-Encoding', headers)
@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from apify_client import ApifyClient
+from apify_client.concurrency import ConcurrencyGovernor
+
+import requests
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ConcurrencyGovernorTest(unittest.TestCase):
+    def test_additive_increase(self) -> None:
+        governor = ConcurrencyGovernor(initial_concurrency=4, max_concurrency=6)
+        # about a full limit's worth of successful calls grows the limit by one
+        for _ in range(3):
+            governor.on_success('GET datasets', 0.1)
+        self.assertEqual(governor.concurrency, 4)
+        for _ in range(2):
+            governor.on_success('GET datasets', 0.1)
+        self.assertEqual(governor.concurrency, 5)
+
+        for _ in range(100):
+            governor.on_success('GET datasets', 0.1)
+        self.assertEqual(governor.concurrency, 6)
+
+    def test_multiplicative_decrease(self) -> None:
+        clock = FakeClock()
+        governor = ConcurrencyGovernor(initial_concurrency=16, max_concurrency=16, min_concurrency=2, clock=clock)
+
+        governor.on_overloaded()
+        self.assertEqual(governor.concurrency, 8)
+        # a burst of errors cuts the limit only once
+        governor.on_overloaded()
+        self.assertEqual(governor.concurrency, 8)
+
+        for _ in range(3):
+            clock.now += 1
+            governor.on_overloaded()
+        self.assertEqual(governor.concurrency, 2)
+
+    def test_latency_rise_cuts_concurrency(self) -> None:
+        clock = FakeClock()
+        governor = ConcurrencyGovernor(initial_concurrency=8, max_concurrency=8, clock=clock)
+        for _ in range(20):
+            governor.on_success('POST datasets', 0.1)
+        self.assertEqual(governor.concurrency, 8)
+
+        # other endpoints are compared to their own latency
+        for _ in range(20):
+            governor.on_success('GET actors', 1)
+        self.assertEqual(governor.concurrency, 8)
+
+        for _ in range(5):
+            governor.on_success('POST datasets', 1)
+        self.assertEqual(governor.concurrency, 4)
+
+    def test_slot(self) -> None:
+        governor = ConcurrencyGovernor(initial_concurrency=3)
+        lock = threading.Lock()
+        in_flight_counts = []
+
+        def call() -> None:
+            with governor.slot():
+                with lock:
+                    in_flight_counts.append(governor.in_flight)
+                time.sleep(0.01)
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            for future in [executor.submit(call) for _ in range(30)]:
+                future.result()
+
+        self.assertEqual(max(in_flight_counts), 3)
+        self.assertEqual(governor.in_flight, 0)
+
+    def test_slot_async(self) -> None:
+        governor = ConcurrencyGovernor(initial_concurrency=3)
+        in_flight_counts = []
+
+        async def call() -> None:
+            async with governor.slot_async():
+                in_flight_counts.append(governor.in_flight)
+                await asyncio.sleep(0.01)
+
+        async def main() -> None:
+            await asyncio.gather(*[call() for _ in range(30)])
+
+            # cancelled waiters give their slots back
+            tasks = [asyncio.create_task(call()) for _ in range(10)]
+            await asyncio.sleep(0)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        asyncio.run(main())
+        self.assertEqual(max(in_flight_counts), 3)
+        self.assertEqual(governor.in_flight, 0)
+
+    def test_client_feeds_governor(self) -> None:
+        client = ApifyClient(min_delay_between_retries_millis=1)
+        governor = client.http_client.concurrency_governor
+        status_codes = [503, 200]
+
+        def request(*_args: Any, **_kwargs: Any) -> requests.Response:
+            response = requests.Response()
+            response.status_code = status_codes.pop(0)
+            response._content = b'{"data": {}}'
+            response.headers['Content-Type'] = 'application/json'
+            return response
+
+        client.http_client.requests_session.request = request  # type: ignore
+
+        initial_concurrency = governor.concurrency
+        client.dataset('some-dataset').get()
+        self.assertLess(governor.concurrency, initial_concurrency)
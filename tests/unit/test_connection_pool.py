@@ -0,0 +1,162 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List
+
+from apify_client import ApifyClient
+from apify_client._errors import ApifyApiError
+from apify_client.retry import Jitter, RetryPolicy
+from apify_client.transport import RequestsTransport
+
+import requests
+
+RESPONSE_BODY = b'{"data": {"id": "some-dataset-id", "itemCount": 0}}'
+
+
+class ScriptedServer(ThreadingHTTPServer):
+    """A local keep-alive server, which answers the requests as scripted, and counts the connections opened to it."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(('127.0.0.1', 0), ScriptedRequestHandler)
+        # How to answer the next requests, 'ok', 'error' or 'drop', the requests after them get 'ok'
+        self.script: List[str] = []
+        self.requests_count = 0
+        self.opened_connections_count = 0
+        self.lock = threading.Lock()
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        with self.lock:
+            self.opened_connections_count += 1
+        super().process_request(request, client_address)
+
+
+class ScriptedRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._respond()
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self._respond()
+
+    def _respond(self) -> None:
+        server: ScriptedServer = self.server  # type: ignore
+        with server.lock:
+            server.requests_count += 1
+            action = server.script.pop(0) if server.script else 'ok'
+
+        if action == 'drop':
+            # closes the connection without any response, like a load balancer dropping an idle connection
+            self.close_connection = True
+            return
+
+        body = RESPONSE_BODY if action == 'ok' else b'{"error": {"type": "internal-error", "message": "Internal error"}}'
+        self.send_response(200 if action == 'ok' else 500)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args: Any) -> None:
+        pass
+
+
+class ConnectionPoolTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = ScriptedServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.retry_policy = RetryPolicy(max_retries=3, min_delay_between_retries_millis=1, jitter=Jitter.NONE)
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _create_client(self, **kwargs: Any) -> ApifyClient:
+        client = ApifyClient(base_url=f'http://127.0.0.1:{self.server.server_port}', retry_policy=self.retry_policy, **kwargs)
+        self.addCleanup(client.close)
+        return client
+
+    def test_connection_pool_options(self) -> None:
+        requests_session = ApifyClient(pool_connections=2, pool_maxsize=32, pool_block=True).http_client.requests_session
+        for url in ['https://api.apify.com/v2', 'http://localhost:3000']:
+            adapter = requests_session.get_adapter(url)
+            self.assertEqual(adapter._pool_connections, 2)  # type: ignore
+            self.assertEqual(adapter._pool_maxsize, 32)  # type: ignore
+            self.assertEqual(adapter._pool_block, True)  # type: ignore
+
+    def test_invalid_pool_options(self) -> None:
+        with self.assertRaises(ValueError):
+            ApifyClient(pool_maxsize=0)
+        with self.assertRaises(ValueError):
+            ApifyClient(pool_connections=0)
+        with self.assertRaises(ValueError):
+            RequestsTransport(pool_maxsize=-1, pool_block=True)
+
+    def test_threads_share_connections(self) -> None:
+        client = self._create_client(pool_maxsize=4)
+
+        def make_requests() -> None:
+            for _ in range(10):
+                client.dataset('some-dataset-id').get()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for future in [executor.submit(make_requests) for _ in range(4)]:
+                future.result()
+
+        self.assertEqual(self.server.requests_count, 40)
+        self.assertLessEqual(self.server.opened_connections_count, 4)
+
+    def test_blocking_pool(self) -> None:
+        # the threads wait for the only connection of the pool, instead of opening their own
+        client = self._create_client(pool_maxsize=1, pool_block=True)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(client.dataset('some-dataset-id').get) for _ in range(20)]
+            for future in futures:
+                self.assertEqual((future.result(timeout=10) or {})['id'], 'some-dataset-id')
+
+        self.assertEqual(self.server.opened_connections_count, 1)
+
+    def test_retries_reuse_connection(self) -> None:
+        client = self._create_client(pool_maxsize=1, pool_block=True)
+        self.server.script = ['error', 'error']
+
+        self.assertEqual((client.dataset('some-dataset-id').get() or {})['id'], 'some-dataset-id')
+        self.assertEqual(self.server.requests_count, 3)
+        self.assertEqual(self.server.opened_connections_count, 1)
+
+        # the API errors beyond the retry limit are raised, and the connection stays in the pool
+        self.server.script = ['error'] * 4
+        with self.assertRaises(ApifyApiError):
+            client.dataset('some-dataset-id').get()
+        self.assertEqual(client.dataset('some-dataset-id').get(), {'id': 'some-dataset-id', 'itemCount': 0})
+        self.assertEqual(self.server.opened_connections_count, 1)
+
+    def test_retry_after_dropped_connection(self) -> None:
+        client = self._create_client(pool_maxsize=1, pool_block=True)
+        client.dataset('some-dataset-id').get()
+
+        # the retry of the dropped request opens a new connection in place of the dropped one, without blocking on the full pool
+        self.server.script = ['drop']
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertEqual((executor.submit(client.dataset('some-dataset-id').get).result(timeout=10) or {})['id'], 'some-dataset-id')
+        self.assertEqual(self.server.requests_count, 3)
+        self.assertEqual(self.server.opened_connections_count, 2)
+
+    def test_dropped_connection_not_retried(self) -> None:
+        client = self._create_client(pool_maxsize=1, pool_block=True)
+
+        # a POST request may have reached the API before the connection dropped, so it's not retried
+        self.server.script = ['drop']
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                executor.submit(client.dataset('some-dataset-id').push_items, [{'a': 1}]).result(timeout=10)
+            self.assertEqual(self.server.requests_count, 1)
+
+            # the failed request has given the place of its connection in the pool back
+            self.assertEqual((executor.submit(client.dataset('some-dataset-id').get).result(timeout=10) or {})['id'], 'some-dataset-id')
+        self.assertEqual(self.server.opened_connections_count, 2)
@@ -0,0 +1,266 @@
+import asyncio
+import io
+import json
+import random
+import threading
+import time
+import unittest
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List
+
+from apify_client import ApifyClient, ApifyClientAsync
+from apify_client._utils import ListPage
+from apify_client.testing import FakeApifyServer
+from apify_client.transport import InMemoryAsyncTransport, InMemoryTransport
+
+import httpx
+
+DATASET_SIZE = 5500
+
+
+def _items_page(offset: int, limit: int) -> ListPage:
+    items = [{'index': i} for i in range(offset, min(offset + limit, DATASET_SIZE))]
+    return ListPage({'items': items, 'total': DATASET_SIZE, 'offset': offset, 'count': len(items), 'limit': limit})
+
+
+class DatasetClientIterateItemsTest(unittest.TestCase):
+    def test_iterate_items_prefetch_pages(self) -> None:
+        dataset_client = ApifyClient().dataset('some-dataset')
+
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+        requested_windows: List[Any] = []
+
+        def list_items(*, offset: int, limit: int, **_kwargs: Any) -> ListPage:
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                requested_windows.append((offset, limit))
+            time.sleep(random.uniform(0, 0.02))
+            with lock:
+                in_flight -= 1
+            return _items_page(offset, limit)
+
+        dataset_client.list_items = list_items  # type: ignore
+
+        # yields all the items in order
+        items = list(dataset_client.iterate_items(prefetch_pages=3))
+        self.assertEqual([item['index'] for item in items], list(range(DATASET_SIZE)))
+        self.assertLessEqual(max_in_flight, 3)
+        self.assertEqual(sorted(requested_windows), [(offset, 1000) for offset in range(0, 5000, 1000)] + [(5000, 500)])
+
+        # respects offset and limit
+        items = list(dataset_client.iterate_items(offset=100, limit=2500, prefetch_pages=2))
+        self.assertEqual([item['index'] for item in items], list(range(100, 2600)))
+
+    def test_iterate_items_prefetch_pages_async(self) -> None:
+        dataset_client = ApifyClientAsync().dataset('some-dataset')
+
+        async def list_items(*, offset: int, limit: int, **_kwargs: Any) -> ListPage:
+            await asyncio.sleep(random.uniform(0, 0.02))
+            return _items_page(offset, limit)
+
+        dataset_client.list_items = list_items  # type: ignore
+
+        async def collect() -> List:
+            return [item async for item in dataset_client.iterate_items(offset=10, prefetch_pages=3)]
+
+        items = asyncio.run(collect())
+        self.assertEqual([item['index'] for item in items], list(range(10, DATASET_SIZE)))
+
+    def test_iterate_items_prefetch_pages_with_filters(self) -> None:
+        server = FakeApifyServer()
+        # every third item is empty, so the pages with skip_empty have fewer items than their limit
+        dataset = server.add_dataset([{} if i % 3 == 0 and i < DATASET_SIZE - 10 else {'index': i, '#hidden': i} for i in range(DATASET_SIZE)])
+        dataset_client = ApifyClient(transport=InMemoryTransport(server.handle_request)).dataset(dataset['id'])
+        async_dataset_client = ApifyClientAsync(transport=InMemoryAsyncTransport(server.handle_request)).dataset(dataset['id'])
+
+        async def collect_async(**kwargs: Any) -> List:
+            return [item async for item in async_dataset_client.iterate_items(**kwargs)]
+
+        for kwargs in [{'skip_empty': True}, {'clean': True, 'offset': 10}, {'skip_hidden': True, 'limit': 2500}]:
+            sequential_items = list(dataset_client.iterate_items(**kwargs))
+            self.assertGreater(len(sequential_items), 0)
+            self.assertEqual(list(dataset_client.iterate_items(prefetch_pages=3, **kwargs)), sequential_items)
+            self.assertEqual(asyncio.run(collect_async(prefetch_pages=3, **kwargs)), sequential_items)
+
+    def test_iterate_items_prefetch_pages_stopped_early(self) -> None:
+        dataset_client = ApifyClient().dataset('some-dataset')
+        lock = threading.Lock()
+        in_flight = 0
+
+        def list_items(*, offset: int, limit: int, **_kwargs: Any) -> ListPage:
+            nonlocal in_flight
+            with lock:
+                in_flight += 1
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return _items_page(offset, limit)
+
+        dataset_client.list_items = list_items  # type: ignore
+
+        items = dataset_client.iterate_items(prefetch_pages=3)
+        for _ in range(1500):
+            next(items)
+        # closing the iteration waits for the pages being fetched, none of the calls keeps running after it
+        items.close()
+        self.assertEqual(in_flight, 0)
+
+
+class DatasetClientListItemsTest(unittest.TestCase):
+    def test_list_items_lazy_count(self) -> None:
+        server = FakeApifyServer(seed=0)
+        dataset = server.add_dataset([{'index': i, '#hidden': i} for i in range(5)])
+
+        def handle_request(method: str, url: str, headers: Any, body: bytes = b'') -> Any:
+            status_code, response_headers, response_body = server.handle_request(method, url, headers, body)
+            # the API returns invalid counts when hidden or empty items are skipped
+            if 'skipHidden' in url:
+                response_headers = {**response_headers, 'X-Apify-Pagination-Count': '10'}
+            return status_code, response_headers, response_body
+
+        dataset_client = ApifyClient(transport=InMemoryTransport(handle_request)).dataset(dataset['id'])
+        page = dataset_client.list_items(skip_hidden=True, lazy=True)
+        self.assertEqual((page.count, page.total), (5, 5))
+        self.assertEqual(list(page), [{'index': i} for i in range(5)])
+        self.assertEqual(dataset_client.list_items(skip_hidden=True).count, 5)
+
+        # the count of the page doesn't include the skipped empty items
+        dataset = server.add_dataset([{'index': 0}, {}, {'index': 2}])
+        page = ApifyClient(transport=InMemoryTransport(server.handle_request)).dataset(dataset['id']).list_items(skip_empty=True, lazy=True)
+        self.assertEqual(page.count, 2)
+        self.assertEqual(page.items, [{'index': 0}, {'index': 2}])
+
+
+class DatasetClientPushItemsTest(unittest.TestCase):
+    def test_push_items(self) -> None:
+        server = FakeApifyServer(seed=0)
+        dataset = server.add_dataset()
+        sent_requests: List[Any] = []
+
+        def handle_request(method: str, url: str, headers: Any, body: bytes = b'') -> Any:
+            sent_requests.append((headers, body))
+            return server.handle_request(method, url, headers, body)
+
+        dataset_client = ApifyClient(transport=InMemoryTransport(handle_request)).dataset(dataset['id'])
+
+        # small lists and tuples are encoded at once, so they stay under the minimum size for compression
+        dataset_client.push_items([{'index': 0}])
+        dataset_client.push_items(({'index': 1}, {'index': 2}))
+        for headers, body in sent_requests:
+            self.assertNotIn('Content-Encoding', headers)
+            self.assertIsInstance(json.loads(body), list)
+
+        # generators are streamed, their size isn't known in advance, so they are always compressed
+        sent_requests.clear()
+        dataset_client.push_items({'index': index} for index in range(3, 5))
+        self.assertEqual(sent_requests[0][0]['Content-Encoding'], 'gzip')
+
+        self.assertEqual(dataset_client.list_items().items, [{'index': index} for index in range(5)])
+
+
+class DatasetClientIterateItemsStreamingTest(unittest.TestCase):
+    jsonl_body = b'{"index": 0}\n{"index": 1, "text": "\xc5\xbelu\xc5\xa5ou\xc4\x8dk\xc3\xbd"}\n\n{"index": 2}\n'
+    expected_items = [{'index': 0}, {'index': 1, 'text': 'žluťoučký'}, {'index': 2}]
+
+    def test_iterate_items_streaming(self) -> None:
+        dataset_client = ApifyClient().dataset('some-dataset')
+        items_stream = io.BytesIO(self.jsonl_body)
+        requested_formats = []
+
+        def stream_items(*, item_format: str, **_kwargs: Any) -> io.IOBase:
+            requested_formats.append(item_format)
+            return items_stream
+
+        dataset_client.stream_items = stream_items  # type: ignore
+
+        self.assertEqual(list(dataset_client.iterate_items_streaming()), self.expected_items)
+        self.assertEqual(requested_formats, ['jsonl'])
+        self.assertTrue(items_stream.closed)
+
+    def test_iterate_items_streaming_async(self) -> None:
+        dataset_client = ApifyClientAsync().dataset('some-dataset')
+
+        @asynccontextmanager
+        async def stream_items(*, item_format: str, **_kwargs: Any) -> AsyncIterator[httpx.Response]:
+            self.assertEqual(item_format, 'jsonl')
+            yield httpx.Response(200, content=self.jsonl_body)
+
+        dataset_client.stream_items = stream_items  # type: ignore
+
+        async def collect() -> List:
+            return [item async for item in dataset_client.iterate_items_streaming()]
+
+        self.assertEqual(asyncio.run(collect()), self.expected_items)
+
+
+class DatasetClientBatchWriterTest(unittest.TestCase):
+    items = [{'index': i, 'text': 'x' * random.randint(0, 100)} for i in range(2000)]
+
+    def test_batch_writer(self) -> None:
+        dataset_client = ApifyClient().dataset('some-dataset')
+
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+        payloads: List[bytes] = []
+
+        def push_items(items: bytes) -> None:
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(random.uniform(0, 0.01))
+            with lock:
+                in_flight -= 1
+                payloads.append(items)
+
+        dataset_client.push_items = push_items  # type: ignore
+
+        with dataset_client.batch_writer(max_payload_size_bytes=5000, max_workers=3) as writer:
+            writer.add(self.items[0])
+            writer.add_items(self.items[1:])
+
+        self.assertLessEqual(max_in_flight, 3)
+        self.assertTrue(all(len(payload) <= 5000 for payload in payloads))
+        pushed_items = [item for payload in payloads for item in json.loads(payload)]
+        self.assertEqual(sorted(pushed_items, key=lambda item: item['index']), self.items)
+
+        # items over the limit are rejected right away
+        with dataset_client.batch_writer(max_payload_size_bytes=100) as writer:
+            with self.assertRaises(ValueError):
+                writer.add({'text': 'x' * 100})
+
+    def test_batch_writer_error(self) -> None:
+        dataset_client = ApifyClient().dataset('some-dataset')
+
+        def push_items(items: bytes) -> None:
+            raise RuntimeError('push failed')
+
+        dataset_client.push_items = push_items  # type: ignore
+
+        with self.assertRaisesRegex(RuntimeError, 'push failed'):
+            with dataset_client.batch_writer(max_payload_size_bytes=1000) as writer:
+                writer.add_items(self.items)
+
+    def test_batch_writer_async(self) -> None:
+        dataset_client = ApifyClientAsync().dataset('some-dataset')
+        payloads: List[bytes] = []
+
+        async def push_items(items: bytes) -> None:
+            await asyncio.sleep(random.uniform(0, 0.01))
+            payloads.append(items)
+
+        dataset_client.push_items = push_items  # type: ignore
+
+        async def write() -> None:
+            async with dataset_client.batch_writer(max_payload_size_bytes=5000, max_workers=3) as writer:
+                await writer.add_items(self.items)
+
+        asyncio.run(write())
+        self.assertTrue(all(len(payload) <= 5000 for payload in payloads))
+        pushed_items = [item for payload in payloads for item in json.loads(payload)]
+        self.assertEqual(sorted(pushed_items, key=lambda item: item['index']), self.items)
@@ -0,0 +1,160 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
+
+from apify_client import ApifyClient, ApifyClientAsync
+from apify_client.hedging import HedgingPolicy
+
+import httpx
+import requests
+
+RESPONSE_BODY = b'{"data": {"id": "some-run"}}'
+
+
+class HedgingPolicyTest(unittest.TestCase):
+    def test_hedge_delay(self) -> None:
+        hedging_policy = HedgingPolicy(percentile=90, min_samples=10, min_delay_millis=20)
+        self.assertIsNone(hedging_policy.get_hedge_delay_secs('GET actor-runs'))
+
+        # the percentile is computed after the first 10 latencies, and then after every 20 new ones
+        for latency_millis in range(1, 91):
+            hedging_policy.record_latency('GET actor-runs', latency_millis / 1000)
+        self.assertAlmostEqual(hedging_policy.get_hedge_delay_secs('GET actor-runs') or 0, 0.081)
+        self.assertIsNone(hedging_policy.get_hedge_delay_secs('GET datasets'))
+
+        # the delay is never shorter than the minimum
+        for _ in range(1000):
+            hedging_policy.record_latency('GET datasets', 0.001)
+        self.assertAlmostEqual(hedging_policy.get_hedge_delay_secs('GET datasets') or 0, 0.02)
+
+    def test_hedges_budget(self) -> None:
+        hedging_policy = HedgingPolicy(max_hedged_ratio=0.25, max_hedges_burst=2)
+        self.assertFalse(hedging_policy.take_hedge())
+
+        for _ in range(4):
+            hedging_policy.get_hedge_delay_secs('GET actor-runs')
+        self.assertTrue(hedging_policy.take_hedge())
+        self.assertFalse(hedging_policy.take_hedge())
+
+        # the budget for the hedges doesn't grow indefinitely in the periods without slow requests
+        for _ in range(100):
+            hedging_policy.get_hedge_delay_secs('GET actor-runs')
+        self.assertEqual([hedging_policy.take_hedge() for _ in range(3)], [True, True, False])
+
+    def test_client_hedges_slow_requests(self) -> None:
+        hedging_policy = HedgingPolicy(min_samples=1, max_hedged_ratio=1, min_delay_millis=50)
+        hedging_policy.record_latency('GET actor-runs', 0.05)
+        client = ApifyClient(hedging_policy=hedging_policy)
+        requested_at: List[float] = []
+
+        def request(*_args: Any, **_kwargs: Any) -> requests.Response:
+            requested_at.append(time.monotonic())
+            # the first request is slow, the hedged one is fast
+            if len(requested_at) == 1:
+                time.sleep(1)
+            response = requests.Response()
+            response.status_code = 200
+            response._content = RESPONSE_BODY
+            response.headers['Content-Type'] = 'application/json'
+            return response
+
+        client.http_client.requests_session.request = request  # type: ignore
+
+        started_at = time.monotonic()
+        self.assertEqual(client.run('some-run').get(), {'id': 'some-run'})
+        self.assertLess(time.monotonic() - started_at, 0.5)
+        self.assertEqual(len(requested_at), 2)
+        self.assertGreaterEqual(requested_at[1] - requested_at[0], 0.05)
+
+    def test_client_doesnt_queue_primary_requests(self) -> None:
+        hedging_policy = HedgingPolicy(min_samples=1, max_hedged_ratio=1, min_delay_millis=5000)
+        hedging_policy.record_latency('GET actor-runs', 0.01)
+        client = ApifyClient(hedging_policy=hedging_policy, pool_maxsize=1)
+        in_flight_count = 0
+        max_in_flight_count = 0
+        lock = threading.Lock()
+
+        def request(*_args: Any, **_kwargs: Any) -> requests.Response:
+            nonlocal in_flight_count, max_in_flight_count
+            with lock:
+                in_flight_count += 1
+                max_in_flight_count = max(max_in_flight_count, in_flight_count)
+            time.sleep(0.2)
+            with lock:
+                in_flight_count -= 1
+            response = requests.Response()
+            response.status_code = 200
+            response._content = RESPONSE_BODY
+            response.headers['Content-Type'] = 'application/json'
+            return response
+
+        client.http_client.requests_session.request = request  # type: ignore
+
+        # the primary requests don't wait for the worker threads of the hedges, whose number follows the pool size
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for future in [executor.submit(client.run('some-run').get) for _ in range(4)]:
+                self.assertEqual(future.result(), {'id': 'some-run'})
+        self.assertEqual(max_in_flight_count, 4)
+        # so the time they would wait isn't counted in their latencies either
+        self.assertLess(max(hedging_policy._samples['GET actor-runs'].latencies), 0.35)
+        client.close()
+
+    def test_client_close_stops_hedging_threads(self) -> None:
+        hedging_policy = HedgingPolicy(min_samples=1, max_hedged_ratio=1, min_delay_millis=10)
+        hedging_policy.record_latency('GET actor-runs', 0.01)
+
+        def request(*_args: Any, **_kwargs: Any) -> requests.Response:
+            time.sleep(0.05)
+            response = requests.Response()
+            response.status_code = 200
+            response._content = RESPONSE_BODY
+            response.headers['Content-Type'] = 'application/json'
+            return response
+
+        with ApifyClient(hedging_policy=hedging_policy) as client:
+            client.http_client.requests_session.request = request  # type: ignore
+            self.assertEqual(client.run('some-run').get(), {'id': 'some-run'})
+            executor = client.http_client._hedging_executor
+            self.assertIsNotNone(executor)
+            worker_threads = list(executor._threads)  # type: ignore
+            self.assertGreater(len(worker_threads), 0)
+
+        # the worker threads exit once the requests they were sending finish
+        for thread in worker_threads:
+            thread.join(timeout=1)
+            self.assertFalse(thread.is_alive())
+        with self.assertRaises(RuntimeError):
+            executor.submit(time.sleep, 0)  # type: ignore
+
+    def test_async_client_hedges_slow_requests(self) -> None:
+        hedging_policy = HedgingPolicy(min_samples=1, max_hedged_ratio=1, min_delay_millis=50)
+        hedging_policy.record_latency('GET actor-runs', 0.05)
+        requests_count = 0
+        cancelled_requests_count = 0
+
+        async def handle_request(request: httpx.Request) -> httpx.Response:
+            nonlocal requests_count, cancelled_requests_count
+            requests_count += 1
+            try:
+                if requests_count == 1:
+                    await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled_requests_count += 1
+                raise
+            return httpx.Response(200, content=RESPONSE_BODY, headers={'Content-Type': 'application/json'})
+
+        async def main() -> None:
+            client = ApifyClientAsync(hedging_policy=hedging_policy)
+            client.http_client.httpx_async_client = httpx.AsyncClient(transport=httpx.MockTransport(handle_request))
+
+            started_at = time.monotonic()
+            self.assertEqual(await client.run('some-run').get(), {'id': 'some-run'})
+            self.assertLess(time.monotonic() - started_at, 0.5)
+            await asyncio.sleep(0)
+
+        asyncio.run(main())
+        self.assertEqual(requests_count, 2)
+        self.assertEqual(cancelled_requests_count, 1)
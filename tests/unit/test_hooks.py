@@ -0,0 +1,134 @@
+import asyncio
+import unittest
+from typing import Any, List
+
+from apify_client import ApifyClient, ApifyClientAsync
+from apify_client.hooks import RequestEvent, RequestHooks
+from apify_client.retry import RetryPolicy
+from apify_client.transport import AsyncTransport, Transport
+
+import httpx
+import requests
+
+
+def make_response(status_code: int, body: bytes = b'{"data": {"id": "some-dataset"}}') -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers['Content-Type'] = 'application/json'
+    response.request = requests.Request('GET', 'https://api.apify.com/v2/datasets/some-dataset').prepare()
+    return response
+
+
+class FailingTransport(Transport):
+    def send(self, *_args: Any, **_kwargs: Any) -> Any:
+        raise requests.exceptions.ChunkedEncodingError('Connection broken: invalid chunk length')
+
+
+class FailingAsyncTransport(AsyncTransport):
+    async def send(self, *_args: Any, **_kwargs: Any) -> Any:
+        raise RuntimeError('Some error of the transport')
+
+
+class RecordingHooks(RequestHooks):
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+        self.events: List[RequestEvent] = []
+        super().__init__(
+            before_request=lambda event: self._record('before_request', event),
+            after_response=lambda event: self._record('after_response', event),
+            on_retry=lambda event: self._record('on_retry', event),
+            on_error=lambda event: self._record('on_error', event),
+        )
+
+    def _record(self, hook: str, event: RequestEvent) -> None:
+        self.calls.append(f'{hook} {event.attempt}')
+        if event not in self.events:
+            self.events.append(event)
+
+
+class RequestHooksTest(unittest.TestCase):
+    def test_hooks(self) -> None:
+        hooks = RecordingHooks()
+        client = ApifyClient(retry_policy=RetryPolicy(min_delay_between_retries_millis=1), request_hooks=hooks)
+        responses: List[Any] = [requests.exceptions.ConnectionError(), make_response(503), make_response(200)]
+
+        def request(*_args: Any, **_kwargs: Any) -> requests.Response:
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        client.http_client.requests_session.request = request  # type: ignore
+
+        client.dataset('some-dataset').get()
+        self.assertEqual(hooks.calls, [
+            'before_request 1', 'on_error 1',
+            'on_retry 2', 'before_request 2', 'after_response 2',
+            'on_retry 3', 'before_request 3', 'after_response 3',
+        ])
+
+        first, second, third = hooks.events
+        self.assertIsInstance(first.error, requests.exceptions.ConnectionError)
+        self.assertIsNone(first.status_code)
+        self.assertEqual((second.retry_reason, second.status_code), ('network_error', 503))
+        self.assertEqual((third.retry_reason, third.status_code), ('503', 200))
+        self.assertEqual(third.method, 'GET')
+        self.assertEqual(third.url, 'https://api.apify.com/v2/datasets/some-dataset')
+        self.assertEqual(third.url_template, 'datasets/{id}')
+        self.assertEqual(third.endpoint_class, 'datasets')
+        self.assertEqual(third.response_decompressed_bytes, len(b'{"data": {"id": "some-dataset"}}'))
+        self.assertIsNotNone(third.started_at)
+        self.assertGreaterEqual(third.latency_secs or 0, 0)
+
+    def test_context(self) -> None:
+        # the same event is passed to all the hooks of a request, so they can share data
+        spans: List[str] = []
+        hooks = RequestHooks(
+            before_request=lambda event: event.context.update(span=f'span of {event.url_template}'),
+            after_response=lambda event: spans.append(event.context['span']),
+        )
+        client = ApifyClient(request_hooks=hooks)
+        client.http_client.requests_session.request = lambda *_args, **_kwargs: make_response(200)  # type: ignore
+
+        client.dataset('some-dataset').get()
+        self.assertEqual(spans, ['span of datasets/{id}'])
+
+    def test_hooks_async(self) -> None:
+        hooks = RecordingHooks()
+        statuses = [500, 200]
+
+        async def handle_request(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(statuses.pop(0), content=b'{"data": {}}', headers={'Content-Type': 'application/json'})
+
+        async def main() -> None:
+            client = ApifyClientAsync(retry_policy=RetryPolicy(min_delay_between_retries_millis=1), request_hooks=hooks)
+            client.http_client.httpx_async_client = httpx.AsyncClient(transport=httpx.MockTransport(handle_request))
+            await client.key_value_store('some-store').get_record('some-record')
+
+        asyncio.run(main())
+        self.assertEqual(hooks.calls, ['before_request 1', 'after_response 1', 'on_retry 2', 'before_request 2', 'after_response 2'])
+        self.assertEqual([event.status_code for event in hooks.events], [500, 200])
+        self.assertEqual(hooks.events[1].url_template, 'key-value-stores/{id}/records/{id}')
+        self.assertEqual(hooks.events[1].retry_reason, '500')
+
+    def test_hooks_other_errors(self) -> None:
+        # the errors which are not retried end the request with the on_error hook and count in the statistics too
+        hooks = RecordingHooks()
+        client = ApifyClient(retry_policy=RetryPolicy(min_delay_between_retries_millis=1), request_hooks=hooks, transport=FailingTransport())
+        with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+            client.dataset('some-dataset').get()
+        self.assertEqual(hooks.calls, ['before_request 1', 'on_error 1'])
+        self.assertIsInstance(hooks.events[0].error, requests.exceptions.ChunkedEncodingError)
+        self.assertEqual(client.stats.as_dict()['total']['network_errors'], 1)
+
+        async_hooks = RecordingHooks()
+
+        async def main() -> None:
+            async_client = ApifyClientAsync(request_hooks=async_hooks, transport=FailingAsyncTransport())
+            with self.assertRaises(RuntimeError):
+                await async_client.dataset('some-dataset').get()
+            self.assertEqual(async_client.stats.as_dict()['total']['network_errors'], 1)
+
+        asyncio.run(main())
+        self.assertEqual(async_hooks.calls, ['before_request 1', 'on_error 1'])
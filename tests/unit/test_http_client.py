@@ -0,0 +1,287 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from apify_client import ApifyClient, ApifyClientAsync
+from apify_client._errors import DeadlineExceededError, InvalidResponseBodyError
+from apify_client._http_client import _HTTPClient
+from apify_client.testing import FakeApifyServer
+from apify_client.transport import InMemoryTransport
+
+import httpx
+import requests
+
+RUN_RESPONSE_BODY = b'{"data": {"id": "some-run", "status": "RUNNING"}}'
+
+
+class HTTPClientTest(unittest.TestCase):
+    def test_timeouts(self) -> None:
+        client = ApifyClient(connect_timeout_secs=5, read_timeout_secs=50)
+        http_client = client.http_client
+        self.assertEqual(http_client._get_timeouts(None, None), (5, 50))
+        self.assertEqual(http_client._get_timeouts(1, None), (1, 50))
+
+        with client.timeouts(read_timeout_secs=20):
+            self.assertEqual(http_client._get_timeouts(None, None), (5, 20))
+            with client.timeouts(connect_timeout_secs=2):
+                self.assertEqual(http_client._get_timeouts(None, None), (2, 20))
+            self.assertEqual(http_client._get_timeouts(None, 10), (5, 10))
+        self.assertEqual(http_client._get_timeouts(None, None), (5, 50))
+
+    def test_deadline(self) -> None:
+        client = ApifyClient(connect_timeout_secs=5, read_timeout_secs=50, min_delay_between_retries_millis=100)
+        http_client = client.http_client
+
+        with client.deadline(10):
+            connect_timeout, read_timeout = http_client._get_timeouts(None, None)
+            self.assertEqual(connect_timeout, 5)
+            self.assertTrue(9 < read_timeout <= 10)
+
+            # nested deadlines can't extend the outer one
+            with client.deadline(20):
+                self.assertTrue(9 < http_client._get_timeouts(None, None)[1] <= 10)
+            with client.deadline(1):
+                self.assertTrue(0 < http_client._get_timeouts(None, None)[0] <= 1)
+
+        with client.deadline(0):
+            self.assertRaises(DeadlineExceededError, http_client._get_timeouts, None, None)
+
+        # the timeouts of the requests and the retries are cut short by the deadline
+        request_timeouts = []
+
+        def request(*_args: Any, timeout: Tuple[float, float], **_kwargs: Any) -> None:
+            request_timeouts.append(timeout)
+            raise requests.exceptions.ReadTimeout()
+
+        http_client.requests_session.request = request  # type: ignore
+
+        started_at = time.monotonic()
+        with self.assertRaises(DeadlineExceededError) as context_manager:
+            with client.deadline(1):
+                client.dataset('some-dataset').get()
+
+        self.assertLess(time.monotonic() - started_at, 1)
+        self.assertIsInstance(context_manager.exception.__cause__, requests.exceptions.ReadTimeout)
+        self.assertGreater(len(request_timeouts), 1)
+        self.assertTrue(all(read_timeout <= 1 for _, read_timeout in request_timeouts))
+
+    def test_coalescing(self) -> None:
+        client = ApifyClient(coalesce_requests=True)
+        requests_count = 0
+        requests_started = threading.Event()
+        release_requests = threading.Event()
+
+        def request(*_args: Any, **_kwargs: Any) -> requests.Response:
+            nonlocal requests_count
+            requests_count += 1
+            requests_started.set()
+            release_requests.wait()
+            response = requests.Response()
+            response.status_code = 200
+            response._content = RUN_RESPONSE_BODY
+            response.headers['Content-Type'] = 'application/json'
+            return response
+
+        client.http_client.requests_session.request = request  # type: ignore
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            first_run = executor.submit(client.run('some-run').get)
+            requests_started.wait()
+            other_runs = [executor.submit(client.run('some-run').get) for _ in range(4)]
+            # a different request is not shared
+            other_run = executor.submit(client.run('other-run').get)
+            time.sleep(0.1)
+            release_requests.set()
+            runs = [first_run.result()] + [run.result() for run in other_runs]
+            other_run.result()
+
+        self.assertEqual(requests_count, 2)
+        self.assertTrue(all(run == {'id': 'some-run', 'status': 'RUNNING'} for run in runs))
+        # every call gets its own copy of the response
+        self.assertEqual(len({id(run) for run in runs}), 5)
+
+        # the requests which are not in flight at the same time are not shared
+        client.run('some-run').get()
+        self.assertEqual(requests_count, 3)
+
+    def test_coalescing_disabled_by_default(self) -> None:
+        client = ApifyClient()
+        requests_count = 0
+
+        def request(*_args: Any, **_kwargs: Any) -> requests.Response:
+            nonlocal requests_count
+            requests_count += 1
+            time.sleep(0.1)
+            response = requests.Response()
+            response.status_code = 200
+            response._content = RUN_RESPONSE_BODY
+            response.headers['Content-Type'] = 'application/json'
+            return response
+
+        client.http_client.requests_session.request = request  # type: ignore
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda _: client.run('some-run').get(), range(3)))
+        self.assertEqual(requests_count, 3)
+
+    def test_coalescing_async(self) -> None:
+        requests_count = 0
+
+        async def handle_request(request: httpx.Request) -> httpx.Response:
+            nonlocal requests_count
+            requests_count += 1
+            await asyncio.sleep(0.1)
+            if request.url.path.endswith('/failing-run'):
+                return httpx.Response(500, content=b'{"error": {"message": "Error", "type": "error"}}')
+            return httpx.Response(200, content=RUN_RESPONSE_BODY, headers={'Content-Type': 'application/json'})
+
+        async def main() -> None:
+            client = ApifyClientAsync(max_retries=0, coalesce_requests=True)
+            client.http_client.httpx_async_client = httpx.AsyncClient(transport=httpx.MockTransport(handle_request))
+
+            runs = await asyncio.gather(*[client.run('some-run').get() for _ in range(5)])
+            self.assertEqual(requests_count, 1)
+            self.assertTrue(all(run == {'id': 'some-run', 'status': 'RUNNING'} for run in runs))
+            self.assertEqual(len({id(run) for run in runs}), 5)
+
+            # the calls sharing a request get its error too
+            errors = await asyncio.gather(*[client.run('failing-run').get() for _ in range(3)], return_exceptions=True)
+            self.assertEqual(requests_count, 2)
+            self.assertTrue(all(isinstance(error, Exception) for error in errors))
+
+            # when the call which sent the shared request is cancelled, the others send their own
+            first_call = asyncio.ensure_future(client.run('some-run').get())
+            await asyncio.sleep(0.01)
+            other_call = asyncio.ensure_future(client.run('some-run').get())
+            await asyncio.sleep(0.01)
+            first_call.cancel()
+            self.assertEqual(await other_call, {'id': 'some-run', 'status': 'RUNNING'})
+            self.assertEqual(requests_count, 4)
+
+        asyncio.run(main())
+
+    def test_coalescing_waiter_timeout(self) -> None:
+        client = ApifyClient(coalesce_requests=True)
+        requests_started = threading.Event()
+        release_requests = threading.Event()
+
+        def request(*_args: Any, **_kwargs: Any) -> requests.Response:
+            requests_started.set()
+            release_requests.wait()
+            response = requests.Response()
+            response.status_code = 200
+            response._content = RUN_RESPONSE_BODY
+            response.headers['Content-Type'] = 'application/json'
+            return response
+
+        client.http_client.requests_session.request = request  # type: ignore
+
+        def get_run_with_short_timeouts() -> Any:
+            with client.timeouts(connect_timeout_secs=0.05, read_timeout_secs=0.05):
+                return client.run('some-run').get()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            slow_run = executor.submit(client.run('some-run').get)
+            requests_started.wait()
+            # the waiting call gives up after its own timeouts, even though the slow request it waits for is still in flight
+            started_at = time.monotonic()
+            with self.assertRaises(requests.exceptions.ReadTimeout):
+                executor.submit(get_run_with_short_timeouts).result()
+            self.assertLess(time.monotonic() - started_at, 1)
+            release_requests.set()
+            self.assertEqual(slow_run.result(), {'id': 'some-run', 'status': 'RUNNING'})
+
+    def test_coalescing_waiter_timeout_async(self) -> None:
+        async def handle_request(_request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.5)
+            return httpx.Response(200, content=RUN_RESPONSE_BODY, headers={'Content-Type': 'application/json'})
+
+        async def main() -> None:
+            client = ApifyClientAsync(coalesce_requests=True)
+            client.http_client.httpx_async_client = httpx.AsyncClient(transport=httpx.MockTransport(handle_request))
+
+            async def get_run_with_short_timeouts() -> Any:
+                with client.timeouts(connect_timeout_secs=0.05, read_timeout_secs=0.05):
+                    return await client.run('some-run').get()
+
+            slow_run = asyncio.ensure_future(client.run('some-run').get())
+            await asyncio.sleep(0.01)
+            started_at = time.monotonic()
+            with self.assertRaises(httpx.ReadTimeout):
+                await get_run_with_short_timeouts()
+            self.assertLess(time.monotonic() - started_at, 0.4)
+            self.assertEqual(await slow_run, {'id': 'some-run', 'status': 'RUNNING'})
+
+        asyncio.run(main())
+
+    def test_parse_dates(self) -> None:
+        server = FakeApifyServer()
+        dataset_id = server.add_dataset([{'index': 0}], name='some-dataset')['id']
+
+        def get_dataset_and_list(parse_dates: str) -> Tuple[Any, Any]:
+            client = ApifyClient(transport=InMemoryTransport(server.handle_request), parse_dates=parse_dates)
+            return client.dataset(dataset_id).get(), client.datasets().list().items[0]
+
+        for parse_dates in ['eager', 'lazy']:
+            for dataset in get_dataset_and_list(parse_dates):
+                self.assertIsInstance(dataset['createdAt'], datetime)
+                self.assertEqual(dataset['name'], 'some-dataset')
+        for dataset in get_dataset_and_list('off'):
+            self.assertIsInstance(dataset['createdAt'], str)
+
+        with self.assertRaises(ValueError):
+            ApifyClient(parse_dates='sometimes')
+
+    def test_parse_response(self) -> None:
+        http_client = _HTTPClient()
+
+        def make_response(content: bytes, content_type: Optional[str], status_code: int = 200) -> requests.Response:
+            response = requests.Response()
+            response.status_code = status_code
+            response._content = content
+            if content_type is not None:
+                response.headers['Content-Type'] = content_type
+            return response
+
+        parse = http_client._maybe_parse_response
+        self.assertEqual(parse(make_response(b'{"data": {"a": [1, "\xc5\xbe"]}}', 'application/json; charset=utf-8')), {'data': {'a': [1, 'ž']}})
+        self.assertEqual(parse(make_response(b'<a>b</a>', 'application/xml')), '<a>b</a>')
+        self.assertEqual(parse(make_response(b'some text', 'text/plain; charset=utf-8')), 'some text')
+        self.assertEqual(parse(make_response(b'\x00\x01', 'application/octet-stream')), b'\x00\x01')
+        self.assertEqual(parse(make_response(b'\x00\x01', None)), b'\x00\x01')
+        self.assertIsNone(parse(make_response(b'', 'application/json', status_code=204)))
+
+        # malformed JSON, e.g. a partially received body, raises an error which the client retries
+        for malformed_body in [b'{"data": {"a": ', b'', b'not json']:
+            with self.assertRaises(InvalidResponseBodyError):
+                parse(make_response(malformed_body, 'application/json'))
+
+    def test_resource_clients_reuse_parsed_body(self) -> None:
+        client = ApifyClient(max_retries=1, min_delay_between_retries_millis=1)
+        bodies = [b'{"data": {"id": "some-run", "sta', RUN_RESPONSE_BODY, b'{"data": {"total": 1, "items": [{"id": "a"}]}}']
+
+        def request(*_args: Any, **_kwargs: Any) -> requests.Response:
+            response = requests.Response()
+            response.status_code = 200
+            response._content = bodies.pop(0)
+            response.headers['Content-Type'] = 'application/json'
+
+            def fail_json(**_kwargs: Any) -> Any:
+                raise AssertionError('The body was decoded a second time')
+
+            response.json = fail_json  # type: ignore
+            return response
+
+        client.http_client.requests_session.request = request  # type: ignore
+
+        # the truncated body is retried, and the parsed body of the valid one is returned without decoding it again
+        self.assertEqual(client.run('some-run').get(), {'id': 'some-run', 'status': 'RUNNING'})
+        self.assertEqual(client.runs().list().items, [{'id': 'a'}])
+
+        bodies.extend([b'{"data": ', b'{"data": '])
+        with self.assertRaises(InvalidResponseBodyError):
+            client.run('some-run').get()
@@ -0,0 +1,38 @@
+import unittest
+
+from apify_client.json_codec import _IS_ORJSON_INSTALLED, JSONCodec, OrjsonJSONCodec, StdlibJSONCodec, default_json_codec
+
+
+class JSONCodecTest(unittest.TestCase):
+    value = {'text': 'žluťoučký kůň', 'number': 1.5, 'list': [1, None, True], 'nested': {'a': 'b'}}
+
+    def _test_codec(self, codec: JSONCodec) -> None:
+        encoded = codec.dumps(self.value)
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(encoded, '{"text":"žluťoučký kůň","number":1.5,"list":[1,null,true],"nested":{"a":"b"}}'.encode('utf-8'))
+        self.assertEqual(codec.loads(encoded), self.value)
+        self.assertEqual(codec.loads(encoded.decode('utf-8')), self.value)
+        self.assertRaises(ValueError, codec.loads, b'{"invalid": ')
+        self.assertRaises(TypeError, codec.dumps, {'value': object()})
+
+    def test_stdlib_json_codec(self) -> None:
+        self._test_codec(StdlibJSONCodec())
+
+    @unittest.skipUnless(_IS_ORJSON_INSTALLED, 'orjson is not installed')
+    def test_orjson_json_codec(self) -> None:
+        codec = OrjsonJSONCodec()
+        self._test_codec(codec)
+        # falls back to the standard library for values orjson can't encode
+        self.assertEqual(codec.dumps({1: 2 ** 70}), b'{"1":1180591620717411303424}')
+
+    def test_default_json_codec(self) -> None:
+        self.assertIsInstance(default_json_codec(), OrjsonJSONCodec if _IS_ORJSON_INSTALLED else StdlibJSONCodec)
+
+    def test_incomplete_codec(self) -> None:
+        class DumpsOnlyCodec(JSONCodec):
+            def dumps(self, value: object) -> bytes:
+                return b'null'
+
+        # a codec missing one of the methods fails when it's created, not when the client first uses it
+        with self.assertRaises(TypeError):
+            DumpsOnlyCodec()  # type: ignore
@@ -0,0 +1,89 @@
+import time
+import unittest
+from email.utils import formatdate
+from typing import Any, List
+
+from apify_client import ApifyClient
+from apify_client.rate_limit import RateLimiter, _parse_retry_after_secs
+
+import requests
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RateLimiterTest(unittest.TestCase):
+    def test_global_budget(self) -> None:
+        clock = FakeClock()
+        rate_limiter = RateLimiter(requests_per_second=10, burst=2, clock=clock)
+
+        # the burst goes through at once, then the requests are spaced evenly
+        self.assertEqual([rate_limiter.reserve('datasets') for _ in range(2)], [0, 0])
+        self.assertAlmostEqual(rate_limiter.reserve('datasets'), 0.1)
+        self.assertAlmostEqual(rate_limiter.reserve('actor-runs'), 0.2)
+
+        clock.now += 1
+        self.assertEqual(rate_limiter.reserve('datasets'), 0)
+
+        unlimited_rate_limiter = RateLimiter(requests_per_second=None, clock=clock)
+        self.assertEqual([unlimited_rate_limiter.reserve('datasets') for _ in range(1000)], [0] * 1000)
+
+    def test_endpoint_class_budgets(self) -> None:
+        clock = FakeClock()
+        rate_limiter = RateLimiter(requests_per_second=100, endpoint_class_requests_per_second={'datasets': 2}, clock=clock)
+
+        self.assertEqual([rate_limiter.reserve('datasets') for _ in range(2)], [0, 0])
+        self.assertAlmostEqual(rate_limiter.reserve('datasets'), 0.5)
+        self.assertEqual(rate_limiter.reserve('key-value-stores'), 0)
+
+    def test_on_rate_limited(self) -> None:
+        clock = FakeClock()
+        rate_limiter = RateLimiter(requests_per_second=100, clock=clock)
+
+        rate_limiter.on_rate_limited('datasets', 5)
+        self.assertEqual(rate_limiter.reserve('datasets'), 5)
+        self.assertEqual(rate_limiter.reserve('key-value-stores'), 0)
+
+        clock.now += 5
+        # no burst right after the pause, the requests are spaced evenly after the one which waited for it
+        self.assertAlmostEqual(rate_limiter.reserve('datasets'), 0.02)
+        self.assertAlmostEqual(rate_limiter.reserve('datasets'), 0.03)
+
+        rate_limiter.on_rate_limited('actors')
+        self.assertEqual(rate_limiter.reserve('actors'), 1)
+
+    def test_parse_retry_after_secs(self) -> None:
+        self.assertEqual(_parse_retry_after_secs({}), None)
+        self.assertEqual(_parse_retry_after_secs({'retry-after': '3'}), 3)
+        self.assertEqual(_parse_retry_after_secs({'retry-after': '-3'}), 0)
+        self.assertTrue(8 < (_parse_retry_after_secs({'retry-after': formatdate(time.time() + 10, usegmt=True)}) or 0) <= 10)
+        self.assertEqual(_parse_retry_after_secs({'retry-after': 'soon'}), None)
+        self.assertEqual(_parse_retry_after_secs({'ratelimit-reset': '2'}), 2)
+        self.assertTrue(8 < (_parse_retry_after_secs({'x-ratelimit-reset': str(int(time.time()) + 10)}) or 0) <= 10)
+
+    def test_client_honors_retry_after(self) -> None:
+        client = ApifyClient(base_url='http://localhost:3000/v2', min_delay_between_retries_millis=1)
+        requested_at: List[float] = []
+
+        def request(*_args: Any, **_kwargs: Any) -> requests.Response:
+            requested_at.append(time.monotonic())
+            response = requests.Response()
+            if len(requested_at) == 1:
+                response.status_code = 429
+                response.headers['Retry-After'] = '0.5'
+            else:
+                response.status_code = 200
+                response._content = b'{"data": {"id": "some-dataset"}}'
+                response.headers['Content-Type'] = 'application/json'
+            return response
+
+        client.http_client.requests_session.request = request  # type: ignore
+
+        self.assertEqual(client.dataset('some-dataset').get(), {'id': 'some-dataset'})
+        self.assertEqual(len(requested_at), 2)
+        self.assertGreaterEqual(requested_at[1] - requested_at[0], 0.45)
@@ -0,0 +1,232 @@
+import asyncio
+import time
+import unittest
+from typing import Any, Callable, List
+
+from apify_client._errors import ApifyApiError
+from apify_client.retry import Jitter, RetryPolicy
+
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+
+
+class RetryableError(Exception):
+    pass
+
+
+class BailError(Exception):
+    pass
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, secs: float) -> None:
+        self.now += secs
+
+
+def make_api_error(status_code: int) -> ApifyApiError:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b'{"error": {"message": "Error", "type": "error"}}'
+    response.request = requests.Request('GET', 'https://api.apify.com/v2').prepare()
+    return ApifyApiError(response, 1)
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def test_call(self) -> None:
+        attempt_counter = 0
+
+        def returns_on_fifth_attempt(bail: Callable, attempt: int) -> Any:
+            nonlocal attempt_counter
+            attempt_counter += 1
+
+            if attempt == 5:
+                return 'SUCCESS'
+            raise RetryableError()
+
+        def bails_on_third_attempt(bail: Callable, attempt: int) -> Any:
+            nonlocal attempt_counter
+            attempt_counter += 1
+
+            if attempt == 3:
+                bail(BailError())
+            raise RetryableError()
+
+        # Returns the correct result after the correct time (should take 100 + 200 + 400 + 800 = 1500 ms)
+        start = time.time()
+        retry_policy = RetryPolicy(min_delay_between_retries_millis=100, backoff_factor=2, jitter=Jitter.NONE)
+        result = retry_policy.call(returns_on_fifth_attempt, method='GET')
+        elapsed_time_seconds = time.time() - start
+        self.assertEqual(result, 'SUCCESS')
+        self.assertEqual(attempt_counter, 5)
+        self.assertGreater(elapsed_time_seconds, 1.4)
+        self.assertLess(elapsed_time_seconds, 2.0)
+
+        # Stops retrying when failed for max_retries times
+        attempt_counter = 0
+        with self.assertRaises(RetryableError):
+            RetryPolicy(max_retries=3, min_delay_between_retries_millis=1).call(returns_on_fifth_attempt, method='GET')
+        self.assertEqual(attempt_counter, 4)
+
+        # Bails when the bail function is called
+        attempt_counter = 0
+        with self.assertRaises(BailError):
+            RetryPolicy(min_delay_between_retries_millis=1).call(bails_on_third_attempt, method='GET')
+        self.assertEqual(attempt_counter, 3)
+
+    def test_call_async(self) -> None:
+        attempt_counter = 0
+
+        async def returns_on_fifth_attempt(bail: Callable, attempt: int) -> Any:
+            nonlocal attempt_counter
+            attempt_counter += 1
+
+            if attempt == 5:
+                return 'SUCCESS'
+            raise RetryableError()
+
+        async def bails_on_third_attempt(bail: Callable, attempt: int) -> Any:
+            nonlocal attempt_counter
+            attempt_counter += 1
+
+            if attempt == 3:
+                bail(BailError())
+            raise RetryableError()
+
+        # Returns the correct result after the correct time (should take 100 + 200 + 400 + 800 = 1500 ms)
+        start = time.time()
+        retry_policy = RetryPolicy(min_delay_between_retries_millis=100, backoff_factor=2, jitter=Jitter.NONE)
+        result = asyncio.run(retry_policy.call_async(returns_on_fifth_attempt, method='GET'))
+        elapsed_time_seconds = time.time() - start
+        self.assertEqual(result, 'SUCCESS')
+        self.assertEqual(attempt_counter, 5)
+        self.assertGreater(elapsed_time_seconds, 1.4)
+        self.assertLess(elapsed_time_seconds, 2.0)
+
+        # Stops retrying when failed for max_retries times
+        attempt_counter = 0
+        with self.assertRaises(RetryableError):
+            asyncio.run(RetryPolicy(max_retries=3, min_delay_between_retries_millis=1).call_async(returns_on_fifth_attempt, method='GET'))
+        self.assertEqual(attempt_counter, 4)
+
+        # Bails when the bail function is called
+        attempt_counter = 0
+        with self.assertRaises(BailError):
+            asyncio.run(RetryPolicy(min_delay_between_retries_millis=1).call_async(bails_on_third_attempt, method='GET'))
+        self.assertEqual(attempt_counter, 3)
+
+    def test_simulated_time(self) -> None:
+        clock = FakeClock()
+        sleeps: List[float] = []
+
+        def sleep(secs: float) -> None:
+            sleeps.append(secs)
+            clock.sleep(secs)
+
+        def always_fails(bail: Callable, attempt: int) -> Any:
+            raise make_api_error(503)
+
+        retry_policy = RetryPolicy(
+            max_retries=5,
+            min_delay_between_retries_millis=1000,
+            max_delay_between_retries_millis=4000,
+            jitter=Jitter.NONE,
+            sleep=sleep,
+            clock=clock,
+        )
+        with self.assertRaises(ApifyApiError):
+            retry_policy.call(always_fails, method='GET')
+        self.assertEqual(sleeps, [1, 2, 4, 4, 4])
+        self.assertEqual(clock.now, 1015)
+
+    def test_jitter(self) -> None:
+        for _ in range(100):
+            full_jitter_delay = RetryPolicy(min_delay_between_retries_millis=1000, jitter=Jitter.FULL).get_delay_secs(3)
+            self.assertTrue(0 <= full_jitter_delay <= 4)
+
+            proportional_jitter_delay = RetryPolicy(min_delay_between_retries_millis=1000).get_delay_secs(3)
+            self.assertTrue(4 <= proportional_jitter_delay <= 8)
+
+            decorrelated_jitter_policy = RetryPolicy(
+                min_delay_between_retries_millis=1000,
+                max_delay_between_retries_millis=5000,
+                jitter=Jitter.DECORRELATED,
+            )
+            self.assertTrue(1 <= decorrelated_jitter_policy.get_delay_secs(1) <= 3)
+            self.assertTrue(1 <= decorrelated_jitter_policy.get_delay_secs(2, 1.2) <= 3.6)
+            self.assertTrue(1 <= decorrelated_jitter_policy.get_delay_secs(5, 10) <= 5)
+
+    def test_should_retry(self) -> None:
+        retry_policy = RetryPolicy(max_retries=3, max_retries_by_method={'post': 1}, max_retries_by_status_code={503: 5})
+
+        # only the rate limit and internal errors are retried
+        self.assertTrue(retry_policy.should_retry(method='GET', attempt=1, error=make_api_error(429)))
+        self.assertTrue(retry_policy.should_retry(method='GET', attempt=1, error=make_api_error(500)))
+        self.assertFalse(retry_policy.should_retry(method='GET', attempt=1, error=make_api_error(404)))
+
+        # the rules for methods and status codes override the max_retries
+        self.assertFalse(retry_policy.should_retry(method='GET', attempt=4, error=make_api_error(500)))
+        self.assertFalse(retry_policy.should_retry(method='POST', attempt=2, error=make_api_error(500)))
+        self.assertTrue(retry_policy.should_retry(method='POST', attempt=5, error=make_api_error(503)))
+
+        # non-idempotent requests are retried after network errors only when they couldn't reach the API
+        read_timeout = requests.exceptions.ReadTimeout()
+        connection_refused = requests.exceptions.ConnectionError(MaxRetryError(
+            None,  # type: ignore
+            'https://api.apify.com/v2',
+            NewConnectionError(None, 'Connection refused'),  # type: ignore
+        ))
+        self.assertTrue(retry_policy.should_retry(method='GET', attempt=1, error=read_timeout))
+        self.assertFalse(retry_policy.should_retry(method='POST', attempt=1, error=read_timeout))
+        self.assertTrue(retry_policy.should_retry(method='POST', attempt=1, error=connection_refused))
+        self.assertTrue(retry_policy.should_retry(method='POST', attempt=1, error=requests.exceptions.ConnectTimeout()))
+        self.assertTrue(RetryPolicy(retry_non_idempotent_requests=True).should_retry(method='POST', attempt=1, error=read_timeout))
+
+    def test_retry_budget(self) -> None:
+        clock = FakeClock()
+        retry_policy = RetryPolicy(retry_budget=2, retry_budget_window_secs=10, clock=clock)
+        error = make_api_error(500)
+
+        self.assertEqual([retry_policy.should_retry(method='GET', attempt=1, error=error) for _ in range(3)], [True, True, False])
+        # errors which are not retried don't spend the budget
+        clock.now += 5
+        self.assertFalse(retry_policy.should_retry(method='GET', attempt=1, error=make_api_error(400)))
+        clock.now += 5
+        self.assertEqual([retry_policy.should_retry(method='GET', attempt=1, error=error) for _ in range(3)], [True, True, False])
+
+    def test_retry_budget_ratio(self) -> None:
+        clock = FakeClock()
+        retry_policy = RetryPolicy(retry_budget_ratio=0.1, retry_budget_min_retries=2, retry_budget_window_secs=10, clock=clock)
+        error = make_api_error(500)
+
+        def fails_on_first_attempt(bail: Callable, attempt: int) -> Any:
+            if attempt == 1:
+                raise error
+            return 'SUCCESS'
+
+        # the minimum of the retries is allowed even at low traffic
+        self.assertEqual([retry_policy.should_retry(method='GET', attempt=1, error=error) for _ in range(3)], [True, True, False])
+
+        # with more calls, a fraction of them can be retried
+        for _ in range(50):
+            retry_policy.call(lambda bail, attempt: 'SUCCESS', method='GET')
+        self.assertEqual([retry_policy.should_retry(method='GET', attempt=1, error=error) for _ in range(4)], [True, True, True, False])
+
+        with self.assertRaises(ApifyApiError):
+            RetryPolicy(retry_budget_ratio=0.1, retry_budget_min_retries=0).call(fails_on_first_attempt, method='GET')
+
+    def test_retry_budget_ratio_without_failures(self) -> None:
+        clock = FakeClock()
+        retry_policy = RetryPolicy(retry_budget_ratio=0.1, retry_budget_window_secs=1, clock=clock)
+
+        # the calls out of the window are forgotten even when none of them fails
+        for _ in range(100_000):
+            retry_policy.call(lambda bail, attempt: 'SUCCESS', method='GET')
+            clock.now += 0.01
+        self.assertLessEqual(len(retry_policy._called_at), 101)
+        self.assertEqual(len(retry_policy._retried_at), 0)
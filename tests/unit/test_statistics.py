@@ -0,0 +1,110 @@
+import unittest
+from typing import Any, List
+
+from apify_client import ApifyClient
+from apify_client.retry import RetryPolicy
+from apify_client.statistics import Statistics
+
+import requests
+
+
+def make_response(status_code: int, body: bytes = b'{"data": {"id": "some-dataset"}}') -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers['Content-Type'] = 'application/json'
+    response.request = requests.Request('GET', 'https://api.apify.com/v2/datasets/some-dataset').prepare()
+    return response
+
+
+class StatisticsTest(unittest.TestCase):
+    def test_latency_percentiles(self) -> None:
+        statistics = Statistics(latency_buckets_secs=[0.1 * bucket for bucket in range(1, 11)])
+        for latency_millis in range(1, 1001):
+            statistics.record_request('datasets', status_code=200, latency_secs=latency_millis / 1000)
+
+        latency = statistics.as_dict()['endpoint_classes']['datasets']['latency_secs']
+        self.assertEqual(latency['count'], 1000)
+        self.assertAlmostEqual(latency['max'], 1)
+        self.assertAlmostEqual(latency['p50'], 0.5, delta=0.01)
+        self.assertAlmostEqual(latency['p95'], 0.95, delta=0.01)
+        self.assertAlmostEqual(latency['p99'], 0.99, delta=0.01)
+
+        # the latencies longer than the last bucket are estimated up to the longest one
+        statistics.reset()
+        for latency_secs in [0.05, 0.05, 3, 5]:
+            statistics.record_request('datasets', status_code=200, latency_secs=latency_secs)
+        self.assertTrue(1 < statistics.as_dict()['total']['latency_secs']['p99'] <= 5)
+
+    def test_as_dict(self) -> None:
+        statistics = Statistics()
+        statistics.record_call('datasets')
+        statistics.record_request('datasets', status_code=500, latency_secs=0.1, request_bytes=100, request_uncompressed_bytes=400)
+        statistics.record_retry('datasets', reason='500')
+        statistics.record_request('datasets', status_code=None, latency_secs=0.2)
+        statistics.record_retry('datasets', reason='network_error')
+        statistics.record_request('datasets', status_code=200, latency_secs=0.1, response_bytes=50, response_decompressed_bytes=200)
+        statistics.record_call('acts')
+        statistics.record_cache_hit('acts')
+
+        datasets = statistics.as_dict()['endpoint_classes']['datasets']
+        self.assertEqual(datasets['calls'], 1)
+        self.assertEqual(datasets['requests'], 3)
+        self.assertEqual(datasets['responses_by_status_code'], {200: 1, 500: 1})
+        self.assertEqual(datasets['network_errors'], 1)
+        self.assertEqual(datasets['retries'], 2)
+        self.assertEqual(datasets['retries_by_reason'], {'500': 1, 'network_error': 1})
+        self.assertEqual((datasets['request_bytes'], datasets['request_uncompressed_bytes']), (100, 400))
+        self.assertEqual((datasets['response_bytes'], datasets['response_decompressed_bytes']), (50, 200))
+
+        total = statistics.as_dict()['total']
+        self.assertEqual((total['calls'], total['cache_hits'], total['requests']), (2, 1, 3))
+
+    def test_to_prometheus(self) -> None:
+        statistics = Statistics(latency_buckets_secs=[0.1, 1])
+        statistics.record_call('datasets')
+        statistics.record_request('datasets', status_code=429, latency_secs=0.05)
+        statistics.record_retry('datasets', reason='429')
+        statistics.record_request('datasets', status_code=200, latency_secs=0.5)
+
+        metrics = statistics.to_prometheus().splitlines()
+        self.assertIn('# TYPE apify_client_calls_total counter', metrics)
+        self.assertIn('apify_client_calls_total{endpoint_class="datasets"} 1', metrics)
+        self.assertIn('apify_client_requests_total{endpoint_class="datasets"} 2', metrics)
+        self.assertIn('apify_client_responses_total{endpoint_class="datasets",status_code="429"} 1', metrics)
+        self.assertIn('apify_client_retries_total{endpoint_class="datasets",reason="429"} 1', metrics)
+        self.assertIn('# TYPE apify_client_request_duration_seconds histogram', metrics)
+        self.assertIn('apify_client_request_duration_seconds_bucket{endpoint_class="datasets",le="0.1"} 1', metrics)
+        self.assertIn('apify_client_request_duration_seconds_bucket{endpoint_class="datasets",le="1"} 2', metrics)
+        self.assertIn('apify_client_request_duration_seconds_bucket{endpoint_class="datasets",le="+Inf"} 2', metrics)
+        self.assertIn('apify_client_request_duration_seconds_count{endpoint_class="datasets"} 2', metrics)
+
+        self.assertIn('my_app_calls_total{endpoint_class="datasets"} 1', statistics.to_prometheus(prefix='my_app').splitlines())
+
+    def test_client(self) -> None:
+        client = ApifyClient(retry_policy=RetryPolicy(min_delay_between_retries_millis=1))
+        responses: List[requests.Response] = [make_response(503), make_response(200)]
+
+        def request(*_args: Any, **_kwargs: Any) -> requests.Response:
+            return responses.pop(0)
+
+        client.http_client.requests_session.request = request  # type: ignore
+
+        client.dataset('some-dataset').get()
+        datasets = client.stats.as_dict()['endpoint_classes']['datasets']
+        self.assertEqual(datasets['calls'], 1)
+        self.assertEqual(datasets['requests'], 2)
+        self.assertEqual(datasets['responses_by_status_code'], {200: 1, 503: 1})
+        self.assertEqual(datasets['retries_by_reason'], {'503': 1})
+        self.assertEqual(datasets['response_decompressed_bytes'], 2 * len(b'{"data": {"id": "some-dataset"}}'))
+
+        # the request bodies are measured before and after the compression
+        responses.append(make_response(201, b'{}'))
+        client.key_value_store('some-store').set_record('some-record', 'x' * 10_000)
+        key_value_stores = client.stats.as_dict()['endpoint_classes']['key-value-stores']
+        self.assertEqual(key_value_stores['request_uncompressed_bytes'], 10_000)
+        self.assertLess(key_value_stores['request_bytes'], 1000)
+
+        # a statistics object can be shared by several clients
+        statistics = Statistics()
+        self.assertIs(ApifyClient(statistics=statistics).stats, statistics)
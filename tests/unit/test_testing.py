@@ -0,0 +1,91 @@
+import asyncio
+import time
+import unittest
+
+from apify_client import ApifyClient, ApifyClientAsync
+from apify_client.retry import RetryPolicy
+from apify_client.testing import FakeApifyServer
+
+
+class FakeApifyServerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = FakeApifyServer(seed=1).start()
+        self.client = ApifyClient(base_url=self.server.url, retry_policy=RetryPolicy(min_delay_between_retries_millis=1))
+
+    def tearDown(self) -> None:
+        self.server.stop()
+
+    def test_datasets(self) -> None:
+        dataset = self.server.add_dataset([{'index': i, '#hidden': True} for i in range(2500)], name='my-dataset')
+        dataset_client = self.client.dataset(dataset['id'])
+
+        page = dataset_client.list_items(offset=10, limit=5, desc=True, clean=True)
+        self.assertEqual((page.total, page.offset, page.limit, page.count), (2500, 10, 5, 5))
+        self.assertEqual(page.items[0], {'index': 2489})
+        self.assertEqual(len(list(dataset_client.iterate_items())), 2500)
+        self.assertEqual(dataset_client.download_items(item_format='jsonl', limit=1, fields=['index']), b'{"index": 0}\n')
+
+        dataset_client.push_items([{'index': 2500}, {'index': 2501}])
+        self.assertEqual(self.client.dataset('someone~my-dataset').get()['itemCount'], 2502)  # type: ignore
+
+    def test_key_value_stores(self) -> None:
+        store_client = self.client.key_value_store(self.client.key_value_stores().get_or_create(name='my-store')['id'])
+        store_client.set_record('a', {'value': 1})
+        store_client.set_record('b', 'x' * 10_000)
+
+        self.assertEqual(store_client.get_record('a'), {'key': 'a', 'value': {'value': 1}, 'content_type': 'application/json; charset=utf-8'})
+        self.assertEqual((store_client.get_record('b') or {})['value'], 'x' * 10_000)
+        self.assertIsNone(store_client.get_record('c'))
+        keys = store_client.list_keys(limit=1)
+        self.assertEqual((keys['items'][0]['key'], keys['isTruncated'], keys['nextExclusiveStartKey']), ('a', True, 'a'))
+
+    def test_request_queues(self) -> None:
+        queue_client = self.client.request_queue(self.server.add_request_queue([{'url': 'https://example.com/1'}])['id'])
+
+        self.assertTrue(queue_client.add_request({'url': 'https://example.com/1'})['wasAlreadyPresent'])
+        request_id = queue_client.add_request({'url': 'https://example.com/2'}, forefront=True)['requestId']
+        self.assertEqual([request['url'] for request in queue_client.list_head()['items']], ['https://example.com/2', 'https://example.com/1'])
+
+        queue_client.update_request({**(queue_client.get_request(request_id) or {}), 'handledAt': '2021-06-10T07:16:29.174Z'})
+        self.assertEqual([request['url'] for request in queue_client.list_head()['items']], ['https://example.com/1'])
+
+    def test_actor_runs(self) -> None:
+        self.server.add_actor('my-actor', run_duration_secs=0.3, output_items=[{'result': 1}])
+
+        started_at = time.monotonic()
+        run = self.client.actor('someone~my-actor').call(run_input={'input': 1}) or {}
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.3)
+        self.assertEqual(run['status'], 'SUCCEEDED')
+
+        run_client = self.client.run(run['id'])
+        self.assertEqual(run_client.dataset().list_items().items, [{'result': 1}])
+        self.assertEqual((run_client.key_value_store().get_record('INPUT') or {})['value'], {'input': 1})
+        self.assertIn('Run started', run_client.log().get() or '')
+        self.assertEqual((self.client.actor('my-actor').last_run().get() or {})['id'], run['id'])
+
+        run = self.client.actor('my-actor').start()
+        self.assertEqual(self.client.run(run['id']).abort()['status'], 'ABORTED')
+
+    def test_injected_errors(self) -> None:
+        dataset = self.server.add_dataset()
+        self.server.retry_after_secs = 0.01
+        self.server.fail_next_requests(2, status_code=429)
+        self.client.dataset(dataset['id']).get()
+        self.assertEqual(len(self.server.requests), 3)
+
+        # the failing requests don't change anything, so they can be retried
+        self.server.error_rate = 0.5
+        for i in range(20):
+            self.client.dataset(dataset['id']).push_items({'index': i})
+        self.assertEqual(len(list(self.client.dataset(dataset['id']).iterate_items())), 20)
+
+    def test_async_client(self) -> None:
+        dataset = self.server.add_dataset([{'index': i} for i in range(10)])
+
+        async def main() -> None:
+            client = ApifyClientAsync(base_url=self.server.url)
+            dataset_client = client.dataset(dataset['id'])
+            await dataset_client.push_items([{'index': 10}])
+            self.assertEqual((await dataset_client.list_items(offset=10)).items, [{'index': 10}])
+
+        asyncio.run(main())
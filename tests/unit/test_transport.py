@@ -0,0 +1,130 @@
+import asyncio
+import unittest
+from typing import Dict, List, Mapping, Tuple
+
+from apify_client import ApifyClient, ApifyClientAsync
+from apify_client.hooks import RequestHooks
+from apify_client.retry import RetryPolicy, _may_have_reached_api
+from apify_client.testing import FakeApifyServer
+from apify_client.transport import HTTPXTransport, InMemoryAsyncTransport, InMemoryTransport, Transport
+
+import requests
+
+
+class TransportTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = FakeApifyServer(seed=1)
+        self.dataset = self.server.add_dataset([{'index': i} for i in range(3000)])
+
+    def test_in_memory_transport(self) -> None:
+        sent_requests: List[Tuple[str, str, Mapping[str, str]]] = []
+
+        def handle_request(method: str, url: str, headers: Mapping[str, str], body: bytes) -> Tuple[int, Mapping[str, str], bytes]:
+            sent_requests.append((method, url, headers))
+            return self.server.handle_request(method, url, headers, body)
+
+        client = ApifyClient('some-token', base_url='http://fake-api/v2', transport=InMemoryTransport(handle_request))
+        dataset_client = client.dataset(self.dataset['id'])
+
+        self.assertEqual(len(list(dataset_client.iterate_items())), 3000)
+        self.assertEqual(sent_requests[0][1], f'http://fake-api/v2/datasets/{self.dataset["id"]}/items?offset=0&limit=1000')
+        self.assertEqual(sent_requests[0][2]['Authorization'], 'Bearer some-token')
+
+        dataset_client.push_items({'index': 3000})
+        self.assertEqual(dataset_client.list_items(offset=3000).items, [{'index': 3000}])
+        self.assertEqual(next(dataset_client.iterate_items_streaming(limit=1)), {'index': 0})
+
+        # the calls go through the transport, and the session of the default transport isn't there to be misused
+        self.assertEqual(client.dataset(self.dataset['id']).get()['itemCount'], 3001)  # type: ignore
+        with self.assertRaises(TypeError):
+            client.http_client.requests_session
+
+    def test_httpx_transport(self) -> None:
+        with self.server:
+            transport = HTTPXTransport()
+            client = ApifyClient(base_url=self.server.url, transport=transport, retry_policy=RetryPolicy(min_delay_between_retries_millis=1))
+            dataset_client = client.dataset(self.dataset['id'])
+
+            self.assertEqual(len(dataset_client.list_items().items), 3000)
+            items_stream = dataset_client.stream_items(item_format='jsonl', limit=2)
+            self.assertEqual(items_stream.read(), b'{"index": 0}\n{"index": 1}\n')
+            items_stream.close()
+
+            self.server.fail_next_requests(1)
+            self.assertEqual(dataset_client.get()['itemCount'], 3000)  # type: ignore
+            self.assertIsNone(client.key_value_store('missing-store').get())
+
+            # the network errors are raised as the errors of `requests`, which the client retries
+            self.server.stop()
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                transport.send('GET', 'http://127.0.0.1:1/v2', headers={}, params=None, data=None, stream=False, timeout=(1, 1))
+            transport.close()
+
+    def test_httpx_transport_connect_error(self) -> None:
+        # the connection can't be established, so even a POST request is retried, because it didn't reach the API
+        with self.server:
+            url = self.server.url
+        attempts: List[int] = []
+        hooks = RequestHooks(before_request=lambda event: attempts.append(event.attempt))
+        client = ApifyClient(
+            base_url=url,
+            transport=HTTPXTransport(),
+            retry_policy=RetryPolicy(max_retries=2, min_delay_between_retries_millis=1),
+            request_hooks=hooks,
+        )
+
+        with self.assertRaises(requests.exceptions.ConnectionError) as context:
+            client.actor('some-actor').start()
+        self.assertFalse(_may_have_reached_api(context.exception))
+        self.assertEqual(attempts, [1, 2, 3])
+        client.close()
+
+    def test_http2(self) -> None:
+        with self.server:
+            client = ApifyClient(base_url=self.server.url, http2=True)
+            self.assertIsInstance(client.http_client.transport, HTTPXTransport)
+            # HTTP/2 is negotiated only over TLS, so with the plain HTTP fake server, the requests fall back to HTTP/1.1
+            dataset_client = client.dataset(self.dataset['id'])
+            self.assertEqual(len(dataset_client.list_items(limit=10).items), 10)
+            dataset_client.push_items([{'index': 3000}])
+            self.assertEqual(dataset_client.list_items(offset=3000).items, [{'index': 3000}])
+            self.assertEqual(self.server.requests[-2], ('POST', f'/v2/datasets/{self.dataset["id"]}/items'))
+            # the HTTP/2 transport replaces the requests session
+            with self.assertRaises(TypeError):
+                client.http_client.requests_session
+            client.close()
+
+            async def main() -> None:
+                async_client = ApifyClientAsync(base_url=self.server.url, http2=True)
+                self.assertEqual(len((await async_client.dataset(self.dataset['id']).list_items(limit=10)).items), 10)
+                await async_client.close()
+
+            asyncio.run(main())
+
+        with self.assertRaises(ValueError):
+            ApifyClient(http2=True, transport=InMemoryTransport(self.server.handle_request))
+
+    def test_in_memory_async_transport(self) -> None:
+        async def main() -> None:
+            client = ApifyClientAsync(base_url='http://fake-api/v2', transport=InMemoryAsyncTransport(self.server.handle_request))
+            dataset_client = client.dataset(self.dataset['id'])
+            await dataset_client.push_items([{'index': 3000}])
+            self.assertEqual((await dataset_client.list_items(offset=2999)).items, [{'index': 2999}, {'index': 3000}])
+
+            store: Dict = await client.key_value_stores().get_or_create(name='some-store')
+            await client.key_value_store(store['id']).set_record('a', {'b': 1})
+            self.assertEqual((await client.key_value_store(store['id']).get_record('a') or {})['value'], {'b': 1})
+            with self.assertRaises(TypeError):
+                client.http_client.httpx_async_client
+            await client.close()
+
+        asyncio.run(main())
+
+    def test_incomplete_transport(self) -> None:
+        class CloseOnlyTransport(Transport):
+            def close(self) -> None:
+                pass
+
+        # a transport missing the send method fails when it's created, not on the first request
+        with self.assertRaises(TypeError):
+            CloseOnlyTransport()  # type: ignore
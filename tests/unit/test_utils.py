@@ -1,20 +1,30 @@
+import asyncio
+import gzip
 import io
-import time
+import json
 import unittest
 from datetime import datetime, timezone
-from typing import Any, Callable
+from typing import Generator, List
 
 from apify_client._utils import (
+    ListPage,
     _encode_webhook_list_to_base64,
+    _FileBody,
+    _get_url_template,
+    _GzippedBody,
+    _IncrementalJSONReader,
     _is_content_type_json,
     _is_content_type_text,
     _is_content_type_xml,
     _is_file_or_bytes,
+    _JSONArrayBody,
     _parse_date_fields,
     _pluck_data,
-    _retry_with_exp_backoff,
+    _StreamingBody,
     _to_safe_id,
 )
+from apify_client.compression import CompressionPolicy
+from apify_client.json_codec import StdlibJSONCodec
 
 
 class UtilsTest(unittest.TestCase):
@@ -55,6 +65,41 @@ class UtilsTest(unittest.TestCase):
         # doesn't die when the date can't be parsed
         self.assertEqual(_parse_date_fields({'createdAt': 'NOT_A_DATE'}), {'createdAt': 'NOT_A_DATE'})
 
+        # parses dates with a different precision than the API uses
+        expected_datetime = datetime(2016, 11, 14, 11, 10, 52, 400000, timezone.utc)
+        self.assertEqual(_parse_date_fields({'createdAt': '2016-11-14T11:10:52.4Z'}), {'createdAt': expected_datetime})
+        self.assertEqual(_parse_date_fields({'createdAt': '2016-13-14T11:10:52.425Z'}), {'createdAt': '2016-13-14T11:10:52.425Z'})
+
+        # doesn't parse anything when turned off
+        self.assertEqual(_parse_date_fields({'createdAt': '2016-11-14T11:10:52.425Z'}, 'off'), {'createdAt': '2016-11-14T11:10:52.425Z'})
+
+    def test__parse_date_fields_lazily(self) -> None:
+        expected_datetime = datetime(2020, 2, 29, 10, 9, 8, 100000, timezone.utc)
+        data = {
+            'id': 'abc',
+            'createdAt': '2020-02-29T10:09:08.100Z',
+            'stats': {'finishedAt': '2020-02-29T10:09:08.100Z'},
+            'items': [{'modifiedAt': '2020-02-29T10:09:08.100Z', 'a': {'b': {'startedAt': '2020-02-29T10:09:08.100Z'}}}],
+        }
+        parsed = _parse_date_fields(data, 'lazy')
+
+        # the dates are converted when accessed, without changing the original data
+        self.assertEqual(parsed['createdAt'], expected_datetime)
+        self.assertEqual(parsed.get('stats', {}).get('finishedAt'), expected_datetime)
+        self.assertEqual(parsed['items'][0]['modifiedAt'], expected_datetime)
+        self.assertEqual(data['createdAt'], '2020-02-29T10:09:08.100Z')
+        self.assertEqual(data['stats'], {'finishedAt': '2020-02-29T10:09:08.100Z'})
+
+        # reading all the values, or copying the dict, converts them too, up to the same depth as the eager parsing
+        self.assertEqual(parsed, _parse_date_fields(data))
+        self.assertEqual({**_parse_date_fields(data, 'lazy')}['createdAt'], expected_datetime)
+        self.assertEqual(dict(_parse_date_fields(data, 'lazy').items())['createdAt'], expected_datetime)
+        self.assertEqual(parsed['items'][0]['a']['b']['startedAt'], '2020-02-29T10:09:08.100Z')
+
+        # values set later are kept as they are
+        parsed['updatedAt'] = '2020-02-29T10:09:08.100Z'
+        self.assertEqual(parsed['updatedAt'], '2020-02-29T10:09:08.100Z')
+
     def test__pluck_data(self) -> None:
         # works correctly when data is present
         self.assertEqual(_pluck_data({'data': {}}), {})
@@ -104,52 +149,6 @@ class UtilsTest(unittest.TestCase):
         self.assertEqual(_is_file_or_bytes({'a': 'b'}), False)
         self.assertEqual(_is_file_or_bytes(None), False)
 
-    def test__retry_with_exp_backoff(self) -> None:
-        attempt_counter = 0
-
-        class RetryableException(Exception):
-            pass
-
-        class BailException(Exception):
-            pass
-
-        def returns_on_fifth_attempt(bail: Callable, attempt: int) -> Any:
-            nonlocal attempt_counter
-            attempt_counter += 1
-
-            if attempt == 5:
-                return 'SUCCESS'
-            raise RetryableException()
-
-        def bails_on_third_attempt(bail: Callable, attempt: int) -> Any:
-            nonlocal attempt_counter
-            attempt_counter += 1
-
-            if attempt == 3:
-                bail(BailException())
-            raise RetryableException()
-
-        # Returns the correct result after the correct time (should take 100 + 200 + 400 + 800 = 1500 ms)
-        start = time.time()
-        result = _retry_with_exp_backoff(returns_on_fifth_attempt, backoff_base_millis=100, backoff_factor=2, random_factor=0)
-        elapsed_time_seconds = time.time() - start
-        self.assertEqual(result, 'SUCCESS')
-        self.assertEqual(attempt_counter, 5)
-        self.assertGreater(elapsed_time_seconds, 1.4)
-        self.assertLess(elapsed_time_seconds, 2.0)
-
-        # Stops retrying when failed for max_retries times
-        attempt_counter = 0
-        with self.assertRaises(RetryableException):
-            _retry_with_exp_backoff(returns_on_fifth_attempt, max_retries=3, backoff_base_millis=1)
-        self.assertEqual(attempt_counter, 4)
-
-        # Bails when the bail function is called
-        attempt_counter = 0
-        with self.assertRaises(BailException):
-            _retry_with_exp_backoff(bails_on_third_attempt, backoff_base_millis=1)
-        self.assertEqual(attempt_counter, 3)
-
     def test__encode_webhook_list_to_base64(self) -> None:
         self.assertEqual(_encode_webhook_list_to_base64([]), b'W10=')
         self.assertEqual(
@@ -166,3 +165,143 @@ class UtilsTest(unittest.TestCase):
             ]),
             b'W3siZXZlbnRUeXBlcyI6IFsiQUNUT1IuUlVOLkNSRUFURUQiXSwgInJlcXVlc3RVcmwiOiAiaHR0cHM6Ly9leGFtcGxlLmNvbS9ydW4tY3JlYXRlZCJ9LCB7ImV2ZW50VHlwZXMiOiBbIkFDVE9SLlJVTi5TVUNDRUVERUQiXSwgInJlcXVlc3RVcmwiOiAiaHR0cHM6Ly9leGFtcGxlLmNvbS9ydW4tc3VjY2VlZGVkIiwgInBheWxvYWRUZW1wbGF0ZSI6ICJ7XCJoZWxsb1wiOiBcIndvcmxkXCIsIFwicmVzb3VyY2VcIjp7e3Jlc291cmNlfX19In1d',  # noqa: E501
         )
+
+    def test__incremental_json_reader(self) -> None:
+        def split_to_chunks(data: bytes, chunk_size: int) -> List[bytes]:
+            return [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+        items = [
+            {'id': 1, 'name': 'žluťoučký kůň', 'nested': {'list': [1, 2.5, None, True]}},
+            12345678,
+            'a string with a \\"quote\\" and a ] bracket',
+            [],
+            {},
+        ]
+        response_body = json.dumps({'data': {'total': 5, 'offset': 0, 'items': items, 'trailing': 'x'}}, ensure_ascii=False).encode('utf-8')
+
+        # parses the same result regardless of how the data is split, even in the middle of multi-byte characters or numbers
+        for chunk_size in [1, 2, 3, 7, 64, len(response_body)]:
+            reader = _IncrementalJSONReader(split_to_chunks(response_body, chunk_size))
+            self.assertEqual(reader.read_object_until_key('data'), ({}, True))
+            self.assertEqual(reader.read_object_until_key('items'), ({'total': 5, 'offset': 0}, True))
+            self.assertEqual(list(reader.iterate_array()), items)
+
+        # parses top-level arrays
+        self.assertEqual(list(_IncrementalJSONReader([b' [ 1 ,', b'2', b'3 ] ']).iterate_array()), [1, 23])
+        self.assertEqual(list(_IncrementalJSONReader([b'[]']).iterate_array()), [])
+
+        # reports a missing key
+        self.assertEqual(_IncrementalJSONReader([b'{"a": [1, 2]}']).read_object_until_key('items'), ({'a': [1, 2]}, False))
+
+        # fails on invalid or truncated data
+        with self.assertRaises(ValueError):
+            list(_IncrementalJSONReader([b'[1, 2']).iterate_array())
+        with self.assertRaises(ValueError):
+            list(_IncrementalJSONReader([b'{"a": 1}']).iterate_array())
+
+    def test_list_page_lazy(self) -> None:
+        # eager pages behave as before
+        page = ListPage({'items': [1, 2, 3], 'total': 10})
+        self.assertEqual(page.items, [1, 2, 3])
+        self.assertEqual(list(page), [1, 2, 3])
+        self.assertEqual((page.count, page.offset, page.total), (3, 0, 10))
+
+        # lazy pages don't consume the iterator until needed
+        consumed = []
+
+        def generate_items() -> Generator:
+            for i in range(3):
+                consumed.append(i)
+                yield i
+
+        page = ListPage({'items': generate_items(), 'count': 3, 'total': 3})
+        self.assertEqual(consumed, [])
+        self.assertEqual(list(page), [0, 1, 2])
+        with self.assertRaises(ValueError):
+            page.items
+
+        # accessing items of a lazy page reads all of them
+        page = ListPage({'items': generate_items(), 'count': 3})
+        self.assertEqual(page.items, [0, 1, 2])
+        self.assertEqual(list(page), [0, 1, 2])
+
+        # a lazy page without the count stays lazy, until the count is accessed
+        consumed.clear()
+        page = ListPage({'items': generate_items(), 'offset': 5})
+        self.assertEqual(consumed, [])
+        self.assertEqual((page.count, page.total), (3, 8))
+        self.assertEqual(consumed, [0, 1, 2])
+        self.assertEqual(list(page), [0, 1, 2])
+
+        consumed.clear()
+        page = ListPage({'items': generate_items(), 'total': 100})
+        self.assertEqual((page.offset, page.limit, page.total), (0, 0, 100))
+        self.assertEqual(next(iter(page)), 0)
+        self.assertEqual(consumed, [0])
+
+    def test__json_array_body(self) -> None:
+        items = [{'index': i, 'text': 'žluťoučký kůň'} for i in range(1000)]
+
+        # lists can be encoded repeatedly, so requests with them can be retried
+        body = _JSONArrayBody(items, StdlibJSONCodec(), chunk_size=1024)
+        self.assertTrue(body.is_replayable)
+        chunks = list(body)
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(json.loads(b''.join(chunks)), items)
+        self.assertEqual(json.loads(b''.join(body)), items)
+
+        # generators are encoded lazily, only once
+        consumed = []
+
+        def generate_items() -> Generator:
+            for item in items:
+                consumed.append(item)
+                yield item
+
+        body = _JSONArrayBody(generate_items(), StdlibJSONCodec(), chunk_size=1024)
+        self.assertFalse(body.is_replayable)
+        self.assertEqual(consumed, [])
+        chunks_iterator = iter(body)
+        first_chunk = next(chunks_iterator)
+        self.assertLess(len(consumed), len(items))
+        self.assertEqual(json.loads(first_chunk + b''.join(chunks_iterator)), items)
+
+        async def collect_async() -> List[bytes]:
+            return [chunk async for chunk in _JSONArrayBody([], StdlibJSONCodec()).aiter()]
+
+        self.assertEqual(json.loads(b''.join(asyncio.run(collect_async()))), [])
+
+    def test__streaming_body_is_abstract(self) -> None:
+        class SizedBody(_StreamingBody):
+            size_bytes = 0
+
+        with self.assertRaises(TypeError):
+            SizedBody()  # type: ignore
+
+    def test__file_body(self) -> None:
+        file = io.BytesIO(b'skipped' + b'x' * 3000)
+        file.seek(7)
+        body = _FileBody(file, chunk_size=1024)
+        self.assertTrue(body.is_replayable)
+        self.assertEqual(body.size_bytes, 3000)
+        self.assertEqual([len(chunk) for chunk in body], [1024, 1024, 952])
+        # reading the body again starts from the original position
+        self.assertEqual(b''.join(body), b'x' * 3000)
+
+        text_file = io.StringIO('žluťoučký kůň')
+        self.assertEqual(b''.join(_FileBody(text_file)), 'žluťoučký kůň'.encode('utf-8'))
+
+    def test__gzipped_body(self) -> None:
+        items = [{'index': i} for i in range(1000)]
+        body = _GzippedBody(_JSONArrayBody(iter(items), StdlibJSONCodec(), chunk_size=1024), CompressionPolicy())
+        self.assertFalse(body.is_replayable)
+        self.assertEqual(json.loads(gzip.decompress(b''.join(body))), items)
+
+    def test__get_url_template(self) -> None:
+        base_url = 'https://api.apify.com/v2'
+        self.assertEqual(_get_url_template(f'{base_url}/acts', base_url), 'acts')
+        self.assertEqual(_get_url_template(f'{base_url}/acts/john~my-actor/runs/last', base_url), 'acts/{id}/runs/last')
+        self.assertEqual(_get_url_template(f'{base_url}/actor-runs/some-run/dataset/items', base_url), 'actor-runs/{id}/dataset/items')
+        self.assertEqual(_get_url_template(f'{base_url}/key-value-stores/some-store/records/a', base_url), 'key-value-stores/{id}/records/{id}')
+        self.assertEqual(_get_url_template(f'{base_url}/request-queues/some-queue/requests/batch', base_url), 'request-queues/{id}/requests/batch')
+        self.assertEqual(_get_url_template(f'{base_url}/request-queues/q/requests/r/lock', base_url), 'request-queues/{id}/requests/{id}/lock')